@@ -34,11 +34,26 @@ const io = new Server(server, {
 });
 
 const PORT = 3001;
+
+// Per packet logging is off by default: writing every command (which can hold
+// large batchPlay descriptors) to the console limits how many packets the
+// proxy can route. Set PROXY_DEBUG=1 to turn it on.
+const DEBUG = ["1", "true"].includes(
+    (process.env.PROXY_DEBUG || "").toLowerCase()
+);
+
+function debug(...args) {
+    if (DEBUG) {
+        console.log(...args);
+    }
+}
+
 // Track clients by application
 const applicationClients = {};
 
 io.on("connection", (socket) => {
-    console.log(`User connected: ${socket.id}`);
+    // every MCP tool call connects, so these are per packet too
+    debug(`User connected: ${socket.id}`);
 
     socket.on("register", ({ application }) => {
         console.log(
@@ -67,16 +82,17 @@ io.on("connection", (socket) => {
 
         if (senderId) {
             io.to(senderId).emit("packet_response", packet);
-            console.log(`Sent confirmation to client ${senderId}`);
+            debug(`Sent confirmation to client ${senderId}`);
         } else {
             console.log(`No sender ID provided in packet`);
         }
     });
 
     socket.on("command_packet", ({ application, command }) => {
-        console.log(
+        // only the action, not the whole command
+        debug(
             `Command from ${socket.id} for application ${application}:`,
-            command
+            command && command.action
         );
 
         // Register this client for this application if not already registered
@@ -100,7 +116,7 @@ io.on("connection", (socket) => {
     });
 
     socket.on("disconnect", () => {
-        console.log(`User disconnected: ${socket.id}`);
+        debug(`User disconnected: ${socket.id}`);
 
         // Remove this client from all application registrations
         for (const app in applicationClients) {
@@ -117,7 +133,7 @@ io.on("connection", (socket) => {
 function sendToApplication(packet) {
     let application = packet.application;
     if (applicationClients[application]) {
-        console.log(
+        debug(
             `Sending to ${applicationClients[application].size} clients for ${application}`
         );
 
@@ -0,0 +1,250 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# Checks tool arguments in the server before anything is sent to Photoshop, so
+# calls that would only fail there (out of range filter settings, unknown blend
+# modes, layers that do not exist) are rejected without sending them. Fonts
+# that are not installed only add a warning to the result, as Photoshop has
+# fonts of its own. The checks of each tool are built once, when the tools are
+# instrumented, from the batchPlay tool specs and the argument names.
+
+import functools
+import inspect
+import threading
+import time
+
+import core
+import document_state
+import font_index
+
+# Arguments that take the PostScript name of an installed font
+FONT_ARGS = {"postscript_font_name"}
+
+# Reasons of checks that warn instead of rejecting the call. Photoshop bundles
+# fonts (and gets Adobe Fonts) that are not in the font folders that are scanned.
+ADVISORY = {"font"}
+
+
+class ValidationStats:
+    """
+    Counts checked and rejected calls, and the requests the checks sent to
+    Photoshop (probes). A rejected call that made no probe is a round trip to
+    Photoshop avoided.
+    """
+
+    def __init__(self):
+        self.checked = 0
+        self.rejected = 0
+        self.avoided = 0
+        self.probes = 0
+        self.seconds = 0.0
+        self.by_reason = {}
+        self.by_tool = {}
+        self._lock = threading.Lock()
+
+    def record(self, seconds, tool_name=None, reason=None, probes=0):
+        with self._lock:
+            self.checked += 1
+            self.seconds += seconds
+            self.probes += probes
+            if reason is not None:
+                self.rejected += 1
+                if not probes:
+                    self.avoided += 1
+                self.by_reason[reason] = self.by_reason.get(reason, 0) + 1
+                self.by_tool[tool_name] = self.by_tool.get(tool_name, 0) + 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "checkedCalls": self.checked,
+                "rejectedCalls": self.rejected,
+                "avoidedRoundTrips": self.avoided,
+                "probeRoundTrips": self.probes,
+                "rejectedByReason": dict(self.by_reason),
+                "rejectedByTool": dict(self.by_tool),
+                "meanCheckMicroseconds": round(self.seconds / self.checked * 1e6, 2) if self.checked else 0.0,
+            }
+
+
+stats = ValidationStats()
+
+# probes sent by the checks of the call being checked on this thread
+_local = threading.local()
+
+
+def _in_bounds(low, high):
+    def check(value):
+        if isinstance(value, (int, float)) and not low <= value <= high:
+            return f"must be between {low} and {high}, got {value}"
+    return check
+
+
+def _one_of(values, ignore_case=False):
+    allowed = {str(v).upper() for v in values} if ignore_case else set(values)
+    listed = ", ".join(str(v) for v in values)
+
+    def check(value):
+        key = str(value).upper() if ignore_case else value
+        if key not in allowed:
+            return f"must be one of {listed}, got {value!r}"
+    return check
+
+
+def _installed_font(value):
+    return font_index.check_font(value)
+
+
+def _existing_layer(value):
+    # layers created earlier in a batch being collected are not known yet
+    if core.is_collecting():
+        return None
+
+    state = document_state.current_state()
+    ids = document_state.current_layer_ids()
+    if state is None or ids is None:
+        return None
+
+    missing = [v for v in (value if isinstance(value, list) else [value])
+        if isinstance(v, int) and v not in ids]
+    if not missing:
+        return None
+
+    # the layer may have been made since (in Photoshop, or by another client), so
+    # only reject if the document is still at the state the tree was seen at
+    _local.probes = getattr(_local, "probes", 0) + 1
+    try:
+        response = core.sendCommand(core.createCommand("getHistoryState", {}))
+    except Exception:
+        return None
+    if document_state.state_from_response(response) != state:
+        return None
+
+    return (f"no layer with ID {', '.join(map(str, missing))} in the active document. "
+        "Use get_layers to find layer IDs.")
+
+
+def compile_checks(fn, spec=None, enums=None):
+    """
+    Builds the argument checks of a tool.
+
+    Args:
+        fn: Tool function
+        spec (dict): batchPlay tool spec (see batchplay_tools), for its parameter
+            bounds and choices
+        enums (dict): Argument name -> accepted values (matched ignoring case),
+            e.g. {"blend_mode": blend_modes}. Only applied where the default of
+            the argument is one of the values, as some tools take the batchPlay
+            spelling instead (e.g. "colorBurn").
+
+    Returns:
+        list: (argument name, reason, check) tuples. check returns an error
+            message, or None if the value is valid.
+    """
+    parameters = inspect.signature(fn).parameters
+    checks = []
+
+    for param in (spec or {}).get("params", []):
+        if param["bounds"] is not None:
+            checks.append((param["name"], "bounds", _in_bounds(*param["bounds"])))
+        if param["choices"] is not None:
+            checks.append((param["name"], "choices", _one_of(list(param["choices"]))))
+
+    for name, param in parameters.items():
+        values = (enums or {}).get(name)
+        if values and param.default in values:
+            checks.append((name, "enum", _one_of(values, ignore_case=True)))
+
+        if name in FONT_ARGS:
+            checks.append((name, "font", _installed_font))
+
+        # the layer tree is only known for the active document
+        if document_state.is_layer_arg(name) and "document_id" not in parameters:
+            checks.append((name, "layer", _existing_layer))
+
+    return checks
+
+
+def wrap(tool_name, fn, checks):
+    """
+    Returns fn wrapped to raise ValueError, before calling it, if an argument
+    fails a check. Failed ADVISORY checks are added to a dict result as
+    "warnings" instead.
+    """
+    names = list(inspect.signature(fn).parameters)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        values = {**dict(zip(names, args)), **kwargs} if args else kwargs
+        warnings = []
+        _local.probes = 0
+
+        for arg, reason, check in checks:
+            value = values.get(arg)
+            if value is None:
+                continue
+
+            error = check(value)
+            if error is None:
+                continue
+
+            if reason in ADVISORY:
+                warnings.append(f"{arg}: {error}")
+                continue
+
+            stats.record(time.perf_counter() - start, tool_name, reason, _local.probes)
+            raise ValueError(f"{arg}: {error}")
+
+        stats.record(time.perf_counter() - start, probes=_local.probes)
+        result = fn(*args, **kwargs)
+
+        if warnings and isinstance(result, dict):
+            result = {**result, "warnings": warnings}
+        return result
+
+    return wrapper
+
+
+def instrument(tool_manager, specs=(), enums=None):
+    """
+    Wraps the functions of all registered tools that have argument checks.
+
+    Args:
+        tool_manager: FastMCP tool manager
+        specs (list[dict]): batchPlay tool specs
+        enums (dict): See compile_checks()
+
+    Returns:
+        int: Number of tools with checks
+    """
+    specs_by_name = {spec["name"]: spec for spec in specs}
+    count = 0
+
+    for tool in tool_manager.list_tools():
+        checks = compile_checks(tool.fn, specs_by_name.get(tool.name), enums)
+        if checks:
+            tool.fn = wrap(tool.name, tool.fn, checks)
+            count += 1
+
+    return count
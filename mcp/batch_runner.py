@@ -0,0 +1,371 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# Runs a recipe of tool calls over a folder of images. Each file is opened and
+# processed in a single request to Photoshop, then read back (in tiles if it
+# does not fit in one proxy message) and closed, while the previous files are
+# encoded in the export process pool and the next file is read from disk ahead
+# of time.
+#
+# Also runs data merges: variants of an open template, each made in one
+# request, read back and reset by reverting to a history snapshot.
+
+import collections
+import glob
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core import collect_commands, createCommand, sendCommand, sendCommands
+import image_export
+import logger
+import tiled_readback
+
+CHECKPOINT_FILE = ".batch_checkpoint.json"
+
+# max seconds to wait for one file (open + recipe + read back)
+BATCH_TIMEOUT = 300
+
+# max files being encoded at once, bounds the memory held by pending pixels
+MAX_IN_FLIGHT = max(2, (os.cpu_count() or 2) * 2)
+
+PREFETCH_CHUNK = 4 * 1024 * 1024
+
+MERGE_SNAPSHOT = "Data merge template"
+
+
+def compile_recipe(recipe, resolve_tool):
+    """
+    Turns recipe steps into the plugin commands their tools would send.
+
+    Args:
+        recipe (list[dict]): Steps with "tool" (a tool name), optional "args" (dict)
+            and optional "repeat" (int, how many times to run the step)
+        resolve_tool (callable): Returns the function for a tool name, or None
+
+    Returns:
+        list[dict]: Commands to run for every file
+    """
+    commands = []
+
+    for i, step in enumerate(recipe):
+        name = step.get("tool")
+        fn = resolve_tool(name)
+        if fn is None:
+            raise ValueError(f"Recipe step {i + 1}: unknown tool '{name}'")
+
+        with collect_commands() as collected:
+            try:
+                fn(**step.get("args", {}))
+            except Exception as e:
+                # tools that need the result of a command can not be batched
+                raise ValueError(f"Recipe step {i + 1} ({name}) can not be run in a batch: {e}")
+
+        repeat = step.get("repeat", 1)
+        if not isinstance(repeat, int) or repeat < 0:
+            raise ValueError(f"Recipe step {i + 1} ({name}): repeat must be a non negative integer")
+
+        commands.extend(collected * repeat)
+
+    return commands
+
+
+class EncodeQueue:
+    """
+    Images being encoded in the export pool. Holds at most MAX_IN_FLIGHT, waiting
+    for the oldest to finish before more are added, so the pixels waiting in
+    shared memory stay bounded.
+    """
+
+    def __init__(self, on_done):
+        # called as on_done(key, results) when all renditions of an image are
+        # written, with the results of image_export.collect()
+        self._on_done = on_done
+        self._items = collections.deque()
+
+    def add(self, key, pixels, renditions, placement=None):
+        """Starts encoding a pixel array to renditions (see image_export.submit_renditions())."""
+        self._items.append((key, image_export.submit_renditions(pixels, renditions, placement)))
+
+        while len(self._items) > MAX_IN_FLIGHT:
+            self._finish()
+
+    def drain(self):
+        while self._items:
+            self._finish()
+
+    def _finish(self):
+        key, jobs = self._items.popleft()
+        self._on_done(key, image_export.collect(jobs))
+
+
+def close_document_command():
+    """Command that closes the active document without saving."""
+    return createCommand("executeBatchPlayCommand", {"commands": [{
+        "_obj": "close",
+        "saving": {"_enum": "yesNo", "_value": "no"},
+        "_isCommand": True
+    }]})
+
+
+class Checkpoint:
+    """
+    Records which input files have been written, so a batch stopped part way
+    (e.g. by a crash) can be resumed. Only valid for the same recipe and outputs.
+    """
+
+    def __init__(self, path, key):
+        self.path = path
+        self.key = key
+        self.done = set()
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("key") == key:
+                self.done = set(data.get("done", []))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.log(f"Ignoring unreadable batch checkpoint {path}: {e}")
+
+    def mark(self, input_path):
+        self.done.add(input_path)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"key": self.key, "done": sorted(self.done)}, f)
+        os.replace(tmp_path, self.path)
+
+
+def _prefetch(path):
+    """Reads a file so it is in the OS cache by the time Photoshop opens it."""
+    try:
+        with open(path, "rb") as f:
+            while f.read(PREFETCH_CHUNK):
+                pass
+    except OSError:
+        pass
+
+
+def _read_pixels(info):
+    """
+    Reads the active document, given its getDocumentInfo response. The pixels
+    are read in their own requests, sized to fit through the proxy, instead of
+    with the commands that made them.
+    """
+    size = (int(round(info["width"])), int(round(info["height"])))
+    return tiled_readback.read_document(size=size)
+
+
+def _close_if_open(path):
+    """Closes the active document if it is the one opened from path (after a failed step)."""
+    try:
+        info = sendCommand(createCommand("getDocumentInfo", {}))["response"]
+        if os.path.normcase(os.path.abspath(info.get("path") or "")) == os.path.normcase(path):
+            sendCommand(close_document_command())
+    except Exception as e:
+        logger.log(f"Could not close {path} after failure: {e}")
+
+
+def run(input_glob, recipe_commands, output_dir, renditions, resume=True):
+    """
+    Opens each file matching input_glob, runs the recipe commands on it and
+    writes the result as renditions in output_dir.
+
+    Args:
+        input_glob (str): Glob pattern for the input files ("**" is recursive)
+        recipe_commands (list[dict]): Commands from compile_recipe()
+        output_dir (str): Directory to write to (created if needed)
+        renditions (list[dict]): Rendition templates (see image_export.expand_renditions())
+            applied to each file, named after the input file
+        resume (bool): Skip files recorded as done by a previous run with the same
+            recipe and renditions
+
+    Returns:
+        dict: Counts, failures, elapsed time and images per minute
+    """
+    files = sorted(
+        os.path.abspath(p) for p in glob.glob(input_glob, recursive=True) if os.path.isfile(p))
+
+    os.makedirs(output_dir, exist_ok=True)
+    key = hashlib.sha1(
+        json.dumps([recipe_commands, renditions], sort_keys=True, default=str).encode()).hexdigest()
+    checkpoint = Checkpoint(os.path.join(output_dir, CHECKPOINT_FILE), key)
+
+    if not resume:
+        checkpoint.done = set()
+    todo = [p for p in files if p not in checkpoint.done]
+    skipped = len(files) - len(todo)
+
+    start = time.perf_counter()
+    processed = 0
+    failed = []
+    prefetcher = ThreadPoolExecutor(max_workers=1)
+
+    def done(input_path, results):
+        nonlocal processed
+        errors = [r["error"] for r in results if "error" in r]
+        if errors:
+            failed.append({"file": input_path, "error": "; ".join(errors)})
+        else:
+            checkpoint.mark(input_path)
+            processed += 1
+
+    queue = EncodeQueue(done)
+
+    try:
+        next_prefetch = prefetcher.submit(_prefetch, todo[0]) if todo else None
+
+        for i, input_path in enumerate(todo):
+            next_prefetch.result()
+            if i + 1 < len(todo):
+                next_prefetch = prefetcher.submit(_prefetch, todo[i + 1])
+
+            commands = [createCommand("openFile", {"filePath": input_path})]
+            commands += recipe_commands
+            commands += [createCommand("getDocumentInfo", {})]
+
+            try:
+                response = sendCommands(commands, BATCH_TIMEOUT)
+                pixels = _read_pixels(response["response"][-1])
+                sendCommand(close_document_command())
+            except Exception as e:
+                logger.log(f"Batch: {input_path} failed: {e}")
+                failed.append({"file": input_path, "error": str(e)})
+                _close_if_open(input_path)
+                continue
+
+            base_path = os.path.join(
+                output_dir, os.path.splitext(os.path.basename(input_path))[0])
+            queue.add(input_path, pixels, image_export.expand_renditions(base_path, renditions))
+
+        queue.drain()
+    finally:
+        prefetcher.shutdown(wait=False)
+
+    seconds = time.perf_counter() - start
+    logger.log(f"Batch: {processed} processed, {len(failed)} failed, {skipped} skipped in {seconds:.1f}s")
+
+    return {
+        "total": len(files),
+        "processed": processed,
+        "skipped": skipped,
+        "failed": failed,
+        "seconds": round(seconds, 3),
+        "imagesPerMinute": round(processed * 60 / seconds, 1) if seconds > 0 and processed else 0.0,
+        "checkpoint": checkpoint.path,
+    }
+
+
+def _snapshot_command(verb):
+    if verb == "make":
+        descriptor = {
+            "_obj": "make",
+            "_target": [{"_ref": "snapshotClass"}],
+            "name": MERGE_SNAPSHOT,
+            "using": {"_enum": "historyState", "_value": "fullDocument"},
+            "_isCommand": True
+        }
+    else:
+        descriptor = {
+            "_obj": verb,
+            "_target": [{"_ref": "snapshotClass", "_name": MERGE_SNAPSHOT}],
+            "_isCommand": True
+        }
+
+    return createCommand("executeBatchPlayCommand", {"commands": [descriptor]})
+
+
+def run_merge(template_path, variants, close_template=True):
+    """
+    Opens a template once and writes one image per variant. Each variant's
+    commands run in one request, starting from a history snapshot of the
+    untouched template instead of reopening it, and the result is read back.
+
+    Args:
+        template_path (str): Template document to open
+        variants (list): (key, commands, renditions) tuples, where commands are
+            plugin commands that fill in the template (see core.collect_commands())
+            and renditions are the files to write (see image_export.submit_renditions())
+        close_template (bool): Close the template (without saving) when done
+
+    Returns:
+        dict: Counts, failures, elapsed time and variants per minute
+    """
+    start = time.perf_counter()
+    written = 0
+    failed = []
+
+    def done(key, results):
+        nonlocal written
+        errors = [r["error"] for r in results if "error" in r]
+        if errors:
+            failed.append({"row": key, "error": "; ".join(errors)})
+        else:
+            written += 1
+
+    sendCommands([
+        createCommand("openFile", {"filePath": template_path}),
+        _snapshot_command("make"),
+    ], BATCH_TIMEOUT)
+
+    queue = EncodeQueue(done)
+    try:
+        for key, commands, renditions in variants:
+            commands = [_snapshot_command("select")] + commands
+            commands.append(createCommand("getDocumentInfo", {}))
+
+            try:
+                response = sendCommands(commands, BATCH_TIMEOUT)
+                pixels = _read_pixels(response["response"][-1])
+            except Exception as e:
+                logger.log(f"Data merge: row {key} failed: {e}")
+                failed.append({"row": key, "error": str(e)})
+                continue
+
+            queue.add(key, pixels, renditions)
+
+        queue.drain()
+    finally:
+        # leave the template as it was opened
+        end = [_snapshot_command("select"), _snapshot_command("delete")]
+        if close_template:
+            end.append(close_document_command())
+        try:
+            sendCommands(end, BATCH_TIMEOUT)
+        except Exception as e:
+            logger.log(f"Data merge: could not reset template: {e}")
+
+    seconds = time.perf_counter() - start
+    logger.log(f"Data merge: {written} written, {len(failed)} failed in {seconds:.1f}s")
+
+    return {
+        "total": len(variants),
+        "written": written,
+        "failed": failed,
+        "seconds": round(seconds, 3),
+        "variantsPerMinute": round(written * 60 / seconds, 1) if seconds > 0 and written else 0.0,
+    }
@@ -0,0 +1,2702 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# Tools that select a layer and send one batchPlay descriptor built from their
+# arguments, declared as data instead of one hand-written function each.
+#
+# A spec is the tool name, its docstring, its parameters (after layer_id, which
+# every tool takes) and a descriptor template. Any string value "$name" in the
+# template is replaced with the argument of that name. At startup each spec is
+# compiled into a plain Python function, so a call costs the same as the
+# hand-written version, and the functions are registered as MCP tools.
+
+import textwrap
+
+from core import createCommand, sendCommand
+
+_REQUIRED = object()
+
+
+def _param(name, kind, default=_REQUIRED, bounds=None, choices=None, cast=None):
+    """
+    Declares a tool parameter.
+
+    Args:
+        name (str): Argument name
+        kind (type): int, float, str or bool
+        default: Default value. Omit for a required argument.
+        bounds (tuple): (min, max) of a numeric argument, checked by arg_validation
+        choices: Accepted values, checked by arg_validation. A dict maps each
+            value to what is sent to Photoshop.
+        cast (type): Converts the argument before it is sent, e.g. float
+    """
+    return {"name": name, "kind": kind, "default": default, "bounds": bounds,
+        "choices": choices, "cast": cast}
+
+
+def _tool(name, doc, params, commands):
+    return {"name": name, "doc": doc, "params": params, "commands": commands}
+
+
+SPECS = [
+    _tool(
+        "apply_plastic_wrap",
+        """
+        Applies Plastic Wrap filter to a layer for a liquid/chrome/wet look.
+
+        Args:
+            layer_id: ID of the layer to apply the effect to
+            highlight_strength: Strength of highlights (0-20). Default 15.
+            detail: Detail level (1-15). Default 9.
+            smoothness: Smoothness (1-15). Default 7.
+        """,
+        [
+            _param("highlight_strength", int, 15, bounds=(0, 20)),
+            _param("detail", int, 9, bounds=(1, 15)),
+            _param("smoothness", int, 7, bounds=(1, 15)),
+        ],
+        [{
+            "_obj": "plasticWrap",
+            "highlightStrength": "$highlight_strength",
+            "detail": "$detail",
+            "smoothness": "$smoothness",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_glass_distortion",
+        """
+        Applies Glass distortion filter for liquid/glass refraction look.
+
+        Args:
+            layer_id: ID of the layer
+            distortion: Distortion amount (0-20). Default 5.
+            smoothness: Smoothness (1-15). Default 3.
+            texture: Texture type — 'frosted', 'blocks', 'canvas', 'tinyLens'. Default 'frosted'.
+            scaling: Texture scale percentage (50-200). Default 100.
+        """,
+        [
+            _param("distortion", int, 5, bounds=(0, 20)),
+            _param("smoothness", int, 3, bounds=(1, 15)),
+            _param("texture", str, "frosted",
+                choices={"frosted": 1, "blocks": 2, "canvas": 3, "tinyLens": 4}),
+            _param("scaling", int, 100, bounds=(50, 200)),
+        ],
+        [{
+            "_obj": "glass",
+            "distortion": "$distortion",
+            "smoothness": "$smoothness",
+            "textureType": "$texture",
+            "scaling": "$scaling",
+            "invert": False,
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_ripple",
+        """
+        Applies Ripple distortion filter.
+
+        Args:
+            layer_id: ID of the layer
+            amount: Ripple amount (-999 to 999). Default 100.
+            size: Ripple size — 'small', 'medium', 'large'. Default 'medium'.
+        """,
+        [
+            _param("amount", int, 100, bounds=(-999, 999)),
+            _param("size", str, "medium", choices={"small": 0, "medium": 1, "large": 2}),
+        ],
+        [{
+            "_obj": "ripple",
+            "amount": "$amount",
+            "rippleSize": "$size",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_ocean_ripple",
+        """
+        Applies Ocean Ripple distortion filter for water surface effect.
+
+        Args:
+            layer_id: ID of the layer
+            ripple_size: Size of ripples (1-15). Default 9.
+            ripple_magnitude: Magnitude of ripples (1-20). Default 9.
+        """,
+        [
+            _param("ripple_size", int, 9, bounds=(1, 15)),
+            _param("ripple_magnitude", int, 9, bounds=(1, 20)),
+        ],
+        [{
+            "_obj": "oceanRipple",
+            "rippleSize": "$ripple_size",
+            "rippleMagnitude": "$ripple_magnitude",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_chrome_filter",
+        """
+        Applies Chrome filter for metallic/liquid chrome look.
+
+        Args:
+            layer_id: ID of the layer
+            detail: Detail level (0-10). Default 4.
+            smoothness: Smoothness (0-10). Default 7.
+        """,
+        [
+            _param("detail", int, 4, bounds=(0, 10)),
+            _param("smoothness", int, 7, bounds=(0, 10)),
+        ],
+        [{
+            "_obj": "chrome",
+            "detail": "$detail",
+            "smoothness": "$smoothness",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "set_layer_blend_if",
+        """
+        Sets the Blend If sliders for a layer (Layer Style > Blending Options).
+        Controls which tonal ranges are visible/hidden for seamless compositing.
+
+        Split points: black_feather > black, white_feather < white for smooth transitions.
+
+        Args:
+            layer_id: ID of the layer
+            this_layer_black: This Layer dark cutoff (0-255). Default 0.
+            this_layer_black_feather: This Layer dark feather point (0-255). Default 0.
+            this_layer_white: This Layer light cutoff (0-255). Default 255.
+            this_layer_white_feather: This Layer light feather point (0-255). Default 255.
+            underlying_black: Underlying Layer dark cutoff (0-255). Default 0.
+            underlying_black_feather: Underlying Layer dark feather point (0-255). Default 0.
+            underlying_white: Underlying Layer light cutoff (0-255). Default 255.
+            underlying_white_feather: Underlying Layer light feather point (0-255). Default 255.
+        """,
+        [
+            _param("this_layer_black", int, 0, bounds=(0, 255)),
+            _param("this_layer_black_feather", int, 0, bounds=(0, 255)),
+            _param("this_layer_white", int, 255, bounds=(0, 255)),
+            _param("this_layer_white_feather", int, 255, bounds=(0, 255)),
+            _param("underlying_black", int, 0, bounds=(0, 255)),
+            _param("underlying_black_feather", int, 0, bounds=(0, 255)),
+            _param("underlying_white", int, 255, bounds=(0, 255)),
+            _param("underlying_white_feather", int, 255, bounds=(0, 255)),
+        ],
+        [{
+            "_obj": "set",
+            "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}],
+            "to": {
+                "_obj": "layer",
+                "blendRange": [{
+                    "_obj": "blendRange",
+                    "channel": {"_ref": "channel", "_enum": "channel", "_value": "gray"},
+                    "srcBlackMin": "$this_layer_black",
+                    "srcBlackMax": "$this_layer_black_feather",
+                    "srcWhiteMin": "$this_layer_white_feather",
+                    "srcWhiteMax": "$this_layer_white",
+                    "destBlackMin": "$underlying_black",
+                    "destBlackMax": "$underlying_black_feather",
+                    "destWhiteMin": "$underlying_white_feather",
+                    "destWhiteMax": "$underlying_white",
+                }]
+            },
+            "_isCommand": True
+        }],
+    ),
+
+    # Apply filter to layer mask
+    _tool(
+        "select_layer_mask",
+        """
+        Selects (targets) the layer mask of the specified layer so that subsequent
+        operations (paint, fill, filter) apply to the mask instead of the layer pixels.
+
+        Args:
+            layer_id: ID of the layer whose mask to select.
+        """,
+        [],
+        [{
+            "_obj": "select",
+            "_target": [{"_ref": "channel", "_enum": "channel", "_value": "mask"}],
+            "makeVisible": False,
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "select_layer_rgb",
+        """
+        Selects the RGB composite channel of the specified layer (switches back from mask editing
+        to normal pixel editing).
+
+        Args:
+            layer_id: ID of the layer.
+        """,
+        [],
+        [{
+            "_obj": "select",
+            "_target": [{"_ref": "channel", "_enum": "channel", "_value": "RGB"}],
+            "makeVisible": False,
+            "_isCommand": True
+        }],
+    ),
+
+    # Add layer mask (white = reveal all, black = hide all)
+    _tool(
+        "add_layer_mask_reveal_all",
+        """
+        Adds a white (reveal all) layer mask to the specified layer.
+
+        Args:
+            layer_id: ID of the layer to add mask to.
+        """,
+        [],
+        [{
+            "_obj": "make",
+            "new": {"_class": "channel"},
+            "at": {"_ref": "channel", "_enum": "channel", "_value": "mask"},
+            "using": {"_enum": "userMaskEnabled", "_value": "revealAll"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "add_layer_mask_hide_all",
+        """
+        Adds a black (hide all) layer mask to the specified layer.
+
+        Args:
+            layer_id: ID of the layer to add mask to.
+        """,
+        [],
+        [{
+            "_obj": "make",
+            "new": {"_class": "channel"},
+            "at": {"_ref": "channel", "_enum": "channel", "_value": "mask"},
+            "using": {"_enum": "userMaskEnabled", "_value": "hideAll"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_polar_coordinates",
+        """
+        Applies Polar Coordinates distortion filter.
+
+        Args:
+            layer_id: ID of the layer
+            conversion: 'rectangularToPolar' or 'polarToRectangular'. Default 'rectangularToPolar'.
+        """,
+        [
+            _param("conversion", str, "rectangularToPolar", choices=("rectangularToPolar", "polarToRectangular")),
+        ],
+        [{
+            "_obj": "polarCoordinates",
+            "conversion": {"_enum": "polarConversionType", "_value": "$conversion"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_pinch",
+        """
+        Applies Pinch distortion filter (inward/outward squeeze).
+
+        Args:
+            layer_id: ID of the layer
+            amount: Pinch amount (-100 to 100). Positive = inward, negative = outward. Default 50.
+        """,
+        [
+            _param("amount", int, 50, bounds=(-100, 100)),
+        ],
+        [{
+            "_obj": "pinch",
+            "amount": "$amount",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_wind",
+        """
+        Applies Wind filter for motion/blast effects.
+
+        Args:
+            layer_id: ID of the layer
+            method: 'wind', 'blast', or 'stagger'. Default 'wind'.
+            direction: 'fromTheRight', 'fromTheLeft'. Default 'fromTheRight'.
+        """,
+        [
+            _param("method", str, "wind", choices=("wind", "blast", "stagger")),
+            _param("direction", str, "fromTheRight", choices=("fromTheRight", "fromTheLeft")),
+        ],
+        [{
+            "_obj": "wind",
+            "windMethod": {"_enum": "windMethod", "_value": "$method"},
+            "direction": {"_enum": "direction", "_value": "$direction"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_smart_blur",
+        """
+        Applies Smart Blur filter. Blurs areas of similar tone while preserving edges.
+
+        Args:
+            layer_id: ID of the layer
+            radius: Blur radius (0.1-100). Default 5.0.
+            threshold: Tonal threshold (0.1-100). Default 25.0.
+            quality: 'low', 'medium', or 'high'. Default 'medium'.
+            mode: 'normal', 'edgeOnly', or 'overlayEdge'. Default 'normal'.
+        """,
+        [
+            _param("radius", float, 5.0, bounds=(0.1, 100)),
+            _param("threshold", float, 25.0, bounds=(0.1, 100)),
+            _param("quality", str, "medium", choices=("low", "medium", "high")),
+            _param("mode", str, "normal", choices=("normal", "edgeOnly", "overlayEdge")),
+        ],
+        [{
+            "_obj": "smartBlur",
+            "radius": "$radius",
+            "threshold": "$threshold",
+            "smartBlurQuality": {"_enum": "smartBlurQuality", "_value": "$quality"},
+            "smartBlurMode": {"_enum": "smartBlurMode", "_value": "$mode"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_box_blur",
+        """
+        Applies Box Blur filter. Creates a flat, uniform blur.
+
+        Args:
+            layer_id: ID of the layer
+            radius: Blur radius in pixels (1-999). Default 5.
+        """,
+        [
+            _param("radius", int, 5, bounds=(1, 999), cast=float),
+        ],
+        [{
+            "_obj": "boxblur",
+            "radius": {"_unit": "pixelsUnit", "_value": "$radius"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_shape_blur",
+        """
+        Applies Shape Blur filter using a custom kernel shape.
+
+        Args:
+            layer_id: ID of the layer
+            radius: Blur radius in pixels (1-1000). Default 5.
+        """,
+        [
+            _param("radius", int, 5, bounds=(1, 1000)),
+        ],
+        [{
+            "_obj": "shapeBlur",
+            "radius": "$radius",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_average_blur",
+        """
+        Applies Average Blur. Fills the layer/selection with the average color of all pixels.
+
+        Args:
+            layer_id: ID of the layer
+        """,
+        [],
+        [{
+            "_obj": "average",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_field_blur",
+        """
+        Applies Field Blur (Blur Gallery). Uniform blur across the image with adjustable amount.
+
+        Args:
+            layer_id: ID of the layer
+            blur_amount: Blur amount in pixels (0-500). Default 15.
+        """,
+        [
+            _param("blur_amount", int, 15, bounds=(0, 500), cast=float),
+        ],
+        [{
+            "_obj": "bokehImageGalleryBlur",
+            "fieldBlur": {"_unit": "pixelsUnit", "_value": "$blur_amount"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_diffuse_glow",
+        """
+        Applies Diffuse Glow filter. Adds dreamy, soft glow using background color.
+
+        Args:
+            layer_id: ID of the layer
+            graininess: Grain amount (0-10). Default 6.
+            glow_amount: Glow intensity (0-20). Default 10.
+            clear_amount: Clear area amount (0-20). Default 15.
+        """,
+        [
+            _param("graininess", int, 6, bounds=(0, 10)),
+            _param("glow_amount", int, 10, bounds=(0, 20)),
+            _param("clear_amount", int, 15, bounds=(0, 20)),
+        ],
+        [{
+            "_obj": "filterGallery",
+            "filterGallery": {
+                "_obj": "filterGallery",
+                "filterRecord": [{
+                    "_obj": "diffuseGlow",
+                    "graininess": "$graininess",
+                    "glowAmount": "$glow_amount",
+                    "clearAmount": "$clear_amount"
+                }]
+            },
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_glowing_edges",
+        """
+        Applies Glowing Edges filter. Creates neon-like edge outlines.
+
+        Args:
+            layer_id: ID of the layer
+            edge_width: Width of edges (1-14). Default 2.
+            edge_brightness: Brightness of edges (0-20). Default 6.
+            smoothness: Smoothness (1-15). Default 5.
+        """,
+        [
+            _param("edge_width", int, 2, bounds=(1, 14)),
+            _param("edge_brightness", int, 6, bounds=(0, 20)),
+            _param("smoothness", int, 5, bounds=(1, 15)),
+        ],
+        [{
+            "_obj": "filterGallery",
+            "filterGallery": {
+                "_obj": "filterGallery",
+                "filterRecord": [{
+                    "_obj": "glowingEdges",
+                    "edgeWidth": "$edge_width",
+                    "edgeBrightness": "$edge_brightness",
+                    "smoothness": "$smoothness"
+                }]
+            },
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_tiles",
+        """
+        Applies Tiles filter. Breaks image into tiles with offset.
+
+        Args:
+            layer_id: ID of the layer
+            number_of_tiles: Number of tiles (1-99). Default 10.
+            maximum_offset: Max offset percent (1-99). Default 14.
+            fill_empty: Fill for empty areas: 'backgroundColor', 'foregroundColor', 'inverseImage', 'unalteredImage'. Default 'backgroundColor'.
+        """,
+        [
+            _param("number_of_tiles", int, 10, bounds=(1, 99)),
+            _param("maximum_offset", int, 14, bounds=(1, 99)),
+            _param("fill_empty", str, "backgroundColor", choices=("backgroundColor", "foregroundColor", "inverseImage", "unalteredImage")),
+        ],
+        [{
+            "_obj": "tiles",
+            "numberOfTiles": "$number_of_tiles",
+            "maximumOffset": "$maximum_offset",
+            "fillEmptyArea": {"_enum": "fillEmptyArea", "_value": "$fill_empty"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_trace_contour",
+        """
+        Applies Trace Contour filter. Traces edges at a brightness level.
+
+        Args:
+            layer_id: ID of the layer
+            level: Brightness level to trace (0-255). Default 128.
+            edge: 'lower' or 'upper'. Default 'lower'.
+        """,
+        [
+            _param("level", int, 128, bounds=(0, 255)),
+            _param("edge", str, "lower", choices=("lower", "upper")),
+        ],
+        [{
+            "_obj": "traceContour",
+            "level": "$level",
+            "edge": {"_enum": "edge", "_value": "$edge"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_extrude",
+        """
+        Applies Extrude filter. Creates 3D blocks or pyramids from image.
+
+        Args:
+            layer_id: ID of the layer
+            extrude_type: 'blocks' or 'pyramids'. Default 'blocks'.
+            size: Size of elements (2-255). Default 30.
+            depth: Depth (1-255). Default 30.
+            solid_front: Fill front faces with solid color. Default True.
+            mask_incomplete: Mask incomplete blocks. Default False.
+        """,
+        [
+            _param("extrude_type", str, "blocks", choices=("blocks", "pyramids")),
+            _param("size", int, 30, bounds=(2, 255)),
+            _param("depth", int, 30, bounds=(1, 255)),
+            _param("solid_front", bool, True),
+            _param("mask_incomplete", bool, False),
+        ],
+        [{
+            "_obj": "extrude",
+            "extrudeType": {"_enum": "extrudeType", "_value": "$extrude_type"},
+            "extrudeSize": "$size",
+            "extrudeDepth": "$depth",
+            "extrudeSolidFace": "$solid_front",
+            "extrudeMaskIncomplete": "$mask_incomplete",
+            "_isCommand": True
+        }],
+    ),
+
+    # Artistic filters
+    _tool(
+        "apply_colored_pencil",
+        """
+        Applies Colored Pencil artistic filter.
+
+        Args:
+            layer_id: ID of the layer
+            pencil_width: Width of pencil strokes (1-24). Default 4.
+            stroke_pressure: Pressure of strokes (0-15). Default 8.
+            paper_brightness: Paper brightness (0-50). Default 25.
+        """,
+        [
+            _param("pencil_width", int, 4, bounds=(1, 24)),
+            _param("stroke_pressure", int, 8, bounds=(0, 15)),
+            _param("paper_brightness", int, 25, bounds=(0, 50)),
+        ],
+        [{
+            "_obj": "coloredPencil",
+            "pencilWidth": "$pencil_width",
+            "strokePressure": "$stroke_pressure",
+            "paperBrightness": "$paper_brightness",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_cutout",
+        """
+        Applies Cutout artistic filter. Creates a paper cutout appearance.
+
+        Args:
+            layer_id: ID of the layer
+            number_of_levels: Number of levels (2-8). Default 4.
+            edge_simplicity: Edge simplicity (0-10). Default 4.
+            edge_fidelity: Edge fidelity (1-3). Default 2.
+        """,
+        [
+            _param("number_of_levels", int, 4, bounds=(2, 8)),
+            _param("edge_simplicity", int, 4, bounds=(0, 10)),
+            _param("edge_fidelity", int, 2, bounds=(1, 3)),
+        ],
+        [{
+            "_obj": "cutout",
+            "numberOfLevels": "$number_of_levels",
+            "edgeSimplicity": "$edge_simplicity",
+            "edgeFidelity": "$edge_fidelity",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_dry_brush",
+        """
+        Applies Dry Brush artistic filter.
+
+        Args:
+            layer_id: ID of the layer
+            brush_size: Brush size (0-10). Default 2.
+            brush_detail: Detail (0-10). Default 8.
+            texture: Texture (1-3). Default 1.
+        """,
+        [
+            _param("brush_size", int, 2, bounds=(0, 10)),
+            _param("brush_detail", int, 8, bounds=(0, 10)),
+            _param("texture", int, 1, bounds=(1, 3)),
+        ],
+        [{
+            "_obj": "dryBrush",
+            "brushSize": "$brush_size",
+            "brushDetail": "$brush_detail",
+            "texture": "$texture",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_film_grain",
+        """
+        Applies Film Grain artistic filter.
+
+        Args:
+            layer_id: ID of the layer
+            grain: Grain amount (0-20). Default 4.
+            highlight_area: Highlight area (0-20). Default 0.
+            intensity: Intensity (0-10). Default 10.
+        """,
+        [
+            _param("grain", int, 4, bounds=(0, 20)),
+            _param("highlight_area", int, 0, bounds=(0, 20)),
+            _param("intensity", int, 10, bounds=(0, 10)),
+        ],
+        [{
+            "_obj": "filmGrain",
+            "grain": "$grain",
+            "highlightArea": "$highlight_area",
+            "intensity": "$intensity",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_fresco",
+        """
+        Applies Fresco artistic filter.
+
+        Args:
+            layer_id: ID of the layer
+            brush_size: Brush size (0-10). Default 2.
+            brush_detail: Detail (0-10). Default 8.
+            texture: Texture (1-3). Default 1.
+        """,
+        [
+            _param("brush_size", int, 2, bounds=(0, 10)),
+            _param("brush_detail", int, 8, bounds=(0, 10)),
+            _param("texture", int, 1, bounds=(1, 3)),
+        ],
+        [{
+            "_obj": "fresco",
+            "brushSize": "$brush_size",
+            "brushDetail": "$brush_detail",
+            "texture": "$texture",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_neon_glow",
+        """
+        Applies Neon Glow artistic filter.
+
+        Args:
+            layer_id: ID of the layer
+            glow_size: Size of glow (-24 to 24). Default 5.
+            glow_brightness: Brightness (0-50). Default 15.
+            glow_color_red: Glow color red (0-255). Default 228.
+            glow_color_green: Glow color green (0-255). Default 60.
+            glow_color_blue: Glow color blue (0-255). Default 220.
+        """,
+        [
+            _param("glow_size", int, 5, bounds=(-24, 24)),
+            _param("glow_brightness", int, 15, bounds=(0, 50)),
+            _param("glow_color_red", int, 228, bounds=(0, 255)),
+            _param("glow_color_green", int, 60, bounds=(0, 255)),
+            _param("glow_color_blue", int, 220, bounds=(0, 255)),
+        ],
+        [{
+            "_obj": "neonGlow",
+            "glowSize": "$glow_size",
+            "glowBrightness": "$glow_brightness",
+            "glowColor": {
+                "_obj": "RGBColor",
+                "red": "$glow_color_red",
+                "grain": "$glow_color_green",
+                "blue": "$glow_color_blue"
+            },
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_paint_daubs",
+        """
+        Applies Paint Daubs artistic filter.
+
+        Args:
+            layer_id: ID of the layer
+            brush_size: Brush size (1-50). Default 8.
+            sharpness: Sharpness (0-40). Default 7.
+            brush_type: 'simple', 'lightRough', 'darkRough', 'wideSharp', 'wideBlurry', 'sparkle'. Default 'simple'.
+        """,
+        [
+            _param("brush_size", int, 8, bounds=(1, 50)),
+            _param("sharpness", int, 7, bounds=(0, 40)),
+            _param("brush_type", str, "simple", choices=("simple", "lightRough", "darkRough", "wideSharp", "wideBlurry", "sparkle")),
+        ],
+        [{
+            "_obj": "paintDaubs",
+            "brushSize": "$brush_size",
+            "sharpness": "$sharpness",
+            "brushType": {"_enum": "brushType", "_value": "$brush_type"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_palette_knife",
+        """
+        Applies Palette Knife artistic filter.
+
+        Args:
+            layer_id: ID of the layer
+            stroke_size: Stroke size (1-50). Default 12.
+            stroke_detail: Stroke detail (1-3). Default 3.
+            softness: Softness (0-10). Default 0.
+        """,
+        [
+            _param("stroke_size", int, 12, bounds=(1, 50)),
+            _param("stroke_detail", int, 3, bounds=(1, 3)),
+            _param("softness", int, 0, bounds=(0, 10)),
+        ],
+        [{
+            "_obj": "paletteKnife",
+            "strokeSize": "$stroke_size",
+            "strokeDetail": "$stroke_detail",
+            "softness": "$softness",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_poster_edges",
+        """
+        Applies Poster Edges artistic filter.
+
+        Args:
+            layer_id: ID of the layer
+            edge_thickness: Edge thickness (0-10). Default 2.
+            edge_intensity: Edge intensity (0-10). Default 1.
+            posterization: Posterization (0-6). Default 2.
+        """,
+        [
+            _param("edge_thickness", int, 2, bounds=(0, 10)),
+            _param("edge_intensity", int, 1, bounds=(0, 10)),
+            _param("posterization", int, 2, bounds=(0, 6)),
+        ],
+        [{
+            "_obj": "posterEdges",
+            "edgeThickness": "$edge_thickness",
+            "edgeIntensity": "$edge_intensity",
+            "posterization": "$posterization",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_rough_pastels",
+        """
+        Applies Rough Pastels artistic filter.
+
+        Args:
+            layer_id: ID of the layer
+            stroke_length: Stroke length (0-40). Default 6.
+            stroke_detail: Detail (1-20). Default 4.
+            texture: 'brick', 'burlap', 'canvas', 'sandstone'. Default 'canvas'.
+            scaling: Texture scaling (50-200). Default 100.
+            relief: Relief depth (0-50). Default 20.
+            light_direction: 'topLeft', 'top', 'topRight', 'left', 'bottomLeft', 'bottom', 'bottomRight', 'right'. Default 'topLeft'.
+            invert_texture: Invert texture. Default False.
+        """,
+        [
+            _param("stroke_length", int, 6, bounds=(0, 40)),
+            _param("stroke_detail", int, 4, bounds=(1, 20)),
+            _param("texture", str, "canvas", choices=("brick", "burlap", "canvas", "sandstone")),
+            _param("scaling", int, 100, bounds=(50, 200)),
+            _param("relief", int, 20, bounds=(0, 50)),
+            _param("light_direction", str, "topLeft", choices=("topLeft", "top", "topRight", "left", "bottomLeft", "bottom", "bottomRight", "right")),
+            _param("invert_texture", bool, False),
+        ],
+        [{
+            "_obj": "roughPastels",
+            "strokeLength": "$stroke_length",
+            "strokeDetail": "$stroke_detail",
+            "texture": {"_enum": "texture", "_value": "$texture"},
+            "scaling": "$scaling",
+            "relief": "$relief",
+            "lightDirection": {"_enum": "lightDirection", "_value": "$light_direction"},
+            "invertTexture": "$invert_texture",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_smudge_stick",
+        """
+        Applies Smudge Stick artistic filter.
+
+        Args:
+            layer_id: ID of the layer
+            stroke_length: Stroke length (0-10). Default 2.
+            highlight_area: Highlight area (0-20). Default 12.
+            intensity: Intensity (0-10). Default 10.
+        """,
+        [
+            _param("stroke_length", int, 2, bounds=(0, 10)),
+            _param("highlight_area", int, 12, bounds=(0, 20)),
+            _param("intensity", int, 10, bounds=(0, 10)),
+        ],
+        [{
+            "_obj": "smudgeStick",
+            "strokeLength": "$stroke_length",
+            "highlightArea": "$highlight_area",
+            "intensity": "$intensity",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_sponge_filter",
+        """
+        Applies Sponge artistic filter.
+
+        Args:
+            layer_id: ID of the layer
+            brush_size: Brush size (0-10). Default 2.
+            definition: Definition (0-25). Default 12.
+            smoothness: Smoothness (1-15). Default 5.
+        """,
+        [
+            _param("brush_size", int, 2, bounds=(0, 10)),
+            _param("definition", int, 12, bounds=(0, 25)),
+            _param("smoothness", int, 5, bounds=(1, 15)),
+        ],
+        [{
+            "_obj": "sponge",
+            "brushSize": "$brush_size",
+            "definition": "$definition",
+            "smoothness": "$smoothness",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_underpainting",
+        """
+        Applies Underpainting artistic filter.
+
+        Args:
+            layer_id: ID of the layer
+            brush_size: Brush size (0-40). Default 2.
+            texture_coverage: Texture coverage (0-40). Default 1.
+            texture: 'brick', 'burlap', 'canvas', 'sandstone'. Default 'canvas'.
+            scaling: Texture scaling (50-200). Default 100.
+            relief: Relief depth (0-50). Default 4.
+            light_direction: Light direction. Default 'topLeft'.
+            invert_texture: Invert texture. Default False.
+        """,
+        [
+            _param("brush_size", int, 2, bounds=(0, 40)),
+            _param("texture_coverage", int, 1, bounds=(0, 40)),
+            _param("texture", str, "canvas", choices=("brick", "burlap", "canvas", "sandstone")),
+            _param("scaling", int, 100, bounds=(50, 200)),
+            _param("relief", int, 4, bounds=(0, 50)),
+            _param("light_direction", str, "topLeft"),
+            _param("invert_texture", bool, False),
+        ],
+        [{
+            "_obj": "underpainting",
+            "brushSize": "$brush_size",
+            "textureCoverage": "$texture_coverage",
+            "texture": {"_enum": "texture", "_value": "$texture"},
+            "scaling": "$scaling",
+            "relief": "$relief",
+            "lightDirection": {"_enum": "lightDirection", "_value": "$light_direction"},
+            "invertTexture": "$invert_texture",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_watercolor",
+        """
+        Applies Watercolor artistic filter.
+
+        Args:
+            layer_id: ID of the layer
+            brush_detail: Brush detail (1-14). Default 14.
+            shadow_intensity: Shadow intensity (0-10). Default 0.
+            texture: Texture (1-3). Default 1.
+        """,
+        [
+            _param("brush_detail", int, 14, bounds=(1, 14)),
+            _param("shadow_intensity", int, 0, bounds=(0, 10)),
+            _param("texture", int, 1, bounds=(1, 3)),
+        ],
+        [{
+            "_obj": "watercolor",
+            "brushDetail": "$brush_detail",
+            "shadowIntensity": "$shadow_intensity",
+            "texture": "$texture",
+            "_isCommand": True
+        }],
+    ),
+
+    # Sketch filters
+    _tool(
+        "apply_bas_relief",
+        """
+        Applies Bas Relief sketch filter.
+
+        Args:
+            layer_id: ID of the layer
+            detail: Detail (1-15). Default 13.
+            smoothness: Smoothness (1-15). Default 3.
+            light_direction: Light direction. Default 'bottomLeft'.
+        """,
+        [
+            _param("detail", int, 13, bounds=(1, 15)),
+            _param("smoothness", int, 3, bounds=(1, 15)),
+            _param("light_direction", str, "bottomLeft"),
+        ],
+        [{
+            "_obj": "basRelief",
+            "detail": "$detail",
+            "smoothness": "$smoothness",
+            "lightDirection": {"_enum": "lightDirection", "_value": "$light_direction"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_chalk_and_charcoal",
+        """
+        Applies Chalk & Charcoal sketch filter.
+
+        Args:
+            layer_id: ID of the layer
+            chalk_area: Chalk area (0-20). Default 6.
+            charcoal_area: Charcoal area (0-20). Default 6.
+            stroke_pressure: Stroke pressure (0-5). Default 1.
+        """,
+        [
+            _param("chalk_area", int, 6, bounds=(0, 20)),
+            _param("charcoal_area", int, 6, bounds=(0, 20)),
+            _param("stroke_pressure", int, 1, bounds=(0, 5)),
+        ],
+        [{
+            "_obj": "chalkCharcoal",
+            "chalkArea": "$chalk_area",
+            "charcoalArea": "$charcoal_area",
+            "strokePressure": "$stroke_pressure",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_charcoal",
+        """
+        Applies Charcoal sketch filter.
+
+        Args:
+            layer_id: ID of the layer
+            charcoal_thickness: Thickness (1-7). Default 1.
+            detail: Detail (0-5). Default 5.
+            light_dark_balance: Balance (0-100). Default 50.
+        """,
+        [
+            _param("charcoal_thickness", int, 1, bounds=(1, 7)),
+            _param("detail", int, 5, bounds=(0, 5)),
+            _param("light_dark_balance", int, 50, bounds=(0, 100)),
+        ],
+        [{
+            "_obj": "charcoal",
+            "charcoalThickness": "$charcoal_thickness",
+            "detail": "$detail",
+            "lightDarkBalance": "$light_dark_balance",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_graphic_pen",
+        """
+        Applies Graphic Pen sketch filter.
+
+        Args:
+            layer_id: ID of the layer
+            stroke_length: Stroke length (1-15). Default 15.
+            light_dark_balance: Balance (0-100). Default 50.
+            stroke_direction: 'rightDiagonal', 'horizontal', 'leftDiagonal', 'vertical'. Default 'rightDiagonal'.
+        """,
+        [
+            _param("stroke_length", int, 15, bounds=(1, 15)),
+            _param("light_dark_balance", int, 50, bounds=(0, 100)),
+            _param("stroke_direction", str, "rightDiagonal", choices=("rightDiagonal", "horizontal", "leftDiagonal", "vertical")),
+        ],
+        [{
+            "_obj": "graphicPen",
+            "strokeLength": "$stroke_length",
+            "lightDarkBalance": "$light_dark_balance",
+            "strokeDirection": {"_enum": "strokeDirection", "_value": "$stroke_direction"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_halftone_pattern",
+        """
+        Applies Halftone Pattern sketch filter.
+
+        Args:
+            layer_id: ID of the layer
+            size: Pattern size (1-12). Default 1.
+            contrast: Contrast (0-50). Default 5.
+            pattern_type: 'dot', 'circle', or 'line'. Default 'dot'.
+        """,
+        [
+            _param("size", int, 1, bounds=(1, 12)),
+            _param("contrast", int, 5, bounds=(0, 50)),
+            _param("pattern_type", str, "dot", choices=("dot", "circle", "line")),
+        ],
+        [{
+            "_obj": "halftoneScreen",
+            "size": "$size",
+            "contrast": "$contrast",
+            "halftoneScreenPatternType": {"_enum": "halftoneScreenPatternType", "_value": "$pattern_type"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_note_paper",
+        """
+        Applies Note Paper sketch filter.
+
+        Args:
+            layer_id: ID of the layer
+            image_balance: Image balance (0-50). Default 25.
+            graininess: Graininess (0-20). Default 10.
+            relief: Relief (0-25). Default 11.
+        """,
+        [
+            _param("image_balance", int, 25, bounds=(0, 50)),
+            _param("graininess", int, 10, bounds=(0, 20)),
+            _param("relief", int, 11, bounds=(0, 25)),
+        ],
+        [{
+            "_obj": "notePaper",
+            "imageBalance": "$image_balance",
+            "graininess": "$graininess",
+            "relief": "$relief",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_photocopy",
+        """
+        Applies Photocopy sketch filter.
+
+        Args:
+            layer_id: ID of the layer
+            detail: Detail (1-24). Default 7.
+            darkness: Darkness (1-50). Default 8.
+        """,
+        [
+            _param("detail", int, 7, bounds=(1, 24)),
+            _param("darkness", int, 8, bounds=(1, 50)),
+        ],
+        [{
+            "_obj": "photocopy",
+            "detail": "$detail",
+            "darkness": "$darkness",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_plaster",
+        """
+        Applies Plaster sketch filter.
+
+        Args:
+            layer_id: ID of the layer
+            image_balance: Image balance (0-50). Default 20.
+            smoothness: Smoothness (1-15). Default 2.
+            light_direction: Light direction. Default 'topLeft'.
+        """,
+        [
+            _param("image_balance", int, 20, bounds=(0, 50)),
+            _param("smoothness", int, 2, bounds=(1, 15)),
+            _param("light_direction", str, "topLeft"),
+        ],
+        [{
+            "_obj": "plaster",
+            "imageBalance": "$image_balance",
+            "smoothness": "$smoothness",
+            "lightDirection": {"_enum": "lightDirection", "_value": "$light_direction"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_reticulation",
+        """
+        Applies Reticulation sketch filter.
+
+        Args:
+            layer_id: ID of the layer
+            density: Density (0-50). Default 12.
+            foreground_level: Foreground level (0-50). Default 40.
+            background_level: Background level (0-50). Default 5.
+        """,
+        [
+            _param("density", int, 12, bounds=(0, 50)),
+            _param("foreground_level", int, 40, bounds=(0, 50)),
+            _param("background_level", int, 5, bounds=(0, 50)),
+        ],
+        [{
+            "_obj": "reticulation",
+            "density": "$density",
+            "foregroundLevel": "$foreground_level",
+            "backgroundLevel": "$background_level",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_stamp_filter",
+        """
+        Applies Stamp sketch filter.
+
+        Args:
+            layer_id: ID of the layer
+            light_dark_balance: Balance (0-50). Default 25.
+            smoothness: Smoothness (1-50). Default 5.
+        """,
+        [
+            _param("light_dark_balance", int, 25, bounds=(0, 50)),
+            _param("smoothness", int, 5, bounds=(1, 50)),
+        ],
+        [{
+            "_obj": "stamp",
+            "lightDarkBalance": "$light_dark_balance",
+            "smoothness": "$smoothness",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_torn_edges",
+        """
+        Applies Torn Edges sketch filter.
+
+        Args:
+            layer_id: ID of the layer
+            image_balance: Image balance (0-50). Default 25.
+            smoothness: Smoothness (1-15). Default 11.
+            contrast: Contrast (1-25). Default 17.
+        """,
+        [
+            _param("image_balance", int, 25, bounds=(0, 50)),
+            _param("smoothness", int, 11, bounds=(1, 15)),
+            _param("contrast", int, 17, bounds=(1, 25)),
+        ],
+        [{
+            "_obj": "tornEdges",
+            "imageBalance": "$image_balance",
+            "smoothness": "$smoothness",
+            "contrast": "$contrast",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_water_paper",
+        """
+        Applies Water Paper sketch filter.
+
+        Args:
+            layer_id: ID of the layer
+            fiber_length: Fiber length (3-50). Default 15.
+            brightness: Brightness (0-100). Default 60.
+            contrast: Contrast (0-100). Default 80.
+        """,
+        [
+            _param("fiber_length", int, 15, bounds=(3, 50)),
+            _param("brightness", int, 60, bounds=(0, 100)),
+            _param("contrast", int, 80, bounds=(0, 100)),
+        ],
+        [{
+            "_obj": "waterPaper",
+            "fiberLength": "$fiber_length",
+            "brightness": "$brightness",
+            "contrast": "$contrast",
+            "_isCommand": True
+        }],
+    ),
+
+    # Brush stroke filters
+    _tool(
+        "apply_accented_edges",
+        """
+        Applies Accented Edges brush stroke filter.
+
+        Args:
+            layer_id: ID of the layer
+            edge_width: Edge width (1-14). Default 2.
+            edge_brightness: Edge brightness (0-50). Default 38.
+            smoothness: Smoothness (1-15). Default 5.
+        """,
+        [
+            _param("edge_width", int, 2, bounds=(1, 14)),
+            _param("edge_brightness", int, 38, bounds=(0, 50)),
+            _param("smoothness", int, 5, bounds=(1, 15)),
+        ],
+        [{
+            "_obj": "accentedEdges",
+            "edgeWidth": "$edge_width",
+            "edgeBrightness": "$edge_brightness",
+            "smoothness": "$smoothness",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_angled_strokes",
+        """
+        Applies Angled Strokes brush stroke filter.
+
+        Args:
+            layer_id: ID of the layer
+            direction_balance: Direction balance (0-100). Default 50.
+            stroke_length: Stroke length (3-50). Default 15.
+            sharpness: Sharpness (0-10). Default 3.
+        """,
+        [
+            _param("direction_balance", int, 50, bounds=(0, 100)),
+            _param("stroke_length", int, 15, bounds=(3, 50)),
+            _param("sharpness", int, 3, bounds=(0, 10)),
+        ],
+        [{
+            "_obj": "angledStrokes",
+            "directionBalance": "$direction_balance",
+            "strokeLength": "$stroke_length",
+            "sharpness": "$sharpness",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_crosshatch",
+        """
+        Applies Crosshatch brush stroke filter.
+
+        Args:
+            layer_id: ID of the layer
+            stroke_length: Stroke length (3-50). Default 9.
+            sharpness: Sharpness (0-20). Default 6.
+            strength: Strength (1-3). Default 1.
+        """,
+        [
+            _param("stroke_length", int, 9, bounds=(3, 50)),
+            _param("sharpness", int, 6, bounds=(0, 20)),
+            _param("strength", int, 1, bounds=(1, 3)),
+        ],
+        [{
+            "_obj": "crosshatch",
+            "strokeLength": "$stroke_length",
+            "sharpness": "$sharpness",
+            "strength": "$strength",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_dark_strokes",
+        """
+        Applies Dark Strokes brush stroke filter.
+
+        Args:
+            layer_id: ID of the layer
+            balance: Balance (0-10). Default 5.
+            black_intensity: Black intensity (0-10). Default 6.
+            white_intensity: White intensity (0-10). Default 2.
+        """,
+        [
+            _param("balance", int, 5, bounds=(0, 10)),
+            _param("black_intensity", int, 6, bounds=(0, 10)),
+            _param("white_intensity", int, 2, bounds=(0, 10)),
+        ],
+        [{
+            "_obj": "darkStrokes",
+            "balance": "$balance",
+            "blackIntensity": "$black_intensity",
+            "whiteIntensity": "$white_intensity",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_ink_outlines",
+        """
+        Applies Ink Outlines brush stroke filter.
+
+        Args:
+            layer_id: ID of the layer
+            stroke_length: Stroke length (1-50). Default 4.
+            dark_intensity: Dark intensity (0-50). Default 20.
+            light_intensity: Light intensity (0-50). Default 10.
+        """,
+        [
+            _param("stroke_length", int, 4, bounds=(1, 50)),
+            _param("dark_intensity", int, 20, bounds=(0, 50)),
+            _param("light_intensity", int, 10, bounds=(0, 50)),
+        ],
+        [{
+            "_obj": "inkOutlines",
+            "strokeLength": "$stroke_length",
+            "darkIntensity": "$dark_intensity",
+            "lightIntensity": "$light_intensity",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_spatter",
+        """
+        Applies Spatter brush stroke filter.
+
+        Args:
+            layer_id: ID of the layer
+            spray_radius: Spray radius (0-25). Default 10.
+            smoothness: Smoothness (1-15). Default 5.
+        """,
+        [
+            _param("spray_radius", int, 10, bounds=(0, 25)),
+            _param("smoothness", int, 5, bounds=(1, 15)),
+        ],
+        [{
+            "_obj": "spatter",
+            "sprayRadius": "$spray_radius",
+            "smoothness": "$smoothness",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_sprayed_strokes",
+        """
+        Applies Sprayed Strokes brush stroke filter.
+
+        Args:
+            layer_id: ID of the layer
+            stroke_length: Stroke length (0-20). Default 12.
+            spray_radius: Spray radius (0-25). Default 7.
+            stroke_direction: 'rightDiagonal', 'horizontal', 'leftDiagonal', 'vertical'. Default 'rightDiagonal'.
+        """,
+        [
+            _param("stroke_length", int, 12, bounds=(0, 20)),
+            _param("spray_radius", int, 7, bounds=(0, 25)),
+            _param("stroke_direction", str, "rightDiagonal", choices=("rightDiagonal", "horizontal", "leftDiagonal", "vertical")),
+        ],
+        [{
+            "_obj": "sprayedStrokes",
+            "strokeLength": "$stroke_length",
+            "sprayRadius": "$spray_radius",
+            "strokeDirection": {"_enum": "strokeDirection", "_value": "$stroke_direction"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_sumi_e",
+        """
+        Applies Sumi-e brush stroke filter.
+
+        Args:
+            layer_id: ID of the layer
+            stroke_width: Stroke width (3-15). Default 3.
+            stroke_pressure: Stroke pressure (0-15). Default 2.
+            contrast: Contrast (0-40). Default 16.
+        """,
+        [
+            _param("stroke_width", int, 3, bounds=(3, 15)),
+            _param("stroke_pressure", int, 2, bounds=(0, 15)),
+            _param("contrast", int, 16, bounds=(0, 40)),
+        ],
+        [{
+            "_obj": "sumie",
+            "strokeWidth": "$stroke_width",
+            "strokePressure": "$stroke_pressure",
+            "contrast": "$contrast",
+            "_isCommand": True
+        }],
+    ),
+
+    # Texture filters
+    _tool(
+        "apply_craquelure",
+        """
+        Applies Craquelure texture filter.
+
+        Args:
+            layer_id: ID of the layer
+            crack_spacing: Spacing (2-100). Default 15.
+            crack_depth: Depth (1-10). Default 6.
+            crack_brightness: Brightness (0-10). Default 9.
+        """,
+        [
+            _param("crack_spacing", int, 15, bounds=(2, 100)),
+            _param("crack_depth", int, 6, bounds=(1, 10)),
+            _param("crack_brightness", int, 9, bounds=(0, 10)),
+        ],
+        [{
+            "_obj": "craquelure",
+            "crackSpacing": "$crack_spacing",
+            "crackDepth": "$crack_depth",
+            "crackBrightness": "$crack_brightness",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_grain",
+        """
+        Applies Grain texture filter.
+
+        Args:
+            layer_id: ID of the layer
+            intensity: Intensity (0-100). Default 40.
+            contrast: Contrast (0-100). Default 50.
+            grain_type: 'regular', 'soft', 'sprinkles', 'clumped', 'contrasty', 'enlarged', 'stippled', 'horizontal', 'vertical', 'speckle'. Default 'regular'.
+        """,
+        [
+            _param("intensity", int, 40, bounds=(0, 100)),
+            _param("contrast", int, 50, bounds=(0, 100)),
+            _param("grain_type", str, "regular", choices=("regular", "soft", "sprinkles", "clumped", "contrasty", "enlarged", "stippled", "horizontal", "vertical", "speckle")),
+        ],
+        [{
+            "_obj": "grain",
+            "intensity": "$intensity",
+            "contrast": "$contrast",
+            "grainType": {"_enum": "grainType", "_value": "$grain_type"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_patchwork",
+        """
+        Applies Patchwork texture filter.
+
+        Args:
+            layer_id: ID of the layer
+            square_size: Square size (0-10). Default 2.
+            relief: Relief (0-25). Default 5.
+        """,
+        [
+            _param("square_size", int, 2, bounds=(0, 10)),
+            _param("relief", int, 5, bounds=(0, 25)),
+        ],
+        [{
+            "_obj": "patchwork",
+            "squareSize": "$square_size",
+            "relief": "$relief",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_stained_glass",
+        """
+        Applies Stained Glass texture filter.
+
+        Args:
+            layer_id: ID of the layer
+            cell_size: Cell size (2-50). Default 6.
+            border_thickness: Border thickness (1-20). Default 4.
+            light_intensity: Light intensity (0-10). Default 3.
+        """,
+        [
+            _param("cell_size", int, 6, bounds=(2, 50)),
+            _param("border_thickness", int, 4, bounds=(1, 20)),
+            _param("light_intensity", int, 3, bounds=(0, 10)),
+        ],
+        [{
+            "_obj": "stainedGlass",
+            "cellSize": "$cell_size",
+            "borderThickness": "$border_thickness",
+            "lightIntensity": "$light_intensity",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_texturizer",
+        """
+        Applies Texturizer texture filter.
+
+        Args:
+            layer_id: ID of the layer
+            texture: 'brick', 'burlap', 'canvas', 'sandstone'. Default 'canvas'.
+            scaling: Scaling (50-200). Default 100.
+            relief: Relief (0-50). Default 4.
+            light_direction: Light direction. Default 'topLeft'.
+            invert_texture: Invert. Default False.
+        """,
+        [
+            _param("texture", str, "canvas", choices=("brick", "burlap", "canvas", "sandstone")),
+            _param("scaling", int, 100, bounds=(50, 200)),
+            _param("relief", int, 4, bounds=(0, 50)),
+            _param("light_direction", str, "topLeft"),
+            _param("invert_texture", bool, False),
+        ],
+        [{
+            "_obj": "texturizer",
+            "texture": {"_enum": "texture", "_value": "$texture"},
+            "scaling": "$scaling",
+            "relief": "$relief",
+            "lightDirection": {"_enum": "lightDirection", "_value": "$light_direction"},
+            "invertTexture": "$invert_texture",
+            "_isCommand": True
+        }],
+    ),
+
+    # Pixelate filters
+    _tool(
+        "apply_facet",
+        """
+        Applies Facet pixelate filter. Groups similar pixels into flat-colored blocks.
+
+        Args:
+            layer_id: ID of the layer
+        """,
+        [],
+        [{"_obj": "facet", "_isCommand": True}],
+    ),
+    _tool(
+        "apply_fragment",
+        """
+        Applies Fragment pixelate filter. Creates four offset copies for a motion effect.
+
+        Args:
+            layer_id: ID of the layer
+        """,
+        [],
+        [{"_obj": "fragment", "_isCommand": True}],
+    ),
+    _tool(
+        "apply_mezzotint",
+        """
+        Applies Mezzotint pixelate filter.
+
+        Args:
+            layer_id: ID of the layer
+            mezzotint_type: 'fineDots', 'mediumDots', 'grainyDots', 'coarseDots', 'shortLines', 'mediumLines', 'longLines', 'shortStrokes', 'mediumStrokes', 'longStrokes'. Default 'mediumDots'.
+        """,
+        [
+            _param("mezzotint_type", str, "mediumDots", choices=("fineDots", "mediumDots", "grainyDots", "coarseDots", "shortLines", "mediumLines", "longLines", "shortStrokes", "mediumStrokes", "longStrokes")),
+        ],
+        [{
+            "_obj": "mezzotint",
+            "mezzotintType": {"_enum": "mezzotintType", "_value": "$mezzotint_type"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_pointillize",
+        """
+        Applies Pointillize pixelate filter. Creates a pointillist painting effect.
+
+        Args:
+            layer_id: ID of the layer
+            cell_size: Cell size (3-300). Default 5.
+        """,
+        [
+            _param("cell_size", int, 5, bounds=(3, 300)),
+        ],
+        [{
+            "_obj": "pointillize",
+            "cellSize": "$cell_size",
+            "_isCommand": True
+        }],
+    ),
+
+    # Render filters
+    _tool(
+        "apply_clouds",
+        """
+        Renders Clouds using foreground and background colors. Fills entire layer.
+
+        Args:
+            layer_id: ID of the layer
+        """,
+        [],
+        [{"_obj": "clouds", "_isCommand": True}],
+    ),
+    _tool(
+        "apply_difference_clouds",
+        """
+        Renders Difference Clouds. Like clouds but blended with existing content using difference mode.
+
+        Args:
+            layer_id: ID of the layer
+        """,
+        [],
+        [{"_obj": "differenceClouds", "_isCommand": True}],
+    ),
+    _tool(
+        "apply_fibers",
+        """
+        Renders Fibers using foreground and background colors.
+
+        Args:
+            layer_id: ID of the layer
+            variance: Variance (0-64). Default 16.
+            strength: Strength (0-10). Default 4.
+        """,
+        [
+            _param("variance", int, 16, bounds=(0, 64)),
+            _param("strength", int, 4, bounds=(0, 10)),
+        ],
+        [{
+            "_obj": "fibers",
+            "variance": "$variance",
+            "strength": "$strength",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_lens_flare",
+        """
+        Renders Lens Flare effect.
+
+        Args:
+            layer_id: ID of the layer
+            brightness: Brightness (10-300). Default 100.
+            flare_center_x: Flare center X pixel coordinate. Default 500.
+            flare_center_y: Flare center Y pixel coordinate. Default 300.
+            lens_type: '50-300mmZoom' or 'zoomLens' or 'moviePrime' or '105mmPrime'. Default 'zoomLens'.
+        """,
+        [
+            _param("brightness", int, 100, bounds=(10, 300)),
+            _param("flare_center_x", int, 500),
+            _param("flare_center_y", int, 300),
+            _param("lens_type", str, "zoomLens", choices=("50-300mmZoom", "zoomLens", "moviePrime", "105mmPrime")),
+        ],
+        [{
+            "_obj": "lensFlare",
+            "brightness": "$brightness",
+            "flareCenter": {
+                "_obj": "paint",
+                "horizontal": {"_unit": "pixelsUnit", "_value": "$flare_center_x"},
+                "vertical": {"_unit": "pixelsUnit", "_value": "$flare_center_y"}
+            },
+            "lensType": {"_enum": "lensType", "_value": "$lens_type"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_reduce_noise",
+        """
+        Applies Reduce Noise filter.
+
+        Args:
+            layer_id: ID of the layer
+            strength: Noise reduction strength (0-10). Default 6.
+            preserve_details: Preserve details percent (0-100). Default 60.
+            reduce_color_noise: Color noise reduction (0-100). Default 60.
+            sharpen_details: Sharpen details (0-100). Default 25.
+        """,
+        [
+            _param("strength", int, 6, bounds=(0, 10)),
+            _param("preserve_details", int, 60, bounds=(0, 100)),
+            _param("reduce_color_noise", int, 60, bounds=(0, 100)),
+            _param("sharpen_details", int, 25, bounds=(0, 100)),
+        ],
+        [{
+            "_obj": "denoise",
+            "strength": "$strength",
+            "preserveDetails": "$preserve_details",
+            "reduceColorNoise": "$reduce_color_noise",
+            "sharpenDetails": "$sharpen_details",
+            "_isCommand": True
+        }],
+    ),
+
+    # Other filters (maximum, minimum, offset, custom)
+    _tool(
+        "apply_maximum",
+        """
+        Applies Maximum filter. Expands bright areas / shrinks dark areas.
+
+        Args:
+            layer_id: ID of the layer
+            radius: Radius in pixels (1-100). Default 1.
+        """,
+        [
+            _param("radius", int, 1, bounds=(1, 100), cast=float),
+        ],
+        [{
+            "_obj": "maximum",
+            "radius": {"_unit": "pixelsUnit", "_value": "$radius"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_minimum",
+        """
+        Applies Minimum filter. Shrinks bright areas / expands dark areas.
+
+        Args:
+            layer_id: ID of the layer
+            radius: Radius in pixels (1-100). Default 1.
+        """,
+        [
+            _param("radius", int, 1, bounds=(1, 100), cast=float),
+        ],
+        [{
+            "_obj": "minimum",
+            "radius": {"_unit": "pixelsUnit", "_value": "$radius"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_offset_filter",
+        """
+        Applies Offset filter. Shifts the layer content.
+
+        Args:
+            layer_id: ID of the layer
+            horizontal: Horizontal offset in pixels. Default 0.
+            vertical: Vertical offset in pixels. Default 0.
+            undefined_area: 'wrapAround', 'repeatEdgePixels', or 'setToTransparent'. Default 'wrapAround'.
+        """,
+        [
+            _param("horizontal", int, 0),
+            _param("vertical", int, 0),
+            _param("undefined_area", str, "wrapAround", choices=("wrapAround", "repeatEdgePixels", "setToTransparent")),
+        ],
+        [{
+            "_obj": "offset",
+            "horizontal": {"_unit": "pixelsUnit", "_value": "$horizontal"},
+            "vertical": {"_unit": "pixelsUnit", "_value": "$vertical"},
+            "undefinedArea": {"_enum": "undefinedArea", "_value": "$undefined_area"},
+            "_isCommand": True
+        }],
+    ),
+
+    # Adjustments
+    _tool(
+        "apply_desaturate",
+        """
+        Applies Desaturate (Image > Adjustments > Desaturate). Removes all color.
+
+        Args:
+            layer_id: ID of the layer
+        """,
+        [],
+        [{"_obj": "desaturate", "_isCommand": True}],
+    ),
+    _tool(
+        "apply_equalize",
+        """
+        Applies Equalize adjustment. Redistributes brightness values evenly.
+
+        Args:
+            layer_id: ID of the layer
+        """,
+        [],
+        [{"_obj": "equalize", "_isCommand": True}],
+    ),
+    _tool(
+        "apply_invert_image",
+        """
+        Applies direct Invert to layer pixels (Image > Adjustments > Invert). Not an adjustment layer.
+
+        Args:
+            layer_id: ID of the layer
+        """,
+        [],
+        [{"_obj": "invert", "_isCommand": True}],
+    ),
+    _tool(
+        "apply_posterize_direct",
+        """
+        Applies Posterize directly to layer pixels (not adjustment layer).
+
+        Args:
+            layer_id: ID of the layer
+            levels: Tonal levels (2-255). Default 4.
+        """,
+        [
+            _param("levels", int, 4, bounds=(2, 255)),
+        ],
+        [{
+            "_obj": "posterize",
+            "levels": "$levels",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_threshold_direct",
+        """
+        Applies Threshold directly to layer pixels (not adjustment layer).
+
+        Args:
+            layer_id: ID of the layer
+            level: Threshold level (1-255). Default 128.
+        """,
+        [
+            _param("level", int, 128, bounds=(1, 255)),
+        ],
+        [{
+            "_obj": "threshold",
+            "level": "$level",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_match_color",
+        """
+        Applies Match Color adjustment.
+
+        Args:
+            layer_id: ID of the layer
+            luminance: Luminance (1-200). Default 100.
+            color_intensity: Color intensity (1-200). Default 100.
+            fade: Fade amount (0-100). Default 0.
+            neutralize: Neutralize color cast. Default False.
+        """,
+        [
+            _param("luminance", int, 100, bounds=(1, 200)),
+            _param("color_intensity", int, 100, bounds=(1, 200)),
+            _param("fade", int, 0, bounds=(0, 100)),
+            _param("neutralize", bool, False),
+        ],
+        [{
+            "_obj": "matchColor",
+            "luminance": "$luminance",
+            "colorIntensity": "$color_intensity",
+            "fade": "$fade",
+            "neutralize": "$neutralize",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_replace_color",
+        """
+        Applies Replace Color adjustment. Replaces a sampled color with new HSL values.
+
+        Args:
+            layer_id: ID of the layer
+            fuzziness: Color selection tolerance (0-200). Default 40.
+            hue: New hue shift (-180 to 180). Default 0.
+            saturation: New saturation (-100 to 100). Default 0.
+            lightness: New lightness (-100 to 100). Default 0.
+            sample_color_red: Sample color red (0-255). Default 255.
+            sample_color_green: Sample color green (0-255). Default 0.
+            sample_color_blue: Sample color blue (0-255). Default 0.
+        """,
+        [
+            _param("fuzziness", int, 40, bounds=(0, 200)),
+            _param("hue", int, 0, bounds=(-180, 180)),
+            _param("saturation", int, 0, bounds=(-100, 100)),
+            _param("lightness", int, 0, bounds=(-100, 100)),
+            _param("sample_color_red", int, 255, bounds=(0, 255)),
+            _param("sample_color_green", int, 0, bounds=(0, 255)),
+            _param("sample_color_blue", int, 0, bounds=(0, 255)),
+        ],
+        [{
+            "_obj": "replaceColor",
+            "fuzziness": "$fuzziness",
+            "hue": "$hue",
+            "saturation": "$saturation",
+            "lightness": "$lightness",
+            "color": {
+                "_obj": "RGBColor",
+                "red": "$sample_color_red",
+                "grain": "$sample_color_green",
+                "blue": "$sample_color_blue"
+            },
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "add_color_lookup_adjustment_layer",
+        """
+        Adds a Color Lookup (LUT) adjustment layer.
+
+        Args:
+            layer_id: ID of the layer to apply to
+            lut_name: Name of the LUT file (e.g., 'Crisp_Warm.look', 'EdgyAmber.3DL', 'FallColors.look', 'Filmstock_50.3DL', 'LateSunset.3DL', 'Moonlight.3DL', 'NightFromDay.CUBE', 'Teal_Orange_Plus_Contrast.look'). Default 'Crisp_Warm.look'.
+        """,
+        [
+            _param("lut_name", str, "Crisp_Warm.look"),
+        ],
+        [{
+            "_obj": "make",
+            "_target": [{"_ref": "adjustmentLayer"}],
+            "using": {
+                "_obj": "adjustmentLayer",
+                "type": {
+                    "_obj": "colorLookup",
+                    "lookupType": {"_enum": "colorLookupType", "_value": "3DLUTFile"},
+                    "name": "$lut_name"
+                }
+            },
+            "_isCommand": True
+        }],
+    ),
+
+    # Layer operations
+    _tool(
+        "apply_layer_mask",
+        """
+        Applies (permanently merges) the layer mask into the layer pixels.
+
+        Args:
+            layer_id: ID of the layer
+        """,
+        [],
+        [{
+            "_obj": "delete",
+            "_target": [{"_ref": "channel", "_enum": "channel", "_value": "mask"}],
+            "apply": True,
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "enable_layer_mask",
+        """
+        Enables or disables a layer mask without deleting it.
+
+        Args:
+            layer_id: ID of the layer
+            enabled: True to enable, False to disable. Default True.
+        """,
+        [
+            _param("enabled", bool, True),
+        ],
+        [{
+            "_obj": "set",
+            "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}],
+            "to": {"_obj": "layer", "userMaskEnabled": "$enabled"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "copy_layer_effects",
+        """
+        Copies layer effects/styles from the specified layer to clipboard.
+
+        Args:
+            layer_id: ID of the source layer
+        """,
+        [],
+        [{
+            "_obj": "copyEffects",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "paste_layer_effects",
+        """
+        Pastes previously copied layer effects/styles onto the specified layer.
+
+        Args:
+            layer_id: ID of the target layer
+        """,
+        [],
+        [{
+            "_obj": "pasteEffects",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "lock_layer",
+        """
+        Locks or unlocks a layer.
+
+        Args:
+            layer_id: ID of the layer
+            lock_all: True to lock all, False to unlock. Default True.
+        """,
+        [
+            _param("lock_all", bool, True),
+        ],
+        [{
+            "_obj": "set",
+            "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}],
+            "to": {
+                "_obj": "layer",
+                "layerLocking": {
+                    "_obj": "layerLocking",
+                    "protectAll": "$lock_all"
+                }
+            },
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "set_layer_color_tag",
+        """
+        Sets the color tag label for a layer in the Layers panel.
+
+        Args:
+            layer_id: ID of the layer
+            color: 'none', 'red', 'orange', 'yellowColor', 'green', 'blue', 'violet', 'gray'. Default 'red'.
+        """,
+        [
+            _param("color", str, "red", choices=("none", "red", "orange", "yellowColor", "green", "blue", "violet", "gray")),
+        ],
+        [{
+            "_obj": "set",
+            "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}],
+            "to": {"_obj": "layer", "color": {"_enum": "color", "_value": "$color"}},
+            "_isCommand": True
+        }],
+    ),
+
+    # Selections
+    _tool(
+        "add_to_selection_rectangle",
+        """
+        Adds a rectangular area to the existing selection.
+
+        Args:
+            layer_id: ID of the layer
+            top: Top bound. Default 0.
+            left: Left bound. Default 0.
+            bottom: Bottom bound. Default 100.
+            right: Right bound. Default 100.
+            feather: Feather radius in pixels. Default 0.
+        """,
+        [
+            _param("top", int, 0),
+            _param("left", int, 0),
+            _param("bottom", int, 100),
+            _param("right", int, 100),
+            _param("feather", int, 0, cast=float),
+        ],
+        [{
+            "_obj": "set",
+            "_target": [{"_ref": "channel", "_property": "selection"}],
+            "to": {
+                "_obj": "rectangle",
+                "top": {"_unit": "pixelsUnit", "_value": "$top"},
+                "left": {"_unit": "pixelsUnit", "_value": "$left"},
+                "bottom": {"_unit": "pixelsUnit", "_value": "$bottom"},
+                "right": {"_unit": "pixelsUnit", "_value": "$right"}
+            },
+            "selectionModifier": {"_enum": "selectionModifierType", "_value": "addToSelection"},
+            "feather": {"_unit": "pixelsUnit", "_value": "$feather"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "subtract_from_selection_rectangle",
+        """
+        Subtracts a rectangular area from the existing selection.
+
+        Args:
+            layer_id: ID of the layer
+            top: Top bound. Default 0.
+            left: Left bound. Default 0.
+            bottom: Bottom bound. Default 100.
+            right: Right bound. Default 100.
+            feather: Feather radius in pixels. Default 0.
+        """,
+        [
+            _param("top", int, 0),
+            _param("left", int, 0),
+            _param("bottom", int, 100),
+            _param("right", int, 100),
+            _param("feather", int, 0, cast=float),
+        ],
+        [{
+            "_obj": "set",
+            "_target": [{"_ref": "channel", "_property": "selection"}],
+            "to": {
+                "_obj": "rectangle",
+                "top": {"_unit": "pixelsUnit", "_value": "$top"},
+                "left": {"_unit": "pixelsUnit", "_value": "$left"},
+                "bottom": {"_unit": "pixelsUnit", "_value": "$bottom"},
+                "right": {"_unit": "pixelsUnit", "_value": "$right"}
+            },
+            "selectionModifier": {"_enum": "selectionModifierType", "_value": "removeFromSelection"},
+            "feather": {"_unit": "pixelsUnit", "_value": "$feather"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "intersect_selection_rectangle",
+        """
+        Intersects a rectangular area with the existing selection.
+
+        Args:
+            layer_id: ID of the layer
+            top: Top bound. Default 0.
+            left: Left bound. Default 0.
+            bottom: Bottom bound. Default 100.
+            right: Right bound. Default 100.
+            feather: Feather radius in pixels. Default 0.
+        """,
+        [
+            _param("top", int, 0),
+            _param("left", int, 0),
+            _param("bottom", int, 100),
+            _param("right", int, 100),
+            _param("feather", int, 0, cast=float),
+        ],
+        [{
+            "_obj": "set",
+            "_target": [{"_ref": "channel", "_property": "selection"}],
+            "to": {
+                "_obj": "rectangle",
+                "top": {"_unit": "pixelsUnit", "_value": "$top"},
+                "left": {"_unit": "pixelsUnit", "_value": "$left"},
+                "bottom": {"_unit": "pixelsUnit", "_value": "$bottom"},
+                "right": {"_unit": "pixelsUnit", "_value": "$right"}
+            },
+            "selectionModifier": {"_enum": "selectionModifierType", "_value": "intersectWith"},
+            "feather": {"_unit": "pixelsUnit", "_value": "$feather"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "select_layer_transparency",
+        """
+        Loads a layer's transparency as a selection (Ctrl+click layer thumbnail).
+
+        Args:
+            layer_id: ID of the layer
+        """,
+        [],
+        [{
+            "_obj": "set",
+            "_target": [{"_ref": "channel", "_property": "selection"}],
+            "to": {"_ref": "channel", "_enum": "channel", "_value": "transparencyEnum"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "select_by_magic_wand",
+        """
+        Selects pixels using Magic Wand tool at a specific point.
+
+        Args:
+            layer_id: ID of the layer
+            x: X coordinate of click point. Default 0.
+            y: Y coordinate of click point. Default 0.
+            tolerance: Color tolerance (0-255). Default 32.
+            contiguous: Only select contiguous pixels. Default True.
+            anti_alias: Anti-alias edges. Default True.
+            sample_all_layers: Sample from all layers. Default False.
+        """,
+        [
+            _param("x", int, 0),
+            _param("y", int, 0),
+            _param("tolerance", int, 32, bounds=(0, 255)),
+            _param("contiguous", bool, True),
+            _param("anti_alias", bool, True),
+            _param("sample_all_layers", bool, False),
+        ],
+        [{
+            "_obj": "set",
+            "_target": [{"_ref": "channel", "_property": "selection"}],
+            "to": {
+                "_obj": "point",
+                "horizontal": {"_unit": "pixelsUnit", "_value": "$x"},
+                "vertical": {"_unit": "pixelsUnit", "_value": "$y"}
+            },
+            "tolerance": "$tolerance",
+            "antiAlias": "$anti_alias",
+            "contiguous": "$contiguous",
+            "merged": "$sample_all_layers",
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_skew",
+        """
+        Applies Skew transform to a layer.
+
+        Args:
+            layer_id: ID of the layer
+            horizontal_skew: Horizontal skew in degrees (-89 to 89). Default 0.
+            vertical_skew: Vertical skew in degrees (-89 to 89). Default 0.
+        """,
+        [
+            _param("horizontal_skew", int, 0, bounds=(-89, 89), cast=float),
+            _param("vertical_skew", int, 0, bounds=(-89, 89), cast=float),
+        ],
+        [{
+            "_obj": "transform",
+            "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}],
+            "freeTransformCenterState": {"_enum": "quadCenterState", "_value": "QCSAverage"},
+            "skew": {
+                "_obj": "paint",
+                "horizontal": {"_unit": "angleUnit", "_value": "$horizontal_skew"},
+                "vertical": {"_unit": "angleUnit", "_value": "$vertical_skew"}
+            },
+            "_isCommand": True
+        }],
+    ),
+
+    # Drawing/painting
+    _tool(
+        "apply_dodge_tool",
+        """
+        Applies Dodge tool at a point (lightens area).
+
+        Args:
+            layer_id: ID of the layer
+            x: X coordinate. Default 50.
+            y: Y coordinate. Default 50.
+            brush_size: Brush diameter in pixels. Default 100.
+            exposure: Exposure percentage (1-100). Default 50.
+            range_value: 'shadows', 'midtones', or 'highlights'. Default 'midtones'.
+        """,
+        [
+            _param("x", int, 50),
+            _param("y", int, 50),
+            _param("brush_size", int, 100, cast=float),
+            _param("exposure", int, 50, bounds=(1, 100), cast=float),
+            _param("range_value", str, "midtones", choices=("shadows", "midtones", "highlights")),
+        ],
+        [{
+            "_obj": "dodge",
+            "position": {
+                "_obj": "paint",
+                "horizontal": {"_unit": "pixelsUnit", "_value": "$x"},
+                "vertical": {"_unit": "pixelsUnit", "_value": "$y"}
+            },
+            "to": {
+                "_obj": "paint",
+                "horizontal": {"_unit": "pixelsUnit", "_value": "$x"},
+                "vertical": {"_unit": "pixelsUnit", "_value": "$y"}
+            },
+            "diameter": {"_unit": "pixelsUnit", "_value": "$brush_size"},
+            "exposure": {"_unit": "percentUnit", "_value": "$exposure"},
+            "range": {"_enum": "range", "_value": "$range_value"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "apply_burn_tool",
+        """
+        Applies Burn tool at a point (darkens area).
+
+        Args:
+            layer_id: ID of the layer
+            x: X coordinate. Default 50.
+            y: Y coordinate. Default 50.
+            brush_size: Brush diameter in pixels. Default 100.
+            exposure: Exposure percentage (1-100). Default 50.
+            range_value: 'shadows', 'midtones', or 'highlights'. Default 'midtones'.
+        """,
+        [
+            _param("x", int, 50),
+            _param("y", int, 50),
+            _param("brush_size", int, 100, cast=float),
+            _param("exposure", int, 50, bounds=(1, 100), cast=float),
+            _param("range_value", str, "midtones", choices=("shadows", "midtones", "highlights")),
+        ],
+        [{
+            "_obj": "burn",
+            "position": {
+                "_obj": "paint",
+                "horizontal": {"_unit": "pixelsUnit", "_value": "$x"},
+                "vertical": {"_unit": "pixelsUnit", "_value": "$y"}
+            },
+            "to": {
+                "_obj": "paint",
+                "horizontal": {"_unit": "pixelsUnit", "_value": "$x"},
+                "vertical": {"_unit": "pixelsUnit", "_value": "$y"}
+            },
+            "diameter": {"_unit": "pixelsUnit", "_value": "$brush_size"},
+            "exposure": {"_unit": "percentUnit", "_value": "$exposure"},
+            "range": {"_enum": "range", "_value": "$range_value"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "fill_path",
+        """
+        Fills the current work path with a color.
+
+        Args:
+            layer_id: ID of the layer
+            color_red: Fill color red (0-255). Default 255.
+            color_green: Fill color green (0-255). Default 0.
+            color_blue: Fill color blue (0-255). Default 0.
+            opacity: Fill opacity (0-100). Default 100.
+        """,
+        [
+            _param("color_red", int, 255, bounds=(0, 255)),
+            _param("color_green", int, 0, bounds=(0, 255)),
+            _param("color_blue", int, 0, bounds=(0, 255)),
+            _param("opacity", int, 100, bounds=(0, 100), cast=float),
+        ],
+        [{
+            "_obj": "fill",
+            "_target": [{"_ref": "path", "_enum": "ordinal", "_value": "targetEnum"}],
+            "using": {"_enum": "fillContents", "_value": "color"},
+            "color": {"_obj": "RGBColor", "red": "$color_red", "grain": "$color_green", "blue": "$color_blue"},
+            "opacity": {"_unit": "percentUnit", "_value": "$opacity"},
+            "_isCommand": True
+        }],
+    ),
+    _tool(
+        "set_layer_opacity",
+        """
+        Sets layer opacity directly via batchPlay. Useful for quick opacity changes.
+
+        Args:
+            layer_id: ID of the layer
+            opacity: Opacity (0-100). Default 100.
+        """,
+        [
+            _param("opacity", int, 100, bounds=(0, 100), cast=float),
+        ],
+        [{
+            "_obj": "set",
+            "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}],
+            "to": {"_obj": "layer", "opacity": {"_unit": "percentUnit", "_value": "$opacity"}},
+            "_isCommand": True
+        }],
+    ),
+
+    # Blur gallery filters
+    _tool(
+        "apply_iris_blur",
+        """
+        Applies Iris Blur (Blur Gallery) for depth-of-field with elliptical focus area.
+
+        Args:
+            layer_id: ID of the layer.
+            blur_amount: Blur intensity 0-500px. Default 25.
+            center_x: Focus center X coordinate. Default 500.
+            center_y: Focus center Y coordinate. Default 500.
+        """,
+        [
+            _param("blur_amount", float, 25.0, bounds=(0, 500), cast=float),
+            _param("center_x", float, 500.0, cast=float),
+            _param("center_y", float, 500.0, cast=float),
+        ],
+        [{"_obj": "blurbTransform", "blurbWidgetType": 1, "blurbIrisBlurAmount": "$blur_amount", "blurbWidgetLocationX": "$center_x", "blurbWidgetLocationY": "$center_y", "_isCommand": True}],
+    ),
+    _tool(
+        "apply_tilt_shift_blur",
+        """
+        Applies Tilt-Shift Blur (Blur Gallery) for miniature/diorama effect.
+
+        Args:
+            layer_id: ID of the layer.
+            blur_amount: Blur intensity 0-500px. Default 30.
+            focus_top: Top of in-focus band in pixels. Default 300.
+            focus_bottom: Bottom of in-focus band in pixels. Default 500.
+            feather_top: Feather distance above focus. Default 100.
+            feather_bottom: Feather distance below focus. Default 100.
+            angle: Rotation angle of the focus band. Default 0.
+        """,
+        [
+            _param("blur_amount", float, 30.0, bounds=(0, 500), cast=float),
+            _param("focus_top", int, 300),
+            _param("focus_bottom", int, 500),
+            _param("feather_top", int, 100),
+            _param("feather_bottom", int, 100),
+            _param("angle", int, 0),
+        ],
+        [{"_obj": "blurbTransform", "blurbWidgetType": 2, "blurbTiltShiftBlurAmount": "$blur_amount", "blurbTiltShiftFocusTop": "$focus_top", "blurbTiltShiftFocusBottom": "$focus_bottom", "blurbTiltShiftFeatherTop": "$feather_top", "blurbTiltShiftFeatherBottom": "$feather_bottom", "blurbTiltShiftSymmetric": True, "blurbTiltShiftAngle": "$angle", "_isCommand": True}],
+    ),
+    _tool(
+        "apply_spin_blur",
+        """
+        Applies Spin Blur (Blur Gallery) for rotational motion blur.
+
+        Args:
+            layer_id: ID of the layer.
+            spin_angle: Spin angle 0-360 degrees. Default 15.
+            center_x: Spin center X. Default 500.
+            center_y: Spin center Y. Default 500.
+        """,
+        [
+            _param("spin_angle", float, 15.0, bounds=(0, 360), cast=float),
+            _param("center_x", float, 500.0, cast=float),
+            _param("center_y", float, 500.0, cast=float),
+        ],
+        [{"_obj": "blurbTransform", "blurbWidgetType": 3, "blurbSpinBlurAngle": "$spin_angle", "blurbWidgetLocationX": "$center_x", "blurbWidgetLocationY": "$center_y", "_isCommand": True}],
+    ),
+    _tool(
+        "apply_path_blur",
+        """
+        Applies Path Blur (Blur Gallery) for directional motion along a path.
+
+        Args:
+            layer_id: ID of the layer.
+            blur_speed: Speed of motion blur 0-500. Default 50.
+        """,
+        [
+            _param("blur_speed", float, 50.0, bounds=(0, 500), cast=float),
+        ],
+        [{"_obj": "blurbTransform", "blurbWidgetType": 4, "blurbPathBlurSpeed": "$blur_speed", "_isCommand": True}],
+    ),
+
+    # Drawing / retouching tools
+    _tool(
+        "apply_clone_stamp",
+        """
+        Applies Clone Stamp tool - clones pixels from source to destination point.
+
+        Args:
+            layer_id: ID of the layer to clone on.
+            source_x: Source X coordinate. Default 0.
+            source_y: Source Y coordinate. Default 0.
+            dest_x: Destination X coordinate. Default 50.
+            dest_y: Destination Y coordinate. Default 50.
+            brush_size: Brush diameter 1-5000. Default 50.
+            opacity: Opacity 1-100. Default 100.
+            hardness: Hardness 0-100. Default 100.
+        """,
+        [
+            _param("source_x", int, 0, cast=float),
+            _param("source_y", int, 0, cast=float),
+            _param("dest_x", int, 50, cast=float),
+            _param("dest_y", int, 50, cast=float),
+            _param("brush_size", int, 50, bounds=(1, 5000), cast=float),
+            _param("opacity", int, 100, bounds=(1, 100)),
+            _param("hardness", int, 100, bounds=(0, 100)),
+        ],
+        [
+            {"_obj": "set", "_target": [{"_ref": "cloneStampTool"}], "to": {"_obj": "cloneStampTool", "opacity": {"_unit": "percentUnit", "_value": "$opacity"}, "flow": {"_unit": "percentUnit", "_value": 100}, "brush": {"_obj": "brush", "diameter": {"_unit": "pixelsUnit", "_value": "$brush_size"}, "hardness": {"_unit": "percentUnit", "_value": "$hardness"}}}, "_isCommand": True},
+            {"_obj": "setd", "_target": [{"_ref": "paintBrushTool"}], "source": {"_enum": "sourceType", "_value": "samplePoint"}, "offset": {"_obj": "point", "horizontal": {"_unit": "pixelsUnit", "_value": "$source_x"}, "vertical": {"_unit": "pixelsUnit", "_value": "$source_y"}}, "_isCommand": True},
+            {"_obj": "paint", "_target": [{"_ref": "paintBrushTool"}], "from": {"_obj": "point", "horizontal": {"_unit": "pixelsUnit", "_value": "$dest_x"}, "vertical": {"_unit": "pixelsUnit", "_value": "$dest_y"}}, "to": {"_obj": "point", "horizontal": {"_unit": "pixelsUnit", "_value": "$dest_x"}, "vertical": {"_unit": "pixelsUnit", "_value": "$dest_y"}}, "_isCommand": True}
+        ],
+    ),
+    _tool(
+        "apply_healing_brush",
+        """
+        Applies Healing Brush - blends source texture with destination color/tone.
+
+        Args:
+            layer_id: ID of the layer.
+            source_x: Source X coordinate. Default 0.
+            source_y: Source Y coordinate. Default 0.
+            dest_x: Destination X coordinate. Default 50.
+            dest_y: Destination Y coordinate. Default 50.
+            brush_size: Brush diameter 1-5000. Default 50.
+        """,
+        [
+            _param("source_x", int, 0),
+            _param("source_y", int, 0),
+            _param("dest_x", int, 50),
+            _param("dest_y", int, 50),
+            _param("brush_size", int, 50, bounds=(1, 5000), cast=float),
+        ],
+        [
+            {"_obj": "select", "_target": [{"_ref": "healingBrushTool"}], "_isCommand": True},
+            {"_obj": "set", "_target": [{"_ref": "healingBrushTool"}], "to": {"_obj": "healingBrushTool", "brush": {"_obj": "brush", "diameter": {"_unit": "pixelsUnit", "_value": "$brush_size"}, "hardness": {"_unit": "percentUnit", "_value": 100}}}, "_isCommand": True}
+        ],
+    ),
+
+    # Advanced selection tools
+    _tool(
+        "select_object",
+        """
+        Uses Object Selection tool to automatically detect and select the main object on the layer.
+
+        Args:
+            layer_id: ID of the layer containing the object to select.
+        """,
+        [],
+        [{"_obj": "autoCutout", "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}], "_isCommand": True}],
+    ),
+    _tool(
+        "select_by_quick_selection",
+        """
+        Uses Quick Selection tool to select area around a point.
+
+        Args:
+            layer_id: ID of the layer.
+            x: X coordinate to start selection. Default 50.
+            y: Y coordinate to start selection. Default 50.
+            brush_size: Selection brush size 1-500. Default 20.
+        """,
+        [
+            _param("x", int, 50),
+            _param("y", int, 50),
+            _param("brush_size", int, 20, bounds=(1, 500), cast=float),
+        ],
+        [
+            {"_obj": "select", "_target": [{"_ref": "quickSelectTool"}], "_isCommand": True},
+            {"_obj": "set", "_target": [{"_ref": "quickSelectTool"}], "to": {"_obj": "quickSelectTool", "brush": {"_obj": "brush", "diameter": {"_unit": "pixelsUnit", "_value": "$brush_size"}}}, "_isCommand": True}
+        ],
+    ),
+
+    # Smart object & layer type operations
+    _tool(
+        "replace_smart_object_contents",
+        """
+        Replaces the contents of a Smart Object layer with a new file.
+
+        Args:
+            layer_id: ID of the Smart Object layer.
+            file_path: Absolute path to the replacement file.
+        """,
+        [
+            _param("file_path", str, ""),
+        ],
+        [{"_obj": "placedLayerReplaceContents", "null": {"_path": "$file_path", "_kind": "local"}, "_isCommand": True}],
+    ),
+    _tool(
+        "convert_layer_to_frame",
+        """
+        Converts a layer to a frame layer (for animation timeline).
+
+        Args:
+            layer_id: ID of the layer.
+        """,
+        [],
+        [{"_obj": "convertToFrameAnimation", "_isCommand": True}],
+    ),
+    _tool(
+        "apply_diffuse",
+        """
+        Applies Diffuse stylize filter for softening effect.
+
+        Args:
+            layer_id: ID of the layer.
+            mode: Diffuse mode - "normal", "darkenOnly", "lightenOnly", "anisotropic". Default "normal".
+        """,
+        [
+            _param("mode", str, "normal", choices=("normal", "darkenOnly", "lightenOnly", "anisotropic")),
+        ],
+        [{"_obj": "diffuse", "mode": {"_enum": "diffuseMode", "_value": "$mode"}, "_isCommand": True}],
+    ),
+
+    # Additional utility operations
+    _tool(
+        "toggle_layer_effects_visibility",
+        """
+        Shows or hides all layer effects/styles on a layer.
+
+        Args:
+            layer_id: ID of the layer.
+            visible: True to show effects, False to hide. Default True.
+        """,
+        [
+            _param("visible", bool, True, choices={True: "show", False: "hide"}),
+        ],
+        [{"_obj": "$visible", "_target": [{"_ref": "layerEffects"}], "_isCommand": True}],
+    ),
+    _tool(
+        "create_layer_from_effects",
+        """
+        Converts layer effects to separate layers (Layer > Layer Style > Create Layers).
+
+        Args:
+            layer_id: ID of the layer with effects.
+        """,
+        [],
+        [{"_obj": "newLayersFromVisible", "_isCommand": True}],
+    ),
+    _tool(
+        "select_linked_layers",
+        """
+        Selects all layers linked to the specified layer.
+
+        Args:
+            layer_id: ID of a linked layer.
+        """,
+        [],
+        [{"_obj": "selectLinked", "_isCommand": True}],
+    ),
+]
+
+
+def select_layer(layer_id):
+    """Selects a layer by ID using batchPlay."""
+    commands = [{
+        "_obj": "select",
+        "_target": [{"_ref": "layer", "_id": layer_id}],
+        "makeVisible": False,
+        "_isCommand": True
+    }]
+    command = createCommand("executeBatchPlayCommand", {"commands": commands})
+    return sendCommand(command)
+
+
+def _value_source(spec, value, params, namespace):
+    """Returns the Python source of a descriptor template value."""
+    if isinstance(value, dict):
+        items = (f"{k!r}: {_value_source(spec, v, params, namespace)}" for k, v in value.items())
+        return "{" + ", ".join(items) + "}"
+
+    if isinstance(value, list):
+        return "[" + ", ".join(_value_source(spec, v, params, namespace) for v in value) + "]"
+
+    if not (isinstance(value, str) and value.startswith("$")):
+        return repr(value)
+
+    name = value[1:]
+    if name == "layer_id":
+        return name
+
+    param = params.get(name)
+    if param is None:
+        raise ValueError(f"{spec['name']}: descriptor uses unknown parameter {value}")
+
+    if isinstance(param["choices"], dict):
+        table = f"_{spec['name']}_{name}"
+        namespace[table] = param["choices"]
+        return f"{table}.get({name}, {param['choices'][param['default']]!r})"
+
+    if param["cast"] is not None:
+        return f"{param['cast'].__name__}({name})"
+
+    return name
+
+
+def _function_source(spec, namespace):
+    params = {p["name"]: p for p in spec["params"]}
+
+    args = ["layer_id: int"]
+    for p in spec["params"]:
+        arg = f"{p['name']}: {p['kind'].__name__}"
+        if p["default"] is not _REQUIRED:
+            arg += f" = {p['default']!r}"
+        args.append(arg)
+
+    commands = _value_source(spec, spec["commands"], params, namespace)
+    return (f"def {spec['name']}({', '.join(args)}) -> dict:\n"
+        f"    select_layer(layer_id)\n"
+        f"    return sendCommand(createCommand(\"executeBatchPlayCommand\", {{\"commands\": {commands}}}))\n")
+
+
+def _docstring(doc):
+    # indented the way it would be in a hand-written function
+    return "\n" + textwrap.indent(textwrap.dedent(doc).strip("\n"), "    ") + "\n    "
+
+
+def build_tools(specs=SPECS):
+    """
+    Compiles specs into tool functions.
+
+    Returns:
+        dict: Tool name to function
+    """
+    namespace = {"select_layer": select_layer, "createCommand": createCommand,
+        "sendCommand": sendCommand}
+    source = "\n".join(_function_source(spec, namespace) for spec in specs)
+    exec(compile(source, f"<{__name__} specs>", "exec"), namespace)
+
+    tools = {}
+    for spec in specs:
+        fn = namespace[spec["name"]]
+        fn.__doc__ = _docstring(spec["doc"])
+        fn.__module__ = __name__
+        tools[spec["name"]] = fn
+
+    return tools
+
+
+def register(mcp, specs=SPECS):
+    """Adds the tools of specs to a FastMCP server."""
+    for fn in build_tools(specs).values():
+        mcp.tool()(fn)
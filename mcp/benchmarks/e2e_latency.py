@@ -0,0 +1,216 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Measures the latency of tool calls end to end: the ps-mcp.py tool functions,
+# the socket client, proxy.js and a fake plugin (fake_photoshop.py).
+#
+#   python benchmarks/e2e_latency.py --calls 200 --json e2e.json
+#   python benchmarks/e2e_latency.py --compare e2e.json
+#
+# Each scenario first makes --calls calls one at a time, for p50 / p95 / p99
+# latency and the median time of each phase of a call:
+#
+#   connect     creating a socket.io client and connecting to the proxy
+#   serialize   encoding and sending the command
+#   proxy       the proxy hop both ways, including encoding and decoding the
+#               response (the wait for the response, less plugin)
+#   plugin      the plugin running the command (reported by fake_photoshop.py)
+#   disconnect  closing the connection
+#   decode      the tool handling the response (decoding, resizing, caching)
+#
+# then makes them again from --concurrency threads for throughput. The proxy is
+# started with node unless --proxy-url points at one that is already running.
+
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import harness
+
+PHASES = ("connect", "serialize", "proxy", "plugin", "disconnect", "decode")
+
+_plugin_seconds = threading.local()
+
+
+def _on_response(command, response):
+    """core listener that keeps the plugin time of the last response on this thread."""
+    _plugin_seconds.value = (response or {}).get("pluginSeconds", 0.0)
+
+
+def _set_layer_visibility(server, layer_ids, i):
+    server._get_tool_function("set_layer_visibility")(layer_id=layer_ids[i % len(layer_ids)], visible=i % 2 == 0)
+
+
+def _get_layers(server, layer_ids, i):
+    server._get_tool_function("get_layers")()
+
+
+def _get_document_image(server, layer_ids, i):
+    import pixel_cache
+
+    # force and an empty cache, so every call reads the image from the plugin
+    pixel_cache.cache.invalidate()
+    server._get_tool_function("get_document_image")(force=True)
+
+
+def _batch(server, layer_ids, i):
+    import core
+
+    set_visibility = server._get_tool_function("set_layer_visibility")
+    with core.collect_commands() as commands:
+        for layer_id in layer_ids[:10]:
+            set_visibility(layer_id=layer_id, visible=i % 2 == 0)
+
+    core.sendCommands(commands)
+
+
+# name, fake_photoshop.py arguments, call
+SCENARIOS = [
+    ("set_layer_visibility", ["--layers", 10], _set_layer_visibility),
+    ("get_layers 10 layers", ["--layers", 10], _get_layers),
+    ("get_layers 100 layers", ["--layers", 100, "--group-size", 10], _get_layers),
+    ("get_layers 1000 layers", ["--layers", 1000, "--group-size", 10], _get_layers),
+    ("get_document_image 512px", ["--width", 512, "--height", 512], _get_document_image),
+    ("get_document_image 2048px", ["--width", 2048, "--height", 2048], _get_document_image),
+    ("batch of 10 setters", ["--layers", 10], _batch),
+]
+
+
+def _timed_call(server, call, layer_ids, i):
+    import socket_client
+
+    start = time.perf_counter()
+    call(server, layer_ids, i)
+    total = time.perf_counter() - start
+
+    timing = socket_client.last_timing()
+    plugin = getattr(_plugin_seconds, "value", 0.0)
+
+    phases = {
+        "connect": timing["connect"],
+        "serialize": timing["send"],
+        "proxy": max(0.0, timing["wait"] - plugin),
+        "plugin": plugin,
+        "disconnect": timing["total"] - timing["connect"] - timing["send"] - timing["wait"],
+        "decode": total - timing["total"],
+    }
+    return (total, phases)
+
+
+def run_scenario(server, call, calls, concurrency, warmup):
+    import core
+
+    response = core.sendCommand(core.createCommand("getLayers", {}))
+    layer_ids = [layer["id"] for layer in response["layers"]]
+
+    for i in range(warmup):
+        call(server, layer_ids, i)
+
+    samples = [_timed_call(server, call, layer_ids, i) for i in range(calls)]
+    latencies = [total for total, _ in samples]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(lambda i: call(server, layer_ids, i), range(calls)))
+    wall = time.perf_counter() - start
+
+    return {
+        "calls": calls,
+        **harness.percentiles(latencies),
+        "mean": round(statistics.mean(latencies) * 1000, 2),
+        "callsPerSecond": round(calls / wall, 1),
+        "phases": {name: round(statistics.median(p[name] for _, p in samples) * 1000, 2) for name in PHASES},
+    }
+
+
+def print_results(results, baseline=None):
+    print(f"{'scenario':>26}  {'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}  {'calls/s':>8}  "
+        + "  ".join(f"{name:>10}" for name in PHASES))
+
+    for name, r in results["scenarios"].items():
+        print(f"{name:>26}  {r['p50']:8.2f}  {r['p95']:8.2f}  {r['p99']:8.2f}  {r['callsPerSecond']:8.1f}  "
+            + "  ".join(f"{r['phases'][phase]:10.2f}" for phase in PHASES))
+
+        old = (baseline or {}).get("scenarios", {}).get(name)
+        if old:
+            deltas = [f"{key} {(r[key] - old[key]) / old[key] * 100:+.0f}%" for key in ("p50", "p95", "p99")
+                if old[key]]
+            print(f"{'vs baseline':>26}  {', '.join(deltas)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=100, help="calls per scenario")
+    parser.add_argument("--warmup", type=int, default=5, help="untimed calls before each scenario")
+    parser.add_argument("--concurrency", type=int, default=4, help="threads for the throughput run")
+    parser.add_argument("--latency", type=float, default=0, help="milliseconds the fake plugin waits per command")
+    parser.add_argument("--scenario", action="append", help="only run scenarios containing this text")
+    parser.add_argument("--proxy-url", help="use a proxy that is already running")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--compare", help="results file from an earlier run to compare with")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    # keep the benchmark's own arguments away from the server's argument parsing
+    sys.argv = sys.argv[:1]
+
+    proxy_url, proxy = harness.start_proxy(args.proxy_url)
+    try:
+        server = harness.load_server(proxy_url)
+
+        import core
+        core.add_listener(_on_response)
+
+        results = {
+            "settings": {"calls": args.calls, "concurrency": args.concurrency, "pluginLatencyMs": args.latency},
+            "scenarios": {},
+        }
+
+        for name, plugin_args, call in SCENARIOS:
+            if args.scenario and not any(s in name for s in args.scenario):
+                continue
+
+            plugin = harness.start_fake_photoshop(proxy_url, "--timing", "--latency", args.latency, *plugin_args)
+            try:
+                results["scenarios"][name] = run_scenario(server, call, args.calls, args.concurrency, args.warmup)
+            finally:
+                harness.stop(plugin)
+    finally:
+        harness.stop(proxy)
+
+    print_results(results, baseline)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
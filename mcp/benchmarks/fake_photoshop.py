@@ -0,0 +1,678 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# A stand-in for the Photoshop UXP plugin, so the MCP server, socket client and
+# proxy can be tested and benchmarked without Photoshop.
+#
+#   python benchmarks/fake_photoshop.py --layers 100 --latency 5 --error-rate 0.01
+#
+# It registers with the proxy as "photoshop" and answers command packets the
+# same way uxp/ps/main.js does (response, document, layers and
+# hasActiveSelection on success, FAILURE and a message on error), from an
+# in-memory model of documents and layers. Layer and document actions update
+# the model, image and pixel reads return synthetic pixels, and any other
+# action succeeds without doing anything (or fails with --strict).
+#
+# --latency / --jitter delay each response, --padding adds bytes to each
+# response, --error-rate fails and --drop-rate ignores a fraction of commands
+# (the caller then times out). --timing adds the seconds the plugin spent on
+# each command to the response as pluginSeconds (see benchmarks/e2e_latency.py).
+
+import argparse
+import base64
+import io
+import random
+import threading
+import time
+
+APPLICATION = "photoshop"
+DEFAULT_PROXY_URL = "http://localhost:3001"
+
+# actions that can run without an open document (see requiresActiveDocument in
+# uxp/ps/commands/index.js)
+NO_DOCUMENT_ACTIONS = {"createDocument", "openFile"}
+
+# actions that never change the document, so do not add a history state
+READ_ONLY_ACTIONS = {
+    "getDocuments",
+    "getDocumentInfo",
+    "getHistoryState",
+    "getDocumentImage",
+    "getDocumentPixels",
+    "getLayers",
+    "getLayerImage",
+    "getLayerImages",
+    "getLayerBounds",
+    "getArtboards",
+    "getLayerComps",
+    "setActiveDocument",
+}
+
+# actions whose responses leave out the layer tree (see main.js)
+NO_LAYERS_ACTIONS = {"getHistoryState"}
+
+SELECTION_ACTIONS = {
+    "selectAll",
+    "selectRectangle",
+    "selectEllipse",
+    "selectPolygon",
+    "selectSubject",
+    "selectSky",
+    "selectColorRange",
+    "selectFocusArea",
+    "loadSelectionFromChannel",
+}
+
+DESELECT_ACTIONS = {"clearSelection", "cropDocument", "deleteSelection"}
+
+
+class FakeDocument:
+    """An open document: its size, history state and a tree of layers."""
+
+    def __init__(self, document_id, name, width, height):
+        self.id = document_id
+        self.name = name
+        self.width = width
+        self.height = height
+        self.history_state_id = 1
+        self.has_selection = False
+        self.active_layer_id = None
+        self.layers = []
+
+    def info(self, active):
+        return {
+            "name": self.name,
+            "id": self.id,
+            "isActive": active,
+            "path": "",
+            "saved": False,
+            "title": self.name,
+            "historyStateId": self.history_state_id,
+        }
+
+    def iter_layers(self, layers=None):
+        """Yields (layer, parent list) for every layer, depth first."""
+        for layer in self.layers if layers is None else layers:
+            yield layer, layers if layers is not None else self.layers
+            yield from self.iter_layers(layer.get("layers", []))
+
+    def find_layer(self, layer_id):
+        for layer, parent in self.iter_layers():
+            if layer["id"] == layer_id:
+                return layer, parent
+        return None, None
+
+
+def _layer_info(layer):
+    """Returns a layer as getLayers in the plugin does (without its bounds)."""
+    out = {k: v for k, v in layer.items() if k not in ("bounds", "layers")}
+    if layer.get("layers"):
+        out["layers"] = [_layer_info(child) for child in layer["layers"]]
+    return out
+
+
+def _resolve_created(value, created):
+    if isinstance(value, list):
+        return [_resolve_created(v, created) for v in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    if "$created" in value:
+        n = value["$created"]
+        if not 0 <= n < len(created):
+            raise ValueError(f"Layer {n} created by the macro does not exist")
+        return created[n]
+
+    return {k: _resolve_created(v, created) for k, v in value.items()}
+
+
+def _synthetic_pixels(width, height, components, seed):
+    """Deterministic raw pixels that change with seed, without needing numpy."""
+    row = bytes((x + seed) & 0xFF for x in range(width * components))
+    return row * height
+
+
+class FakePhotoshop:
+    """
+    In-memory Photoshop that answers command packets like the UXP plugin.
+
+    Args:
+        layers (int): Layers in the document that is open at start (0 opens no document)
+        group_size (int): If set, put the start layers in groups of this many
+        width (int): Width of the start document in pixels
+        height (int): Height of the start document in pixels
+        latency (float): Seconds to wait before each response
+        jitter (float): Extra random seconds (0 to jitter) added to latency
+        padding (int): Bytes of padding added to each response
+        error_rate (float): Fraction of commands that fail
+        drop_rate (float): Fraction of commands that get no response
+        strict (bool): Fail actions the model does not implement
+        timing (bool): Add pluginSeconds to each response
+        seed (int): Random seed for jitter and error injection
+    """
+
+    def __init__(self, layers=10, group_size=0, width=1024, height=768, latency=0.0, jitter=0.0,
+            padding=0, error_rate=0.0, drop_rate=0.0, strict=False, timing=False, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.padding = "x" * padding if padding else None
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.strict = strict
+        self.timing = timing
+
+        self.documents = []
+        self.active_document = None
+        self.commands = 0
+        self.errors = 0
+        self.drops = 0
+
+        self._random = random.Random(seed)
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self._jpeg_cache = {}
+
+        if layers:
+            doc = self._create_document("Untitled-1", width, height)
+            self._add_start_layers(doc, layers - 1, group_size)
+
+        self._actions = {
+            "getDocuments": self._get_documents,
+            "getDocumentInfo": self._get_document_info,
+            "getHistoryState": self._get_history_state,
+            "setActiveDocument": self._set_active_document,
+            "createDocument": self._create_document_action,
+            "duplicateDocument": self._duplicate_document,
+            "getLayers": self._get_layers,
+            "getLayerBounds": self._get_layer_bounds,
+            "createPixelLayer": self._create_layer_action("PIXEL"),
+            "createSingleLineTextLayer": self._create_layer_action("TEXT"),
+            "createMultiLineTextLayer": self._create_layer_action("TEXT"),
+            "deleteLayer": self._delete_layer,
+            "duplicateLayer": self._duplicate_layer,
+            "setLayerProperties": self._set_layer_properties,
+            "groupLayers": self._group_layers,
+            "flattenAllLayers": self._flatten_all_layers,
+            "getDocumentImage": self._get_document_image,
+            "getLayerImage": self._get_layer_image,
+            "getDocumentPixels": self._get_document_pixels,
+            "getLayerImages": self._get_layer_images,
+            "executeBatchPlayCommand": self._execute_batch_play,
+            "runCommands": self._run_commands,
+        }
+
+    def _new_id(self):
+        self._next_id += 1
+        return self._next_id
+
+    def _new_layer(self, doc, name, kind="PIXEL", opacity=100, blend_mode="NORMAL"):
+        layer = {
+            "name": name,
+            "type": kind,
+            "id": self._new_id(),
+            "isClippingMask": False,
+            "opacity": opacity,
+            "blendMode": blend_mode,
+            "bounds": {"left": 0, "top": 0, "right": doc.width, "bottom": doc.height},
+        }
+        doc.active_layer_id = layer["id"]
+        return layer
+
+    def _create_document(self, name, width, height):
+        doc = FakeDocument(self._new_id(), name, int(width), int(height))
+        doc.layers.append(self._new_layer(doc, "Background"))
+        self.documents.append(doc)
+        self.active_document = doc
+        return doc
+
+    def _add_start_layers(self, doc, count, group_size):
+        parent = doc.layers
+        for i in range(count):
+            if group_size and i % group_size == 0:
+                group = self._new_layer(doc, f"Group {i // group_size + 1}", "GROUP")
+                group["layers"] = []
+                doc.layers.insert(0, group)
+                parent = group["layers"]
+            parent.insert(0, self._new_layer(doc, f"Layer {i + 1}"))
+
+    def _require_layer(self, action, layer_id):
+        layer, parent = self.active_document.find_layer(layer_id)
+        if layer is None:
+            raise ValueError(f"{action} : Could not find layerId : {layer_id}")
+        return layer, parent
+
+    # Documents
+
+    def _get_documents(self, options):
+        return [doc.info(doc is self.active_document) for doc in self.documents]
+
+    def _get_document_info(self, options):
+        doc = self.active_document
+        return {
+            "height": doc.height,
+            "width": doc.width,
+            "colorMode": "RGB",
+            "pixelAspectRatio": 1,
+            "resolution": 72,
+            "path": "",
+            "saved": False,
+            "hasUnsavedChanges": doc.history_state_id > 1,
+        }
+
+    def _get_history_state(self, options):
+        doc = self.active_document
+        return {"documentId": doc.id, "historyStateId": doc.history_state_id}
+
+    def _set_active_document(self, options):
+        for doc in self.documents:
+            if doc.id == options.get("documentId"):
+                self.active_document = doc
+                return None
+        raise ValueError(f"setActiveDocument : Could not find documentId : {options.get('documentId')}")
+
+    def _create_document_action(self, options):
+        doc = self._create_document(options.get("name") or f"Untitled-{len(self.documents) + 1}",
+            options.get("width", 1024), options.get("height", 768))
+        return {"documentId": doc.id}
+
+    def _duplicate_document(self, options):
+        source = self.active_document
+        doc = self._create_document(options.get("name") or f"{source.name} copy", source.width, source.height)
+        doc.layers = [self._copy_layer(doc, layer) for layer in source.layers]
+        return {"documentId": doc.id}
+
+    # Layers
+
+    def _get_layers(self, options):
+        return [_layer_info(layer) for layer in self.active_document.layers]
+
+    def _get_layer_bounds(self, options):
+        layer, _ = self._require_layer("getLayerBounds", options.get("layerId"))
+        return dict(layer["bounds"])
+
+    def _create_layer_action(self, kind):
+        def create(options):
+            doc = self.active_document
+            layer = self._new_layer(doc, options.get("layerName") or f"Layer {len(doc.layers)}", kind,
+                options.get("opacity", 100), str(options.get("blendMode", "NORMAL")).upper())
+            doc.layers.insert(0, layer)
+            return {"layerId": layer["id"]}
+        return create
+
+    def _delete_layer(self, options):
+        layer, parent = self._require_layer("deleteLayer", options.get("layerId"))
+        parent.remove(layer)
+
+    def _copy_layer(self, doc, layer, name=None):
+        copy = dict(layer, id=self._new_id(), name=name or layer["name"], bounds=dict(layer["bounds"]))
+        if "layers" in layer:
+            copy["layers"] = [self._copy_layer(doc, child) for child in layer["layers"]]
+        return copy
+
+    def _duplicate_layer(self, options):
+        layer, parent = self._require_layer("duplicateLayer", options.get("sourceLayerId"))
+        copy = self._copy_layer(self.active_document, layer, options.get("duplicateLayerName"))
+        parent.insert(parent.index(layer), copy)
+        return {"layerId": copy["id"]}
+
+    def _set_layer_properties(self, options):
+        layer, _ = self._require_layer("setLayerProperties", options.get("layerId"))
+        if options.get("blendMode") is not None:
+            layer["blendMode"] = str(options["blendMode"]).upper()
+        if options.get("layerOpacity") is not None:
+            layer["opacity"] = options["layerOpacity"]
+        if options.get("isClippingMask") is not None:
+            layer["isClippingMask"] = bool(options["isClippingMask"])
+
+    def _group_layers(self, options):
+        doc = self.active_document
+        group = self._new_layer(doc, options.get("groupName") or "Group", "GROUP")
+        group["layers"] = []
+
+        for layer_id in options.get("layerIds") or []:
+            layer, parent = self._require_layer("groupLayers", layer_id)
+            parent.remove(layer)
+            group["layers"].append(layer)
+
+        doc.layers.insert(0, group)
+        return {"layerId": group["id"]}
+
+    def _flatten_all_layers(self, options):
+        doc = self.active_document
+        doc.layers = [self._new_layer(doc, options.get("layerName") or "Background")]
+
+    # Pixels
+
+    def _jpeg(self, doc):
+        key = (doc.id, doc.history_state_id, doc.width, doc.height)
+        data = self._jpeg_cache.get(key)
+
+        if data is None:
+            from PIL import Image as PILImage
+
+            image = PILImage.frombytes("RGB", (doc.width, doc.height),
+                _synthetic_pixels(doc.width, doc.height, 3, doc.history_state_id))
+            buffer = io.BytesIO()
+            image.save(buffer, format="JPEG", quality=80)
+            data = base64.b64encode(buffer.getvalue()).decode("ascii")
+
+            # only the current state of each document is kept
+            self._jpeg_cache = {k: v for k, v in self._jpeg_cache.items() if k[0] != doc.id}
+            self._jpeg_cache[key] = data
+
+        return {
+            "base64Image": data,
+            "dataUrl": f"data:image/jpeg;base64,{data}",
+            "width": doc.width,
+            "height": doc.height,
+            "colorSpace": "RGB",
+            "components": 3,
+            "format": "jpeg",
+        }
+
+    def _get_document_image(self, options):
+        return self._jpeg(self.active_document)
+
+    def _get_layer_image(self, options):
+        self._require_layer("getLayerImage", options.get("layerId"))
+        return self._jpeg(self.active_document)
+
+    def _get_document_pixels(self, options):
+        doc = self.active_document
+        bounds = options.get("bounds") or {"left": 0, "top": 0, "right": doc.width, "bottom": doc.height}
+        width = int(bounds["right"] - bounds["left"])
+        height = int(bounds["bottom"] - bounds["top"])
+
+        return {
+            "data": _synthetic_pixels(width, height, 3, doc.history_state_id + int(bounds["left"])),
+            "width": width,
+            "height": height,
+            "components": 3,
+            "bounds": bounds,
+            "format": "raw",
+        }
+
+    def _get_layer_images(self, options):
+        doc = self.active_document
+        thumb_size = options.get("thumbSize")
+        results = []
+
+        for layer_id in options.get("layerIds") or []:
+            layer, _ = doc.find_layer(layer_id)
+            if layer is None:
+                results.append({"layerId": layer_id, "error": f"Could not find layerId : {layer_id}"})
+                continue
+
+            bounds = layer["bounds"]
+            if options.get("bounds"):
+                # a tile of the layer
+                tile = options["bounds"]
+                bounds = {
+                    "left": max(bounds["left"], tile["left"]),
+                    "top": max(bounds["top"], tile["top"]),
+                    "right": max(min(bounds["right"], tile["right"]), max(bounds["left"], tile["left"])),
+                    "bottom": max(min(bounds["bottom"], tile["bottom"]), max(bounds["top"], tile["top"])),
+                }
+            width, height = bounds["right"] - bounds["left"], bounds["bottom"] - bounds["top"]
+            if thumb_size and max(width, height) > thumb_size:
+                scale = thumb_size / max(width, height)
+                width, height = max(1, round(width * scale)), max(1, round(height * scale))
+
+            results.append({
+                "layerId": layer_id,
+                "name": layer["name"],
+                "width": width,
+                "height": height,
+                "components": 4,
+                "bounds": dict(bounds),
+                "data": _synthetic_pixels(width, height, 4, layer_id),
+            })
+
+        return results
+
+    # batchPlay and runCommands
+
+    def _batch_play_target(self, descriptor):
+        for ref in descriptor.get("_target") or []:
+            if isinstance(ref, dict) and ref.get("_ref") == "layer" and "_id" in ref:
+                return ref["_id"]
+        return None
+
+    def _play(self, descriptor):
+        doc = self.active_document
+        obj = descriptor.get("_obj")
+        layer_id = self._batch_play_target(descriptor)
+
+        if obj == "make" and (descriptor.get("_target") or [{}])[0].get("_ref") == "layer":
+            name = (descriptor.get("using") or {}).get("name") or f"Layer {len(doc.layers)}"
+            layer = self._new_layer(doc, name)
+            doc.layers.insert(0, layer)
+            return {"layerID": layer["id"]}
+
+        if layer_id is None:
+            return {}
+
+        layer, parent = self._require_layer("executeBatchPlayCommand", layer_id)
+
+        if obj == "select":
+            doc.active_layer_id = layer_id
+        elif obj == "delete":
+            parent.remove(layer)
+        elif obj == "get":
+            return {"layerID": layer_id, "name": layer["name"], "opacity": layer["opacity"],
+                "mode": {"_enum": "blendMode", "_value": layer["blendMode"].lower()}}
+        elif obj == "set":
+            to = descriptor.get("to") or {}
+            if "name" in to:
+                layer["name"] = to["name"]
+            if isinstance(to.get("opacity"), dict):
+                layer["opacity"] = to["opacity"].get("_value", layer["opacity"])
+
+        return {}
+
+    def _execute_batch_play(self, options):
+        if options.get("layerId"):
+            self._require_layer("executeBatchPlayCommand", options["layerId"])
+            self.active_document.active_layer_id = options["layerId"]
+
+        return [self._play(descriptor) for descriptor in options.get("commands") or []]
+
+    def _run_commands(self, options):
+        commands = options.get("commands") or []
+        results = []
+
+        # layers created by earlier commands, for {"$created": n} (see macros.py)
+        created = []
+
+        for i, command in enumerate(commands):
+            try:
+                command = _resolve_created(command, created)
+                doc = self.active_document
+                before = {layer["id"] for layer, _ in doc.iter_layers()} if doc else set()
+                results.append(self._run(command))
+                if doc is not None and doc is self.active_document:
+                    created.extend(sorted({layer["id"] for layer, _ in doc.iter_layers()} - before))
+            except ValueError as e:
+                raise ValueError(f"runCommands: step {i + 1} of {len(commands)} ({command.get('action')}) failed : {e}")
+
+        return results
+
+    def _run(self, command):
+        action = command.get("action")
+        options = command.get("options") or {}
+
+        if action not in NO_DOCUMENT_ACTIONS and self.active_document is None:
+            raise ValueError(f"{action} : Requires an open Photoshop document")
+
+        handler = self._actions.get(action)
+        if handler is None:
+            if self.strict:
+                raise ValueError(f"{action} : Not implemented by the fake plugin")
+            if options.get("layerId") is not None:
+                self._require_layer(action, options["layerId"])
+            result = None
+        else:
+            result = handler(options)
+
+        doc = self.active_document
+        if doc is not None:
+            if action in SELECTION_ACTIONS:
+                doc.has_selection = True
+            elif action in DESELECT_ACTIONS:
+                doc.has_selection = False
+
+            read_only = action in READ_ONLY_ACTIONS or (action == "executeBatchPlayCommand"
+                and all(c.get("_obj") == "get" for c in options.get("commands") or []))
+            if not read_only and action != "runCommands":
+                doc.history_state_id += 1
+
+        return result
+
+    def handle(self, packet):
+        """
+        Runs one command packet and returns the response packet, or None to
+        drop it (see drop_rate).
+        """
+        start = time.perf_counter()
+        command = packet.get("command") or {}
+        out = {"senderId": packet.get("senderId")}
+
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+
+        with self._lock:
+            self.commands += 1
+
+            if self.drop_rate and self._random.random() < self.drop_rate:
+                self.drops += 1
+                return None
+
+            try:
+                if self.error_rate and self._random.random() < self.error_rate:
+                    raise ValueError("Injected error")
+
+                out["response"] = self._run(command)
+                out["status"] = "SUCCESS"
+
+                doc = self.active_document
+                out["document"] = doc.info(True) if doc else None
+                if command.get("action") not in NO_LAYERS_ACTIONS:
+                    out["layers"] = self._get_layers({}) if doc else []
+                out["hasActiveSelection"] = doc.has_selection if doc else False
+            except Exception as e:
+                self.errors += 1
+                out = {
+                    "senderId": packet.get("senderId"),
+                    "status": "FAILURE",
+                    "message": f"Error calling {command.get('action')} : {e}",
+                }
+
+        if self.padding:
+            out["padding"] = self.padding
+        if self.timing:
+            out["pluginSeconds"] = time.perf_counter() - start
+
+        return out
+
+    def stats(self):
+        return {"commands": self.commands, "errors": self.errors, "drops": self.drops}
+
+
+def connect(plugin, proxy_url=DEFAULT_PROXY_URL, application=APPLICATION):
+    """
+    Connects plugin to the proxy and registers it for application.
+
+    Returns:
+        socketio.Client: The connected client. Call disconnect() on it to stop.
+    """
+    import socketio
+
+    sio = socketio.Client(logger=False)
+
+    @sio.event
+    def connect():
+        sio.emit("register", {"application": application})
+
+    @sio.on("command_packet")
+    def command_packet(packet):
+        out = plugin.handle(packet)
+        if out is None:
+            return
+
+        # echoed so load tests can match responses to requests and plugins
+        command = packet.get("command") or {}
+        if "requestId" in command:
+            out["requestId"] = command["requestId"]
+            out["plugin"] = application
+
+        sio.emit("command_packet_response", {"packet": out})
+
+    registered = threading.Event()
+    sio.on("registration_response", lambda data: registered.set())
+
+    sio.connect(proxy_url, transports=["websocket"])
+    if not registered.wait(10):
+        sio.disconnect()
+        raise RuntimeError(f"Could not register with the proxy at {proxy_url}")
+
+    return sio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--proxy-url", default=DEFAULT_PROXY_URL)
+    parser.add_argument("--application", default=APPLICATION, help="application name to register as")
+    parser.add_argument("--layers", type=int, default=10, help="layers in the start document (0 for none)")
+    parser.add_argument("--group-size", type=int, default=0, help="put the start layers in groups of this many")
+    parser.add_argument("--width", type=int, default=1024)
+    parser.add_argument("--height", type=int, default=768)
+    parser.add_argument("--latency", type=float, default=0, help="milliseconds before each response")
+    parser.add_argument("--jitter", type=float, default=0, help="random extra milliseconds per response")
+    parser.add_argument("--padding", type=int, default=0, help="bytes added to each response")
+    parser.add_argument("--error-rate", type=float, default=0, help="fraction of commands that fail")
+    parser.add_argument("--drop-rate", type=float, default=0, help="fraction of commands not answered")
+    parser.add_argument("--strict", action="store_true", help="fail actions the model does not implement")
+    parser.add_argument("--timing", action="store_true", help="add pluginSeconds to each response")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    plugin = FakePhotoshop(layers=args.layers, group_size=args.group_size, width=args.width,
+        height=args.height, latency=args.latency / 1000, jitter=args.jitter / 1000,
+        padding=args.padding, error_rate=args.error_rate, drop_rate=args.drop_rate,
+        strict=args.strict, timing=args.timing, seed=args.seed)
+
+    sio = connect(plugin, args.proxy_url, args.application)
+    print(f"Fake Photoshop registered with {args.proxy_url} as {args.application}", flush=True)
+
+    try:
+        sio.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sio.disconnect()
+        print(plugin.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# Benchmarks font scanning (fonts.parse_fonts) on a synthetic font directory.
+#
+#   python benchmarks/font_scan.py --files 2000 --collections 100
+#
+# Reports fonts per second for the previous eager approach (full TTFont per
+# face, collections reopened per face), serial and parallel cold scans, and a
+# scan served from the on disk cache.
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTCollection, TTFont
+
+import fonts
+
+
+def make_font(ps_name, family, style, glyph_count):
+    """Builds a TrueType font with glyph_count simple glyphs, so files have a realistic size."""
+    glyph_order = [".notdef"] + [f"g{i}" for i in range(glyph_count)]
+
+    glyphs = {}
+    for i, name in enumerate(glyph_order):
+        pen = TTGlyphPen(None)
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 500 + i % 200))
+        pen.lineTo((400, 500))
+        pen.lineTo((400, 0))
+        pen.closePath()
+        glyphs[name] = pen.glyph()
+
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(glyph_order)
+    fb.setupCharacterMap({0x4E00 + i: f"g{i}" for i in range(glyph_count)})
+    fb.setupGlyf(glyphs)
+    fb.setupHorizontalMetrics({name: (500, 0) for name in glyph_order})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": family, "styleName": style, "psName": ps_name})
+    fb.setupOS2()
+    fb.setupPost()
+    return fb.font
+
+
+def build_font_dir(path, files, collections, faces_per_collection, glyph_count):
+    """Writes files .ttf fonts and collections .ttc files to path. Returns (paths, number of faces)."""
+    template = make_font("Template-Regular", "Template", "Regular", glyph_count)
+    styles = ["Regular", "Bold", "Italic", "BoldItalic"]
+
+    paths = []
+    for i in range(files):
+        style = styles[i % len(styles)]
+        template["name"].setName(f"Synthetic{i}", 1, 3, 1, 0x409)
+        template["name"].setName(style, 2, 3, 1, 0x409)
+        template["name"].setName(f"Synthetic{i}-{style}", 6, 3, 1, 0x409)
+        font_path = os.path.join(path, f"Synthetic{i}-{style}.ttf")
+        template.save(font_path)
+        paths.append(font_path)
+
+    for i in range(collections):
+        collection = TTCollection()
+        collection.fonts = [
+            make_font(f"Collection{i}-{styles[j % len(styles)]}{j}", f"Collection{i}",
+                styles[j % len(styles)], glyph_count)
+            for j in range(faces_per_collection)
+        ]
+        font_path = os.path.join(path, f"Collection{i}.ttc")
+        collection.save(font_path)
+        paths.append(font_path)
+
+    return paths, files + collections * faces_per_collection
+
+
+def eager_scan(paths):
+    """The scan before lazy parsing: every table is loaded, collections are reopened per face."""
+    count = 0
+    for path in paths:
+        faces = TTFont(path, fontNumber=0).reader.numFonts if path.endswith(".ttc") else 1
+        for i in range(faces):
+            font = TTFont(path, fontNumber=i) if path.endswith(".ttc") else TTFont(path)
+            font.ensureDecompiled()
+            if fonts._extract_postscript_name(font):
+                count += 1
+            font.close()
+
+    return count
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=1000, help="number of .ttf files")
+    parser.add_argument("--collections", type=int, default=50, help="number of .ttc files")
+    parser.add_argument("--faces", type=int, default=4, help="fonts per collection")
+    parser.add_argument("--glyphs", type=int, default=300, help="glyphs per font")
+    parser.add_argument("--workers", type=int, default=None, help="processes for the parallel scan")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    font_dir = tempfile.mkdtemp(prefix="font-bench-")
+    cache_dir = tempfile.mkdtemp(prefix="font-bench-cache-")
+
+    try:
+        (paths, faces), build_seconds = _timed(lambda: build_font_dir(
+            font_dir, args.files, args.collections, args.faces, args.glyphs))
+        print(f"Built {len(paths)} files ({faces} fonts) in {build_seconds:.1f}s")
+
+        results = {"files": len(paths), "fonts": faces}
+
+        _, eager_seconds = _timed(lambda: eager_scan(paths))
+        serial, serial_seconds = _timed(lambda: fonts.parse_fonts(paths, workers=1))
+        parallel, parallel_seconds = _timed(lambda: fonts.parse_fonts(paths, workers=args.workers))
+        assert serial == parallel, "serial and parallel scans differ"
+        found = sum(len(f) for f in serial)
+
+        # scan() through the cache, pointed at the synthetic directory
+        fonts._font_dirs = lambda: [font_dir]
+        os.environ["XDG_CACHE_HOME"] = os.environ["LOCALAPPDATA"] = cache_dir
+        fonts.cache_path = lambda: os.path.join(cache_dir, fonts.CACHE_FILE_NAME)
+        fonts.scan(use_cache=False)
+        _, cached_seconds = _timed(lambda: fonts.scan())
+
+        for name, seconds in (("eager", eager_seconds), ("serial", serial_seconds), ("parallel", parallel_seconds),
+                ("cached", cached_seconds)):
+            rate = found / seconds if seconds else float("inf")
+            results[name] = {"seconds": round(seconds, 3), "fontsPerSecond": round(rate, 1)}
+            print(f"{name:>8}: {seconds:7.3f}s  {rate:10.1f} fonts/s")
+
+        print(f"Lazy speedup: {eager_seconds / serial_seconds:.2f}x, "
+            f"parallel speedup: {serial_seconds / parallel_seconds:.2f}x ({os.cpu_count()} CPUs)")
+
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(results, f, indent=2)
+    finally:
+        shutil.rmtree(font_dir, ignore_errors=True)
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
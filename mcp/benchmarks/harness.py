@@ -0,0 +1,175 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Starts the proxy, fake plugins and the MCP server for the benchmarks that run
+# against a live proxy (e2e_latency.py, proxy_load.py, soak.py), and samples the
+# CPU and memory use of processes.
+
+import importlib.util
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from urllib.parse import urlparse
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+MCP_DIR = os.path.dirname(BENCHMARKS_DIR)
+PROXY_DIR = os.path.join(os.path.dirname(MCP_DIR), "adb-proxy-socket")
+
+# proxy.js always listens on this port
+DEFAULT_PROXY_URL = "http://localhost:3001"
+
+
+def wait_for_port(url, timeout=10, process=None):
+    """Waits until something accepts connections on the host and port of url."""
+    parsed = urlparse(url)
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"Process exited with code {process.returncode} before listening on {url}")
+        try:
+            socket.create_connection((parsed.hostname, parsed.port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+
+    raise RuntimeError(f"Nothing is listening on {url} after {timeout}s")
+
+
+def start_proxy(proxy_url=None):
+    """
+    Starts adb-proxy-socket/proxy.js with node, unless proxy_url is set (a proxy
+    that is already running).
+
+    Returns:
+        tuple: (proxy url, process or None)
+    """
+    if proxy_url:
+        wait_for_port(proxy_url)
+        return (proxy_url, None)
+
+    if not os.path.isdir(os.path.join(PROXY_DIR, "node_modules")):
+        raise RuntimeError(f"Run npm install in {PROXY_DIR} first, or pass --proxy-url")
+
+    process = subprocess.Popen(["node", "proxy.js"], cwd=PROXY_DIR,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    wait_for_port(DEFAULT_PROXY_URL, process=process)
+    return (DEFAULT_PROXY_URL, process)
+
+
+def start_fake_photoshop(proxy_url, *args):
+    """
+    Starts benchmarks/fake_photoshop.py with args and waits until it has
+    registered with the proxy.
+
+    Returns:
+        subprocess.Popen: The plugin process. Pass to stop() when done.
+    """
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(BENCHMARKS_DIR, "fake_photoshop.py"), "--proxy-url", proxy_url,
+            *[str(a) for a in args]],
+        stdout=subprocess.PIPE, text=True)
+
+    line = process.stdout.readline()
+    if "registered" not in line:
+        stop(process)
+        raise RuntimeError(f"Fake Photoshop did not start: {line.strip() or 'no output'}")
+
+    return process
+
+
+def stop(process):
+    if process is None or process.poll() is not None:
+        return
+
+    process.terminate()
+    try:
+        process.wait(5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def load_server(proxy_url):
+    """
+    Imports ps-mcp.py (without serving) and points its socket client at proxy_url.
+
+    Returns:
+        module: The server module. Tools are in module.mcp._tool_manager.
+    """
+    if MCP_DIR not in sys.path:
+        sys.path.insert(0, MCP_DIR)
+
+    spec = importlib.util.spec_from_file_location("ps_mcp", os.path.join(MCP_DIR, "ps-mcp.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    import socket_client
+    socket_client.configure(url=proxy_url)
+    return module
+
+
+def _parse_cpu_time(value):
+    # ps prints [[dd-]hh:]mm:ss[.cc]
+    days, _, value = value.rpartition("-")
+    seconds = 0.0
+    for part in value.split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds + int(days or 0) * 86400
+
+
+def process_stats(pid):
+    """
+    Returns the CPU time used so far and the resident memory of process pid.
+
+    Returns:
+        tuple: (cpu seconds, rss bytes), or None if the process can not be read
+    """
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            # fields after the command name, which can contain spaces
+            fields = f.read().rsplit(")", 1)[1].split()
+        cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+        return (cpu, int(fields[21]) * os.sysconf("SC_PAGE_SIZE"))
+    except OSError:
+        pass
+
+    # no /proc (macOS)
+    try:
+        out = subprocess.run(["ps", "-o", "time=,rss=", "-p", str(pid)],
+            capture_output=True, text=True, check=True).stdout.split()
+        return (_parse_cpu_time(out[0]), int(out[1]) * 1024)
+    except (OSError, subprocess.CalledProcessError, IndexError, ValueError):
+        return None
+
+
+def percentiles(samples):
+    """Returns p50, p95 and p99 of samples (seconds) in milliseconds."""
+    if len(samples) < 2:
+        value = round(samples[0] * 1000, 2) if samples else 0.0
+        return {"p50": value, "p95": value, "p99": value}
+
+    q = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": round(q[49] * 1000, 2), "p95": round(q[94] * 1000, 2), "p99": round(q[98] * 1000, 2)}
@@ -0,0 +1,353 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Load test for proxy.js: N simulated MCP clients send a mix of commands at a
+# target rate to M fake plugins (fake_photoshop.py) through one proxy.
+#
+#   python benchmarks/proxy_load.py --clients 20 --plugins 4 --rate 200 --duration 30
+#   python benchmarks/proxy_load.py --mix get_layers=1,image=1 --json load.json
+#
+# Each plugin registers under its own application name (photoshop-1, ...) and
+# each client sends to one of them, so responses that come back from the wrong
+# plugin or to the wrong client are counted as misrouted. With
+# --shared-application all plugins register as "photoshop", which is how the
+# proxy sees several open copies of Photoshop: it sends every command to all of
+# them, and with --persistent the extra responses are counted as duplicates.
+#
+# Clients connect for each command like the MCP servers do (socket_client.py),
+# or keep one connection open with --persistent. Commands are sent on a fixed
+# schedule, and latency is measured from when a command was due, so a client
+# that falls behind shows up in the tail. Responses that do not arrive within
+# --timeout are counted as dropped.
+
+import argparse
+import itertools
+import json
+import random
+import threading
+import time
+
+import harness
+
+# name -> (action, options)
+COMMANDS = {
+    "setter": ("setForegroundColor", {"color": {"red": 255, "green": 0, "blue": 0}}),
+    "get_layers": ("getLayers", {}),
+    "document_info": ("getDocumentInfo", {}),
+    "batch_play": ("executeBatchPlayCommand", {"commands": [
+        {"_obj": "gaussianBlur", "radius": {"_unit": "pixelsUnit", "_value": 2}},
+    ]}),
+    "image": ("getDocumentImage", {}),
+}
+
+DEFAULT_MIX = "setter=40,get_layers=30,document_info=20,batch_play=8,image=2"
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in COMMANDS:
+            raise ValueError(f"Unknown command '{name}' in mix. Available: {', '.join(COMMANDS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+class Stats:
+    """Results of all clients, updated from their threads."""
+
+    def __init__(self):
+        self.latencies = []
+        self.service_times = []
+        self.sent = 0
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.duplicates = 0
+        self.misrouted = 0
+        self.connect_errors = 0
+        self._lock = threading.Lock()
+
+    def add(self, **counts):
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def add_latency(self, latency, service_time):
+        with self._lock:
+            self.latencies.append(latency)
+            self.service_times.append(service_time)
+            self.completed += 1
+
+
+class LoadClient:
+    """
+    A simulated MCP client that sends commands to one application at a fixed
+    interval and checks every response it gets.
+    """
+
+    def __init__(self, index, proxy_url, application, stats, timeout, persistent):
+        self.index = index
+        self.proxy_url = proxy_url
+        self.application = application
+        self.stats = stats
+        self.timeout = timeout
+        self.persistent = persistent
+
+        self._pending = {}
+        self._answered = set()
+        self._expired = set()
+        self._lock = threading.Lock()
+        self._sio = None
+
+    def _connect(self):
+        import socketio
+
+        sio = socketio.Client(logger=False, reconnection=False)
+        sio.on("packet_response", self._on_response)
+        sio.connect(self.proxy_url, transports=["websocket"])
+        return sio
+
+    def _on_response(self, packet):
+        request_id = packet.get("requestId")
+
+        with self._lock:
+            pending = self._pending.pop(request_id, None)
+            if pending is None:
+                if request_id in self._expired:
+                    # already counted as dropped
+                    return
+                duplicate = request_id in self._answered
+            else:
+                self._answered.add(request_id)
+
+        if pending is None:
+            self.stats.add(**({"duplicates": 1} if duplicate else {"misrouted": 1}))
+            return
+
+        due, sent, done = pending
+        received = time.perf_counter()
+
+        if packet.get("plugin") != self.application:
+            self.stats.add(misrouted=1)
+        elif packet.get("status") != "SUCCESS":
+            self.stats.add(failed=1)
+        else:
+            self.stats.add_latency(received - due, received - sent)
+
+        done.set()
+
+    def _send(self, request_id, command, due):
+        done = threading.Event()
+
+        try:
+            sio = self._sio if self.persistent else self._connect()
+        except Exception:
+            self.stats.add(connect_errors=1)
+            return
+
+        try:
+            with self._lock:
+                self._pending[request_id] = (due, time.perf_counter(), done)
+            self.stats.add(sent=1)
+
+            sio.emit("command_packet", {"type": "command", "application": self.application, "command": command})
+
+            if not done.wait(self.timeout):
+                with self._lock:
+                    self._pending.pop(request_id, None)
+                    self._expired.add(request_id)
+                self.stats.add(dropped=1)
+        finally:
+            if not self.persistent:
+                sio.disconnect()
+
+    def run(self, commands, start, interval, end):
+        if self.persistent:
+            try:
+                self._sio = self._connect()
+            except Exception:
+                self.stats.add(connect_errors=1)
+                return
+
+        # spread the clients over the first interval
+        due = start + interval * random.random()
+        sequence = itertools.count()
+
+        while due < end:
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            action, options = COMMANDS[next(commands)]
+            request_id = f"{self.index}-{next(sequence)}"
+            self._send(request_id, {"application": self.application, "action": action,
+                "options": options, "requestId": request_id}, due)
+
+            due += interval
+
+        # late duplicates
+        if self.persistent:
+            time.sleep(0.5)
+            self._sio.disconnect()
+
+
+def _commands(mix, seed):
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    while True:
+        yield rng.choices(names, weights)[0]
+
+
+def sample_process(pid, samples, stop):
+    """Appends (time, cpu seconds, rss bytes) for pid to samples until stop is set."""
+    while not stop.is_set():
+        stats = harness.process_stats(pid)
+        if stats:
+            samples.append((time.perf_counter(), *stats))
+        stop.wait(0.5)
+
+
+def run(args):
+    mix = parse_mix(args.mix)
+
+    proxy_url, proxy = harness.start_proxy(args.proxy_url)
+    proxy_pid = proxy.pid if proxy else args.proxy_pid
+
+    applications = ["photoshop" if args.shared_application else f"photoshop-{i + 1}" for i in range(args.plugins)]
+    plugins = []
+
+    try:
+        for application in applications:
+            plugins.append(harness.start_fake_photoshop(proxy_url, "--application", application,
+                "--layers", args.layers, "--latency", args.latency))
+
+        stats = Stats()
+        clients = [LoadClient(i, proxy_url, applications[i % len(applications)], stats, args.timeout,
+            args.persistent) for i in range(args.clients)]
+
+        samples = []
+        stop_sampling = threading.Event()
+        if proxy_pid:
+            threading.Thread(target=sample_process, args=(proxy_pid, samples, stop_sampling), daemon=True).start()
+
+        interval = args.clients / args.rate
+        start = time.perf_counter()
+        end = start + args.duration
+
+        threads = [threading.Thread(target=client.run, args=(_commands(mix, i), start, interval, end))
+            for i, client in enumerate(clients)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        elapsed = time.perf_counter() - start
+        stop_sampling.set()
+    finally:
+        for plugin in plugins:
+            harness.stop(plugin)
+        harness.stop(proxy)
+
+    result = {
+        "settings": {
+            "clients": args.clients,
+            "plugins": args.plugins,
+            "targetRate": args.rate,
+            "duration": args.duration,
+            "mix": mix,
+            "persistent": args.persistent,
+            "sharedApplication": args.shared_application,
+            "pluginLatencyMs": args.latency,
+        },
+        "sent": stats.sent,
+        "completed": stats.completed,
+        "failed": stats.failed,
+        "dropped": stats.dropped,
+        "duplicates": stats.duplicates,
+        "misrouted": stats.misrouted,
+        "connectErrors": stats.connect_errors,
+        "throughput": round(stats.completed / elapsed, 1),
+        "latency": harness.percentiles(stats.latencies),
+        "serviceTime": harness.percentiles(stats.service_times),
+    }
+
+    if len(samples) >= 2:
+        (t0, cpu0, _), (t1, cpu1, _) = samples[0], samples[-1]
+        result["proxy"] = {
+            "cpuPercent": round((cpu1 - cpu0) / (t1 - t0) * 100, 1),
+            "rssStartMB": round(samples[0][2] / 2**20, 1),
+            "rssPeakMB": round(max(s[2] for s in samples) / 2**20, 1),
+            "rssEndMB": round(samples[-1][2] / 2**20, 1),
+        }
+
+    return result
+
+
+def print_result(result):
+    s = result["settings"]
+    print(f"{s['clients']} clients, {s['plugins']} plugins, target {s['targetRate']}/s for {s['duration']}s")
+    print(f"  sent {result['sent']}, completed {result['completed']}, failed {result['failed']}, "
+        f"dropped {result['dropped']}, duplicates {result['duplicates']}, misrouted {result['misrouted']}, "
+        f"connect errors {result['connectErrors']}")
+    print(f"  throughput {result['throughput']}/s")
+
+    for name in ("latency", "serviceTime"):
+        p = result[name]
+        print(f"  {name:>11}: p50 {p['p50']:.2f} ms  p95 {p['p95']:.2f} ms  p99 {p['p99']:.2f} ms")
+
+    if "proxy" in result:
+        p = result["proxy"]
+        print(f"  proxy: cpu {p['cpuPercent']}%  rss {p['rssStartMB']} -> {p['rssEndMB']} MB "
+            f"(peak {p['rssPeakMB']} MB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=10, help="simulated MCP clients")
+    parser.add_argument("--plugins", type=int, default=2, help="fake plugins")
+    parser.add_argument("--rate", type=float, default=100, help="commands per second, over all clients")
+    parser.add_argument("--duration", type=float, default=10, help="seconds to send for")
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+        help=f"command weights, from {', '.join(COMMANDS)} (default {DEFAULT_MIX})")
+    parser.add_argument("--timeout", type=float, default=5, help="seconds before a command counts as dropped")
+    parser.add_argument("--persistent", action="store_true", help="keep one connection per client")
+    parser.add_argument("--shared-application", action="store_true",
+        help="register all plugins as photoshop")
+    parser.add_argument("--layers", type=int, default=50, help="layers in each plugin's document")
+    parser.add_argument("--latency", type=float, default=0, help="milliseconds each plugin waits per command")
+    parser.add_argument("--proxy-url", help="use a proxy that is already running")
+    parser.add_argument("--proxy-pid", type=int, help="process to sample for CPU and RSS with --proxy-url")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    result = run(args)
+    print_result(result)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Soak test for resource leaks in a long running MCP server: makes a large
+# number of tool calls through the proxy to a fake plugin (fake_photoshop.py)
+# and watches the server process for growth.
+#
+#   python benchmarks/soak.py --calls 100000 --json soak.json
+#
+# Some commands are not answered (--drop-rate) or fail (--error-rate), so calls
+# time out or return errors, and the plugin is restarted every
+# --restart-every seconds, so calls made while it is gone fail too. Thread
+# count, open file descriptors, RSS and memory traced by tracemalloc are
+# sampled every --sample-every seconds. Once the first --warmup calls are done
+# the values at that point are the baseline, and the run fails (exit code 1) if
+# any of them has grown by more than its --max-* limit at the end. The
+# allocations that grew the most are printed to help find a leak.
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import harness
+
+# tool name -> arguments (layer_id is filled in)
+CALLS = [
+    ("get_layers", {}),
+    ("get_documents", {}),
+    ("set_layer_visibility", {"layer_id": None, "visible": True}),
+    ("apply_gaussian_blur", {"layer_id": None, "radius": 2}),
+]
+
+
+def open_fds():
+    """Returns the number of open file descriptors of this process, or None if unknown."""
+    for path in ("/proc/self/fd", "/dev/fd"):
+        if os.path.isdir(path):
+            return len(os.listdir(path))
+    return None
+
+
+class Soak:
+    def __init__(self, server, layer_id, traced):
+        self.server = server
+        self.layer_id = layer_id
+        self.traced = traced
+
+        self.calls = 0
+        self.errors = 0
+        self.samples = []
+        self._lock = threading.Lock()
+
+    def call(self, i):
+        name, kwargs = CALLS[i % len(CALLS)]
+        kwargs = {k: self.layer_id if k == "layer_id" else v for k, v in kwargs.items()}
+
+        try:
+            result = self.server._get_tool_function(name)(**kwargs)
+            failed = isinstance(result, dict) and result.get("status") == "error"
+        except Exception:
+            failed = True
+
+        with self._lock:
+            self.calls += 1
+            self.errors += failed
+
+    def sample(self, start):
+        stats = harness.process_stats(os.getpid())
+        row = {
+            "seconds": round(time.perf_counter() - start, 1),
+            "calls": self.calls,
+            "errors": self.errors,
+            "threads": threading.active_count(),
+            "fds": open_fds(),
+            "rssMB": round(stats[1] / 2**20, 1) if stats else None,
+            "tracedMB": round(tracemalloc.get_traced_memory()[0] / 2**20, 2) if self.traced else None,
+        }
+        self.samples.append(row)
+        return row
+
+
+def _growth(baseline, end, limits):
+    failures = []
+    growth = {}
+
+    for key, limit in limits.items():
+        if baseline[key] is None or end[key] is None:
+            continue
+        growth[key] = round(end[key] - baseline[key], 2)
+        if growth[key] > limit:
+            failures.append(f"{key} grew by {growth[key]} (limit {limit})")
+
+    return growth, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=100000, help="tool calls to make")
+    parser.add_argument("--threads", type=int, default=4, help="threads making calls")
+    parser.add_argument("--warmup", type=int, default=2000, help="calls before the baseline is taken")
+    parser.add_argument("--timeout", type=float, default=1, help="seconds before a call times out")
+    parser.add_argument("--drop-rate", type=float, default=0.01, help="fraction of commands the plugin ignores")
+    parser.add_argument("--error-rate", type=float, default=0.01, help="fraction of commands that fail")
+    parser.add_argument("--restart-every", type=float, default=60, help="seconds between plugin restarts (0 for never)")
+    parser.add_argument("--sample-every", type=float, default=10, help="seconds between samples")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="do not trace allocations (faster)")
+    parser.add_argument("--max-threads", type=float, default=4, help="allowed growth in thread count")
+    parser.add_argument("--max-fds", type=float, default=16, help="allowed growth in open file descriptors")
+    parser.add_argument("--max-rss", type=float, default=64, help="allowed RSS growth in MB")
+    parser.add_argument("--max-traced", type=float, default=16, help="allowed growth of traced memory in MB")
+    parser.add_argument("--proxy-url", help="use a proxy that is already running")
+    parser.add_argument("--json", help="also write the samples and results to this file")
+    args = parser.parse_args()
+
+    # keep the benchmark's own arguments away from the server's argument parsing
+    sys.argv = sys.argv[:1]
+    plugin_args = ["--layers", 10, "--drop-rate", args.drop_rate, "--error-rate", args.error_rate]
+
+    proxy_url, proxy = harness.start_proxy(args.proxy_url)
+    plugin = harness.start_fake_photoshop(proxy_url, *plugin_args)
+
+    try:
+        server = harness.load_server(proxy_url)
+
+        import core
+        import socket_client
+        socket_client.configure(timeout=args.timeout)
+
+        layers = core.sendCommand(core.createCommand("getLayers", {}))["layers"]
+        soak = Soak(server, layers[0]["id"], not args.no_tracemalloc)
+
+        if soak.traced:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        last_sample = last_restart = start
+        baseline = snapshot = None
+
+        print(f"{'seconds':>8}  {'calls':>8}  {'errors':>7}  {'threads':>7}  {'fds':>5}  {'rss MB':>7}  {'traced MB':>9}")
+
+        with ThreadPoolExecutor(args.threads) as pool:
+            # submitted in chunks so samples and restarts happen while calls run
+            for chunk in range(0, args.calls, 500):
+                list(pool.map(soak.call, range(chunk, min(chunk + 500, args.calls))))
+                now = time.perf_counter()
+
+                if baseline is None and soak.calls >= args.warmup:
+                    # let the client threads of the last calls finish first
+                    time.sleep(args.timeout + 1)
+                    baseline = soak.sample(start)
+                    snapshot = tracemalloc.take_snapshot() if soak.traced else None
+                    last_sample = now
+
+                if now - last_sample >= args.sample_every:
+                    row = soak.sample(start)
+                    print(f"{row['seconds']:8.1f}  {row['calls']:8d}  {row['errors']:7d}  {row['threads']:7d}  "
+                        f"{row['fds'] or 0:5d}  {row['rssMB'] or 0:7.1f}  {row['tracedMB'] or 0:9.2f}")
+                    last_sample = now
+
+                if args.restart_every and now - last_restart >= args.restart_every:
+                    harness.stop(plugin)
+                    plugin = harness.start_fake_photoshop(proxy_url, *plugin_args)
+                    last_restart = time.perf_counter()
+
+        # settle as before the baseline
+        time.sleep(args.timeout + 1)
+        end = soak.sample(start)
+        top = []
+        if soak.traced:
+            if snapshot is not None:
+                diff = tracemalloc.take_snapshot().compare_to(snapshot, "lineno")
+                top = [str(stat) for stat in diff[:10] if stat.size_diff > 0]
+            tracemalloc.stop()
+    finally:
+        harness.stop(plugin)
+        harness.stop(proxy)
+
+    baseline = baseline or soak.samples[0]
+    growth, failures = _growth(baseline, end, {"threads": args.max_threads, "fds": args.max_fds,
+        "rssMB": args.max_rss, "tracedMB": args.max_traced})
+
+    print(f"{end['calls']} calls ({end['errors']} failed or timed out) in {end['seconds']}s")
+    print(f"Growth since call {baseline['calls']}: " + ", ".join(f"{k} {v:+}" for k, v in growth.items()))
+    if top:
+        print("Largest allocation growth:")
+        for line in top:
+            print(f"  {line}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"baseline": baseline, "end": end, "growth": growth, "failures": failures,
+                "topAllocations": top, "samples": soak.samples}, f, indent=2)
+
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
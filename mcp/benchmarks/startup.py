@@ -0,0 +1,96 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# Benchmarks server startup with --profile-startup, which reports the time of
+# each phase (imports, tool registration, font scan, first connection). The
+# total is the time until the server can serve, without the first connection,
+# which depends on the proxy and Photoshop.
+#
+#   python benchmarks/startup.py --runs 5 --check
+#
+# The first run starts with empty font and tool schema caches (a first start
+# after install or upgrade), the others reuse them (a normal restart). With
+# --check, the medians of the warm runs are compared to startup_budget.json and
+# the script fails if a phase is over its budget.
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+MCP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_budget.json")
+
+
+def profile(cache_dir):
+    # point the user cache directory (font and schema caches) at cache_dir
+    env = dict(os.environ, XDG_CACHE_HOME=cache_dir, LOCALAPPDATA=cache_dir)
+    out = subprocess.run([sys.executable, "ps-mcp.py", "--profile-startup"], cwd=MCP_DIR,
+        env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="warm starts to measure")
+    parser.add_argument("--check", action="store_true", help="fail if over startup_budget.json")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    cache_dir = tempfile.mkdtemp(prefix="startup-bench-")
+    try:
+        cold = profile(cache_dir)
+        warm_runs = [profile(cache_dir) for _ in range(args.runs)]
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    warm = {name: round(statistics.median(run[name] for run in warm_runs), 1) for name in cold}
+    results = {"cold": cold, "warm": warm}
+
+    print(f"{'phase':>28}  {'cold ms':>9}  {'warm ms':>9}")
+    for name in cold:
+        print(f"{name:>28}  {cold[name]:9.1f}  {warm[name]:9.1f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.check:
+        with open(BUDGET_PATH) as f:
+            budget = json.load(f)
+
+        over = [f"{name}: {warm[name]} ms > {limit} ms" for name, limit in budget.items()
+            if warm.get(name, 0) > limit]
+        if over:
+            print("Over the startup budget:\n  " + "\n  ".join(over))
+            sys.exit(1)
+
+        print("Within the startup budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# Measures what a client downloads at startup with and without tool discovery
+# mode: the number of tools, the size of the tools/list result and the time to
+# start the server and build it.
+#
+#   python benchmarks/tool_discovery.py --runs 3
+#
+# Each run starts a fresh interpreter, so import time is included.
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+MCP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# run in a child process: loads the server and prints its tools/list result size
+_CHILD = r"""
+import asyncio, importlib.util, json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, ".")
+spec = importlib.util.spec_from_file_location("ps_mcp", "ps-mcp.py")
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+loaded = time.perf_counter()
+tools = asyncio.run(module.mcp.list_tools())
+payload = json.dumps({"tools": [t.model_dump(mode="json", exclude_none=True) for t in tools]})
+done = time.perf_counter()
+print(json.dumps({"tools": len(tools), "bytes": len(payload.encode("utf-8")),
+    "importSeconds": loaded - start, "listSeconds": done - loaded}))
+"""
+
+
+def measure(discovery):
+    env = dict(os.environ, PS_MCP_TOOL_DISCOVERY="1" if discovery else "0")
+    out = subprocess.run([sys.executable, "-c", _CHILD], cwd=MCP_DIR, env=env,
+        capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3, help="server starts per mode")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results = {}
+    for mode, discovery in (("full", False), ("discovery", True)):
+        runs = [measure(discovery) for _ in range(args.runs)]
+        results[mode] = {
+            "tools": runs[0]["tools"],
+            "bytes": runs[0]["bytes"],
+            # roughly 4 bytes per token for English text and JSON
+            "approxTokens": runs[0]["bytes"] // 4,
+            "importSeconds": round(statistics.median(r["importSeconds"] for r in runs), 3),
+            "listSeconds": round(statistics.median(r["listSeconds"] for r in runs), 4),
+        }
+
+        r = results[mode]
+        print(f"{mode:>9}: {r['tools']:4d} tools  {r['bytes']:9,d} bytes (~{r['approxTokens']:,d} tokens)  "
+            f"start {r['importSeconds']:.3f}s  tools/list {r['listSeconds'] * 1000:.1f}ms")
+
+    print(f"Payload reduction: {results['full']['bytes'] / results['discovery']['bytes']:.1f}x")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import math
+
+LABEL_HEIGHT = 14
+PADDING = 4
+BACKGROUND = (235, 235, 235)
+CHECKER = (205, 205, 205)
+CHECKER_SIZE = 8
+
+
+def pixels_to_array(data, width, height, components):
+    """
+    Wraps raw chunky 8 bit pixel data from the plugin as a (height, width, components)
+    numpy array without copying it.
+    """
+    import numpy as np
+
+    return np.frombuffer(data, dtype=np.uint8).reshape((height, width, components))
+
+
+def to_image(pixels):
+    """Returns a PIL image for a (height, width, components) uint8 array."""
+    from PIL import Image as PILImage
+
+    mode = {1: "L", 2: "LA", 3: "RGB", 4: "RGBA"}[pixels.shape[2]]
+    if pixels.shape[2] == 1:
+        pixels = pixels[..., 0]
+    return PILImage.fromarray(pixels, mode)
+
+
+def _checkerboard(height, width):
+    import numpy as np
+
+    y, x = np.indices((height, width))
+    mask = ((x // CHECKER_SIZE + y // CHECKER_SIZE) % 2).astype(bool)
+
+    out = np.empty((height, width, 3), dtype=np.uint8)
+    out[...] = BACKGROUND
+    out[mask] = CHECKER
+    return out
+
+
+def _to_rgb(pixels):
+    """Flattens RGBA / gray pixels onto a checkerboard so transparency is visible."""
+    import numpy as np
+
+    components = pixels.shape[2]
+
+    if components in (1, 2):
+        gray = pixels[..., :1]
+        pixels = np.concatenate([gray, gray, gray] + ([pixels[..., 1:]] if components == 2 else []), axis=2)
+        components += 2
+
+    if components == 3:
+        return pixels
+
+    rgb = pixels[..., :3].astype(np.float32)
+    alpha = pixels[..., 3:4].astype(np.float32) / 255.0
+    background = _checkerboard(pixels.shape[0], pixels.shape[1]).astype(np.float32)
+
+    return (rgb * alpha + background * (1.0 - alpha)).astype(np.uint8)
+
+
+def compose(thumbnails, thumb_size, columns=None):
+    """
+    Tiles thumbnails into a single labeled contact sheet image.
+
+    Args:
+        thumbnails (list): (label, pixels) tuples where pixels is a
+            (height, width, components) uint8 array no larger than thumb_size,
+            or None for a layer that could not be read.
+        thumb_size (int): Size of each cell in pixels (excluding the label)
+        columns (int): Number of columns. Defaults to a roughly square grid.
+
+    Returns:
+        PIL.Image: The RGB contact sheet
+    """
+    import numpy as np
+    from PIL import Image as PILImage
+    from PIL import ImageDraw, ImageFont
+
+    count = max(1, len(thumbnails))
+    columns = columns or math.ceil(math.sqrt(count))
+    rows = math.ceil(count / columns)
+
+    cell_w = thumb_size + PADDING * 2
+    cell_h = thumb_size + PADDING * 2 + LABEL_HEIGHT
+
+    sheet = np.empty((rows * cell_h, columns * cell_w, 3), dtype=np.uint8)
+    sheet[...] = (255, 255, 255)
+
+    for i, (_, pixels) in enumerate(thumbnails):
+        if pixels is None:
+            continue
+
+        pixels = pixels[:thumb_size, :thumb_size]
+        h, w = pixels.shape[:2]
+
+        # center the thumbnail in its cell
+        top = (i // columns) * cell_h + PADDING + (thumb_size - h) // 2
+        left = (i % columns) * cell_w + PADDING + (thumb_size - w) // 2
+        sheet[top:top + h, left:left + w] = _to_rgb(pixels)
+
+    image = PILImage.fromarray(sheet, "RGB")
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default()
+
+    for i, (label, pixels) in enumerate(thumbnails):
+        x = (i % columns) * cell_w + PADDING
+        y = (i // columns) * cell_h + PADDING * 2 + thumb_size
+
+        text = str(label) if pixels is not None else f"{label} (unavailable)"
+        while text and draw.textlength(text, font=font) > thumb_size:
+            text = text[:-1]
+
+        draw.text((x, y), text, fill=(0, 0, 0), font=font)
+
+    return image
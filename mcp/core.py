@@ -1,14 +1,36 @@
+import threading
+from contextlib import contextmanager
+
 import logger
 
 application = None
 socket_client = None
 
+# callables invoked as listener(command, response) after every command is sent.
+# response is None if sending the command raised an error.
+_listeners = []
+
+# set while commands are being collected instead of sent (see collect_commands)
+_collecting = threading.local()
+
 def init(app, socket):
     global application, socket_client
     application = app
     socket_client = socket
 
 
+def add_listener(listener):
+    _listeners.append(listener)
+
+
+def _notify(command, response):
+    for listener in _listeners:
+        try:
+            listener(command, response)
+        except Exception as e:
+            logger.log(f"Command listener error: {e}")
+
+
 def createCommand(action:str, options:dict) -> dict:
     command = {
         "application":application,
@@ -18,9 +40,50 @@ def createCommand(action:str, options:dict) -> dict:
 
     return command
 
-def sendCommand(command:dict):
+@contextmanager
+def collect_commands():
+    """
+    While active (on the current thread), sendCommand does not send commands but
+    appends them to the yielded list and returns a placeholder success response.
+    Used to turn tool calls into a list of commands that can be sent in a single
+    request with sendCommands.
+    """
+    commands = []
+    previous = getattr(_collecting, "commands", None)
+    _collecting.commands = commands
+    try:
+        yield commands
+    finally:
+        _collecting.commands = previous
+
+def is_collecting():
+    """Returns True if commands are being collected (see collect_commands) on this thread."""
+    return getattr(_collecting, "commands", None) is not None
+
+
+def sendCommands(commands:list, timeout=None, history_name=None):
+    """Sends several commands in one request. The plugin runs them in order and
+    returns a list with the result of each. If history_name is set, they are
+    grouped into one history state, and rolled back if any of them fails."""
+    options = {"commands":commands}
+    if history_name:
+        options["historyName"] = history_name
+    return sendCommand(createCommand("runCommands", options), timeout)
+
+def sendCommand(command:dict, timeout=None):
+
+    collected = getattr(_collecting, "commands", None)
+    if collected is not None:
+        collected.append(command)
+        return {"status":"SUCCESS", "response":None, "deferred":True}
+
+    try:
+        response = socket_client.send_message_blocking(command, timeout)
+    except Exception:
+        _notify(command, None)
+        raise
+
+    _notify(command, response)
 
-    response = socket_client.send_message_blocking(command)
-    
     logger.log(f"Final response: {response['status']}")
-    return response
\ No newline at end of file
+    return response
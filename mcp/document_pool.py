@@ -0,0 +1,208 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# Keeps documents ready to be handed out, so jobs that need a new document of
+# a common size, or a copy of a heavy template, do not pay Photoshop's creation
+# cost each time. Released documents are reset to a snapshot taken when they
+# were created and go back to the pool instead of being closed.
+
+import os
+import threading
+
+from core import createCommand, sendCommand, sendCommands
+from batch_runner import close_document_command
+import logger
+
+# idle documents kept per preset / template, unless warmed to another count
+POOL_SIZE = 3
+
+PRISTINE_SNAPSHOT = "Document pool pristine"
+
+
+def preset_key(width, height, resolution, color_mode, fill_color):
+    fill = tuple(fill_color.get(c, 0) for c in ("red", "green", "blue"))
+    return ("preset", int(width), int(height), int(resolution), color_mode.upper(), fill)
+
+
+def template_key(file_path):
+    return ("template", os.path.normcase(os.path.abspath(file_path)))
+
+
+def _describe(key):
+    if key[0] == "template":
+        return key[1]
+
+    _, width, height, resolution, color_mode, fill = key
+    return f"{width}x{height} {resolution}ppi {color_mode} fill {fill}"
+
+
+def _snapshot_command(verb):
+    descriptor = {"_obj": verb, "_isCommand": True}
+    if verb == "make":
+        descriptor["_target"] = [{"_ref": "snapshotClass"}]
+        descriptor["name"] = PRISTINE_SNAPSHOT
+        descriptor["using"] = {"_enum": "historyState", "_value": "fullDocument"}
+    else:
+        descriptor["_target"] = [{"_ref": "snapshotClass", "_name": PRISTINE_SNAPSHOT}]
+
+    return createCommand("executeBatchPlayCommand", {"commands": [descriptor]})
+
+
+def _activate_command(document_id):
+    return createCommand("setActiveDocument", {"documentId": document_id})
+
+
+class DocumentPool:
+    """
+    Idle documents by pool key (a preset or a template), and the key of each
+    document that has been handed out.
+    """
+
+    def __init__(self, size=POOL_SIZE):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.created = 0
+        self.recycled = 0
+        self.closed = 0
+        self._idle = {}
+        self._targets = {}
+        self._in_use = {}
+        self._lock = threading.Lock()
+
+    def _create(self, key, count):
+        """Creates count pristine documents for key in one request and returns their ids."""
+        if key[0] == "preset":
+            _, width, height, resolution, color_mode, (r, g, b) = key
+            create = createCommand("createDocument", {
+                "name": "Untitled",
+                "width": width,
+                "height": height,
+                "resolution": resolution,
+                "fillColor": {"red": r, "green": g, "blue": b},
+                "colorMode": color_mode
+            })
+            commands = [create, _snapshot_command("make")] * count
+            results = sendCommands(commands)["response"]
+            ids = [r["documentId"] for r in results[0::2]]
+        else:
+            # duplicates of a freshly opened template, the template itself is closed
+            commands = [createCommand("openFile", {"filePath": key[1]})]
+            commands += [
+                createCommand("duplicateDocument", {"name": os.path.basename(key[1])}),
+                _snapshot_command("make")
+            ] * count
+            results = sendCommands(commands)["response"]
+            ids = [r["documentId"] for r in results[1::2]]
+
+            sendCommands([_activate_command(results[0]["documentId"]), close_document_command()])
+
+        self.created += len(ids)
+        logger.log(f"Document pool: created {len(ids)} documents for {_describe(key)}")
+        return ids
+
+    def warm(self, key, count=None):
+        """
+        Creates documents for key until count (default size) are idle, and keeps
+        up to count idle from then on. Returns the number idle.
+        """
+        count = self.size if count is None else count
+
+        with self._lock:
+            self._targets[key] = count
+            missing = count - len(self._idle.get(key, []))
+            if missing > 0:
+                self._idle.setdefault(key, []).extend(self._create(key, missing))
+            return len(self._idle[key])
+
+    def acquire(self, key):
+        """
+        Activates an idle document for key (creating one if there are none) and
+        returns (document id, whether it came from the pool).
+        """
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+
+            while idle:
+                document_id = idle.pop()
+                try:
+                    response = sendCommand(_activate_command(document_id))
+                except Exception as e:
+                    logger.log(f"Document pool: could not activate {document_id}: {e}")
+                    response = {}
+
+                # the document may have been closed by the user
+                if (response.get("document") or {}).get("id") == document_id:
+                    self.hits += 1
+                    self._in_use[document_id] = key
+                    return (document_id, True)
+
+                logger.log(f"Document pool: dropping missing document {document_id}")
+
+            self.misses += 1
+            document_id = self._create(key, 1)[0]
+            self._in_use[document_id] = key
+            return (document_id, False)
+
+    def release(self, document_id):
+        """
+        Returns a document handed out by acquire() to the pool, reverted to its
+        pristine snapshot. Closes it instead if the pool for its key is full
+        (the count it was warmed to, or size).
+
+        Returns:
+            bool: True if the document was kept, False if it was closed
+        """
+        with self._lock:
+            key = self._in_use.pop(document_id, None)
+            if key is None:
+                raise ValueError(f"Document {document_id} was not acquired from the document pool")
+
+            idle = self._idle.setdefault(key, [])
+            if len(idle) >= self._targets.get(key, self.size):
+                sendCommands([_activate_command(document_id), close_document_command()])
+                self.closed += 1
+                return False
+
+            sendCommands([_activate_command(document_id), _snapshot_command("select")])
+            idle.append(document_id)
+            self.recycled += 1
+            return True
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "idle": {_describe(k): len(v) for k, v in self._idle.items()},
+                "inUse": len(self._in_use),
+                "maxIdle": {_describe(k): self._targets.get(k, self.size) for k in self._idle},
+                "hits": self.hits,
+                "misses": self.misses,
+                "created": self.created,
+                "recycled": self.recycled,
+                "closed": self.closed,
+                "hitRate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+pool = DocumentPool()
@@ -0,0 +1,135 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Tracks the active document info and layer tree that the plugin attaches to
+# every response, so the server can know the current history state without
+# making a round trip.
+
+import time
+
+# How long (in seconds) the last seen state is trusted. Edits made directly in
+# Photoshop are only seen on the next response, so this bounds how stale it can be.
+STATE_MAX_AGE = 10
+
+_document = None
+_layers = None
+_layer_ids = None
+_updated_at = 0.0
+
+
+def state_from_response(response):
+    """
+    Returns the (document id, history state id) tuple from the document info
+    attached to a response, or None if it is not available.
+    """
+    if not response:
+        return None
+
+    document = response.get("document") or {}
+    history_state_id = document.get("historyStateId")
+
+    if history_state_id is None:
+        return None
+
+    return (document.get("id"), history_state_id)
+
+
+def on_response(command, response):
+    """core listener that records the document info and layers from each response."""
+    global _document, _layers, _layer_ids, _updated_at
+
+    if not response or response.get("status") != "SUCCESS" or "document" not in response:
+        # the document may have changed in ways we did not see
+        _document = None
+        _layers = None
+        _layer_ids = None
+        return
+
+    if "layers" not in response:
+        # a getHistoryState probe: the last seen tree is still current if the
+        # document is at the same state
+        same = state_from_response(response) == state_from_response({"document": _document})
+        _document = response.get("document")
+        if not same:
+            _layers = None
+            _layer_ids = None
+        _updated_at = time.monotonic()
+        return
+
+    _document = response.get("document")
+    _layers = response.get("layers")
+    _layer_ids = None
+    _updated_at = time.monotonic()
+
+
+def current_state(max_age=STATE_MAX_AGE):
+    """
+    Returns the last seen (document id, history state id), or None if it is
+    unknown or older than max_age seconds.
+    """
+    if _document is None or time.monotonic() - _updated_at > max_age:
+        return None
+
+    return state_from_response({"document": _document})
+
+
+def current_layers(max_age=STATE_MAX_AGE):
+    """
+    Returns the last seen layer tree of the active document, or None if it is
+    unknown or older than max_age seconds.
+    """
+    layers = _layers
+    if layers is None or time.monotonic() - _updated_at > max_age:
+        return None
+
+    return layers
+
+
+def current_layer_ids(max_age=STATE_MAX_AGE):
+    """
+    Returns the set of IDs of every layer (including layers in groups) in the
+    last seen layer tree, or None if it is unknown or older than max_age seconds.
+    """
+    global _layer_ids
+
+    layers, ids = _layers, _layer_ids
+    if layers is None or time.monotonic() - _updated_at > max_age:
+        return None
+
+    if ids is None:
+        ids = set()
+        pending = list(layers)
+        while pending:
+            layer = pending.pop()
+            ids.add(layer.get("id"))
+            pending.extend(layer.get("layers") or [])
+
+        # a response may have replaced the tree meanwhile
+        if layers is _layers:
+            _layer_ids = ids
+
+    return ids
+
+
+def is_layer_arg(name):
+    """Returns True if a tool argument called name holds a layer ID (or a list of them)."""
+    return name == "layer_ids" or ("layer" in name and name.endswith("_id"))
@@ -0,0 +1,467 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Text and photo effect recipes (from skills/ps-text-effects and
+# skills/ps-photo-effects) as data, so an effect can be compiled into the
+# commands of all its steps and sent to Photoshop in one request.
+#
+# A recipe step is {"tool", "args", "repeat"}, as in batch_process recipes.
+# Any string value "$name" is replaced with the recipe parameter of that name
+# ("$name.red" for a key of a parameter dict), and "$layer_id" with the target
+# layer.
+
+import json
+import re
+
+from batch_runner import compile_recipe
+
+# Seconds to wait for an effect, filters on large documents can be slow
+EFFECT_TIMEOUT = 120
+
+_PLACEHOLDER = re.compile(r"^\$([A-Za-z_]\w*)(?:\.(\w+))?$")
+
+
+def _rgb(red, green, blue):
+    return {"red": red, "green": green, "blue": blue}
+
+
+def _stops(*stops):
+    return [{"location": location, "color": _rgb(*color)} for location, color in stops]
+
+
+def _color_step(tool, color, **args):
+    # the glow, satin and color overlay tools take the color as separate arguments
+    return {"tool": tool, "args": {
+        "layer_id": "$layer_id",
+        "color_red": f"${color}.red",
+        "color_green": f"${color}.green",
+        "color_blue": f"${color}.blue",
+        **args,
+    }}
+
+
+def _step(tool, repeat=1, **args):
+    step = {"tool": tool, "args": {"layer_id": "$layer_id", **args}}
+    if repeat != 1:
+        step["repeat"] = repeat
+    return step
+
+
+def _rotate(angle):
+    return {"tool": "rotate_canvas", "args": {"angle": angle}}
+
+
+def _curves(channel, *points):
+    return _step("add_curves_adjustment_layer", channel=channel,
+        points=[{"input": i, "output": o} for i, o in points])
+
+
+TEXT_EFFECTS = {
+    "liquid_drip": {
+        "description": "Streaks dripping down from the text. Use white text on a black "
+            "background, merged into one layer.",
+        "params": {"wind_passes": 6, "blur_radius": 2.5, "opacity": 90,
+            "glow_color": _rgb(255, 17, 119)},
+        "steps": [
+            _step("rasterize_layer"),
+            _step("scale_layer", width=100, height=300, anchor_position="TOPCENTER"),
+            # rotating counter clockwise first, so the wind pushes the pixels down
+            _rotate(-90),
+            _step("apply_wind", repeat="$wind_passes", method="wind", direction="fromTheLeft"),
+            _rotate(90),
+            _step("apply_gaussian_blur", radius="$blur_radius"),
+            _step("set_layer_properties", blend_mode="SCREEN", layer_opacity="$opacity"),
+            _color_step("add_outer_glow_layer_style", "glow_color", blend_mode="SCREEN",
+                opacity=100, size=20),
+        ],
+    },
+    "chrome": {
+        "description": "Reflective chrome / metallic text.",
+        "params": {"depth": 300, "size": 5},
+        "steps": [
+            _step("add_gradient_overlay_layer_style", gradient_type="reflected", angle=90,
+                color_stops=_stops((0, (26, 26, 26)), (25, (216, 216, 216)), (50, (26, 26, 26)),
+                    (75, (250, 250, 250)), (100, (26, 26, 26)))),
+            _step("add_bevel_emboss_layer_style", style="innerBevel", technique="chiselHard",
+                depth="$depth", size="$size", angle=120, altitude=30, highlight_mode="SCREEN",
+                highlight_opacity=90, shadow_mode="MULTIPLY", shadow_opacity=75),
+        ],
+    },
+    "neon": {
+        "description": "Glowing neon tube text.",
+        "params": {"color": _rgb(255, 17, 119), "glow_size": 20, "ambient_size": 60},
+        "steps": [
+            _color_step("add_inner_glow_layer_style", "color", blend_mode="NORMAL", opacity=100,
+                source="center", choke=0, size=8),
+            _color_step("add_outer_glow_layer_style", "color", blend_mode="SCREEN", opacity=100,
+                spread=0, size="$glow_size"),
+            # a screen drop shadow with no distance is a wide ambient glow
+            _step("add_drop_shadow_layer_style", blend_mode="SCREEN", color="$color",
+                opacity=100, distance=0, spread=0, size="$ambient_size"),
+        ],
+    },
+    "glass": {
+        "description": "Clear glass / frosted text, showing the background through the letters.",
+        "params": {"depth": 150, "size": 10},
+        "steps": [
+            _step("set_layer_properties", fill_opacity=0),
+            _step("add_bevel_emboss_layer_style", style="innerBevel", technique="smooth",
+                depth="$depth", size="$size", soften=2, angle=120, altitude=30,
+                highlight_mode="SCREEN", highlight_opacity=85, shadow_mode="MULTIPLY",
+                shadow_opacity=50),
+            _step("add_inner_shadow_layer_style", blend_mode="MULTIPLY", opacity=30, angle=120,
+                distance=3, choke=0, size=5),
+            _step("add_inner_glow_layer_style", blend_mode="SCREEN", color_red=255,
+                color_green=255, color_blue=255, opacity=30, source="edge", choke=0, size=8),
+            _step("add_stroke_layer_style", size=1, position="INSIDE", blend_mode="SCREEN",
+                color=_rgb(255, 255, 255), opacity=50),
+        ],
+    },
+    "fire": {
+        "description": "Flames rising from the text. Use white text on a black background, "
+            "merged into one layer.",
+        "params": {"wind_passes": 4, "blur_radius": 1.5, "flicker": 1},
+        "steps": [
+            _step("rasterize_layer"),
+            # rotating clockwise first, so the wind pushes the pixels up
+            _rotate(90),
+            _step("apply_wind", repeat="$wind_passes", method="wind", direction="fromTheLeft"),
+            _rotate(-90),
+            _step("apply_gaussian_blur", radius="$blur_radius"),
+            # flicker is 0 or 1
+            _step("apply_ripple", repeat="$flicker", amount=110, size="medium"),
+            _step("add_gradient_map_adjustment_layer",
+                color_stops=_stops((0, (0, 0, 0)), (30, (255, 0, 0)), (55, (255, 102, 0)),
+                    (80, (255, 204, 0)), (100, (255, 255, 255)))),
+        ],
+    },
+    "ice": {
+        "description": "Frozen ice text. Works best on light blue (168, 216, 234) text.",
+        "params": {"depth": 250, "frost_color": _rgb(200, 232, 255)},
+        "steps": [
+            _step("add_bevel_emboss_layer_style", style="innerBevel", technique="chiselHard",
+                depth="$depth", size=5, angle=120, altitude=30, highlight_mode="SCREEN",
+                highlight_opacity=90, shadow_mode="MULTIPLY", shadow_color_red=26,
+                shadow_color_green=58, shadow_color_blue=92, shadow_opacity=70),
+            _color_step("add_inner_glow_layer_style", "frost_color", blend_mode="SCREEN", opacity=50,
+                source="edge", size=12),
+            _color_step("add_satin_layer_style", "frost_color", blend_mode="SCREEN", opacity=30,
+                angle=19, distance=11, size=14, invert=True),
+        ],
+    },
+    "gold": {
+        "description": "Polished gold / luxury text.",
+        "params": {"depth": 200, "stroke_size": 2},
+        "steps": [
+            _step("add_gradient_overlay_layer_style", gradient_type="linear", angle=90,
+                color_stops=_stops((0, (191, 149, 63)), (25, (252, 246, 186)), (50, (179, 135, 40)),
+                    (75, (251, 245, 183)), (100, (170, 119, 28)))),
+            _step("add_bevel_emboss_layer_style", style="innerBevel", technique="smooth",
+                depth="$depth", size=3, highlight_color_red=252, highlight_color_green=246,
+                highlight_color_blue=186, shadow_color_red=92, shadow_color_green=58,
+                shadow_color_blue=10),
+            # the stroke tool only takes a solid color, so use the middle gold
+            _step("add_stroke_layer_style", size="$stroke_size", position="OUTSIDE",
+                color=_rgb(179, 135, 40)),
+            _step("add_satin_layer_style", blend_mode="MULTIPLY", color_red=92, color_green=58,
+                color_blue=10, opacity=25, angle=19, distance=8, size=10),
+        ],
+    },
+    "holographic": {
+        "description": "Iridescent rainbow foil text.",
+        "params": {"angle": 135},
+        "steps": [
+            _step("add_gradient_overlay_layer_style", gradient_type="linear", angle="$angle",
+                color_stops=_stops((0, (255, 0, 153)), (15, (255, 102, 0)), (30, (255, 255, 0)),
+                    (45, (0, 255, 102)), (60, (0, 204, 255)), (75, (102, 51, 255)),
+                    (100, (255, 0, 153)))),
+            _step("add_bevel_emboss_layer_style", style="innerBevel", technique="smooth",
+                depth=150, size=4, soften=2),
+            _step("add_satin_layer_style", blend_mode="LINEARDODGE", color_red=255,
+                color_green=255, color_blue=255, opacity=30),
+        ],
+    },
+    "letterpress": {
+        "description": "Text pressed into the background. Use direction \"down\" on dark "
+            "backgrounds and \"up\" on light ones.",
+        "params": {"direction": "down", "depth": 150},
+        "steps": [
+            _step("set_layer_properties", fill_opacity=0),
+            _step("add_bevel_emboss_layer_style", style="pillowEmboss", direction="$direction",
+                depth="$depth", size=2),
+            _step("add_inner_shadow_layer_style", opacity=30),
+        ],
+    },
+    "outline": {
+        "description": "Hollow text with only an outline.",
+        "params": {"size": 2, "color": _rgb(255, 255, 255)},
+        "steps": [
+            _step("set_layer_properties", fill_opacity=0),
+            _step("add_stroke_layer_style", size="$size", position="CENTER", color="$color"),
+        ],
+    },
+    "smoke": {
+        "description": "Wispy smoke text. Use white text on a black background, merged into "
+            "one layer.",
+        "params": {"blur_radius": 3, "amplitude_max": 20},
+        "steps": [
+            _step("rasterize_layer"),
+            _step("apply_wave", generators=5, wavelength_min=10, wavelength_max=80,
+                amplitude_min=5, amplitude_max="$amplitude_max"),
+            _step("apply_gaussian_blur", radius="$blur_radius"),
+            _step("set_layer_properties", blend_mode="SCREEN"),
+        ],
+    },
+    "retro": {
+        "description": "Warm off-white vintage text with a red outline and a hard shadow.",
+        "params": {"color": _rgb(240, 230, 210), "stroke_color": _rgb(200, 30, 30)},
+        "steps": [
+            _color_step("add_color_overlay_layer_style", "color"),
+            _step("add_stroke_layer_style", size=3, position="OUTSIDE", color="$stroke_color"),
+            _step("add_drop_shadow_layer_style", opacity=100, distance=4, spread=100, size=0),
+        ],
+    },
+    "lava": {
+        "description": "Molten lava text glowing orange.",
+        "params": {"depth": 300},
+        "steps": [
+            _step("add_inner_glow_layer_style", blend_mode="SCREEN", color_red=255,
+                color_green=102, color_blue=0, opacity=75, size=15),
+            _step("add_outer_glow_layer_style", blend_mode="SCREEN", color_red=255,
+                color_green=51, color_blue=0, opacity=80, size=25),
+            _step("add_bevel_emboss_layer_style", style="innerBevel", depth="$depth", size=7),
+        ],
+    },
+    "liquid_bevel": {
+        "description": "Glossy liquid text built only from stacked layer styles.",
+        "params": {"size": 20, "stroke_color": _rgb(255, 255, 255)},
+        "steps": [
+            _step("add_stroke_layer_style", size=2, color="$stroke_color"),
+            _step("add_bevel_emboss_layer_style", style="innerBevel", technique="smooth",
+                depth=100, size="$size", angle=120, altitude=47, highlight_mode="SCREEN",
+                highlight_opacity=100, shadow_mode="MULTIPLY", shadow_opacity=100),
+            _step("add_inner_glow_layer_style", size=15, opacity=50, source="edge"),
+            _step("add_outer_glow_layer_style", size=30, opacity=60),
+            _step("set_layer_properties", fill_opacity=0),
+        ],
+    },
+}
+
+PHOTO_EFFECTS = {
+    "cyberpunk": {
+        "description": "Blue shadows and pink highlights synthwave grading.",
+        "params": {"vibrance": 30},
+        "steps": [
+            _step("add_color_balance_adjustment_layer", shadows=[0, 0, 50],
+                highlights=[30, -10, -20]),
+            _step("add_levels_adjustment_layer", output_shadow=15),
+            _step("add_vibrance_adjustment_layer", vibrance="$vibrance"),
+        ],
+    },
+    "retro_vintage": {
+        "description": "Faded blacks, capped whites and warm, desaturated colors.",
+        "params": {"saturation": -25, "density": 22},
+        "steps": [
+            _curves("composite", (0, 30), (255, 240)),
+            _curves("red", (0, 12), (255, 255)),
+            _curves("blue", (0, 35), (255, 220)),
+            _step("add_hue_saturation_adjustment_layer", saturation="$saturation"),
+            _step("add_photo_filter_adjustment_layer", color_red=236, color_green=138,
+                color_blue=0, density="$density"),
+        ],
+    },
+    "duotone": {
+        "description": "Maps the image to two colors, e.g. midnight blue to gold.",
+        "params": {"shadow_color": _rgb(25, 25, 112), "highlight_color": _rgb(255, 215, 0)},
+        "steps": [
+            _step("add_gradient_map_adjustment_layer", color_stops=[
+                {"location": 0, "color": "$shadow_color"},
+                {"location": 100, "color": "$highlight_color"}]),
+        ],
+    },
+    "vignette": {
+        "description": "Darkens the corners of the image.",
+        "params": {"amount": -80, "midpoint": 40},
+        "steps": [
+            _step("lens_correction", vignette="$amount", vignette_midpoint="$midpoint"),
+        ],
+    },
+    "hdr": {
+        "description": "Punchy HDR look with recovered shadows and highlights.",
+        "params": {"shadow_amount": 50, "highlight_amount": 30, "vibrance": 30},
+        "steps": [
+            _step("shadows_highlights", shadow_amount="$shadow_amount",
+                highlight_amount="$highlight_amount"),
+            _curves("composite", (0, 0), (64, 50), (192, 205), (255, 255)),
+            _step("add_vibrance_adjustment_layer", vibrance="$vibrance"),
+        ],
+    },
+    "miniature": {
+        "description": "Tilt-shift blur that makes a scene look like a model.",
+        "params": {"blur_amount": 30, "focus_top": 300, "focus_bottom": 500},
+        "steps": [
+            _step("apply_tilt_shift_blur", blur_amount="$blur_amount", focus_top="$focus_top",
+                focus_bottom="$focus_bottom"),
+        ],
+    },
+    "day_to_night": {
+        "description": "Turns a daylight photo into a blue night scene.",
+        "params": {"saturation": -30},
+        "steps": [
+            _curves("composite", (0, 0), (128, 90), (255, 180)),
+            _step("add_color_balance_adjustment_layer", shadows=[0, 0, 40],
+                midtones=[-10, 0, 30]),
+            _step("add_hue_saturation_adjustment_layer", saturation="$saturation"),
+        ],
+    },
+    "teal_orange": {
+        "description": "Cinematic teal shadows and orange skin tones.",
+        "params": {},
+        "steps": [
+            _curves("red", (0, 0), (60, 45), (190, 210), (255, 255)),
+            _curves("green", (0, 0), (75, 70), (180, 185), (255, 255)),
+            _curves("blue", (0, 0), (50, 75), (200, 175), (255, 255)),
+        ],
+    },
+    "anime": {
+        "description": "Bright, contrasty Japanese anime style colors.",
+        "params": {"vibrance": 20},
+        "steps": [
+            _curves("composite", (0, 0), (64, 54), (192, 202), (255, 255)),
+            _step("add_color_balance_adjustment_layer", shadows=[0, 0, 10]),
+            _step("add_vibrance_adjustment_layer", vibrance="$vibrance", saturation=5),
+        ],
+    },
+    "moody_blue": {
+        "description": "Cool, desaturated grading with blue shadows and muted highlights.",
+        "params": {"saturation": -20},
+        "steps": [
+            _step("add_color_balance_adjustment_layer", shadows=[0, 0, 40]),
+            _step("add_hue_saturation_adjustment_layer", saturation="$saturation"),
+            _curves("composite", (0, 0), (255, 230)),
+        ],
+    },
+    "warm_vintage": {
+        "description": "Raised blacks, a warm filter and softened colors.",
+        "params": {"black_point": 20, "density": 25, "saturation": -15},
+        "steps": [
+            _step("add_levels_adjustment_layer", output_shadow="$black_point"),
+            _step("add_photo_filter_adjustment_layer", density="$density"),
+            _step("add_hue_saturation_adjustment_layer", saturation="$saturation"),
+        ],
+    },
+}
+
+
+def _type_name(value):
+    if isinstance(value, bool):
+        return "a boolean"
+    if isinstance(value, (int, float)):
+        return "a number"
+    if isinstance(value, str):
+        return "a string"
+    if isinstance(value, dict):
+        return "an object"
+    if isinstance(value, list):
+        return "a list"
+    return type(value).__name__
+
+
+def _check_override(name, value, default):
+    # overrides replace the default in the steps, so must have the same shape
+    if _type_name(value) != _type_name(default):
+        raise ValueError(f"Parameter '{name}' must be {_type_name(default)} like its "
+            f"default {json.dumps(default)}, got {json.dumps(value, default=str)}")
+
+    if isinstance(default, dict):
+        if set(value) != set(default):
+            raise ValueError(f"Parameter '{name}' must have the keys "
+                f"{', '.join(sorted(default))}, got {', '.join(sorted(map(str, value))) or 'none'}")
+
+        for key, item in value.items():
+            _check_override(f"{name}.{key}", item, default[key])
+
+
+def _substitute(value, params):
+    if isinstance(value, str):
+        m = _PLACEHOLDER.match(value)
+        if m is None:
+            return value
+
+        name, key = m.groups()
+        if name not in params:
+            raise ValueError(f"Recipe uses unknown parameter '{name}'")
+
+        return params[name][key] if key else params[name]
+
+    if isinstance(value, dict):
+        return {k: _substitute(v, params) for k, v in value.items()}
+
+    if isinstance(value, list):
+        return [_substitute(v, params) for v in value]
+
+    return value
+
+
+def describe(effects):
+    """Returns the name, description and parameters with defaults of each effect."""
+    return [
+        {"name": name, "description": recipe["description"], "params": recipe["params"]}
+        for name, recipe in effects.items()
+    ]
+
+
+def compile_effect(effects, name, layer_id, params, resolve_tool):
+    """
+    Turns an effect recipe into the plugin commands of all its steps.
+
+    Args:
+        effects (dict): TEXT_EFFECTS or PHOTO_EFFECTS
+        name (str): Effect name
+        layer_id (int): Layer to apply the effect to
+        params (dict): Overrides for the recipe parameters, or None
+        resolve_tool (callable): Returns the function for a tool name, or None
+
+    Returns:
+        list[dict]: Commands to send with core.sendCommands()
+
+    Raises:
+        ValueError: If the effect or a parameter is unknown, or a parameter does
+            not have the type (and keys) of its default
+    """
+    recipe = effects.get(name)
+    if recipe is None:
+        raise ValueError(f"Unknown effect '{name}'. Available: {', '.join(sorted(effects))}")
+
+    params = params or {}
+    unknown = set(params) - set(recipe["params"])
+    if unknown:
+        raise ValueError(f"Unknown parameters for '{name}': {', '.join(sorted(unknown))}. "
+            f"Available: {', '.join(sorted(recipe['params'])) or 'none'}")
+
+    for param, value in params.items():
+        _check_override(param, value, recipe["params"][param])
+
+    values = {**recipe["params"], **params, "layer_id": layer_id}
+    steps = [_substitute(step, values) for step in recipe["steps"]]
+
+    return compile_recipe(steps, resolve_tool)
@@ -0,0 +1,194 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# In memory search index over the installed fonts (see fonts.py), so fonts can
+# be looked up by name instead of listing them all to the model.
+
+import bisect
+import re
+import threading
+
+import fonts
+
+DEFAULT_LIMIT = 20
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def _normalize(text):
+    return _NON_ALNUM.sub("", (text or "").lower())
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class FontIndex:
+    """
+    Prefix and trigram index over font PostScript, family and style names.
+
+    Short queries (under 3 characters) match name prefixes, longer ones match
+    any part of a name.
+    """
+
+    def __init__(self, records):
+        by_name = {}
+        for record in records:
+            by_name.setdefault(record["postscript"], record)
+
+        self.fonts = sorted(by_name.values(), key=lambda r: r["postscript"].lower())
+        self.families = {}
+        self._grams = {}
+        self._prefixes = []
+        self._postscript = {}
+
+        for i, font in enumerate(self.fonts):
+            self._postscript[font["postscript"].lower()] = i
+            self.families.setdefault(font.get("family") or "", []).append(i)
+
+            keys = {_normalize(font["postscript"]), _normalize(font.get("family"))}
+            for key in keys:
+                if key:
+                    self._prefixes.append((key, i))
+                    for gram in _trigrams(key):
+                        self._grams.setdefault(gram, set()).add(i)
+
+        self._prefixes.sort()
+
+    def __contains__(self, postscript_name):
+        return postscript_name.lower() in self._postscript
+
+    def __len__(self):
+        return len(self.fonts)
+
+    def _prefix_matches(self, prefix):
+        start = bisect.bisect_left(self._prefixes, (prefix,))
+        out = set()
+        for key, i in self._prefixes[start:]:
+            if not key.startswith(prefix):
+                break
+            out.add(i)
+        return out
+
+    def _candidates(self, query):
+        if len(query) < 3:
+            return self._prefix_matches(query)
+
+        grams = sorted(_trigrams(query), key=lambda g: len(self._grams.get(g, ())))
+        candidates = set(self._grams.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not candidates:
+                break
+            candidates &= self._grams.get(gram, set())
+
+        # trigrams can match out of order, confirm the whole query is present
+        return {
+            i for i in candidates
+            if query in _normalize(self.fonts[i]["postscript"])
+            or query in _normalize(self.fonts[i].get("family"))
+        }
+
+    def search(self, query=None, family=None, style=None, limit=DEFAULT_LIMIT):
+        """
+        Finds fonts whose PostScript or family name contains query, optionally
+        limited to a family and / or style (case and punctuation insensitive).
+
+        Returns:
+            list[dict]: Up to limit {"postscript", "family", "style"} dicts, best matches first
+        """
+        query = _normalize(query)
+        family = _normalize(family)
+        style = _normalize(style)
+
+        indexes = self._candidates(query) if query else range(len(self.fonts))
+
+        matches = []
+        for i in indexes:
+            font = self.fonts[i]
+            if family and _normalize(font.get("family")) != family:
+                continue
+            if style and _normalize(font.get("style")) != style:
+                continue
+
+            name = _normalize(font["postscript"])
+            rank = (
+                0 if name == query else
+                1 if name.startswith(query) else
+                2 if _normalize(font.get("family")).startswith(query) else 3
+            )
+            matches.append((rank, len(name), font["postscript"].lower(), i))
+
+        matches.sort()
+        return [dict(self.fonts[m[3]]) for m in matches[:limit]]
+
+    def summary(self, examples=20):
+        """A short description of the installed fonts for the instructions."""
+        # families with the most styles first, as examples of what is installed
+        largest = sorted(self.families.items(), key=lambda kv: (-len(kv[1]), kv[0]))
+        names = [self.fonts[indexes[0]]["postscript"] for family, indexes in largest[:examples] if family]
+
+        return (f"{len(self.fonts)} fonts in {len(self.families)} families are installed. "
+            f"Use search_fonts to find PostScript names. Examples: {', '.join(names)}")
+
+
+_lock = threading.Lock()
+_index = None
+_source = None
+
+
+def get_index():
+    """Returns the index of the fonts known so far, rebuilt when a font scan updates them."""
+    global _index, _source
+
+    entries = fonts.get_font_entries()
+    with _lock:
+        if _index is None or entries is not _source:
+            _index = FontIndex(font for entry in entries.values() for font in entry["fonts"])
+            _source = entries
+
+        return _index
+
+
+def check_font(postscript_name):
+    """
+    Returns a message with the closest matches if postscript_name is not one of
+    the installed fonts, or None. Returns None for None, or before any fonts are
+    known.
+    """
+    if not postscript_name:
+        return None
+
+    index = get_index()
+    if not len(index) or postscript_name in index:
+        return None
+
+    suggestions = [f["postscript"] for f in index.search(postscript_name, limit=5)]
+    if not suggestions:
+        # fall back to fonts of the same family, e.g. "Arial-Bold" -> Arial
+        family = re.split(r"[-_ ]", postscript_name)[0]
+        suggestions = [f["postscript"] for f in index.search(family, limit=5)]
+
+    message = f"Font '{postscript_name}' was not found in the installed fonts."
+    if suggestions:
+        message += f" Did you mean: {', '.join(suggestions)}?"
+    return message + " Use search_fonts to find PostScript names."
@@ -20,89 +20,318 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import glob
+import json
+import multiprocessing
 import os
 import sys
-import glob
-from fontTools.ttLib import TTFont
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 
-def list_all_fonts_postscript():
-    """
-    Returns a list of PostScript names for all fonts installed on the system.
-    Works on both Windows and macOS.
-    
-    Returns:
-        list: A list of PostScript font names as strings
-    """
-    postscript_names = []
-    
-    # Get font directories based on platform
+import logger
+
+# bump when the format of cache entries changes
+CACHE_VERSION = 1
+
+CACHE_FILE_NAME = "fonts.json"
+
+# below this many changed files, parse in process rather than start a pool
+PARALLEL_MIN_FILES = 500
+
+# max font files sent to a worker process at once
+PARALLEL_CHUNK = 32
+
+_lock = threading.Lock()
+_entries = None  # font file path -> {"mtime", "size", "fonts"}, latest known
+_scan_thread = None
+_scan_done = threading.Event()
+
+# how long the last background scan took
+scan_seconds = None
+
+
+def _font_dirs():
     font_dirs = []
-    
+
     if sys.platform == 'win32':  # Windows
         # Windows font directory
         if 'WINDIR' in os.environ:
             font_dirs.append(os.path.join(os.environ['WINDIR'], 'Fonts'))
-    
+        # fonts installed for the current user only
+        if 'LOCALAPPDATA' in os.environ:
+            font_dirs.append(os.path.join(os.environ['LOCALAPPDATA'], 'Microsoft', 'Windows', 'Fonts'))
+        # fonts activated from Adobe Fonts
+        if 'APPDATA' in os.environ:
+            font_dirs.append(os.path.join(os.environ['APPDATA'], 'Adobe', 'CoreSync', 'plugins', 'livetype', 'r'))
+
     elif sys.platform == 'darwin':  # macOS
         # macOS system font directories
         font_dirs.extend([
             '/System/Library/Fonts',
             '/Library/Fonts',
-            os.path.expanduser('~/Library/Fonts')
+            os.path.expanduser('~/Library/Fonts'),
+            # fonts activated from Adobe Fonts
+            os.path.expanduser('~/Library/Application Support/Adobe/CoreSync/plugins/livetype/.r'),
         ])
-    
+
     else:
-        print(f"Unsupported platform: {sys.platform}")
-        return []
-    
-    # Get all font files from all directories
+        logger.log(f"Unsupported platform for font listing: {sys.platform}")
+
+    return font_dirs
+
+
+def _font_files():
+    """Returns the paths of all font files in the system font directories."""
     font_extensions = ['*.ttf', '*.ttc', '*.otf']
-    font_files = []
-    
-    for font_dir in font_dirs:
+    font_files = set()
+
+    for font_dir in _font_dirs():
         if os.path.exists(font_dir):
             for ext in font_extensions:
-                font_files.extend(glob.glob(os.path.join(font_dir, ext)))
+                font_files.update(glob.glob(os.path.join(font_dir, ext)))
                 # Also check subdirectories on macOS
                 if sys.platform == 'darwin':
-                    font_files.extend(glob.glob(os.path.join(font_dir, '**', ext), recursive=True))
-    
-    # Process each font file
-    for font_path in font_files:
+                    font_files.update(glob.glob(os.path.join(font_dir, '**', ext), recursive=True))
+
+    return sorted(font_files)
+
+
+def cache_path():
+    """Returns the path of the font cache file in the user's cache directory."""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+
+    return os.path.join(base, 'ps-mcp', CACHE_FILE_NAME)
+
+
+def _load_cache():
+    try:
+        with open(cache_path(), encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.log(f"Ignoring unreadable font cache {cache_path()}: {e}")
+        return {}
+
+    if data.get('version') != CACHE_VERSION:
+        return {}
+
+    return data.get('files', {})
+
+
+def _save_cache(entries):
+    path = cache_path()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'files': entries}, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.log(f"Could not write font cache {path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _read_names(font):
+    ps_name = _extract_postscript_name(font)
+    # names starting with a dot are hidden system fonts
+    if not ps_name or ps_name.startswith('.'):
+        return None
+
+    family, style = _extract_family_and_style(font)
+    return {'postscript': ps_name, 'family': family, 'style': style}
+
+
+def _scan_file(font_path):
+    """Returns a {"postscript", "family", "style"} dict for each font in a font file."""
+    from fontTools.ttLib import TTCollection, TTFont
+
+    fonts = []
+
+    try:
+        # lazy: only the table directory is read up front, and only the tables
+        # that are accessed (name, and CFF if name has no PostScript name) are parsed
+        if font_path.lower().endswith('.ttc'):
+            # TrueType Collections (.ttc files) contain multiple fonts, read from one open file
+            container = TTCollection(font_path, lazy=True)
+            faces = container.fonts
+        else:
+            container = TTFont(font_path, lazy=True)
+            faces = [container]
+    except Exception as e:
+        logger.log(f"Error opening font file {font_path}: {e}")
+        return fonts
+
+    try:
+        for i, font in enumerate(faces):
+            try:
+                names = _read_names(font)
+                if names:
+                    fonts.append(names)
+            except Exception as e:
+                logger.log(f"Error processing font {font_path} ({i}): {e}")
+    finally:
+        container.close()
+
+    return fonts
+
+
+def _scan_chunk(font_paths):
+    """Worker: scans several font files, to amortize the cost of sending work to a process."""
+    return [_scan_file(font_path) for font_path in font_paths]
+
+
+def parse_fonts(font_paths, workers=None):
+    """
+    Reads the fonts in each font file. Large numbers of files are spread across
+    a pool of worker processes.
+
+    Args:
+        font_paths (list[str]): Font files
+        workers (int): Number of processes. Defaults to the number of CPUs.
+            1 parses in this process.
+
+    Returns:
+        list: For each path, a list of {"postscript", "family", "style"} dicts
+    """
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(font_paths) < PARALLEL_MIN_FILES:
+        return [_scan_file(font_path) for font_path in font_paths]
+
+    chunk = max(1, min(PARALLEL_CHUNK, len(font_paths) // (workers * 4)))
+    chunks = [font_paths[i:i + chunk] for i in range(0, len(font_paths), chunk)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = []
+        for chunk_result in pool.map(_scan_chunk, chunks):
+            results.extend(chunk_result)
+
+    return results
+
+
+def scan(use_cache=True):
+    """
+    Reads the fonts in every installed font file. Files that have not changed
+    (same path, modification time and size) since the last scan are taken from
+    the on disk cache instead of being parsed again.
+
+    Returns:
+        dict: font file path -> {"mtime", "size", "fonts"}
+    """
+    global _entries
+
+    cached = _load_cache() if use_cache else {}
+    entries = {}
+    changed = []
+
+    for font_path in _font_files():
         try:
-            # TrueType Collections (.ttc files) can contain multiple fonts
-            if font_path.lower().endswith('.ttc'):
-                try:
-                    ttc = TTFont(font_path, fontNumber=0)
-                    num_fonts = ttc.reader.numFonts
-                    ttc.close()
-                    
-                    # Extract PostScript name from each font in the collection
-                    for i in range(num_fonts):
-                        try:
-                            font = TTFont(font_path, fontNumber=i)
-                            ps_name = _extract_postscript_name(font)
-                            if ps_name and not ps_name.startswith('.'):
-                                postscript_names.append(ps_name)
-                            font.close()
-                        except Exception as e:
-                            print(f"Error processing font {i} in collection {font_path}: {e}")
-                except Exception as e:
-                    print(f"Error determining number of fonts in collection {font_path}: {e}")
-            else:
-                # Regular TTF/OTF file
-                try:
-                    font = TTFont(font_path)
-                    ps_name = _extract_postscript_name(font)
-                    if ps_name:
-                        postscript_names.append(ps_name)
-                    font.close()
-                except Exception as e:
-                    print(f"Error processing font {font_path}: {e}")
-        except Exception as e:
-            print(f"Error with font file {font_path}: {e}")
- 
-    return list(set(postscript_names))
+            stat = os.stat(font_path)
+        except OSError:
+            continue
+
+        entry = cached.get(font_path)
+        if entry is None or entry['mtime'] != stat.st_mtime or entry['size'] != stat.st_size:
+            entry = {'mtime': stat.st_mtime, 'size': stat.st_size, 'fonts': None}
+            changed.append(font_path)
+
+        entries[font_path] = entry
+
+    for font_path, fonts in zip(changed, parse_fonts(changed)):
+        entries[font_path]['fonts'] = fonts
+    parsed = len(changed)
+
+    if parsed or entries.keys() != cached.keys():
+        _save_cache(entries)
+
+    logger.log(f"Font scan: {len(entries)} files, {parsed} parsed, {len(entries) - parsed} from cache")
+
+    with _lock:
+        _entries = entries
+
+    return entries
+
+
+def _names(entries):
+    return sorted({font['postscript'] for entry in entries.values() for font in entry['fonts']})
+
+
+def list_all_fonts_postscript():
+    """
+    Returns a list of PostScript names for all fonts installed on the system.
+    Works on both Windows and macOS.
+
+    Returns:
+        list: A list of PostScript font names as strings
+    """
+    return _names(scan())
+
+
+def start_background_scan():
+    """
+    Makes the fonts from the last scan (from the cache file) available right away,
+    and rescans new or changed font files on a background thread.
+    """
+    global _entries, _scan_thread
+
+    # pool worker processes re-import the server module, they do not need fonts
+    if multiprocessing.parent_process() is not None:
+        return
+
+    with _lock:
+        if _scan_thread is not None:
+            return
+        if _entries is None:
+            _entries = _load_cache()
+
+        _scan_thread = threading.Thread(target=_background_scan, name="font-scan", daemon=True)
+        _scan_thread.start()
+
+
+def _background_scan():
+    global scan_seconds
+
+    start = time.perf_counter()
+    try:
+        scan()
+    except Exception as e:
+        logger.log(f"Background font scan failed: {e}")
+    finally:
+        scan_seconds = time.perf_counter() - start
+        _scan_done.set()
+
+
+def wait_for_scan(timeout=None):
+    """Waits for the background scan to finish. Returns False if it timed out."""
+    return _scan_done.wait(timeout)
+
+
+def get_font_entries():
+    """
+    Returns the font file entries known so far (font file path -> {"mtime", "size", "fonts"}).
+    A new dict is returned after each scan, so callers can tell when fonts change.
+    """
+    with _lock:
+        entries = _entries
+
+    return entries if entries is not None else scan()
+
+
+def get_font_names():
+    """
+    Returns the PostScript names of the installed fonts known so far. While a
+    background scan is running these are the fonts from the cache file.
+    """
+    return _names(get_font_entries())
 
 def _extract_postscript_name(font):
     """
@@ -141,6 +370,31 @@ def _extract_postscript_name(font):
     
     return None
 
+def _decode_name(record):
+    return (
+        record.string.decode('utf-16-be')
+        if record.isUnicode() else record.string.decode('latin-1')
+    )
+
+
+def _extract_family_and_style(font):
+    """
+    Returns the (family, style) names of a TTFont, preferring the typographic
+    names (nameID 16 / 17) over the legacy ones (nameID 1 / 2).
+    """
+    if 'name' not in font:
+        return (None, None)
+
+    names = {}
+    for record in font['name'].names:
+        if record.nameID in (1, 2, 16, 17) and record.nameID not in names:
+            try:
+                names[record.nameID] = _decode_name(record)
+            except Exception:
+                pass
+
+    return (names.get(16) or names.get(1), names.get(17) or names.get(2))
+
 if __name__ == "__main__":
     font_names = list_all_fonts_postscript()
     print(f"Number of fonts found: {len(font_names)}")
\ No newline at end of file
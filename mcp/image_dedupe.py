@@ -0,0 +1,129 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import hashlib
+import io
+
+import logger
+
+# Width / height of the difference hash grid (HASH_SIZE * HASH_SIZE bits)
+HASH_SIZE = 32
+
+# Max number of differing hash bits for a changed capture to be flagged as
+# looking the same as the previous one. Only flagged, as small edits (a one
+# pixel stroke, a slight color change) can leave the hash unchanged.
+HASH_THRESHOLD = 0
+
+# capture key -> {"state": (document id, history state id), "digest": str, "phash": int}
+_captures = {}
+
+
+def perceptual_hash(data):
+    """
+    Computes a difference hash (dHash) of encoded image bytes.
+
+    Args:
+        data (bytes): Encoded image (JPEG, PNG, WebP)
+
+    Returns:
+        int: HASH_SIZE * HASH_SIZE bit hash
+    """
+    from PIL import Image as PILImage
+
+    with PILImage.open(io.BytesIO(data)) as image:
+        # lets the JPEG decoder scale down while decoding
+        image.draft("L", (HASH_SIZE * 4, HASH_SIZE * 4))
+        small = image.convert("L").resize((HASH_SIZE + 1, HASH_SIZE), PILImage.BILINEAR)
+
+    pixels = small.tobytes()
+    value = 0
+    for row in range(HASH_SIZE):
+        offset = row * (HASH_SIZE + 1)
+        for col in range(HASH_SIZE):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+
+    return value
+
+
+def is_unchanged(key, state):
+    """Returns True if the last capture for key was taken at the same document history state."""
+    last = _captures.get(key)
+    return state is not None and last is not None and last["state"] == state
+
+
+def record(key, state, data):
+    """
+    Records the image sent for key.
+
+    Returns:
+        tuple: (unchanged, looks_same). unchanged is True if the image is byte for
+            byte the previous capture, which is the only case it can be left out.
+            looks_same is True if it differs but is within HASH_THRESHOLD of its
+            perceptual hash, which only annotates the image.
+    """
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    last = _captures.get(key)
+
+    if last is not None and last["digest"] == digest:
+        last["state"] = state
+        return (True, False)
+
+    try:
+        phash = perceptual_hash(data)
+    except Exception as e:
+        logger.log(f"Could not hash capture for {key}: {e}")
+        phash = None
+
+    looks_same = (
+        last is not None and phash is not None and last["phash"] is not None and
+        bin(last["phash"] ^ phash).count("1") <= HASH_THRESHOLD
+    )
+
+    _captures[key] = {"state": state, "digest": digest, "phash": phash}
+    return (False, looks_same)
+
+
+def forget(key=None):
+    """Clears the recorded capture for key, or all captures if key is None."""
+    if key is None:
+        _captures.clear()
+    else:
+        _captures.pop(key, None)
+
+
+def looks_same_note(state):
+    """Sent with an image that changed but looks the same as the last capture."""
+    return {
+        "looksUnchanged": True,
+        "historyStateId": state[1] if state else None,
+        "message": "The document changed but the image looks the same as the last capture.",
+    }
+
+
+def unchanged_response(state):
+    """The marker returned instead of an image when nothing visible has changed."""
+    return {
+        "status": "SUCCESS",
+        "unchanged": True,
+        "historyStateId": state[1] if state else None,
+        "message": "Image unchanged since last capture. Call again with force=True to return it anyway.",
+    }
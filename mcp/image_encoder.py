@@ -0,0 +1,229 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import logger
+
+# Default size budget (in bytes) for images returned to the AI
+DEFAULT_BYTE_BUDGET = 512 * 1024
+
+MIN_QUALITY = 30
+MAX_QUALITY = 90
+
+# PNG is lossless, so it is picked whenever it fits the budget and is not much
+# bigger than the best lossy candidate
+PNG_PREFERENCE_RATIO = 1.5
+
+# Max number of downscale passes when even MIN_QUALITY does not fit the budget
+MAX_DOWNSCALE_PASSES = 4
+
+_executor = None
+
+
+def _get_executor():
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1),
+            thread_name_prefix="image-encoder"
+        )
+
+    return _executor
+
+
+def _available_formats():
+    from PIL import features
+
+    formats = ["JPEG"]
+    if features.check("webp"):
+        formats.append("WEBP")
+    return formats
+
+
+def _flatten(image, background=(255, 255, 255)):
+    """Composites an image with transparency onto a solid background (for JPEG)."""
+    from PIL import Image as PILImage
+
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        image = image.convert("RGBA")
+        flat = PILImage.new("RGB", image.size, background)
+        flat.paste(image, mask=image.split()[-1])
+        return flat
+
+    if image.mode != "RGB":
+        return image.convert("RGB")
+
+    return image
+
+
+def encode(image, fmt, quality=None):
+    """
+    Encodes a PIL image to bytes in the specified format.
+
+    Args:
+        image: PIL image to encode
+        fmt (str): JPEG, WEBP or PNG
+        quality (int): Quality (1-100) for lossy formats. Ignored for PNG.
+
+    Returns:
+        bytes: The encoded image
+    """
+    buffer = io.BytesIO()
+    fmt = fmt.upper()
+
+    if fmt == "JPEG":
+        _flatten(image).save(buffer, format="JPEG", quality=quality, optimize=True)
+    elif fmt == "WEBP":
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        image.save(buffer, format="WEBP", quality=quality, method=4)
+    elif fmt == "PNG":
+        image.save(buffer, format="PNG", compress_level=6)
+    else:
+        raise ValueError(f"Unsupported image format: {fmt}")
+
+    return buffer.getvalue()
+
+
+def _search_quality(image, fmt, max_bytes, min_quality, max_quality):
+    """Binary searches for the highest quality that fits within max_bytes.
+
+    Returns (quality, data), or None if min_quality does not fit.
+    """
+
+    # Most images fit at the top quality, so check it first
+    data = encode(image, fmt, max_quality)
+    if len(data) <= max_bytes:
+        return (max_quality, data)
+
+    best = None
+    lo, hi = min_quality, max_quality - 1
+    while lo <= hi:
+        quality = (lo + hi) // 2
+        data = encode(image, fmt, quality)
+
+        if len(data) <= max_bytes:
+            best = (quality, data)
+            lo = quality + 1
+        else:
+            hi = quality - 1
+
+    return best
+
+
+def _pick(image, max_bytes, formats, allow_png, min_quality, max_quality):
+    executor = _get_executor()
+
+    lossy = {
+        fmt: executor.submit(_search_quality, image, fmt, max_bytes, min_quality, max_quality)
+        for fmt in formats
+    }
+    png = executor.submit(encode, image, "PNG") if allow_png else None
+
+    best = None
+    for fmt, future in lossy.items():
+        found = future.result()
+        if not found:
+            continue
+
+        quality, data = found
+        if (best is None or quality > best[2] or
+                (quality == best[2] and len(data) < len(best[0]))):
+            best = (data, fmt, quality)
+
+    if png is not None:
+        data = png.result()
+        if len(data) <= max_bytes and (
+                best is None or len(data) <= len(best[0]) * PNG_PREFERENCE_RATIO):
+            best = (data, "PNG", 100)
+
+    return best
+
+
+def encode_to_budget(image, max_bytes=DEFAULT_BYTE_BUDGET, allow_png=True,
+        min_quality=MIN_QUALITY, max_quality=MAX_QUALITY):
+    """
+    Encodes an image so that it fits within a byte budget.
+
+    JPEG and WebP (when available) are searched in parallel for the highest quality
+    that fits, and PNG is used when it fits and is competitive in size. If nothing
+    fits at min_quality the image is downscaled and the search repeated.
+
+    Args:
+        image: PIL image to encode
+        max_bytes (int): Maximum size of the encoded image in bytes
+        allow_png (bool): Whether PNG can be picked
+        min_quality (int): Lowest lossy quality to consider before downscaling
+        max_quality (int): Highest lossy quality to consider
+
+    Returns:
+        tuple: (bytes, format) where format is "jpeg", "webp" or "png"
+    """
+    from PIL import Image as PILImage
+
+    formats = _available_formats()
+
+    for _ in range(MAX_DOWNSCALE_PASSES + 1):
+        best = _pick(image, max_bytes, formats, allow_png, min_quality, max_quality)
+
+        if best:
+            data, fmt, quality = best
+            logger.log(f"Encoded {image.size[0]}x{image.size[1]} image as {fmt} "
+                f"q={quality} ({len(data)} / {max_bytes} bytes)")
+            return (data, fmt.lower())
+
+        # Shrink proportionally to how far over budget the smallest candidate was
+        smallest = len(encode(image, "JPEG", min_quality))
+        scale = max(0.25, min(0.9, (max_bytes / smallest) ** 0.5 * 0.9))
+        size = (max(1, int(image.size[0] * scale)), max(1, int(image.size[1] * scale)))
+        image = image.resize(size, PILImage.LANCZOS)
+
+    data = encode(image, "JPEG", min_quality)
+    logger.log(f"Could not fit image in {max_bytes} bytes, returning {len(data)} bytes")
+    return (data, "jpeg")
+
+
+def fit_to_budget(data, fmt, max_bytes=DEFAULT_BYTE_BUDGET):
+    """
+    Returns already encoded image bytes unchanged if they fit within the budget,
+    otherwise decodes and re-encodes them with encode_to_budget.
+
+    Args:
+        data (bytes): Encoded image data
+        fmt (str): Format of data (e.g. "jpeg")
+        max_bytes (int): Maximum size of the returned image in bytes
+
+    Returns:
+        tuple: (bytes, format)
+    """
+    from PIL import Image as PILImage
+
+    if len(data) <= max_bytes:
+        return (data, fmt)
+
+    with PILImage.open(io.BytesIO(data)) as image:
+        image.load()
+        return encode_to_budget(image, max_bytes)
@@ -0,0 +1,427 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Encodes and writes raw pixels read from Photoshop to image files in a pool
+# of worker processes, so the MCP server stays responsive and several files
+# can be encoded at once.
+
+import multiprocessing.context
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import export_worker
+import logger
+
+FORMATS = {
+    ".png": "PNG",
+    ".tif": "TIFF",
+    ".tiff": "TIFF",
+    ".jpg": "JPEG",
+    ".jpeg": "JPEG",
+    ".webp": "WEBP",
+}
+
+_MODES = {1: "L", 2: "LA", 3: "RGB", 4: "RGBA"}
+
+RESAMPLING = ("lanczos", "bicubic", "bilinear", "nearest")
+
+_pool = None
+
+
+class _WorkerProcess(multiprocessing.context.SpawnProcess):
+    @staticmethod
+    def _Popen(process_obj):
+        # the main module is read while the process is launched, so this makes
+        # it run export_worker as its main module instead of the server
+        main = sys.modules["__main__"]
+        sys.modules["__main__"] = export_worker
+        try:
+            return multiprocessing.context.SpawnProcess._Popen(process_obj)
+        finally:
+            sys.modules["__main__"] = main
+
+
+class _WorkerContext(multiprocessing.context.SpawnContext):
+    """
+    Spawns (rather than forks, which would copy the server's socket and font
+    scan threads) pool processes that start from export_worker.
+    """
+
+    Process = _WorkerProcess
+
+
+def _get_pool():
+    global _pool
+
+    if _pool is None:
+        workers = max(1, (os.cpu_count() or 2) - 1)
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=_WorkerContext())
+        logger.log(f"Started image export pool with {workers} workers")
+
+    return _pool
+
+
+def safe_file_name(name):
+    """Returns name (e.g. a layer or artboard name) with characters that are not valid in file names replaced."""
+    name = re.sub(r'[\\/:*?"<>|\x00-\x1f]', "_", str(name)).strip(" .")
+    return name or "untitled"
+
+
+def expand_renditions(base_path, renditions):
+    """
+    Builds concrete renditions (see submit_renditions()) for one output from
+    rendition templates that use a file name suffix and format instead of a path.
+
+    Args:
+        base_path (str): Path without extension, e.g. "/out/Home"
+        renditions (list[dict]): Templates with "suffix" (e.g. "@2x"), "format"
+            (a file extension, e.g. "png") and any of the submit_renditions() size
+            and quality keys
+
+    Returns:
+        list[dict]: Renditions with "file_path" set, e.g. "/out/Home@2x.png"
+    """
+    out = []
+    for template in renditions:
+        rendition = {k: v for k, v in template.items() if k not in ("suffix", "format")}
+        ext = str(template.get("format", "png")).lower().lstrip(".")
+        rendition["file_path"] = f"{base_path}{template.get('suffix', '')}.{ext}"
+        out.append(rendition)
+
+    return out
+
+
+def format_for_path(path):
+    """Returns the Pillow format name for a file path based on its extension."""
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext not in FORMATS:
+        raise ValueError(f"Unsupported file extension '{ext}' for {path}. "
+            f"Supported: {', '.join(sorted(FORMATS))}")
+
+    return FORMATS[ext]
+
+
+def _to_image(pixels):
+    from PIL import Image as PILImage
+
+    mode = _MODES[pixels.shape[2]]
+    if pixels.shape[2] == 1:
+        pixels = pixels[..., 0]
+    return PILImage.fromarray(pixels, mode)
+
+
+def write_image(image, path, fmt, options=None):
+    """
+    Saves a PIL image to path atomically (via a temporary file in the same directory).
+
+    Args:
+        image: PIL image
+        path (str): Destination file path
+        fmt (str): PNG, TIFF, JPEG or WEBP
+        options (dict): Extra Pillow save options (e.g. quality)
+    """
+    options = dict(options or {})
+
+    if fmt == "JPEG":
+        from image_encoder import _flatten
+        image = _flatten(image)
+        options.setdefault("quality", 90)
+    elif fmt == "PNG":
+        options.setdefault("compress_level", 6)
+    elif fmt == "TIFF":
+        options.setdefault("compression", "tiff_deflate")
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        image.save(tmp_path, format=fmt, **options)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def place_on_canvas(pixels, placement):
+    """
+    Places pixels on a transparent canvas.
+
+    Args:
+        pixels (numpy.ndarray): (height, width, components) uint8 array
+        placement (tuple): (canvas width, canvas height, left, top) of the pixels on the canvas
+
+    Returns:
+        numpy.ndarray: (canvas height, canvas width, 4) uint8 RGBA array
+    """
+    import numpy as np
+
+    canvas_w, canvas_h, left, top = placement
+    canvas = np.zeros((canvas_h, canvas_w, 4), dtype=np.uint8)
+
+    h, w, components = pixels.shape
+    # clip to the canvas, layers can extend past the document bounds
+    x0, y0 = max(0, left), max(0, top)
+    x1, y1 = min(canvas_w, left + w), min(canvas_h, top + h)
+    if x0 >= x1 or y0 >= y1:
+        return canvas
+
+    src = pixels[y0 - top:y1 - top, x0 - left:x1 - left]
+    if components >= 3:
+        canvas[y0:y1, x0:x1, :3] = src[..., :3]
+    else:
+        canvas[y0:y1, x0:x1, :3] = src[..., :1]
+
+    canvas[y0:y1, x0:x1, 3] = src[..., -1] if components in (2, 4) else 255
+    return canvas
+
+
+def rendition_size(width, height, rendition):
+    """
+    Returns the (width, height) of a rendition of a width x height image.
+
+    The rendition is sized by "scale" (e.g. 2 for @2x), or fit within
+    "width" and / or "height" keeping the aspect ratio.
+    """
+    box_w, box_h = rendition.get("width"), rendition.get("height")
+
+    if box_w or box_h:
+        scale = min(
+            box_w / width if box_w else float("inf"),
+            box_h / height if box_h else float("inf"))
+    else:
+        scale = rendition.get("scale", 1)
+
+    if scale <= 0:
+        raise ValueError(f"Invalid rendition size for {rendition.get('file_path')}")
+
+    return (max(1, round(width * scale)), max(1, round(height * scale)))
+
+
+def _resize(image, size, resample):
+    from PIL import Image as PILImage
+
+    if size == image.size:
+        return image
+
+    filters = {
+        "lanczos": PILImage.LANCZOS,
+        "bicubic": PILImage.BICUBIC,
+        "bilinear": PILImage.BILINEAR,
+        "nearest": PILImage.NEAREST,
+    }
+
+    # reducing_gap first shrinks by an integer factor with a fast box reduce,
+    # which is much quicker for big downscales (thumbnails)
+    gap = 3.0 if size[0] * 2 < image.size[0] else None
+    resized = image.resize(size, filters[resample], reducing_gap=gap)
+    image.close()
+    return resized
+
+
+def _encode_job(shm_name, shape, path, fmt, options, placement, size=None, resample="lanczos"):
+    """
+    Worker, run in the pool through export_worker.encode(): attaches to the
+    shared pixels, then encodes and writes one file.
+    """
+    import numpy as np
+
+    start = time.perf_counter()
+    shm = shared_memory.SharedMemory(name=shm_name)
+
+    try:
+        pixels = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+        if placement is not None:
+            pixels = place_on_canvas(pixels, placement)
+
+        image = _to_image(pixels)
+        if size is not None:
+            image = _resize(image, tuple(size), resample)
+
+        width, height = image.size
+        write_image(image, path, fmt, options)
+        image.close()
+        del image, pixels
+    finally:
+        shm.close()
+
+    return {
+        "file_path": path,
+        "format": fmt,
+        "width": width,
+        "height": height,
+        "size_bytes": os.path.getsize(path),
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+class SharedPixels:
+    """
+    Copies pixels into a shared memory block once, so any number of encode jobs
+    in the pool can read them without pickling the array for each job.
+    """
+
+    def __init__(self, pixels):
+        import numpy as np
+
+        self.shape = pixels.shape
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, pixels.nbytes))
+        np.ndarray(pixels.shape, dtype=np.uint8, buffer=self._shm.buf)[...] = pixels
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    def release(self):
+        self._shm.close()
+        self._shm.unlink()
+
+
+def _release_when_done(shared, futures):
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def done(_):
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            shared.release()
+
+    for future in futures:
+        future.add_done_callback(done)
+
+
+def submit(pixels, paths, options=None, placement=None):
+    """
+    Starts encoding the same pixels to one or more files in the process pool
+    and returns without waiting.
+
+    Args:
+        pixels (numpy.ndarray): (height, width, components) uint8 array
+        paths (list[str]): Destination paths. The format is picked from each extension.
+        options (dict): Extra Pillow save options applied to every file
+        placement (tuple): Optional (canvas width, canvas height, left, top) to
+            place the pixels on a transparent canvas of that size before encoding
+
+    Returns:
+        list: (path, Future) tuples. Pass to collect() to wait for the results.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+
+    shared = SharedPixels(pixels)
+    pool = _get_pool()
+
+    jobs = []
+    for path in paths:
+        try:
+            future = pool.submit(export_worker.encode, shared.name, shared.shape, path,
+                format_for_path(path), options, placement)
+        except Exception as e:
+            future = Future()
+            future.set_exception(e)
+        jobs.append((path, future))
+
+    _release_when_done(shared, [future for _, future in jobs])
+    return jobs
+
+
+def collect(jobs):
+    """
+    Waits for jobs returned by submit().
+
+    Returns:
+        list[dict]: For each path, file info (file_path, format, width, height,
+            size_bytes, seconds) or {"file_path", "error"} if it failed
+    """
+    results = []
+    for path, future in jobs:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append({"file_path": path, "error": str(e)})
+
+    return results
+
+
+def submit_renditions(pixels, renditions, placement=None):
+    """
+    Starts encoding resized renditions of the same pixels in the process pool
+    and returns without waiting.
+
+    Args:
+        pixels (numpy.ndarray): (height, width, components) uint8 array
+        renditions (list[dict]): One dict per file with:
+            - "file_path" (str): Destination path. The format is picked from the extension.
+            - "scale" (float): Size relative to the pixels, e.g. 0.5, 2 or 3. Default 1.
+            - "width" / "height" (int): Fit within this box instead of scaling.
+            - "quality" (int): JPEG / WebP quality.
+            - "resample" (str): One of RESAMPLING. Default "lanczos".
+        placement (tuple): See submit()
+
+    Returns:
+        list: (path, Future) tuples. Pass to collect() to wait for the results.
+    """
+    if placement is not None:
+        width, height = placement[:2]
+    else:
+        height, width = pixels.shape[:2]
+
+    shared = SharedPixels(pixels)
+    pool = _get_pool()
+
+    jobs = []
+    for rendition in renditions:
+        path = rendition.get("file_path")
+        try:
+            if not path:
+                raise ValueError("Rendition is missing file_path")
+
+            resample = rendition.get("resample", "lanczos")
+            if resample not in RESAMPLING:
+                raise ValueError(f"Unknown resample '{resample}'. Supported: {', '.join(RESAMPLING)}")
+
+            options = {"quality": rendition["quality"]} if "quality" in rendition else None
+            future = pool.submit(export_worker.encode, shared.name, shared.shape, path,
+                format_for_path(path), options, placement,
+                rendition_size(width, height, rendition), resample)
+        except Exception as e:
+            future = Future()
+            future.set_exception(e)
+        jobs.append((path, future))
+
+    _release_when_done(shared, [future for _, future in jobs])
+    return jobs
+
+
+def save(pixels, paths, options=None, placement=None):
+    """
+    Encodes the same pixels to one or more files in parallel in the process pool
+    and waits for them to be written. See submit() for the arguments and collect()
+    for the results.
+    """
+    return collect(submit(pixels, paths, options, placement))
@@ -25,6 +25,10 @@ import os
 
 _enabled = os.environ.get("MCP_DEBUG", "").lower() in ("1", "true")
 
+def enabled():
+    """Returns True if messages are logged (MCP_DEBUG is set), so callers can skip building large ones."""
+    return _enabled
+
 def log(message, filter_tag="LOGGER"):
     if _enabled:
         print(f"{filter_tag} : {message}", file=sys.stderr)
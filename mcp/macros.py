@@ -0,0 +1,456 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# Records the tool calls the server runs into named macros saved on disk, and
+# replays them as a single request. Unlike Photoshop actions, macros can have
+# parameters, and layers are stored by name so a macro works in other documents.
+# Layers created while recording are stored as {"$created": n}, the n-th layer
+# the macro creates, which the plugin resolves while replaying.
+
+import copy
+import functools
+import inspect
+import json
+import os
+import re
+import sys
+import threading
+from collections import OrderedDict
+
+from batch_runner import compile_recipe
+import core
+import document_state
+import logger
+import pixel_cache
+
+MACRO_VERSION = 1
+
+# compiled macros kept in memory
+COMPILED_CACHE_SIZE = 32
+
+_compiled = OrderedDict()
+_compiled_lock = threading.Lock()
+
+# macro file path -> (modification time, macro, names of the layers it uses)
+_parsed = {}
+
+
+def macro_dir():
+    """Returns the directory macros are saved to in the user's data directory."""
+    if sys.platform == 'win32':
+        base = os.environ.get('APPDATA') or os.path.expanduser('~')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Application Support')
+    else:
+        base = os.environ.get('XDG_DATA_HOME') or os.path.expanduser('~/.local/share')
+
+    return os.path.join(base, 'ps-mcp', 'macros')
+
+
+def _macro_path(name):
+    if not re.fullmatch(r"[\w\- ]+", name or ""):
+        raise ValueError(f"Invalid macro name '{name}'. Use letters, numbers, spaces, - and _")
+
+    return os.path.join(macro_dir(), f"{name}.json")
+
+
+def _find_layer(layers, layer_id):
+    for layer in layers or []:
+        if layer.get("id") == layer_id:
+            return layer
+        found = _find_layer(layer.get("layers"), layer_id)
+        if found is not None:
+            return found
+
+    return None
+
+
+def _layer_ids_by_name(layers, out=None):
+    # top most layer wins if several have the same name
+    out = {} if out is None else out
+    for layer in layers or []:
+        out.setdefault(layer.get("name"), layer.get("id"))
+        _layer_ids_by_name(layer.get("layers"), out)
+
+    return out
+
+
+def _all_layer_ids(layers, out=None):
+    out = set() if out is None else out
+    for layer in layers or []:
+        out.add(layer.get("id"))
+        _all_layer_ids(layer.get("layers"), out)
+
+    return out
+
+
+def _to_symbolic(layer_id, layers, created):
+    if layer_id in created:
+        return {"$created": created[layer_id]}
+
+    layer = _find_layer(layers, layer_id)
+    return {"$layer": layer["name"]} if layer is not None else layer_id
+
+
+def _current_layers():
+    # the last seen tree if recent, as edits made in Photoshop are not seen
+    layers = document_state.current_layers()
+    if layers is None:
+        layers = core.sendCommand(core.createCommand("getLayers", {}))["response"]
+
+    return layers
+
+
+class MacroRecorder:
+    """
+    Records top level tool calls while active. Tools are wrapped by instrument(),
+    and the commands each call sends are seen through a core listener.
+
+    Calls made while commands are being collected (compiling a recipe or macro)
+    and calls made by another tool are not recorded, nor are calls that only
+    read from Photoshop.
+
+    Layers are looked up in the layer tree before and after each call, to store
+    the layers it uses by name and to know which layers it created. A call is
+    not recorded if the tree can not be read.
+    """
+
+    def __init__(self):
+        self.name = None
+        self.steps = []
+        self._created = {}
+        self._local = threading.local()
+
+    @property
+    def recording(self):
+        return self.name is not None
+
+    def start(self, name):
+        _macro_path(name)
+        if self.recording:
+            raise ValueError(f"Already recording macro '{self.name}'")
+
+        self.name = name
+        self.steps = []
+        # id of each layer created while recording -> its index in creation order
+        self._created = {}
+        logger.log(f"Recording macro '{name}'")
+
+    def stop(self):
+        """Stops recording and returns (name, steps)."""
+        if not self.recording:
+            raise ValueError("No macro is being recorded")
+
+        name, steps = self.name, self.steps
+        self.name = None
+        self.steps = []
+        self._created = {}
+        return (name, steps)
+
+    def wrap(self, tool_name, fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if (not self.recording or core.is_collecting()
+                    or getattr(self._local, "step", None) is not None):
+                return fn(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+
+            # layers are looked up before the call, which may rename or delete them
+            try:
+                layers = _current_layers()
+            except Exception as e:
+                logger.log(f"Not recording {tool_name}, the layers could not be read: {e}")
+                return fn(*args, **kwargs)
+
+            arguments = {}
+            for arg, value in bound.arguments.items():
+                if document_state.is_layer_arg(arg) and isinstance(value, list):
+                    value = [_to_symbolic(v, layers, self._created) for v in value]
+                elif document_state.is_layer_arg(arg) and isinstance(value, int):
+                    value = _to_symbolic(value, layers, self._created)
+                arguments[arg] = value
+
+            step = {"tool": tool_name, "args": arguments, "commands": [], "failed": False}
+            self._local.step = step
+            try:
+                result = fn(*args, **kwargs)
+            finally:
+                self._local.step = None
+
+            changed = any(not pixel_cache.is_read_only(c) for c in step["commands"])
+            if not changed or step["failed"]:
+                return result
+
+            try:
+                after = _current_layers()
+            except Exception as e:
+                logger.log(f"Not recording {tool_name}, the layers could not be read: {e}")
+                return result
+
+            # numbered in id order, as the plugin numbers them when replaying
+            before = _all_layer_ids(layers)
+            for layer_id in sorted(_all_layer_ids(after) - before):
+                self._created[layer_id] = len(self._created)
+
+            del step["failed"]
+            self.steps.append(step)
+            return result
+
+        return wrapper
+
+    def on_command(self, command, response):
+        """core listener that records the commands sent by the tool being recorded."""
+        step = getattr(self._local, "step", None)
+        if step is None:
+            return
+
+        step["commands"].append(command)
+        if not response or response.get("status") != "SUCCESS":
+            step["failed"] = True
+
+
+recorder = MacroRecorder()
+
+
+def instrument(tool_manager, exclude=()):
+    """Wraps the functions of all registered tools (except exclude) so their calls can be recorded."""
+    for tool in tool_manager.list_tools():
+        if tool.name not in exclude:
+            tool.fn = recorder.wrap(tool.name, tool.fn)
+
+
+def _mark_parameters(steps, parameters):
+    # parameters maps a parameter name to "tool.arg" (that argument in every
+    # step calling the tool) or "n.arg" (step n, starting at 1)
+    defaults = {}
+
+    for param, target in (parameters or {}).items():
+        where, _, arg = str(target).rpartition(".")
+        matched = [
+            step for i, step in enumerate(steps, start=1)
+            if (where == str(i) or where == step["tool"]) and arg in step["args"]
+        ]
+
+        if not matched:
+            raise ValueError(f"Parameter '{param}': no recorded step matches '{target}'")
+
+        defaults[param] = matched[0]["args"][arg]
+        for step in matched:
+            step["args"][arg] = {"$param": param}
+
+    return defaults
+
+
+def save(name, steps, parameters=None, description=""):
+    """
+    Saves recorded steps as a macro.
+
+    Args:
+        name (str): Macro name
+        steps (list[dict]): Steps returned by MacroRecorder.stop(). Not changed,
+            so they can be saved again if this fails.
+        parameters (dict): Parameter name -> "tool.arg" or "step number.arg" of
+            the argument to expose. The recorded value is the default.
+        description (str): What the macro does
+
+    Returns:
+        dict: The saved macro
+    """
+    if not steps:
+        raise ValueError("Nothing was recorded")
+
+    steps = copy.deepcopy(steps)
+
+    macro = {
+        "version": MACRO_VERSION,
+        "name": name,
+        "description": description,
+        "steps": steps,
+    }
+    macro["params"] = _mark_parameters(steps, parameters)
+
+    path = _macro_path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        # the commands are kept for reference, replay uses the tool calls
+        json.dump(macro, f, indent=1, default=str)
+    os.replace(tmp_path, path)
+
+    logger.log(f"Saved macro '{name}' with {len(steps)} steps to {path}")
+    return macro
+
+
+def load(name):
+    path = _macro_path(name)
+    if not os.path.exists(path):
+        raise ValueError(f"Unknown macro '{name}'")
+
+    with open(path, encoding='utf-8') as f:
+        macro = json.load(f)
+
+    if macro.get("version") != MACRO_VERSION:
+        raise ValueError(f"Macro '{name}' was saved by an incompatible version")
+
+    return macro
+
+
+def list_macros():
+    """Returns the name, description, parameters and tools of each saved macro."""
+    directory = macro_dir()
+    if not os.path.isdir(directory):
+        return []
+
+    out = []
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith(".json"):
+            continue
+
+        try:
+            macro = load(file_name[:-len(".json")])
+        except (ValueError, OSError) as e:
+            logger.log(f"Skipping macro {file_name}: {e}")
+            continue
+
+        out.append({
+            "name": macro["name"],
+            "description": macro.get("description", ""),
+            "params": macro.get("params", {}),
+            "layers": sorted(layer_names(macro)),
+            "tools": [step["tool"] for step in macro["steps"]],
+        })
+
+    return out
+
+
+def layer_names(macro):
+    """Returns the names of the layers the steps of a macro refer to."""
+    names = set()
+
+    def visit(value):
+        if isinstance(value, dict):
+            if "$layer" in value:
+                names.add(value["$layer"])
+            else:
+                for v in value.values():
+                    visit(v)
+        elif isinstance(value, list):
+            for v in value:
+                visit(v)
+
+    for step in macro["steps"]:
+        visit(step["args"])
+
+    return names
+
+
+def _bind(value, params, layer_ids):
+    if isinstance(value, dict):
+        if "$param" in value:
+            return params[value["$param"]]
+        if "$layer" in value:
+            return layer_ids[value["$layer"]]
+        if "$created" in value:
+            # resolved by the plugin to a layer an earlier command created
+            return value
+        return {k: _bind(v, params, layer_ids) for k, v in value.items()}
+
+    if isinstance(value, list):
+        return [_bind(v, params, layer_ids) for v in value]
+
+    return value
+
+
+def compile_macro(name, params, layers, layer_map, resolve_tool):
+    """
+    Turns a saved macro into the commands to replay it. The parsed macro and the
+    compiled commands are cached until the macro file changes, so a cache hit
+    does not read the file. Only the layers that exist before the macro runs are
+    looked up by name, layers it creates are left for the plugin to resolve.
+
+    Args:
+        name (str): Macro name
+        params (dict): Overrides for the macro parameters, or None
+        layers (list): Layer tree of the document to replay in
+        layer_map (dict): Layer name used in the macro -> layer id, for layers not
+            found by name in layers
+        resolve_tool (callable): Returns the function for a tool name, or None
+
+    Returns:
+        list[dict]: Commands to send with core.sendCommands()
+    """
+    path = _macro_path(name)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        raise ValueError(f"Unknown macro '{name}'")
+
+    with _compiled_lock:
+        parsed = _parsed.get(path)
+    if parsed is None or parsed[0] != mtime:
+        macro = load(name)
+        parsed = (mtime, macro, layer_names(macro))
+        with _compiled_lock:
+            _parsed[path] = parsed
+    _, macro, names = parsed
+
+    params = params or {}
+    unknown = set(params) - set(macro["params"])
+    if unknown:
+        raise ValueError(f"Unknown parameters for macro '{name}': {', '.join(sorted(unknown))}")
+    values = {**macro["params"], **params}
+
+    by_name = _layer_ids_by_name(layers)
+    layer_ids = {}
+    for layer_name in names:
+        layer_id = (layer_map or {}).get(layer_name, by_name.get(layer_name))
+        if layer_id is None:
+            raise ValueError(f"Layer '{layer_name}' used by macro '{name}' is not in the "
+                "active document. Pass its id in layer_map.")
+        layer_ids[layer_name] = layer_id
+
+    key = (path, mtime, json.dumps(values, sort_keys=True, default=str),
+        tuple(sorted(layer_ids.items())))
+
+    with _compiled_lock:
+        if key in _compiled:
+            _compiled.move_to_end(key)
+            return _compiled[key]
+
+    steps = [
+        {"tool": step["tool"], "args": _bind(step["args"], values, layer_ids)}
+        for step in macro["steps"]
+    ]
+    commands = compile_recipe(steps, resolve_tool)
+
+    with _compiled_lock:
+        _compiled[key] = commands
+        while len(_compiled) > COMPILED_CACHE_SIZE:
+            _compiled.popitem(last=False)
+
+    return commands
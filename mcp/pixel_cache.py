@@ -0,0 +1,160 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+from collections import OrderedDict
+
+import document_state
+import logger
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Plugin actions that never change the document, so do not invalidate the cache
+READ_ONLY_ACTIONS = {
+    "getDocuments",
+    "getDocumentInfo",
+    "getHistoryState",
+    "getDocumentImage",
+    "getDocumentPixels",
+    "getLayers",
+    "getLayerImage",
+    "getLayerImages",
+    "getLayerBounds",
+    "getArtboards",
+    "getArtboardImages",
+    "getLayerComps",
+    "getLayerCompImages",
+}
+
+
+class PixelCache:
+    """
+    LRU cache of encoded layer / document images, bounded by total size in bytes.
+
+    Keys are (document id, layer id, history state id, size, format) tuples, so an
+    entry can only be returned for the exact document state it was captured at.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key) if key is not None else None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, nbytes):
+        if key is None or nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size_bytes -= old[1]
+
+            self._entries[key] = (value, nbytes)
+            self.size_bytes += nbytes
+
+            while self.size_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.size_bytes -= evicted_bytes
+                self.evictions += 1
+
+    def invalidate(self, document_id=None):
+        """Drops all entries for document_id, or every entry if document_id is None."""
+        with self._lock:
+            if document_id is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                self.size_bytes = 0
+            else:
+                keys = [k for k in self._entries if k[0] == document_id]
+                for k in keys:
+                    self.size_bytes -= self._entries.pop(k)[1]
+                dropped = len(keys)
+
+        if dropped:
+            logger.log(f"Pixel cache: invalidated {dropped} entries (document {document_id})")
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "sizeBytes": self.size_bytes,
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hitRate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+cache = PixelCache()
+
+
+def make_key(state, layer_id, size, fmt):
+    """Builds a cache key from a (document id, history state id) state, or None if state is unknown."""
+    if state is None:
+        return None
+
+    return (state[0], layer_id, state[1], size, fmt)
+
+
+def is_read_only(command):
+    """Returns True if command never changes the document."""
+    action = command.get("action")
+
+    if action in READ_ONLY_ACTIONS:
+        return True
+
+    if action == "runCommands":
+        commands = command.get("options", {}).get("commands") or []
+        return bool(commands) and all(is_read_only(c) for c in commands)
+
+    if action == "executeBatchPlayCommand":
+        commands = command.get("options", {}).get("commands") or []
+        return bool(commands) and all(c.get("_obj") == "get" for c in commands)
+
+    return False
+
+
+def on_command(command, response):
+    """core listener that invalidates cached pixels when a command may have changed the document."""
+    if is_read_only(command):
+        return
+
+    state = document_state.state_from_response(response)
+    cache.invalidate(state[0] if state else None)
@@ -24,11 +24,11 @@ from mcp.server.fastmcp import FastMCP, Image
 from PIL import Image as PILImage
 
 from core import init, sendCommand, createCommand
+from image_encoder import encode_to_budget, DEFAULT_BYTE_BUDGET
 import socket_client
 import sys
 import tempfile
 import os
-import io
 
 
 #logger.log(f"Python path: {sys.executable}")
@@ -502,8 +502,15 @@ def add_black_and_white_effect(sequence_id:str, video_track_index: int, track_it
     return sendCommand(command)
 
 @mcp.tool()
-def get_sequence_frame_image(sequence_id: str, seconds: int):
-    """Returns a jpeg of the specified timestamp in the specified sequence in Premiere pro as an MCP Image object that can be displayed."""
+def get_sequence_frame_image(sequence_id: str, seconds: int, max_bytes: int = DEFAULT_BYTE_BUDGET):
+    """Returns an image of the specified timestamp in the specified sequence in Premiere pro as an MCP Image object that can be displayed.
+
+    Args:
+        sequence_id (str): The id for the sequence to capture the frame from
+        seconds (int): The timestamp in seconds from the beginning of the sequence
+        max_bytes (int): Maximum size in bytes of the returned image. The format
+            (JPEG / WebP / PNG) and quality are picked to fit.
+    """
     
     temp_dir = tempfile.gettempdir()
     file_path = os.path.join(temp_dir, f"frame_{sequence_id}_{seconds}.png")
@@ -521,21 +528,11 @@ def get_sequence_frame_image(sequence_id: str, seconds: int):
     
     file_path = result["response"]["filePath"]
     
-    with open(file_path, 'rb') as f:
-        png_image = PILImage.open(f)
-        
-        # Convert to RGB if necessary (removes alpha channel)
-        if png_image.mode in ("RGBA", "LA", "P"):
-            rgb_image = PILImage.new("RGB", png_image.size, (255, 255, 255))
-            rgb_image.paste(png_image, mask=png_image.split()[-1] if png_image.mode == "RGBA" else None)
-            png_image = rgb_image
-        
-        # Save as JPEG to bytes buffer
-        jpeg_buffer = io.BytesIO()
-        png_image.save(jpeg_buffer, format="JPEG", quality=85, optimize=True)
-        jpeg_bytes = jpeg_buffer.getvalue()
+    with PILImage.open(file_path) as png_image:
+        png_image.load()
+        data, fmt = encode_to_budget(png_image, max_bytes)
     
-    image = Image(data=jpeg_bytes, format="jpeg")
+    image = Image(data=data, format=fmt)
     
     del result["response"]
     
@@ -22,16 +22,14 @@
 
 from mcp.server.fastmcp import FastMCP, Image
 from core import init, sendCommand, createCommand
-from fonts import list_all_fonts_postscript
-import numpy as np
+from fonts import start_background_scan
+import font_index
 import base64
 import socket_client
 import sys
 import os
 import json
 
-FONT_LIMIT = 1000 #max number of font names to return to AI
-
 mcp_name = "Adobe Photoshop Batch Play MCP Server"
 mcp = FastMCP(mcp_name, log_level="ERROR")
 print(f"{mcp_name} running on stdio", file=sys.stderr)
@@ -104,6 +102,23 @@ def call_batch_play_command(commands: str):
     return sendCommand(command_dict)
 
 
+@mcp.tool()
+def search_fonts(query: str = None, family: str = None, style: str = None,
+        limit: int = font_index.DEFAULT_LIMIT) -> list:
+    """Searches the installed fonts. Use to find the PostScript name to pass to the text tools.
+
+    Args:
+        query (str): Part of a PostScript or family name, e.g. "helvetica" or "Roboto-Bold".
+            Case and punctuation are ignored.
+        family (str): Only fonts of this family, e.g. "Arial"
+        style (str): Only fonts of this style, e.g. "Bold Italic"
+        limit (int): Max number of fonts to return. Default 20.
+
+    Returns:
+        list: Matching fonts, best first, as {"postscript", "family", "style"} dicts
+    """
+    return font_index.get_index().search(query, family, style, limit)
+
 @mcp.resource("config://get_instructions")
 def get_instructions() -> str:
     """Read this first! Returns information and instructions on how to use Photoshop and this API"""
@@ -158,10 +173,11 @@ def get_instructions() -> str:
 
     interpolation_methods: {", ".join(interpolation_methods)}
 
-    fonts: {", ".join(font_names[:FONT_LIMIT])}
+    fonts: {font_index.get_index().summary()}
     """
 
-font_names = list_all_fonts_postscript()
+# cached fonts are available right away, new / changed font files are read in the background
+start_background_scan()
 
 interpolation_methods = [
    "AUTOMATIC",
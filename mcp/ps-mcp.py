@@ -20,16 +20,40 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from mcp.server.fastmcp import FastMCP, Image
-from core import init, sendCommand, createCommand
-from fonts import list_all_fonts_postscript
-import numpy as np
+# imported first, so the startup profile includes the time of the other imports
+import startup
+
+from mcp.server.fastmcp import FastMCP, Image, Context
+from core import init, sendCommand, sendCommands, createCommand, add_listener, collect_commands
+from fonts import start_background_scan
+import fonts
+from image_encoder import fit_to_budget, encode_to_budget, DEFAULT_BYTE_BUDGET
+import contact_sheet as contact_sheet_module
+import image_dedupe
+import document_state
+import pixel_cache
+import tiled_readback
+import image_export
+import batch_runner
+import batchplay_tools
+import arg_validation
+import effect_recipes
+import macros
+import tool_discovery
+import tool_schemas
+import logger
+import font_index
+import document_pool
+import csv
+import math
+import string
 import base64
 import socket_client
 import sys
 import os
+import time
 
-FONT_LIMIT = 1000 #max number of font names to return to AI
+EXPORT_REQUEST_BYTES = tiled_readback.MAX_REQUEST_BYTES #max pixel bytes requested at once by the export tools
 
 #logger.log(f"Python path: {sys.executable}")
 #logger.log(f"PYTHONPATH: {os.environ.get('PYTHONPATH')}")
@@ -37,14 +61,21 @@ FONT_LIMIT = 1000 #max number of font names to return to AI
 #logger.log(f"Sys.path: {sys.path}")
 
 
+startup.phase("imports")
+
 mcp_name = "Adobe Photoshop MCP Server"
 mcp = FastMCP(mcp_name, log_level="ERROR")
+tool_schemas.install(mcp, "ps-mcp")
 # print(f"{mcp_name} running on stdio", file=sys.stderr)
 
 APPLICATION = "photoshop"
 PROXY_URL = 'http://localhost:3001'
 PROXY_TIMEOUT = 20
 
+# only list a few core tools at startup, and let the client enable the others
+# by category (see tool_discovery)
+TOOL_DISCOVERY = "--tool-discovery" in sys.argv or os.environ.get("PS_MCP_TOOL_DISCOVERY") == "1"
+
 socket_client.configure(
     app=APPLICATION, 
     url=PROXY_URL,
@@ -52,6 +83,8 @@ socket_client.configure(
 )
 
 init(APPLICATION, socket_client)
+add_listener(document_state.on_response)
+add_listener(pixel_cache.on_command)
 
 @mcp.tool()
 def set_active_document(document_id:int):
@@ -161,12 +194,145 @@ def create_document(document_name: str, width: int, height:int, resolution:int,
 
     return sendCommand(command)
 
+@mcp.tool()
+def warm_document_pool(width: int, height: int, resolution: int = 72,
+        fill_color: dict = {"red":255, "green":255, "blue":255}, color_mode: str = "RGB",
+        count: int = document_pool.POOL_SIZE):
+    """Creates documents of a preset ahead of time, so acquire_document can hand
+    them out immediately. Use before jobs that create many documents of the same size.
+
+    Args:
+        width (int): Width in pixels
+        height (int): Height in pixels
+        resolution (int): Resolution (Pixels per Inch). Default 72.
+        fill_color (dict): Background fill. Default white.
+        color_mode (str): Color mode. Default "RGB".
+        count (int): Number of idle documents to keep ready, also after they are
+            released. Default 3.
+
+    Returns:
+        dict: Number of idle documents for the preset and pool stats
+    """
+    key = document_pool.preset_key(width, height, resolution, color_mode, fill_color)
+    idle = document_pool.pool.warm(key, count)
+    return {'status': 'success', 'idle': idle, 'stats': document_pool.pool.stats()}
+
+@mcp.tool()
+def register_document_template(file_path: str, count: int = document_pool.POOL_SIZE):
+    """Keeps untouched copies of a template document open, so acquire_template_document
+    can hand one out without opening or duplicating the template.
+
+    Args:
+        file_path (str): Absolute path of the template document
+        count (int): Number of idle copies to keep ready, also after they are
+            released. Default 3.
+
+    Returns:
+        dict: Number of idle copies of the template and pool stats
+    """
+    idle = document_pool.pool.warm(document_pool.template_key(file_path), count)
+    return {'status': 'success', 'idle': idle, 'stats': document_pool.pool.stats()}
+
+@mcp.tool()
+def acquire_document(width: int, height: int, resolution: int = 72,
+        fill_color: dict = {"red":255, "green":255, "blue":255}, color_mode: str = "RGB"):
+    """Makes a new, empty document of the preset active, taking it from the document
+    pool if one is ready (see warm_document_pool). Faster than create_document for
+    repeated jobs. Call release_document instead of closing it when done.
+
+    Args:
+        width (int): Width in pixels
+        height (int): Height in pixels
+        resolution (int): Resolution (Pixels per Inch). Default 72.
+        fill_color (dict): Background fill. Default white.
+        color_mode (str): Color mode. Default "RGB".
+
+    Returns:
+        dict: documentId of the now active document and whether it came from the pool
+    """
+    key = document_pool.preset_key(width, height, resolution, color_mode, fill_color)
+    document_id, pooled = document_pool.pool.acquire(key)
+    return {'status': 'success', 'documentId': document_id, 'pooled': pooled}
+
+@mcp.tool()
+def acquire_template_document(file_path: str):
+    """Makes an untouched copy of a template document active, taken from the document
+    pool if one is ready (see register_document_template). Call release_document
+    instead of closing it when done.
+
+    Args:
+        file_path (str): Absolute path of the template document
+
+    Returns:
+        dict: documentId of the now active document and whether it came from the pool
+    """
+    document_id, pooled = document_pool.pool.acquire(document_pool.template_key(file_path))
+    return {'status': 'success', 'documentId': document_id, 'pooled': pooled}
+
+@mcp.tool()
+def release_document(document_id: int):
+    """Returns a document from acquire_document / acquire_template_document to the pool.
+    All changes to it are discarded. Save or export it first if needed.
+
+    Args:
+        document_id (int): ID of the document returned by acquire_document
+
+    Returns:
+        dict: Whether the document was kept for reuse or closed because the pool was full
+    """
+    try:
+        kept = document_pool.pool.release(document_id)
+    except ValueError as e:
+        return {'status': 'error', 'error': str(e)}
+
+    return {'status': 'success', 'kept': kept}
+
+@mcp.tool()
+def get_document_pool_stats() -> dict:
+    """Returns the number of idle documents per preset / template and the pool hit rate."""
+    return document_pool.pool.stats()
+
+def _layer_regions(layer_ids, doc_width, doc_height):
+    """Returns layer id -> the bounds of the layer within the document, or an error message."""
+    try:
+        response = sendCommands([createCommand("getLayerBounds", {"layerId": i}) for i in layer_ids])
+        bounds = dict(zip(layer_ids, response["response"]))
+    except Exception:
+        # a layer does not exist, ask for each one to know which
+        bounds = {}
+        for layer_id in layer_ids:
+            try:
+                bounds[layer_id] = sendCommand(createCommand("getLayerBounds", {"layerId": layer_id}))["response"]
+            except Exception as e:
+                bounds[layer_id] = str(e)
+
+    regions = {}
+    for layer_id, b in bounds.items():
+        if isinstance(b, str):
+            regions[layer_id] = b
+            continue
+
+        # layers can extend past the document
+        regions[layer_id] = {
+            "left": min(doc_width, max(0, int(b["left"]))),
+            "top": min(doc_height, max(0, int(b["top"]))),
+            "right": max(0, min(doc_width, math.ceil(b["right"]))),
+            "bottom": max(0, min(doc_height, math.ceil(b["bottom"]))),
+        }
+
+    return regions
+
 @mcp.tool()
 def export_layers_as_png(layers_info: list[dict[str, str|int]]):
     """Exports multiple layers from the Photoshop document as PNG files.
     
     This function exports each specified layer as a separate PNG image file to its 
-    corresponding file path. The entire layer, including transparent space will be saved.
+    corresponding file path. The entire layer, including transparent space will be saved
+    (each PNG is the size of the document). Layer pixels are exported as is, without
+    the layer's opacity, blend mode or layer styles applied.
+
+    Layer pixels are read from Photoshop in a few requests (large layers in tiles)
+    and the PNGs are encoded in parallel, so exporting many layers is fast.
     
     Args:
         layers_info (list[dict[str, str|int]]): A list of dictionaries containing the export information.
@@ -177,13 +343,105 @@ def export_layers_as_png(layers_info: list[dict[str, str|int]]):
                    will be saved (e.g., "/path/to/directory/layername.png").
                    The parent directory must already exist or the export will fail.
     """
-    
-    command = createCommand("exportLayersAsPng", {
-        "layersInfo":layers_info
-    })
 
-    return sendCommand(command)
+    doc_width, doc_height = tiled_readback.get_document_size()
+    layer_ids = [info["layerId"] for info in layers_info]
+
+    if doc_width * doc_height * 4 <= EXPORT_REQUEST_BYTES:
+        # no layer can be larger than the budget, only a batch of them
+        full = {"left": 0, "top": 0, "right": doc_width, "bottom": doc_height}
+        regions = {layer_id: full for layer_id in layer_ids}
+    else:
+        regions = _layer_regions(layer_ids, doc_width, doc_height)
+
+    results = [None] * len(layers_info)
+
+    def failed(index, error):
+        results[index] = {
+            **layers_info[index],
+            "success": False,
+            "message": f"exportLayersAsPng: {error}"
+        }
+
+    def done(index, encoded):
+        result = encoded[0]
+        if "error" in result:
+            failed(index, result["error"])
+            return
+
+        results[index] = {
+            "savedFilePath": result["file_path"],
+            "layerId": layers_info[index]["layerId"],
+            "sizeBytes": result["size_bytes"],
+            "success": True
+        }
+
+    # encoding overlaps with reading the next layers, with a bounded number in flight
+    queue = batch_runner.EncodeQueue(done)
+
+    def encode(index, pixels, left, top):
+        queue.add(index, pixels, [{"file_path": layers_info[index]["filePath"]}],
+            placement=(doc_width, doc_height, left, top))
+
+    def read_batch(batch):
+        command = createCommand("getLayerImages", {
+            "layerIds":[layers_info[i]["layerId"] for i in batch]
+        })
+        response = sendCommand(command)
+
+        for index, item in zip(batch, response["response"]):
+            if "error" in item:
+                failed(index, item["error"])
+                continue
+
+            pixels = contact_sheet_module.pixels_to_array(
+                item["data"], item["width"], item["height"], item["components"])
+            bounds = item.get("bounds") or {"left": 0, "top": 0}
+            encode(index, pixels, int(bounds["left"]), int(bounds["top"]))
+
+    def read_tile(layer_id, tile):
+        item = sendCommand(createCommand("getLayerImages", {
+            "layerIds":[layer_id],
+            "bounds":tile
+        }))["response"][0]
+        if "error" in item:
+            raise RuntimeError(item["error"])
+        return item
+
+    batch = []
+    batch_bytes = 0
+    for index, layer_id in enumerate(layer_ids):
+        region = regions[layer_id]
+        if isinstance(region, str):
+            failed(index, region)
+            continue
+
+        size = max(0, region["right"] - region["left"]) * max(0, region["bottom"] - region["top"]) * 4
+
+        if size > EXPORT_REQUEST_BYTES:
+            # too large for one response through the proxy
+            try:
+                pixels = tiled_readback.read_tiled(lambda tile: read_tile(layer_id, tile), region)
+            except Exception as e:
+                failed(index, e)
+                continue
+
+            encode(index, pixels, region["left"], region["top"])
+            continue
+
+        if batch and batch_bytes + size > EXPORT_REQUEST_BYTES:
+            read_batch(batch)
+            batch, batch_bytes = [], 0
+
+        batch.append(index)
+        batch_bytes += size
+
+    if batch:
+        read_batch(batch)
+
+    queue.drain()
 
+    return results
 
 
 @mcp.tool()
@@ -247,8 +505,18 @@ def group_layers(group_name: str, layer_ids: list[int]) -> list:
 
 
 @mcp.tool()
-def get_layer_image(layer_id: int):
-    """Returns a jpeg of the specified layer's content as an MCP Image object that can be displayed."""
+def get_layer_image(layer_id: int, max_bytes: int = DEFAULT_BYTE_BUDGET, force: bool = False):
+    """Returns an image of the specified layer's content as an MCP Image object that can be displayed.
+
+    If the document has not changed since this layer was last captured, a small
+    {"unchanged": True} marker is returned instead of the image.
+
+    Args:
+        layer_id (int): ID of the layer to capture.
+        max_bytes (int): Maximum size in bytes of the returned image. The image is
+            re-encoded (JPEG / WebP / PNG, lower quality or downscaled) to fit.
+        force (bool): Always return the image, even if it has not changed.
+    """
 
     command = createCommand("getLayerImage",
         {
@@ -256,28 +524,162 @@ def get_layer_image(layer_id: int):
         }
     )
 
-    response = sendCommand(command)
+    return _capture_image(command, ("layer", layer_id), layer_id, max_bytes, force)
 
-    if response.get('status') == 'SUCCESS' and 'response' in response:
-        image_data = response['response']
-        data_url = image_data.get('dataUrl')
 
-        if data_url and data_url.startswith("data:image/jpeg;base64,"):
-            # Strip the data URL prefix and decode the base64 JPEG bytes
-            base64_data = data_url.split(",", 1)[1]
-            jpeg_bytes = base64.b64decode(base64_data)
+@mcp.tool()
+def get_document_image(max_bytes: int = DEFAULT_BYTE_BUDGET, force: bool = False):
+    """Returns an image of the current visible Photoshop document as an MCP Image object that can be displayed.
 
-            return Image(data=jpeg_bytes, format="jpeg")
+    If nothing visible has changed since the last capture (same history state, or
+    the same encoded bytes), a small {"unchanged": True} marker is returned instead of
+    the image. An image that changed but looks the same is returned with a
+    {"looksUnchanged": True} note.
 
-    return response
+    Args:
+        max_bytes (int): Maximum size in bytes of the returned image. The image is
+            re-encoded (JPEG / WebP / PNG, lower quality or downscaled) to fit.
+        force (bool): Always return the image, even if it has not changed.
+    """
+    command = createCommand("getDocumentImage", {})
+
+    return _capture_image(command, ("document",), None, max_bytes, force)
 
 
 @mcp.tool()
-def get_document_image():
-    """Returns a jpeg of the current visible Photoshop document as an MCP Image object that can be displayed."""
-    command = createCommand("getDocumentImage", {})
+def get_layer_images(layer_ids: list[int], thumb_size: int = 256, contact_sheet: bool = False, max_bytes: int = DEFAULT_BYTE_BUDGET):
+    """Returns thumbnails of multiple layers, read from Photoshop in a single request.
+
+    Use this instead of calling get_layer_image for each layer when inspecting many layers.
+
+    Args:
+        layer_ids (list[int]): IDs of the layers to capture.
+        thumb_size (int): Max width / height of each thumbnail in pixels. Default 256.
+        contact_sheet (bool): If True, returns a single image with all thumbnails
+            tiled in a grid and labeled with the layer names. If False, returns one
+            image per layer.
+        max_bytes (int): Maximum total size in bytes of the returned image(s).
+
+    Returns:
+        list: A dict describing each layer (layerId, name, width, height or error),
+            followed by the contact sheet image or one image per layer (in layer_ids order).
+    """
+
+    state = _get_document_state()
+
+    thumbnails = {}
+    missing = []
+    for layer_id in layer_ids:
+        cached = pixel_cache.cache.get(pixel_cache.make_key(state, layer_id, thumb_size, "raw"))
+        if cached is not None:
+            thumbnails[layer_id] = cached
+        else:
+            missing.append(layer_id)
+
+    if missing:
+        command = createCommand("getLayerImages", {
+            "layerIds":missing,
+            "thumbSize":thumb_size
+        })
+        response = sendCommand(command)
+        state = document_state.state_from_response(response)
+
+        for item in response.get("response") or []:
+            layer_id = item["layerId"]
+
+            if "error" in item:
+                thumbnails[layer_id] = {"name": item.get("name"), "pixels": None, "error": item["error"]}
+                continue
+
+            pixels = contact_sheet_module.pixels_to_array(
+                item["data"], item["width"], item["height"], item["components"])
+            thumbnails[layer_id] = {"name": item.get("name"), "pixels": pixels}
+            pixel_cache.cache.put(
+                pixel_cache.make_key(state, layer_id, thumb_size, "raw"),
+                thumbnails[layer_id], pixels.nbytes)
+
+    info = []
+    for layer_id in layer_ids:
+        thumb = thumbnails.get(layer_id) or {"name": None, "pixels": None, "error": "No data returned"}
+        entry = {"layerId": layer_id, "name": thumb["name"]}
+        if thumb["pixels"] is None:
+            entry["error"] = thumb.get("error")
+        else:
+            entry["height"], entry["width"] = thumb["pixels"].shape[:2]
+        info.append(entry)
+
+    if contact_sheet:
+        sheet = contact_sheet_module.compose(
+            [(thumbnails.get(i, {}).get("name") or i, thumbnails.get(i, {}).get("pixels")) for i in layer_ids],
+            thumb_size)
+        data, fmt = encode_to_budget(sheet, max_bytes)
+        return [{"layers": info}, Image(data=data, format=fmt)]
+
+    images = []
+    per_image_budget = max(1, max_bytes // max(1, len(layer_ids)))
+    for layer_id in layer_ids:
+        pixels = thumbnails.get(layer_id, {}).get("pixels")
+        if pixels is None:
+            continue
+
+        data, fmt = encode_to_budget(contact_sheet_module.to_image(pixels), per_image_budget)
+        images.append(Image(data=data, format=fmt))
+
+    return [{"layers": info}] + images
+
+
+@mcp.tool()
+def get_pixel_cache_stats() -> dict:
+    """Returns hit / miss / eviction counters and the size of the server side image cache."""
+    return pixel_cache.cache.stats()
+
+
+@mcp.tool()
+def get_validation_stats() -> dict:
+    """Returns how many tool calls were checked, rejected before being sent to Photoshop,
+    and the requests the checks sent to Photoshop themselves."""
+    return arg_validation.stats.stats()
+
+
+def _get_document_state():
+    """Returns (document id, history state id) for the active document.
+
+    Always asks Photoshop, as the document may have been edited there since the
+    last response. getHistoryState responses leave out the layer tree, so this
+    is cheap even for documents with many layers."""
+
+    response = sendCommand(createCommand("getHistoryState", {}))
+    return document_state.state_from_response(response)
+
+
+def _capture_image(command, dedupe_key, layer_id, max_bytes, force):
+    """Returns an image for a getLayerImage / getDocumentImage command, skipping the
+    round trip when the image is unchanged (dedupe) or already cached."""
+
+    state = _get_document_state()
+    if not force and image_dedupe.is_unchanged(dedupe_key, state):
+        return image_dedupe.unchanged_response(state)
+
+    cache_key = pixel_cache.make_key(state, layer_id, max_bytes, "jpeg")
+    cached = pixel_cache.cache.get(cache_key)
+    if cached is not None:
+        data, fmt = cached
+        image_dedupe.record(dedupe_key, state, data)
+        return Image(data=data, format=fmt)
+
     response = sendCommand(command)
 
+    return _image_from_response(response, max_bytes, dedupe_key, force, layer_id)
+
+
+def _image_from_response(response, max_bytes, dedupe_key=None, force=False, layer_id=None):
+    """Converts a getLayerImage / getDocumentImage response into an MCP Image
+    that fits within max_bytes. Returns the response unchanged if it has no image.
+
+    If dedupe_key is set and the bytes match the last capture for that key, the
+    unchanged marker is returned instead (unless force is True). If they differ
+    but look the same (perceptual hash), the image is returned with a note."""
+
     if response.get('status') == 'SUCCESS' and 'response' in response:
         image_data = response['response']
         data_url = image_data.get('dataUrl')
@@ -287,172 +689,707 @@ def get_document_image():
             base64_data = data_url.split(",", 1)[1]
             jpeg_bytes = base64.b64decode(base64_data)
 
-            return Image(data=jpeg_bytes, format="jpeg")
+            state = document_state.state_from_response(response)
+            data, fmt = fit_to_budget(jpeg_bytes, "jpeg", max_bytes)
+            pixel_cache.cache.put(
+                pixel_cache.make_key(state, layer_id, max_bytes, "jpeg"), (data, fmt), len(data))
+
+            if dedupe_key is not None:
+                # the same bytes as a cache hit records
+                unchanged, looks_same = image_dedupe.record(dedupe_key, state, data)
+                if unchanged and not force:
+                    return image_dedupe.unchanged_response(state)
+                if looks_same:
+                    return [image_dedupe.looks_same_note(state), Image(data=data, format=fmt)]
+
+            return Image(data=data, format=fmt)
 
     return response
 
 @mcp.tool()
-def save_document_image_as_png(file_path: str):
+def save_document_image_as_png(file_path: str, tile_size: int = tiled_readback.DEFAULT_TILE_SIZE):
     """
     Capture the Photoshop document and save as PNG file
+
+    Large documents (over about 10 megapixels) are read in tiles and written to
+    the PNG as they arrive, so they can be saved without loading the whole image
+    in memory.
     
     Args:
         file_path: Where to save the PNG file
+        tile_size: Size in pixels of the tiles large documents are read in. Default 1024.
         
     Returns:
         dict: Status and file info
     """
-    command = createCommand("getDocumentImage", {})
-    response = sendCommand(command)
-    
-    if response.get('format') == 'raw' and 'rawDataBase64' in response:
-        try:
-            # Decode raw data
-            raw_bytes = base64.b64decode(response['rawDataBase64'])
-            
-            # Extract metadata
-            width = response['width']
-            height = response['height']
-            components = response['components']
-            
-            # Convert to numpy array and reshape
-            pixel_array = np.frombuffer(raw_bytes, dtype=np.uint8)
-            image_array = pixel_array.reshape((height, width, components))
-            
-            # Create and save PNG
-            mode = 'RGBA' if components == 4 else 'RGB'
-            image = Image.fromarray(image_array, mode)
-            image.save(file_path, 'PNG')
-            
-            return {
-                'status': 'success',
-                'file_path': file_path,
-                'width': width,
-                'height': height,
-                'size_bytes': os.path.getsize(file_path)
-            }
-            
-        except Exception as e:
-            return {
-                'status': 'error',
-                'error': str(e)
-            }
-    else:
+    try:
+        width, height = tiled_readback.get_document_size()
+
+        # larger reads would not fit in one message through the proxy
+        if width * height * 4 > EXPORT_REQUEST_BYTES:
+            result = tiled_readback.save_png(file_path, tile_size)
+        else:
+            result = image_export.save(tiled_readback.read_region(), [file_path])[0]
+            if "error" in result:
+                raise RuntimeError(result["error"])
+    except Exception as e:
         return {
             'status': 'error',
-            'error': 'No raw image data received'
+            'error': str(e)
         }
 
+    return {
+        'status': 'success',
+        **result
+    }
+
 @mcp.tool()
-def get_layers() -> list:
-    """Returns a nested list of dicts that contain layer info and the order they are arranged in.
+def save_document_image(file_paths: list[str]):
+    """
+    Captures the visible Photoshop document once and saves it to one or more image files.
+
+    The files are encoded in parallel. The format is picked from each file extension
+    (.png, .tif / .tiff, .jpg / .jpeg, .webp). Files are written atomically.
+    Large documents are read in tiles.
 
     Args:
-        None
-        
+        file_paths (list[str]): Absolute paths of the files to save.
+
     Returns:
-        list: A nested list of dictionaries containing layer information and hierarchy.
-            Each dict has at minimum a 'name' key with the layer name.
-            If a layer has sublayers, they will be contained in a 'layers' key which contains another list of layer dicts.
-            Example: [{'name': 'Group 1', 'layers': [{'name': 'Layer 1'}, {'name': 'Layer 2'}]}, {'name': 'Background'}]
+        dict: Status and, for each file, its path, format, size and encode time (or error)
     """
+    pixels = tiled_readback.read_document(EXPORT_REQUEST_BYTES)
+    results = image_export.save(pixels, file_paths)
 
-    command = createCommand("getLayers", {})
-
-    return sendCommand(command)
-
+    return {
+        'status': 'success' if all("error" not in r for r in results) else 'error',
+        'files': results
+    }
 
 @mcp.tool()
-def place_image(
-    layer_id: int,
-    image_path: str
-):
-    """Places the image at the specified path on the existing pixel layer with the specified id.
+def export_renditions(renditions: list[dict]):
+    """
+    Captures the visible Photoshop document once and exports it at several sizes
+    and formats (e.g. PNG @1x / @2x / @3x, a web JPEG, WebP and thumbnails).
 
-    The image will be placed on the center of the layer, and will fill the layer without changing its aspect ration (thus there may be bars at the top or bottom) 
+    The document is not resized in Photoshop. Renditions are resampled and encoded
+    in parallel from a single read of the document (in tiles for large documents),
+    and written atomically.
 
     Args:
-        layer_id (int): The id of the layer where the image will be placed.
-        image_path (str): The file path to the image that will be placed on the layer.
+        renditions (list[dict]): One dict per file to write with:
+            - "file_path" (str): Absolute path. The format is picked from the extension
+              (.png, .tif / .tiff, .jpg / .jpeg, .webp).
+            - "scale" (float, optional): Size relative to the document, e.g. 1, 2, 3 or 0.5. Default 1.
+            - "width" / "height" (int, optional): Fit within this box (keeping the
+              aspect ratio) instead of using scale. Use for thumbnails.
+            - "quality" (int, optional): JPEG / WebP quality (1-100).
+            - "resample" (str, optional): "lanczos" (default), "bicubic", "bilinear" or "nearest".
+
+    Returns:
+        dict: Status, the time taken to read the document and, for each rendition,
+            its path, format, width, height, size in bytes and encode time (or error)
     """
-    
-    command = createCommand("placeImage", {
-        "layerId":layer_id,
-        "imagePath":image_path
-    })
+    start = time.perf_counter()
+    pixels = tiled_readback.read_document(EXPORT_REQUEST_BYTES)
+    read_seconds = round(time.perf_counter() - start, 3)
 
-    return sendCommand(command)
+    results = image_export.collect(image_export.submit_renditions(pixels, renditions))
 
-@mcp.tool()
-def harmonize_layer(layer_id:int,  new_layer_name:str, rasterize_layer:bool = True):
-    """Harmonizes (matches lighting and other settings) the selected layer with the background layers.
+    return {
+        'status': 'success' if all("error" not in r for r in results) else 'error',
+        'readSeconds': read_seconds,
+        'totalSeconds': round(time.perf_counter() - start, 3),
+        'renditions': results
+    }
 
-    The layer being harmonized should be rasterized and have some transparency.
+def _unique_base_paths(output_dir, names):
+    """Returns an output path (without extension) for each name, made unique by suffixing a count."""
+    seen = {}
+    out = []
+    for name in names:
+        base = image_export.safe_file_name(name)
+        count = seen.get(base.lower(), 0)
+        seen[base.lower()] = count + 1
+        out.append(os.path.join(output_dir, base if count == 0 else f"{base}_{count + 1}"))
+
+    return out
+
+
+def _export_captures(action, ids_key, items, renditions):
+    """
+    Reads pixels for items with a plugin action that returns one image per id, in
+    requests of at most EXPORT_REQUEST_BYTES (larger items in tiles), and encodes
+    the renditions of each in the export pool while the next request is read.
 
     Args:
-        layer_id (int): ID of the layer to be harmonizes.
-        new_layer_name (str): Name for the new layer that will be created with the harmonized content
-        rasterize_layer (bool): Whether the new layer should be rasterized.
-            If not rasterized, the layer will remain a generative layer which
-            allows the user to interact with it. True by default.
+        action (str): getArtboardImages or getLayerCompImages
+        ids_key (str): The action's option holding the ids to read
+        items (list[dict]): id, name, basePath, bounds in the document and pixel
+            bytes of each item
+        renditions (list[dict]): Rendition templates, see image_export.expand_renditions()
+
+    Returns:
+        list[dict]: For each item its id, name and the files written (or an error)
     """
+    results = [None] * len(items)
 
-    command = createCommand("harmonizeLayer", {
-        "layerId":layer_id,
-         "newLayerName":new_layer_name,
-        "rasterizeLayer":rasterize_layer
-    })
+    def failed(index, error):
+        item = items[index]
+        results[index] = {"id": item["id"], "name": item["name"], "success": False, "error": str(error)}
 
-    return sendCommand(command)
+    def done(index, files):
+        item = items[index]
+        results[index] = {"id": item["id"], "name": item["name"], "files": files,
+            "success": all("error" not in f for f in files)}
+
+    # a bounded number of images wait to be encoded
+    queue = batch_runner.EncodeQueue(done)
+
+    def encode(index, pixels):
+        queue.add(index, pixels, image_export.expand_renditions(items[index]["basePath"], renditions))
+
+    def read_batch(batch):
+        response = sendCommand(createCommand(action, {
+            ids_key:[items[i]["id"] for i in batch]
+        }))
+
+        for index, result in zip(batch, response["response"]):
+            if "error" in result:
+                failed(index, result["error"])
+                continue
+
+            encode(index, contact_sheet_module.pixels_to_array(
+                result["data"], result["width"], result["height"], result["components"]))
+
+    def read_tile(item_id, tile):
+        result = sendCommand(createCommand(action, {
+            ids_key:[item_id],
+            "bounds":tile
+        }))["response"][0]
+        if "error" in result:
+            raise RuntimeError(result["error"])
+        return result
+
+    batch = []
+    batch_bytes = 0
+    for index, item in enumerate(items):
+        if item["bytes"] > EXPORT_REQUEST_BYTES:
+            # too large for one response through the proxy
+            try:
+                pixels = tiled_readback.read_tiled(lambda tile: read_tile(item["id"], tile), item["bounds"])
+            except Exception as e:
+                failed(index, e)
+                continue
+
+            encode(index, pixels)
+            continue
+
+        if batch and batch_bytes + item["bytes"] > EXPORT_REQUEST_BYTES:
+            read_batch(batch)
+            batch, batch_bytes = [], 0
+
+        batch.append(index)
+        batch_bytes += item["bytes"]
+
+    if batch:
+        read_batch(batch)
+
+    queue.drain()
+    return results
 
 
 @mcp.tool()
-def rename_layers(
-    layer_data: list[dict]
-):
-    """Renames one or more layers
+def export_artboards(output_dir: str, artboard_names: list[str] = None, renditions: list[dict] = None):
+    """
+    Exports each artboard in the active document to image files in one call.
+
+    Artboard pixels are read straight from the document composite, without cropping
+    or changing the document, and encoded in parallel. Files are named after the
+    artboards, e.g. "<output_dir>/Home.png".
 
     Args:
-        layer_data (list[dict]): A list of dictionaries containing layer rename information.
-            Each dictionary must have the following keys:
-                - "layer_id" (int): ID of the layer to be renamed.
-                - "new_layer_name" (str): New name for the layer.
-    """
-    
-    command = createCommand("renameLayers", {
-        "layerData":layer_data
-    })
-    
-    return sendCommand(command)
+        output_dir (str): Absolute path of an existing directory to write the files to.
+        artboard_names (list[str], optional): Only export artboards with these names. Default all.
+        renditions (list[dict], optional): Files to write per artboard. Each dict has:
+            - "suffix" (str): Added to the file name, e.g. "@2x". Default "".
+            - "format" (str): "png", "jpg", "webp" or "tif". Default "png".
+            - "scale" or "width" / "height", "quality", "resample": as in export_renditions.
+            Default one PNG at 1x.
+
+    Returns:
+        dict: Status and, for each artboard, its id, name and the files written
+            (path, format, size and encode time) or an error
+    """
+    start = time.perf_counter()
+    artboards = sendCommand(createCommand("getArtboards", {}))["response"]
+
+    if artboard_names is not None:
+        artboards = [a for a in artboards if a["name"] in artboard_names]
+
+    if not artboards:
+        return {'status': 'error', 'error': 'No matching artboards in the active document'}
+
+    base_paths = _unique_base_paths(output_dir, [a["name"] for a in artboards])
+    items = []
+    for artboard, base_path in zip(artboards, base_paths):
+        b = artboard["bounds"]
+        items.append({
+            "id": artboard["id"],
+            "name": artboard["name"],
+            "basePath": base_path,
+            "bounds": b,
+            "bytes": int((b["right"] - b["left"]) * (b["bottom"] - b["top"]) * 4)
+        })
+
+    results = _export_captures("getArtboardImages", "artboardIds", items,
+        renditions or [{"format": "png"}])
+
+    return {
+        'status': 'success' if all(r["success"] for r in results) else 'error',
+        'totalSeconds': round(time.perf_counter() - start, 3),
+        'artboards': results
+    }
 
 
 @mcp.tool()
-def scale_layer(
-    layer_id:int,
-    width:int,
-    height:int,
-    anchor_position:str,
-    interpolation_method:str = "AUTOMATIC"
-):
-    """Scales the layer with the specified ID.
+def export_layer_comps(output_dir: str, comp_names: list[str] = None, renditions: list[dict] = None):
+    """
+    Exports the document as it looks with each layer comp applied, in one call.
+
+    Comps are applied and read in a single Photoshop operation that is rolled back
+    afterwards, so the document and its history are left unchanged. Images are
+    encoded in parallel. Files are named after the comps, e.g. "<output_dir>/Dark.png".
 
     Args:
-        layer_id (int): ID of layer to be scaled.
-        width (int): Percentage to scale horizontally.
-        height (int): Percentage to scale vertically.
-        anchor_position (str): The anchor position to scale around. Valid values: TOPLEFT, TOPCENTER, TOPRIGHT, MIDDLELEFT, MIDDLECENTER, MIDDLERIGHT, BOTTOMLEFT, BOTTOMCENTER, BOTTOMRIGHT
-        interpolation_method (str): Interpolation method to use when resampling. Valid values: AUTOMATIC, BICUBIC, BICUBICAUTOMATIC, BICUBICSHARPER, BICUBICSMOOTHER, BILINEAR, NEARESTNEIGHBOR, PRESERVEDETAILS
-    """
-    
-    command = createCommand("scaleLayer", {
-        "layerId":layer_id,
-        "width":width,
-        "height":height,
-        "anchorPosition":anchor_position,
-        "interpolationMethod":interpolation_method
-    })
+        output_dir (str): Absolute path of an existing directory to write the files to.
+        comp_names (list[str], optional): Only export layer comps with these names. Default all.
+        renditions (list[dict], optional): Files to write per comp, as in export_artboards.
+            Default one PNG at 1x.
 
-    return sendCommand(command)
+    Returns:
+        dict: Status and, for each layer comp, its id, name and the files written
+            (path, format, size and encode time) or an error
+    """
+    start = time.perf_counter()
+    comps = sendCommand(createCommand("getLayerComps", {}))["response"]
+
+    if comp_names is not None:
+        comps = [c for c in comps if c["name"] in comp_names]
+
+    if not comps:
+        return {'status': 'error', 'error': 'No matching layer comps in the active document'}
+
+    width, height = tiled_readback.get_document_size()
+    base_paths = _unique_base_paths(output_dir, [c["name"] for c in comps])
+    items = [{
+        "id": comp["id"],
+        "name": comp["name"],
+        "basePath": base_path,
+        "bounds": {"left": 0, "top": 0, "right": width, "bottom": height},
+        "bytes": width * height * 4
+    } for comp, base_path in zip(comps, base_paths)]
+
+    results = _export_captures("getLayerCompImages", "compIds", items,
+        renditions or [{"format": "png"}])
+
+    return {
+        'status': 'success' if all(r["success"] for r in results) else 'error',
+        'totalSeconds': round(time.perf_counter() - start, 3),
+        'layerComps': results
+    }
+
+def _get_tool_function(name):
+    """Returns the function of a registered tool, or None if there is no tool with that name."""
+    if tool_discovery.is_active():
+        tool = tool_discovery.get_tool(name)
+    else:
+        tool = mcp._tool_manager.get_tool(name)
+    return tool.fn if tool else None
+
+
+@mcp.tool()
+def batch_process(input_glob: str, recipe: list[dict], output_dir: str,
+        renditions: list[dict] = None, resume: bool = True):
+    """
+    Applies the same sequence of tool calls to every image matching a glob pattern
+    and exports the results. Use for treating whole folders of images (e.g. auto tone,
+    curves, sharpen, then export), instead of calling the tools for each file.
+
+    Each file is opened and processed in one Photoshop request, then read back and
+    closed, while earlier results are encoded in parallel. Progress is checkpointed in
+    output_dir, so calling again with the same arguments after a failure or crash
+    continues with the files that were not done.
+
+    Args:
+        input_glob (str): Absolute glob pattern of the input files, e.g. "/shots/*.jpg".
+            Use "**" to match sub directories.
+        recipe (list[dict]): Steps applied in order to each file. Each step has:
+            - "tool" (str): Name of a tool that changes the document, e.g. "auto_tone"
+            - "args" (dict, optional): Arguments for the tool
+            - "repeat" (int, optional): Times to run the step, e.g. a filter. Default 1.
+            Tools act on the opened file. Layer ids must be valid in every file
+            (e.g. the Background layer). Do not include open, save or close steps.
+        output_dir (str): Absolute path of the directory to write the results to.
+        renditions (list[dict], optional): Files to write per input, named after it.
+            As in export_artboards ("suffix", "format", "scale" or "width" / "height",
+            "quality"). Default one PNG at 1x.
+        resume (bool, optional): Skip files finished by a previous run with the same
+            recipe and renditions. Default True.
+
+    Returns:
+        dict: Number of files processed, skipped and failed (with errors), elapsed
+            seconds and images per minute
+    """
+    try:
+        commands = batch_runner.compile_recipe(recipe, _get_tool_function)
+    except ValueError as e:
+        return {'status': 'error', 'error': str(e)}
+
+    result = batch_runner.run(input_glob, commands, output_dir,
+        renditions or [{"format": "png"}], resume)
+
+    return {
+        'status': 'success' if not result["failed"] else 'error',
+        **result
+    }
+
+@mcp.tool()
+def data_merge(template: str, csv_path: str, mapping: dict, output_pattern: str,
+        close_template: bool = True):
+    """
+    Generates one image per CSV row from a template document, replacing text in
+    text layers and the contents of smart object layers with values from the row.
+
+    The template is opened once. Each row is applied in a single Photoshop request
+    and then read back, starting again from the untouched template each time, and
+    the images are encoded in parallel.
+
+    Args:
+        template (str): Absolute path of the template document (e.g. a PSD).
+        csv_path (str): Absolute path of a CSV file with a header row.
+        mapping (dict): CSV column name -> layer to fill in, as
+            {"layer_id": int, "type": "text" | "image"}. "text" (default) replaces the
+            text of a text layer. "image" replaces the contents of a smart object
+            layer with the file named in the column (relative paths are resolved
+            against the CSV's directory). A plain layer id is the same as a text layer.
+            Example: {"Headline": 12, "Photo": {"layer_id": 7, "type": "image"}}
+        output_pattern (str): Absolute path of each output file. Use {column} for a
+            value from the row and {row} for the row number, e.g. "/out/banner_{row}_{Headline}.png".
+            The format is picked from the extension (.png, .jpg, .webp, .tif).
+        close_template (bool, optional): Close the template without saving when done. Default True.
+
+    Returns:
+        dict: Number of rows written and failed (with errors), elapsed seconds and
+            variants per minute
+    """
+    try:
+        with open(csv_path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+            columns = reader.fieldnames or []
+    except OSError as e:
+        return {'status': 'error', 'error': f"Could not read {csv_path}: {e}"}
+
+    # check the pattern before anything is opened
+    try:
+        names = {name for _, name, _, _ in string.Formatter().parse(output_pattern) if name is not None}
+    except ValueError as e:
+        return {'status': 'error', 'error': f"Invalid output_pattern: {e}"}
+    for name in names:
+        if "." in name or "[" in name:
+            return {'status': 'error', 'error': f"{{{name}}} in output_pattern: column names with '.' or '[' "
+                "can not be used in a pattern. Rename the column."}
+        if name == "row" and "row" in columns:
+            return {'status': 'error', 'error': f"Column 'row' of {csv_path} clashes with {{row}} "
+                "(the row number) in output_pattern. Rename the column."}
+        if name != "row" and name not in columns:
+            return {'status': 'error', 'error': f"output_pattern refers to {{{name}}}, which is not a column of {csv_path}"}
+
+    fields = {}
+    for column, target in mapping.items():
+        if not isinstance(target, dict):
+            target = {"layer_id": target}
+        if rows and column not in rows[0]:
+            return {'status': 'error', 'error': f"Column '{column}' is not in {csv_path}"}
+        if target.get("type", "text") not in ("text", "image"):
+            return {'status': 'error', 'error': f"Unknown mapping type '{target['type']}' for column '{column}'"}
+        fields[column] = target
+
+    csv_dir = os.path.dirname(os.path.abspath(csv_path))
+    # generated from batchplay_tools.SPECS, so not a name in this module
+    replace_contents = _get_tool_function("replace_smart_object_contents")
+    variants = []
+    for number, row in enumerate(rows, start=1):
+        values = {k: image_export.safe_file_name(v) for k, v in row.items() if k}
+        try:
+            output_path = output_pattern.format_map({**values, "row": number})
+        except (KeyError, IndexError, AttributeError, ValueError) as e:
+            return {'status': 'error', 'error': f"Could not make the output path of row {number} from output_pattern: {e}"}
+
+        with collect_commands() as commands:
+            for column, target in fields.items():
+                value = row[column]
+                if target.get("type", "text") == "image":
+                    replace_contents(target["layer_id"], os.path.join(csv_dir, value))
+                else:
+                    edit_text_layer(target["layer_id"], text=value)
+
+        variants.append((number, commands, [{"file_path": output_path}]))
+
+    result = batch_runner.run_merge(template, variants, close_template)
+
+    return {
+        'status': 'success' if not result["failed"] else 'error',
+        **result
+    }
+
+def _apply_effect(effects, layer_id, effect, params):
+    try:
+        commands = effect_recipes.compile_effect(effects, effect, layer_id, params,
+            _get_tool_function)
+    except ValueError as e:
+        return {'status': 'error', 'error': str(e)}
+
+    history_name = effect.replace("_", " ").title()
+    return sendCommands(commands, effect_recipes.EFFECT_TIMEOUT, history_name)
+
+@mcp.tool()
+def list_effects():
+    """
+    Lists the effects available to apply_text_effect and apply_photo_effect,
+    with a description and the parameters (and defaults) of each.
+    """
+    return {
+        "text": effect_recipes.describe(effect_recipes.TEXT_EFFECTS),
+        "photo": effect_recipes.describe(effect_recipes.PHOTO_EFFECTS),
+    }
+
+@mcp.tool()
+def apply_text_effect(layer_id: int, effect: str, params: dict = None):
+    """
+    Applies a complete text effect recipe (e.g. chrome, neon, liquid_drip) to a
+    layer in a single request, as one history state that can be undone at once.
+    Use instead of calling the individual layer style and filter tools.
+
+    Args:
+        layer_id (int): ID of the text layer
+        effect (str): chrome, neon, glass, gold, ice, holographic, lava, letterpress,
+            outline, retro, liquid_bevel, liquid_drip, fire or smoke. See list_effects.
+        params (dict, optional): Overrides for the effect parameters, e.g.
+            {"color": {"red": 0, "green": 212, "blue": 255}} for neon or
+            {"wind_passes": 7} for liquid_drip. See list_effects.
+    """
+    return _apply_effect(effect_recipes.TEXT_EFFECTS, layer_id, effect, params)
+
+@mcp.tool()
+def apply_photo_effect(layer_id: int, effect: str, params: dict = None):
+    """
+    Applies a complete photo effect or color grading recipe (e.g. teal_orange,
+    cyberpunk, duotone) to a layer in a single request, as one history state
+    that can be undone at once. Adjustment layers are added above the layer.
+
+    Args:
+        layer_id (int): ID of the image layer
+        effect (str): cyberpunk, retro_vintage, duotone, vignette, hdr, miniature,
+            day_to_night, teal_orange, anime, moody_blue or warm_vintage. See list_effects.
+        params (dict, optional): Overrides for the effect parameters. See list_effects.
+    """
+    return _apply_effect(effect_recipes.PHOTO_EFFECTS, layer_id, effect, params)
+
+@mcp.tool()
+def start_macro_recording(name: str):
+    """
+    Starts recording the tool calls that change documents into a macro, which can
+    later be replayed with different parameters, in other documents, in a single
+    request. Unlike record_action_start, the steps can be parameterized.
+
+    Args:
+        name (str): Macro name (letters, numbers, spaces, - and _)
+    """
+    try:
+        macros.recorder.start(name)
+    except ValueError as e:
+        return {'status': 'error', 'error': str(e)}
+
+    return {'status': 'success', 'name': name}
+
+@mcp.tool()
+def stop_macro_recording(parameters: dict = None, description: str = ""):
+    """
+    Stops recording and saves the macro. Layers are saved by name, so the macro
+    applies to layers with the same names when replayed.
+
+    Args:
+        parameters (dict, optional): Arguments to expose as macro parameters, as
+            parameter name -> "tool_name.argument" (that argument in every call of the
+            tool) or "step.argument" (step number, starting at 1). The recorded values
+            are the defaults. e.g. {"blur": "apply_gaussian_blur.radius"}
+        description (str, optional): What the macro does
+
+    Returns:
+        dict: The macro name, parameters and recorded steps
+    """
+    recorder = macros.recorder
+    if not recorder.recording:
+        return {'status': 'error', 'error': "No macro is being recorded"}
+
+    if not recorder.steps:
+        recorder.stop()
+        return {'status': 'error', 'error': "Nothing was recorded"}
+
+    # saved before stopping, so a bad parameter does not lose the recording
+    try:
+        macro = macros.save(recorder.name, recorder.steps, parameters, description)
+    except (ValueError, OSError) as e:
+        return {'status': 'error', 'error': f"{e}. Still recording, call again to save."}
+
+    name, _ = recorder.stop()
+    return {
+        'status': 'success',
+        'name': name,
+        'params': macro["params"],
+        'steps': [{"tool": step["tool"], "args": step["args"]} for step in macro["steps"]],
+    }
+
+@mcp.tool()
+def list_macros():
+    """Lists the saved macros with their parameters, the layer names they use and their tools."""
+    return macros.list_macros()
+
+@mcp.tool()
+def run_macro(name: str, params: dict = None, layer_map: dict = None):
+    """
+    Replays a saved macro in the active document in a single request, as one
+    history state that can be undone at once.
+
+    Args:
+        name (str): Macro name
+        params (dict, optional): Values for the macro parameters. See list_macros.
+        layer_map (dict, optional): Layer name used in the macro -> layer id, for
+            layers with a different name in the active document.
+    """
+    layers = document_state.current_layers()
+    if layers is None:
+        layers = sendCommand(createCommand("getLayers", {}))["response"]
+
+    try:
+        commands = macros.compile_macro(name, params, layers, layer_map, _get_tool_function)
+    except ValueError as e:
+        return {'status': 'error', 'error': str(e)}
+
+    return sendCommands(commands, batch_runner.BATCH_TIMEOUT, name)
+
+@mcp.tool()
+def get_layers() -> list:
+    """Returns a nested list of dicts that contain layer info and the order they are arranged in.
+
+    Args:
+        None
+        
+    Returns:
+        list: A nested list of dictionaries containing layer information and hierarchy.
+            Each dict has at minimum a 'name' key with the layer name.
+            If a layer has sublayers, they will be contained in a 'layers' key which contains another list of layer dicts.
+            Example: [{'name': 'Group 1', 'layers': [{'name': 'Layer 1'}, {'name': 'Layer 2'}]}, {'name': 'Background'}]
+    """
+
+    command = createCommand("getLayers", {})
+
+    return sendCommand(command)
+
+
+@mcp.tool()
+def place_image(
+    layer_id: int,
+    image_path: str
+):
+    """Places the image at the specified path on the existing pixel layer with the specified id.
+
+    The image will be placed on the center of the layer, and will fill the layer without changing its aspect ration (thus there may be bars at the top or bottom) 
+
+    Args:
+        layer_id (int): The id of the layer where the image will be placed.
+        image_path (str): The file path to the image that will be placed on the layer.
+    """
+    
+    command = createCommand("placeImage", {
+        "layerId":layer_id,
+        "imagePath":image_path
+    })
+
+    return sendCommand(command)
+
+@mcp.tool()
+def harmonize_layer(layer_id:int,  new_layer_name:str, rasterize_layer:bool = True):
+    """Harmonizes (matches lighting and other settings) the selected layer with the background layers.
+
+    The layer being harmonized should be rasterized and have some transparency.
+
+    Args:
+        layer_id (int): ID of the layer to be harmonizes.
+        new_layer_name (str): Name for the new layer that will be created with the harmonized content
+        rasterize_layer (bool): Whether the new layer should be rasterized.
+            If not rasterized, the layer will remain a generative layer which
+            allows the user to interact with it. True by default.
+    """
+
+    command = createCommand("harmonizeLayer", {
+        "layerId":layer_id,
+         "newLayerName":new_layer_name,
+        "rasterizeLayer":rasterize_layer
+    })
+
+    return sendCommand(command)
+
+
+@mcp.tool()
+def rename_layers(
+    layer_data: list[dict]
+):
+    """Renames one or more layers
+
+    Args:
+        layer_data (list[dict]): A list of dictionaries containing layer rename information.
+            Each dictionary must have the following keys:
+                - "layer_id" (int): ID of the layer to be renamed.
+                - "new_layer_name" (str): New name for the layer.
+    """
+    
+    command = createCommand("renameLayers", {
+        "layerData":layer_data
+    })
+    
+    return sendCommand(command)
+
+
+@mcp.tool()
+def scale_layer(
+    layer_id:int,
+    width:int,
+    height:int,
+    anchor_position:str,
+    interpolation_method:str = "AUTOMATIC"
+):
+    """Scales the layer with the specified ID.
+
+    Args:
+        layer_id (int): ID of layer to be scaled.
+        width (int): Percentage to scale horizontally.
+        height (int): Percentage to scale vertically.
+        anchor_position (str): The anchor position to scale around. Valid values: TOPLEFT, TOPCENTER, TOPRIGHT, MIDDLELEFT, MIDDLECENTER, MIDDLERIGHT, BOTTOMLEFT, BOTTOMCENTER, BOTTOMRIGHT
+        interpolation_method (str): Interpolation method to use when resampling. Valid values: AUTOMATIC, BICUBIC, BICUBICAUTOMATIC, BICUBICSHARPER, BICUBICSMOOTHER, BILINEAR, NEARESTNEIGHBOR, PRESERVEDETAILS
+    """
+    
+    command = createCommand("scaleLayer", {
+        "layerId":layer_id,
+        "width":width,
+        "height":height,
+        "anchorPosition":anchor_position,
+        "interpolationMethod":interpolation_method
+    })
+
+    return sendCommand(command)
 
 
 @mcp.tool()
@@ -895,7 +1832,7 @@ def create_multi_line_text_layer(
         layer_name (str): The name of the layer to be created. Can be used to select in other api calls.
         text (str): The text to include on the layer.
         font_size (int): Font size.
-        postscript_font_name (string): Postscript Font Name to display the text in. Valid list available via get_option_info.
+        postscript_font_name (string): Postscript Font Name to display the text in. Use search_fonts to find valid names.
         opacity (int): Opacity for the layer specified in percent.
         blend_mode (str): Blend Mode for the layer. Valid list available via get_option_info
         text_color (dict): Color of the text expressed in Red, Green, Blue values between 0 and 255
@@ -939,7 +1876,7 @@ def create_single_line_text_layer(
         layer_name (str): The name of the layer to be created. Can be used to select in other api calls.
         text (str): The text to include on the layer.
         font_size (int): Font size.
-        postscript_font_name (string): Postscript Font Name to display the text in. Valid list available via get_option_info.
+        postscript_font_name (string): Postscript Font Name to display the text in. Use search_fonts to find valid names.
         opacity (int): Opacity for the layer specified in percent.
         blend_mode (str): Blend Mode for the layer. Valid list available via get_option_info
         text_color (dict): Color of the text expressed in Red, Green, Blue values between 0 and 255
@@ -975,7 +1912,7 @@ def edit_text_layer(
         layer_id (int): The ID of the existing text layer to edit.
         text (str): The new text content to replace the current text in the layer. If None, text will not be changed.
         font_size (int): Font size. If None, size will not be changed.
-        postscript_font_name (string): Postscript Font Name to display the text in. Valid list available via get_option_info. If None, font will not will not be changed.
+        postscript_font_name (string): Postscript Font Name to display the text in. Use search_fonts to find valid names. If None, font will not will not be changed.
         text_color (dict): Color of the text expressed in Red, Green, Blue values between 0 and 255 in format of {"red":255, "green":255, "blue":255}. If None, color will not be changed
     """
 
@@ -3122,6 +4059,23 @@ def swap_colors():
 # RESOURCE - Instructions for AI
 # =============================================================================
 
+@mcp.tool()
+def search_fonts(query: str = None, family: str = None, style: str = None,
+        limit: int = font_index.DEFAULT_LIMIT) -> list:
+    """Searches the installed fonts. Use to find the PostScript name to pass to the text tools.
+
+    Args:
+        query (str): Part of a PostScript or family name, e.g. "helvetica" or "Roboto-Bold".
+            Case and punctuation are ignored.
+        family (str): Only fonts of this family, e.g. "Arial"
+        style (str): Only fonts of this style, e.g. "Bold Italic"
+        limit (int): Max number of fonts to return. Default 20.
+
+    Returns:
+        list: Matching fonts, best first, as {"postscript", "family", "style"} dicts
+    """
+    return font_index.get_index().search(query, family, style, limit)
+
 @mcp.resource("config://get_instructions")
 def get_instructions() -> str:
     """Read this first! Returns information and instructions on how to use Photoshop and this API"""
@@ -3208,18 +4162,21 @@ def get_instructions() -> str:
 
     noise_distributions: {", ".join(noise_distributions)}
 
-    fonts: {", ".join(font_names[:FONT_LIMIT])}
+    fonts: {font_index.get_index().summary()}
     """
 
-font_names = list_all_fonts_postscript()
+# cached fonts are available right away, new / changed font files are read in the background
+start_background_scan()
 
 interpolation_methods = [
    "AUTOMATIC",
    "BICUBIC",
+   "BICUBICAUTOMATIC",
    "BICUBICSHARPER",
    "BICUBICSMOOTHER",
    "BILINEAR",
-   "NEARESTNEIGHBOR"
+   "NEARESTNEIGHBOR",
+   "PRESERVEDETAILS"
 ]
 
 anchor_positions = [
@@ -3355,16 +4312,7 @@ noise_distributions = [
 # HELPER: select a layer by ID via batchPlay (no UXP command handler needed)
 # =============================================================================
 
-def _select_layer_bp(layer_id: int):
-    """Internal helper — selects a layer by ID using batchPlay."""
-    commands = [{
-        "_obj": "select",
-        "_target": [{"_ref": "layer", "_id": layer_id}],
-        "makeVisible": False,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
+_select_layer_bp = batchplay_tools.select_layer
 
 
 # =============================================================================
@@ -3408,66 +4356,45 @@ def execute_batchplay(commands: list, layer_id: int = None) -> dict:
 
 
 # =============================================================================
-# PLASTIC WRAP FILTER (via batchPlay)
+# FILTERS AND LAYER OPERATIONS THAT SEND ONE DESCRIPTOR (specs in batchplay_tools.py)
 # =============================================================================
 
-@mcp.tool()
-def apply_plastic_wrap(layer_id: int, highlight_strength: int = 15, detail: int = 9, smoothness: int = 7) -> dict:
-    """
-    Applies Plastic Wrap filter to a layer for a liquid/chrome/wet look.
-
-    Args:
-        layer_id: ID of the layer to apply the effect to
-        highlight_strength: Strength of highlights (0-20). Default 15.
-        detail: Detail level (1-15). Default 9.
-        smoothness: Smoothness (1-15). Default 7.
-    """
-    _select_layer_bp(layer_id)
-
-    commands = [{
-        "_obj": "plasticWrap",
-        "highlightStrength": highlight_strength,
-        "detail": detail,
-        "smoothness": smoothness,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
+batchplay_tools.register(mcp)
 
 
 # =============================================================================
-# GLASS DISTORTION FILTER
+# MERGE SPECIFIC LAYERS
 # =============================================================================
 
 @mcp.tool()
-def apply_glass_distortion(layer_id: int, distortion: int = 5, smoothness: int = 3, texture: str = "frosted", scaling: int = 100) -> dict:
+def merge_layers(layer_ids: list) -> dict:
     """
-    Applies Glass distortion filter for liquid/glass refraction look.
+    Merges specific layers into one. Selects the given layers and merges them.
 
     Args:
-        layer_id: ID of the layer
-        distortion: Distortion amount (0-20). Default 5.
-        smoothness: Smoothness (1-15). Default 3.
-        texture: Texture type — 'frosted', 'blocks', 'canvas', 'tinyLens'. Default 'frosted'.
-        scaling: Texture scale percentage (50-200). Default 100.
+        layer_ids: List of layer IDs to merge together.
     """
-    _select_layer_bp(layer_id)
+    if not layer_ids or len(layer_ids) < 2:
+        raise ValueError("Need at least 2 layer IDs to merge")
 
-    texture_map = {
-        "frosted": 1,
-        "blocks": 2,
-        "canvas": 3,
-        "tinyLens": 4,
-    }
-    texture_id = texture_map.get(texture, 1)
+    # Select first layer via batchPlay
+    _select_layer_bp(layer_ids[0])
+
+    # Add remaining layers to selection
+    for lid in layer_ids[1:]:
+        commands = [{
+            "_obj": "select",
+            "_target": [{"_ref": "layer", "_id": lid}],
+            "selectionModifier": {"_enum": "selectionModifierType", "_value": "addToSelection"},
+            "makeVisible": False,
+            "_isCommand": True
+        }]
+        command = createCommand("executeBatchPlayCommand", {"commands": commands})
+        sendCommand(command)
 
+    # Merge selected layers
     commands = [{
-        "_obj": "glass",
-        "distortion": distortion,
-        "smoothness": smoothness,
-        "textureType": texture_id,
-        "scaling": scaling,
-        "invert": False,
+        "_obj": "mergeLayersNew",
         "_isCommand": True
     }]
     command = createCommand("executeBatchPlayCommand", {"commands": commands})
@@ -3475,298 +4402,29 @@ def apply_glass_distortion(layer_id: int, distortion: int = 5, smoothness: int =
 
 
 # =============================================================================
-# RIPPLE DISTORTION FILTER
+# SELECT LAYER (utility — make a layer active without doing anything else)
 # =============================================================================
 
 @mcp.tool()
-def apply_ripple(layer_id: int, amount: int = 100, size: str = "medium") -> dict:
+def select_layer(layer_id: int) -> dict:
     """
-    Applies Ripple distortion filter.
+    Makes the specified layer the active/selected layer.
 
     Args:
-        layer_id: ID of the layer
-        amount: Ripple amount (-999 to 999). Default 100.
-        size: Ripple size — 'small', 'medium', 'large'. Default 'medium'.
+        layer_id: ID of the layer to select/activate.
     """
-    _select_layer_bp(layer_id)
-
-    size_map = {"small": 0, "medium": 1, "large": 2}
-    size_val = size_map.get(size, 1)
-
-    commands = [{
-        "_obj": "ripple",
-        "amount": amount,
-        "rippleSize": size_val,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
+    return _select_layer_bp(layer_id)
 
 
 # =============================================================================
-# OCEAN RIPPLE DISTORTION FILTER
+# FILL LAYER MASK WITH GRADIENT (for smooth fade effects)
 # =============================================================================
 
 @mcp.tool()
-def apply_ocean_ripple(layer_id: int, ripple_size: int = 9, ripple_magnitude: int = 9) -> dict:
+def fill_mask_with_gradient(layer_id: int, start_x: int = 0, start_y: int = 0, end_x: int = 0, end_y: int = 100, gradient_type: str = "linear") -> dict:
     """
-    Applies Ocean Ripple distortion filter for water surface effect.
-
-    Args:
-        layer_id: ID of the layer
-        ripple_size: Size of ripples (1-15). Default 9.
-        ripple_magnitude: Magnitude of ripples (1-20). Default 9.
-    """
-    _select_layer_bp(layer_id)
-
-    commands = [{
-        "_obj": "oceanRipple",
-        "rippleSize": ripple_size,
-        "rippleMagnitude": ripple_magnitude,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# CHROME FILTER (via batchPlay)
-# =============================================================================
-
-@mcp.tool()
-def apply_chrome_filter(layer_id: int, detail: int = 4, smoothness: int = 7) -> dict:
-    """
-    Applies Chrome filter for metallic/liquid chrome look.
-
-    Args:
-        layer_id: ID of the layer
-        detail: Detail level (0-10). Default 4.
-        smoothness: Smoothness (0-10). Default 7.
-    """
-    _select_layer_bp(layer_id)
-
-    commands = [{
-        "_obj": "chrome",
-        "detail": detail,
-        "smoothness": smoothness,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# SET BLEND-IF SLIDERS
-# =============================================================================
-
-@mcp.tool()
-def set_layer_blend_if(layer_id: int,
-                       this_layer_black: int = 0,
-                       this_layer_black_feather: int = 0,
-                       this_layer_white: int = 255,
-                       this_layer_white_feather: int = 255,
-                       underlying_black: int = 0,
-                       underlying_black_feather: int = 0,
-                       underlying_white: int = 255,
-                       underlying_white_feather: int = 255) -> dict:
-    """
-    Sets the Blend If sliders for a layer (Layer Style > Blending Options).
-    Controls which tonal ranges are visible/hidden for seamless compositing.
-
-    Split points: black_feather > black, white_feather < white for smooth transitions.
-
-    Args:
-        layer_id: ID of the layer
-        this_layer_black: This Layer dark cutoff (0-255). Default 0.
-        this_layer_black_feather: This Layer dark feather point (0-255). Default 0.
-        this_layer_white: This Layer light cutoff (0-255). Default 255.
-        this_layer_white_feather: This Layer light feather point (0-255). Default 255.
-        underlying_black: Underlying Layer dark cutoff (0-255). Default 0.
-        underlying_black_feather: Underlying Layer dark feather point (0-255). Default 0.
-        underlying_white: Underlying Layer light cutoff (0-255). Default 255.
-        underlying_white_feather: Underlying Layer light feather point (0-255). Default 255.
-    """
-    _select_layer_bp(layer_id)
-
-    commands = [{
-        "_obj": "set",
-        "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}],
-        "to": {
-            "_obj": "layer",
-            "blendRange": [{
-                "_obj": "blendRange",
-                "channel": {"_ref": "channel", "_enum": "channel", "_value": "gray"},
-                "srcBlackMin": this_layer_black,
-                "srcBlackMax": this_layer_black_feather,
-                "srcWhiteMin": this_layer_white_feather,
-                "srcWhiteMax": this_layer_white,
-                "destBlackMin": underlying_black,
-                "destBlackMax": underlying_black_feather,
-                "destWhiteMin": underlying_white_feather,
-                "destWhiteMax": underlying_white,
-            }]
-        },
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# MERGE SPECIFIC LAYERS
-# =============================================================================
-
-@mcp.tool()
-def merge_layers(layer_ids: list) -> dict:
-    """
-    Merges specific layers into one. Selects the given layers and merges them.
-
-    Args:
-        layer_ids: List of layer IDs to merge together.
-    """
-    if not layer_ids or len(layer_ids) < 2:
-        raise ValueError("Need at least 2 layer IDs to merge")
-
-    # Select first layer via batchPlay
-    _select_layer_bp(layer_ids[0])
-
-    # Add remaining layers to selection
-    for lid in layer_ids[1:]:
-        commands = [{
-            "_obj": "select",
-            "_target": [{"_ref": "layer", "_id": lid}],
-            "selectionModifier": {"_enum": "selectionModifierType", "_value": "addToSelection"},
-            "makeVisible": False,
-            "_isCommand": True
-        }]
-        command = createCommand("executeBatchPlayCommand", {"commands": commands})
-        sendCommand(command)
-
-    # Merge selected layers
-    commands = [{
-        "_obj": "mergeLayersNew",
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# SELECT LAYER (utility — make a layer active without doing anything else)
-# =============================================================================
-
-@mcp.tool()
-def select_layer(layer_id: int) -> dict:
-    """
-    Makes the specified layer the active/selected layer.
-
-    Args:
-        layer_id: ID of the layer to select/activate.
-    """
-    return _select_layer_bp(layer_id)
-
-
-# =============================================================================
-# APPLY FILTER TO LAYER MASK
-# =============================================================================
-
-@mcp.tool()
-def select_layer_mask(layer_id: int) -> dict:
-    """
-    Selects (targets) the layer mask of the specified layer so that subsequent
-    operations (paint, fill, filter) apply to the mask instead of the layer pixels.
-
-    Args:
-        layer_id: ID of the layer whose mask to select.
-    """
-    _select_layer_bp(layer_id)
-
-    commands = [{
-        "_obj": "select",
-        "_target": [{"_ref": "channel", "_enum": "channel", "_value": "mask"}],
-        "makeVisible": False,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def select_layer_rgb(layer_id: int) -> dict:
-    """
-    Selects the RGB composite channel of the specified layer (switches back from mask editing
-    to normal pixel editing).
-
-    Args:
-        layer_id: ID of the layer.
-    """
-    _select_layer_bp(layer_id)
-
-    commands = [{
-        "_obj": "select",
-        "_target": [{"_ref": "channel", "_enum": "channel", "_value": "RGB"}],
-        "makeVisible": False,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# ADD LAYER MASK (White = reveal all, Black = hide all)
-# =============================================================================
-
-@mcp.tool()
-def add_layer_mask_reveal_all(layer_id: int) -> dict:
-    """
-    Adds a white (reveal all) layer mask to the specified layer.
-
-    Args:
-        layer_id: ID of the layer to add mask to.
-    """
-    _select_layer_bp(layer_id)
-
-    commands = [{
-        "_obj": "make",
-        "new": {"_class": "channel"},
-        "at": {"_ref": "channel", "_enum": "channel", "_value": "mask"},
-        "using": {"_enum": "userMaskEnabled", "_value": "revealAll"},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def add_layer_mask_hide_all(layer_id: int) -> dict:
-    """
-    Adds a black (hide all) layer mask to the specified layer.
-
-    Args:
-        layer_id: ID of the layer to add mask to.
-    """
-    _select_layer_bp(layer_id)
-
-    commands = [{
-        "_obj": "make",
-        "new": {"_class": "channel"},
-        "at": {"_ref": "channel", "_enum": "channel", "_value": "mask"},
-        "using": {"_enum": "userMaskEnabled", "_value": "hideAll"},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# FILL LAYER MASK WITH GRADIENT (for smooth fade effects)
-# =============================================================================
-
-@mcp.tool()
-def fill_mask_with_gradient(layer_id: int, start_x: int = 0, start_y: int = 0, end_x: int = 0, end_y: int = 100, gradient_type: str = "linear") -> dict:
-    """
-    Fills the layer mask with a black-to-white gradient (for smooth fade/transition effects).
-    The layer must already have a mask.
+    Fills the layer mask with a black-to-white gradient (for smooth fade/transition effects).
+    The layer must already have a mask.
 
     Args:
         layer_id: ID of the layer with a mask.
@@ -3844,1729 +4502,44 @@ def fill_mask_with_gradient(layer_id: int, start_x: int = 0, start_y: int = 0, e
     return result
 
 
-# =============================================================================
-# POLAR COORDINATES FILTER
-# =============================================================================
-
-@mcp.tool()
-def apply_polar_coordinates(layer_id: int, conversion: str = "rectangularToPolar") -> dict:
-    """
-    Applies Polar Coordinates distortion filter.
-
-    Args:
-        layer_id: ID of the layer
-        conversion: 'rectangularToPolar' or 'polarToRectangular'. Default 'rectangularToPolar'.
-    """
-    _select_layer_bp(layer_id)
-
-    commands = [{
-        "_obj": "polarCoordinates",
-        "conversion": {"_enum": "polarConversionType", "_value": conversion},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
 # =============================================================================
 # SHEAR FILTER
 # =============================================================================
 
 @mcp.tool()
-def apply_shear(layer_id: int, points: list = None, undefined_area: str = "wrapAround") -> dict:
-    """
-    Applies Shear distortion filter along a curve defined by control points.
-
-    Args:
-        layer_id: ID of the layer
-        points: List of {x, y} dicts defining the shear curve (0-255 range). Default straight line.
-        undefined_area: 'wrapAround' or 'repeatEdgePixels'. Default 'wrapAround'.
-    """
-    if points is None:
-        points = [{"x": 0, "y": 0}, {"x": 255, "y": 255}]
-
-    _select_layer_bp(layer_id)
-
-    curve_points = [{"_obj": "paint", "horizontal": p["x"], "vertical": p["y"]} for p in points]
-
-    commands = [{
-        "_obj": "shear",
-        "shearPoints": curve_points,
-        "undefinedArea": {"_enum": "undefinedArea", "_value": undefined_area},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# PINCH DISTORTION FILTER
-# =============================================================================
-
-@mcp.tool()
-def apply_pinch(layer_id: int, amount: int = 50) -> dict:
-    """
-    Applies Pinch distortion filter (inward/outward squeeze).
-
-    Args:
-        layer_id: ID of the layer
-        amount: Pinch amount (-100 to 100). Positive = inward, negative = outward. Default 50.
-    """
-    _select_layer_bp(layer_id)
-
-    commands = [{
-        "_obj": "pinch",
-        "amount": amount,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# ======================= NEW TOOLS BATCH 1: FILTERS ==========================
-# =============================================================================
-
-
-# =============================================================================
-# WIND FILTER
-# =============================================================================
-
-@mcp.tool()
-def apply_wind(layer_id: int, method: str = "wind", direction: str = "fromTheRight") -> dict:
-    """
-    Applies Wind filter for motion/blast effects.
-
-    Args:
-        layer_id: ID of the layer
-        method: 'wind', 'blast', or 'stagger'. Default 'wind'.
-        direction: 'fromTheRight', 'fromTheLeft'. Default 'fromTheRight'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "wind",
-        "windMethod": {"_enum": "windMethod", "_value": method},
-        "direction": {"_enum": "direction", "_value": direction},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# SMART BLUR FILTER
-# =============================================================================
-
-@mcp.tool()
-def apply_smart_blur(layer_id: int, radius: float = 5.0, threshold: float = 25.0, quality: str = "medium", mode: str = "normal") -> dict:
-    """
-    Applies Smart Blur filter. Blurs areas of similar tone while preserving edges.
-
-    Args:
-        layer_id: ID of the layer
-        radius: Blur radius (0.1-100). Default 5.0.
-        threshold: Tonal threshold (0.1-100). Default 25.0.
-        quality: 'low', 'medium', or 'high'. Default 'medium'.
-        mode: 'normal', 'edgeOnly', or 'overlayEdge'. Default 'normal'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "smartBlur",
-        "radius": radius,
-        "threshold": threshold,
-        "smartBlurQuality": {"_enum": "smartBlurQuality", "_value": quality},
-        "smartBlurMode": {"_enum": "smartBlurMode", "_value": mode},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# BOX BLUR FILTER
-# =============================================================================
-
-@mcp.tool()
-def apply_box_blur(layer_id: int, radius: int = 5) -> dict:
-    """
-    Applies Box Blur filter. Creates a flat, uniform blur.
-
-    Args:
-        layer_id: ID of the layer
-        radius: Blur radius in pixels (1-999). Default 5.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "boxblur",
-        "radius": {"_unit": "pixelsUnit", "_value": float(radius)},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# SHAPE BLUR FILTER
-# =============================================================================
-
-@mcp.tool()
-def apply_shape_blur(layer_id: int, radius: int = 5) -> dict:
-    """
-    Applies Shape Blur filter using a custom kernel shape.
-
-    Args:
-        layer_id: ID of the layer
-        radius: Blur radius in pixels (1-1000). Default 5.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "shapeBlur",
-        "radius": radius,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# AVERAGE BLUR FILTER
-# =============================================================================
-
-@mcp.tool()
-def apply_average_blur(layer_id: int) -> dict:
-    """
-    Applies Average Blur. Fills the layer/selection with the average color of all pixels.
-
-    Args:
-        layer_id: ID of the layer
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "average",
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# FIELD BLUR (Blur Gallery)
-# =============================================================================
-
-@mcp.tool()
-def apply_field_blur(layer_id: int, blur_amount: int = 15) -> dict:
-    """
-    Applies Field Blur (Blur Gallery). Uniform blur across the image with adjustable amount.
-
-    Args:
-        layer_id: ID of the layer
-        blur_amount: Blur amount in pixels (0-500). Default 15.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "bokehImageGalleryBlur",
-        "fieldBlur": {"_unit": "pixelsUnit", "_value": float(blur_amount)},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# DIFFUSE GLOW FILTER
-# =============================================================================
-
-@mcp.tool()
-def apply_diffuse_glow(layer_id: int, graininess: int = 6, glow_amount: int = 10, clear_amount: int = 15) -> dict:
-    """
-    Applies Diffuse Glow filter. Adds dreamy, soft glow using background color.
-
-    Args:
-        layer_id: ID of the layer
-        graininess: Grain amount (0-10). Default 6.
-        glow_amount: Glow intensity (0-20). Default 10.
-        clear_amount: Clear area amount (0-20). Default 15.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "filterGallery",
-        "filterGallery": {
-            "_obj": "filterGallery",
-            "filterRecord": [{
-                "_obj": "diffuseGlow",
-                "graininess": graininess,
-                "glowAmount": glow_amount,
-                "clearAmount": clear_amount
-            }]
-        },
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# GLOWING EDGES FILTER
-# =============================================================================
-
-@mcp.tool()
-def apply_glowing_edges(layer_id: int, edge_width: int = 2, edge_brightness: int = 6, smoothness: int = 5) -> dict:
-    """
-    Applies Glowing Edges filter. Creates neon-like edge outlines.
-
-    Args:
-        layer_id: ID of the layer
-        edge_width: Width of edges (1-14). Default 2.
-        edge_brightness: Brightness of edges (0-20). Default 6.
-        smoothness: Smoothness (1-15). Default 5.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "filterGallery",
-        "filterGallery": {
-            "_obj": "filterGallery",
-            "filterRecord": [{
-                "_obj": "glowingEdges",
-                "edgeWidth": edge_width,
-                "edgeBrightness": edge_brightness,
-                "smoothness": smoothness
-            }]
-        },
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# TILES FILTER
-# =============================================================================
-
-@mcp.tool()
-def apply_tiles(layer_id: int, number_of_tiles: int = 10, maximum_offset: int = 14, fill_empty: str = "backgroundColor") -> dict:
-    """
-    Applies Tiles filter. Breaks image into tiles with offset.
-
-    Args:
-        layer_id: ID of the layer
-        number_of_tiles: Number of tiles (1-99). Default 10.
-        maximum_offset: Max offset percent (1-99). Default 14.
-        fill_empty: Fill for empty areas: 'backgroundColor', 'foregroundColor', 'inverseImage', 'unalteredImage'. Default 'backgroundColor'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "tiles",
-        "numberOfTiles": number_of_tiles,
-        "maximumOffset": maximum_offset,
-        "fillEmptyArea": {"_enum": "fillEmptyArea", "_value": fill_empty},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# TRACE CONTOUR FILTER
-# =============================================================================
-
-@mcp.tool()
-def apply_trace_contour(layer_id: int, level: int = 128, edge: str = "lower") -> dict:
-    """
-    Applies Trace Contour filter. Traces edges at a brightness level.
-
-    Args:
-        layer_id: ID of the layer
-        level: Brightness level to trace (0-255). Default 128.
-        edge: 'lower' or 'upper'. Default 'lower'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "traceContour",
-        "level": level,
-        "edge": {"_enum": "edge", "_value": edge},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# EXTRUDE FILTER
-# =============================================================================
-
-@mcp.tool()
-def apply_extrude(layer_id: int, extrude_type: str = "blocks", size: int = 30, depth: int = 30, solid_front: bool = True, mask_incomplete: bool = False) -> dict:
-    """
-    Applies Extrude filter. Creates 3D blocks or pyramids from image.
-
-    Args:
-        layer_id: ID of the layer
-        extrude_type: 'blocks' or 'pyramids'. Default 'blocks'.
-        size: Size of elements (2-255). Default 30.
-        depth: Depth (1-255). Default 30.
-        solid_front: Fill front faces with solid color. Default True.
-        mask_incomplete: Mask incomplete blocks. Default False.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "extrude",
-        "extrudeType": {"_enum": "extrudeType", "_value": extrude_type},
-        "extrudeSize": size,
-        "extrudeDepth": depth,
-        "extrudeSolidFace": solid_front,
-        "extrudeMaskIncomplete": mask_incomplete,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# ARTISTIC FILTERS
-# =============================================================================
-
-@mcp.tool()
-def apply_colored_pencil(layer_id: int, pencil_width: int = 4, stroke_pressure: int = 8, paper_brightness: int = 25) -> dict:
-    """
-    Applies Colored Pencil artistic filter.
-
-    Args:
-        layer_id: ID of the layer
-        pencil_width: Width of pencil strokes (1-24). Default 4.
-        stroke_pressure: Pressure of strokes (0-15). Default 8.
-        paper_brightness: Paper brightness (0-50). Default 25.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "coloredPencil",
-        "pencilWidth": pencil_width,
-        "strokePressure": stroke_pressure,
-        "paperBrightness": paper_brightness,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_cutout(layer_id: int, number_of_levels: int = 4, edge_simplicity: int = 4, edge_fidelity: int = 2) -> dict:
-    """
-    Applies Cutout artistic filter. Creates a paper cutout appearance.
-
-    Args:
-        layer_id: ID of the layer
-        number_of_levels: Number of levels (2-8). Default 4.
-        edge_simplicity: Edge simplicity (0-10). Default 4.
-        edge_fidelity: Edge fidelity (1-3). Default 2.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "cutout",
-        "numberOfLevels": number_of_levels,
-        "edgeSimplicity": edge_simplicity,
-        "edgeFidelity": edge_fidelity,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_dry_brush(layer_id: int, brush_size: int = 2, brush_detail: int = 8, texture: int = 1) -> dict:
-    """
-    Applies Dry Brush artistic filter.
-
-    Args:
-        layer_id: ID of the layer
-        brush_size: Brush size (0-10). Default 2.
-        brush_detail: Detail (0-10). Default 8.
-        texture: Texture (1-3). Default 1.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "dryBrush",
-        "brushSize": brush_size,
-        "brushDetail": brush_detail,
-        "texture": texture,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_film_grain(layer_id: int, grain: int = 4, highlight_area: int = 0, intensity: int = 10) -> dict:
-    """
-    Applies Film Grain artistic filter.
-
-    Args:
-        layer_id: ID of the layer
-        grain: Grain amount (0-20). Default 4.
-        highlight_area: Highlight area (0-20). Default 0.
-        intensity: Intensity (0-10). Default 10.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "filmGrain",
-        "grain": grain,
-        "highlightArea": highlight_area,
-        "intensity": intensity,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_fresco(layer_id: int, brush_size: int = 2, brush_detail: int = 8, texture: int = 1) -> dict:
-    """
-    Applies Fresco artistic filter.
-
-    Args:
-        layer_id: ID of the layer
-        brush_size: Brush size (0-10). Default 2.
-        brush_detail: Detail (0-10). Default 8.
-        texture: Texture (1-3). Default 1.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "fresco",
-        "brushSize": brush_size,
-        "brushDetail": brush_detail,
-        "texture": texture,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_neon_glow(layer_id: int, glow_size: int = 5, glow_brightness: int = 15, glow_color_red: int = 228, glow_color_green: int = 60, glow_color_blue: int = 220) -> dict:
-    """
-    Applies Neon Glow artistic filter.
-
-    Args:
-        layer_id: ID of the layer
-        glow_size: Size of glow (-24 to 24). Default 5.
-        glow_brightness: Brightness (0-50). Default 15.
-        glow_color_red: Glow color red (0-255). Default 228.
-        glow_color_green: Glow color green (0-255). Default 60.
-        glow_color_blue: Glow color blue (0-255). Default 220.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "neonGlow",
-        "glowSize": glow_size,
-        "glowBrightness": glow_brightness,
-        "glowColor": {
-            "_obj": "RGBColor",
-            "red": glow_color_red,
-            "grain": glow_color_green,
-            "blue": glow_color_blue
-        },
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_paint_daubs(layer_id: int, brush_size: int = 8, sharpness: int = 7, brush_type: str = "simple") -> dict:
-    """
-    Applies Paint Daubs artistic filter.
-
-    Args:
-        layer_id: ID of the layer
-        brush_size: Brush size (1-50). Default 8.
-        sharpness: Sharpness (0-40). Default 7.
-        brush_type: 'simple', 'lightRough', 'darkRough', 'wideSharp', 'wideBlurry', 'sparkle'. Default 'simple'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "paintDaubs",
-        "brushSize": brush_size,
-        "sharpness": sharpness,
-        "brushType": {"_enum": "brushType", "_value": brush_type},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_palette_knife(layer_id: int, stroke_size: int = 12, stroke_detail: int = 3, softness: int = 0) -> dict:
-    """
-    Applies Palette Knife artistic filter.
-
-    Args:
-        layer_id: ID of the layer
-        stroke_size: Stroke size (1-50). Default 12.
-        stroke_detail: Stroke detail (1-3). Default 3.
-        softness: Softness (0-10). Default 0.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "paletteKnife",
-        "strokeSize": stroke_size,
-        "strokeDetail": stroke_detail,
-        "softness": softness,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_poster_edges(layer_id: int, edge_thickness: int = 2, edge_intensity: int = 1, posterization: int = 2) -> dict:
-    """
-    Applies Poster Edges artistic filter.
-
-    Args:
-        layer_id: ID of the layer
-        edge_thickness: Edge thickness (0-10). Default 2.
-        edge_intensity: Edge intensity (0-10). Default 1.
-        posterization: Posterization (0-6). Default 2.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "posterEdges",
-        "edgeThickness": edge_thickness,
-        "edgeIntensity": edge_intensity,
-        "posterization": posterization,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_rough_pastels(layer_id: int, stroke_length: int = 6, stroke_detail: int = 4, texture: str = "canvas", scaling: int = 100, relief: int = 20, light_direction: str = "topLeft", invert_texture: bool = False) -> dict:
-    """
-    Applies Rough Pastels artistic filter.
-
-    Args:
-        layer_id: ID of the layer
-        stroke_length: Stroke length (0-40). Default 6.
-        stroke_detail: Detail (1-20). Default 4.
-        texture: 'brick', 'burlap', 'canvas', 'sandstone'. Default 'canvas'.
-        scaling: Texture scaling (50-200). Default 100.
-        relief: Relief depth (0-50). Default 20.
-        light_direction: 'topLeft', 'top', 'topRight', 'left', 'bottomLeft', 'bottom', 'bottomRight', 'right'. Default 'topLeft'.
-        invert_texture: Invert texture. Default False.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "roughPastels",
-        "strokeLength": stroke_length,
-        "strokeDetail": stroke_detail,
-        "texture": {"_enum": "texture", "_value": texture},
-        "scaling": scaling,
-        "relief": relief,
-        "lightDirection": {"_enum": "lightDirection", "_value": light_direction},
-        "invertTexture": invert_texture,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_smudge_stick(layer_id: int, stroke_length: int = 2, highlight_area: int = 12, intensity: int = 10) -> dict:
-    """
-    Applies Smudge Stick artistic filter.
-
-    Args:
-        layer_id: ID of the layer
-        stroke_length: Stroke length (0-10). Default 2.
-        highlight_area: Highlight area (0-20). Default 12.
-        intensity: Intensity (0-10). Default 10.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "smudgeStick",
-        "strokeLength": stroke_length,
-        "highlightArea": highlight_area,
-        "intensity": intensity,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_sponge_filter(layer_id: int, brush_size: int = 2, definition: int = 12, smoothness: int = 5) -> dict:
-    """
-    Applies Sponge artistic filter.
-
-    Args:
-        layer_id: ID of the layer
-        brush_size: Brush size (0-10). Default 2.
-        definition: Definition (0-25). Default 12.
-        smoothness: Smoothness (1-15). Default 5.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "sponge",
-        "brushSize": brush_size,
-        "definition": definition,
-        "smoothness": smoothness,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_underpainting(layer_id: int, brush_size: int = 2, texture_coverage: int = 1, texture: str = "canvas", scaling: int = 100, relief: int = 4, light_direction: str = "topLeft", invert_texture: bool = False) -> dict:
-    """
-    Applies Underpainting artistic filter.
-
-    Args:
-        layer_id: ID of the layer
-        brush_size: Brush size (0-40). Default 2.
-        texture_coverage: Texture coverage (0-40). Default 1.
-        texture: 'brick', 'burlap', 'canvas', 'sandstone'. Default 'canvas'.
-        scaling: Texture scaling (50-200). Default 100.
-        relief: Relief depth (0-50). Default 4.
-        light_direction: Light direction. Default 'topLeft'.
-        invert_texture: Invert texture. Default False.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "underpainting",
-        "brushSize": brush_size,
-        "textureCoverage": texture_coverage,
-        "texture": {"_enum": "texture", "_value": texture},
-        "scaling": scaling,
-        "relief": relief,
-        "lightDirection": {"_enum": "lightDirection", "_value": light_direction},
-        "invertTexture": invert_texture,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_watercolor(layer_id: int, brush_detail: int = 14, shadow_intensity: int = 0, texture: int = 1) -> dict:
-    """
-    Applies Watercolor artistic filter.
-
-    Args:
-        layer_id: ID of the layer
-        brush_detail: Brush detail (1-14). Default 14.
-        shadow_intensity: Shadow intensity (0-10). Default 0.
-        texture: Texture (1-3). Default 1.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "watercolor",
-        "brushDetail": brush_detail,
-        "shadowIntensity": shadow_intensity,
-        "texture": texture,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# SKETCH FILTERS
-# =============================================================================
-
-@mcp.tool()
-def apply_bas_relief(layer_id: int, detail: int = 13, smoothness: int = 3, light_direction: str = "bottomLeft") -> dict:
-    """
-    Applies Bas Relief sketch filter.
-
-    Args:
-        layer_id: ID of the layer
-        detail: Detail (1-15). Default 13.
-        smoothness: Smoothness (1-15). Default 3.
-        light_direction: Light direction. Default 'bottomLeft'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "basRelief",
-        "detail": detail,
-        "smoothness": smoothness,
-        "lightDirection": {"_enum": "lightDirection", "_value": light_direction},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_chalk_and_charcoal(layer_id: int, chalk_area: int = 6, charcoal_area: int = 6, stroke_pressure: int = 1) -> dict:
-    """
-    Applies Chalk & Charcoal sketch filter.
-
-    Args:
-        layer_id: ID of the layer
-        chalk_area: Chalk area (0-20). Default 6.
-        charcoal_area: Charcoal area (0-20). Default 6.
-        stroke_pressure: Stroke pressure (0-5). Default 1.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "chalkCharcoal",
-        "chalkArea": chalk_area,
-        "charcoalArea": charcoal_area,
-        "strokePressure": stroke_pressure,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_charcoal(layer_id: int, charcoal_thickness: int = 1, detail: int = 5, light_dark_balance: int = 50) -> dict:
-    """
-    Applies Charcoal sketch filter.
-
-    Args:
-        layer_id: ID of the layer
-        charcoal_thickness: Thickness (1-7). Default 1.
-        detail: Detail (0-5). Default 5.
-        light_dark_balance: Balance (0-100). Default 50.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "charcoal",
-        "charcoalThickness": charcoal_thickness,
-        "detail": detail,
-        "lightDarkBalance": light_dark_balance,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_graphic_pen(layer_id: int, stroke_length: int = 15, light_dark_balance: int = 50, stroke_direction: str = "rightDiagonal") -> dict:
-    """
-    Applies Graphic Pen sketch filter.
-
-    Args:
-        layer_id: ID of the layer
-        stroke_length: Stroke length (1-15). Default 15.
-        light_dark_balance: Balance (0-100). Default 50.
-        stroke_direction: 'rightDiagonal', 'horizontal', 'leftDiagonal', 'vertical'. Default 'rightDiagonal'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "graphicPen",
-        "strokeLength": stroke_length,
-        "lightDarkBalance": light_dark_balance,
-        "strokeDirection": {"_enum": "strokeDirection", "_value": stroke_direction},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_halftone_pattern(layer_id: int, size: int = 1, contrast: int = 5, pattern_type: str = "dot") -> dict:
-    """
-    Applies Halftone Pattern sketch filter.
-
-    Args:
-        layer_id: ID of the layer
-        size: Pattern size (1-12). Default 1.
-        contrast: Contrast (0-50). Default 5.
-        pattern_type: 'dot', 'circle', or 'line'. Default 'dot'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "halftoneScreen",
-        "size": size,
-        "contrast": contrast,
-        "halftoneScreenPatternType": {"_enum": "halftoneScreenPatternType", "_value": pattern_type},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_note_paper(layer_id: int, image_balance: int = 25, graininess: int = 10, relief: int = 11) -> dict:
-    """
-    Applies Note Paper sketch filter.
-
-    Args:
-        layer_id: ID of the layer
-        image_balance: Image balance (0-50). Default 25.
-        graininess: Graininess (0-20). Default 10.
-        relief: Relief (0-25). Default 11.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "notePaper",
-        "imageBalance": image_balance,
-        "graininess": graininess,
-        "relief": relief,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_photocopy(layer_id: int, detail: int = 7, darkness: int = 8) -> dict:
-    """
-    Applies Photocopy sketch filter.
-
-    Args:
-        layer_id: ID of the layer
-        detail: Detail (1-24). Default 7.
-        darkness: Darkness (1-50). Default 8.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "photocopy",
-        "detail": detail,
-        "darkness": darkness,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_plaster(layer_id: int, image_balance: int = 20, smoothness: int = 2, light_direction: str = "topLeft") -> dict:
-    """
-    Applies Plaster sketch filter.
-
-    Args:
-        layer_id: ID of the layer
-        image_balance: Image balance (0-50). Default 20.
-        smoothness: Smoothness (1-15). Default 2.
-        light_direction: Light direction. Default 'topLeft'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "plaster",
-        "imageBalance": image_balance,
-        "smoothness": smoothness,
-        "lightDirection": {"_enum": "lightDirection", "_value": light_direction},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_reticulation(layer_id: int, density: int = 12, foreground_level: int = 40, background_level: int = 5) -> dict:
-    """
-    Applies Reticulation sketch filter.
-
-    Args:
-        layer_id: ID of the layer
-        density: Density (0-50). Default 12.
-        foreground_level: Foreground level (0-50). Default 40.
-        background_level: Background level (0-50). Default 5.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "reticulation",
-        "density": density,
-        "foregroundLevel": foreground_level,
-        "backgroundLevel": background_level,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_stamp_filter(layer_id: int, light_dark_balance: int = 25, smoothness: int = 5) -> dict:
-    """
-    Applies Stamp sketch filter.
-
-    Args:
-        layer_id: ID of the layer
-        light_dark_balance: Balance (0-50). Default 25.
-        smoothness: Smoothness (1-50). Default 5.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "stamp",
-        "lightDarkBalance": light_dark_balance,
-        "smoothness": smoothness,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_torn_edges(layer_id: int, image_balance: int = 25, smoothness: int = 11, contrast: int = 17) -> dict:
-    """
-    Applies Torn Edges sketch filter.
-
-    Args:
-        layer_id: ID of the layer
-        image_balance: Image balance (0-50). Default 25.
-        smoothness: Smoothness (1-15). Default 11.
-        contrast: Contrast (1-25). Default 17.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "tornEdges",
-        "imageBalance": image_balance,
-        "smoothness": smoothness,
-        "contrast": contrast,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_water_paper(layer_id: int, fiber_length: int = 15, brightness: int = 60, contrast: int = 80) -> dict:
-    """
-    Applies Water Paper sketch filter.
-
-    Args:
-        layer_id: ID of the layer
-        fiber_length: Fiber length (3-50). Default 15.
-        brightness: Brightness (0-100). Default 60.
-        contrast: Contrast (0-100). Default 80.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "waterPaper",
-        "fiberLength": fiber_length,
-        "brightness": brightness,
-        "contrast": contrast,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# BRUSH STROKE FILTERS
-# =============================================================================
-
-@mcp.tool()
-def apply_accented_edges(layer_id: int, edge_width: int = 2, edge_brightness: int = 38, smoothness: int = 5) -> dict:
-    """
-    Applies Accented Edges brush stroke filter.
-
-    Args:
-        layer_id: ID of the layer
-        edge_width: Edge width (1-14). Default 2.
-        edge_brightness: Edge brightness (0-50). Default 38.
-        smoothness: Smoothness (1-15). Default 5.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "accentedEdges",
-        "edgeWidth": edge_width,
-        "edgeBrightness": edge_brightness,
-        "smoothness": smoothness,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_angled_strokes(layer_id: int, direction_balance: int = 50, stroke_length: int = 15, sharpness: int = 3) -> dict:
-    """
-    Applies Angled Strokes brush stroke filter.
-
-    Args:
-        layer_id: ID of the layer
-        direction_balance: Direction balance (0-100). Default 50.
-        stroke_length: Stroke length (3-50). Default 15.
-        sharpness: Sharpness (0-10). Default 3.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "angledStrokes",
-        "directionBalance": direction_balance,
-        "strokeLength": stroke_length,
-        "sharpness": sharpness,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_crosshatch(layer_id: int, stroke_length: int = 9, sharpness: int = 6, strength: int = 1) -> dict:
-    """
-    Applies Crosshatch brush stroke filter.
-
-    Args:
-        layer_id: ID of the layer
-        stroke_length: Stroke length (3-50). Default 9.
-        sharpness: Sharpness (0-20). Default 6.
-        strength: Strength (1-3). Default 1.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "crosshatch",
-        "strokeLength": stroke_length,
-        "sharpness": sharpness,
-        "strength": strength,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_dark_strokes(layer_id: int, balance: int = 5, black_intensity: int = 6, white_intensity: int = 2) -> dict:
-    """
-    Applies Dark Strokes brush stroke filter.
-
-    Args:
-        layer_id: ID of the layer
-        balance: Balance (0-10). Default 5.
-        black_intensity: Black intensity (0-10). Default 6.
-        white_intensity: White intensity (0-10). Default 2.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "darkStrokes",
-        "balance": balance,
-        "blackIntensity": black_intensity,
-        "whiteIntensity": white_intensity,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_ink_outlines(layer_id: int, stroke_length: int = 4, dark_intensity: int = 20, light_intensity: int = 10) -> dict:
-    """
-    Applies Ink Outlines brush stroke filter.
-
-    Args:
-        layer_id: ID of the layer
-        stroke_length: Stroke length (1-50). Default 4.
-        dark_intensity: Dark intensity (0-50). Default 20.
-        light_intensity: Light intensity (0-50). Default 10.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "inkOutlines",
-        "strokeLength": stroke_length,
-        "darkIntensity": dark_intensity,
-        "lightIntensity": light_intensity,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_spatter(layer_id: int, spray_radius: int = 10, smoothness: int = 5) -> dict:
-    """
-    Applies Spatter brush stroke filter.
-
-    Args:
-        layer_id: ID of the layer
-        spray_radius: Spray radius (0-25). Default 10.
-        smoothness: Smoothness (1-15). Default 5.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "spatter",
-        "sprayRadius": spray_radius,
-        "smoothness": smoothness,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_sprayed_strokes(layer_id: int, stroke_length: int = 12, spray_radius: int = 7, stroke_direction: str = "rightDiagonal") -> dict:
-    """
-    Applies Sprayed Strokes brush stroke filter.
-
-    Args:
-        layer_id: ID of the layer
-        stroke_length: Stroke length (0-20). Default 12.
-        spray_radius: Spray radius (0-25). Default 7.
-        stroke_direction: 'rightDiagonal', 'horizontal', 'leftDiagonal', 'vertical'. Default 'rightDiagonal'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "sprayedStrokes",
-        "strokeLength": stroke_length,
-        "sprayRadius": spray_radius,
-        "strokeDirection": {"_enum": "strokeDirection", "_value": stroke_direction},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_sumi_e(layer_id: int, stroke_width: int = 3, stroke_pressure: int = 2, contrast: int = 16) -> dict:
-    """
-    Applies Sumi-e brush stroke filter.
-
-    Args:
-        layer_id: ID of the layer
-        stroke_width: Stroke width (3-15). Default 3.
-        stroke_pressure: Stroke pressure (0-15). Default 2.
-        contrast: Contrast (0-40). Default 16.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "sumie",
-        "strokeWidth": stroke_width,
-        "strokePressure": stroke_pressure,
-        "contrast": contrast,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# TEXTURE FILTERS
-# =============================================================================
-
-@mcp.tool()
-def apply_craquelure(layer_id: int, crack_spacing: int = 15, crack_depth: int = 6, crack_brightness: int = 9) -> dict:
-    """
-    Applies Craquelure texture filter.
-
-    Args:
-        layer_id: ID of the layer
-        crack_spacing: Spacing (2-100). Default 15.
-        crack_depth: Depth (1-10). Default 6.
-        crack_brightness: Brightness (0-10). Default 9.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "craquelure",
-        "crackSpacing": crack_spacing,
-        "crackDepth": crack_depth,
-        "crackBrightness": crack_brightness,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_grain(layer_id: int, intensity: int = 40, contrast: int = 50, grain_type: str = "regular") -> dict:
-    """
-    Applies Grain texture filter.
-
-    Args:
-        layer_id: ID of the layer
-        intensity: Intensity (0-100). Default 40.
-        contrast: Contrast (0-100). Default 50.
-        grain_type: 'regular', 'soft', 'sprinkles', 'clumped', 'contrasty', 'enlarged', 'stippled', 'horizontal', 'vertical', 'speckle'. Default 'regular'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "grain",
-        "intensity": intensity,
-        "contrast": contrast,
-        "grainType": {"_enum": "grainType", "_value": grain_type},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_patchwork(layer_id: int, square_size: int = 2, relief: int = 5) -> dict:
-    """
-    Applies Patchwork texture filter.
-
-    Args:
-        layer_id: ID of the layer
-        square_size: Square size (0-10). Default 2.
-        relief: Relief (0-25). Default 5.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "patchwork",
-        "squareSize": square_size,
-        "relief": relief,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_stained_glass(layer_id: int, cell_size: int = 6, border_thickness: int = 4, light_intensity: int = 3) -> dict:
-    """
-    Applies Stained Glass texture filter.
-
-    Args:
-        layer_id: ID of the layer
-        cell_size: Cell size (2-50). Default 6.
-        border_thickness: Border thickness (1-20). Default 4.
-        light_intensity: Light intensity (0-10). Default 3.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "stainedGlass",
-        "cellSize": cell_size,
-        "borderThickness": border_thickness,
-        "lightIntensity": light_intensity,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_texturizer(layer_id: int, texture: str = "canvas", scaling: int = 100, relief: int = 4, light_direction: str = "topLeft", invert_texture: bool = False) -> dict:
-    """
-    Applies Texturizer texture filter.
-
-    Args:
-        layer_id: ID of the layer
-        texture: 'brick', 'burlap', 'canvas', 'sandstone'. Default 'canvas'.
-        scaling: Scaling (50-200). Default 100.
-        relief: Relief (0-50). Default 4.
-        light_direction: Light direction. Default 'topLeft'.
-        invert_texture: Invert. Default False.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "texturizer",
-        "texture": {"_enum": "texture", "_value": texture},
-        "scaling": scaling,
-        "relief": relief,
-        "lightDirection": {"_enum": "lightDirection", "_value": light_direction},
-        "invertTexture": invert_texture,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# PIXELATE FILTERS (missing ones)
-# =============================================================================
-
-@mcp.tool()
-def apply_facet(layer_id: int) -> dict:
-    """
-    Applies Facet pixelate filter. Groups similar pixels into flat-colored blocks.
-
-    Args:
-        layer_id: ID of the layer
-    """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "facet", "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_fragment(layer_id: int) -> dict:
-    """
-    Applies Fragment pixelate filter. Creates four offset copies for a motion effect.
-
-    Args:
-        layer_id: ID of the layer
-    """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "fragment", "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_mezzotint(layer_id: int, mezzotint_type: str = "mediumDots") -> dict:
-    """
-    Applies Mezzotint pixelate filter.
-
-    Args:
-        layer_id: ID of the layer
-        mezzotint_type: 'fineDots', 'mediumDots', 'grainyDots', 'coarseDots', 'shortLines', 'mediumLines', 'longLines', 'shortStrokes', 'mediumStrokes', 'longStrokes'. Default 'mediumDots'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "mezzotint",
-        "mezzotintType": {"_enum": "mezzotintType", "_value": mezzotint_type},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_pointillize(layer_id: int, cell_size: int = 5) -> dict:
-    """
-    Applies Pointillize pixelate filter. Creates a pointillist painting effect.
-
-    Args:
-        layer_id: ID of the layer
-        cell_size: Cell size (3-300). Default 5.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "pointillize",
-        "cellSize": cell_size,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# RENDER FILTERS
-# =============================================================================
-
-@mcp.tool()
-def apply_clouds(layer_id: int) -> dict:
-    """
-    Renders Clouds using foreground and background colors. Fills entire layer.
-
-    Args:
-        layer_id: ID of the layer
-    """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "clouds", "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_difference_clouds(layer_id: int) -> dict:
-    """
-    Renders Difference Clouds. Like clouds but blended with existing content using difference mode.
-
-    Args:
-        layer_id: ID of the layer
-    """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "differenceClouds", "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_fibers(layer_id: int, variance: int = 16, strength: int = 4) -> dict:
-    """
-    Renders Fibers using foreground and background colors.
-
-    Args:
-        layer_id: ID of the layer
-        variance: Variance (0-64). Default 16.
-        strength: Strength (0-10). Default 4.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "fibers",
-        "variance": variance,
-        "strength": strength,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_lens_flare(layer_id: int, brightness: int = 100, flare_center_x: int = 500, flare_center_y: int = 300, lens_type: str = "zoomLens") -> dict:
-    """
-    Renders Lens Flare effect.
-
-    Args:
-        layer_id: ID of the layer
-        brightness: Brightness (10-300). Default 100.
-        flare_center_x: Flare center X pixel coordinate. Default 500.
-        flare_center_y: Flare center Y pixel coordinate. Default 300.
-        lens_type: '50-300mmZoom' or 'zoomLens' or 'moviePrime' or '105mmPrime'. Default 'zoomLens'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "lensFlare",
-        "brightness": brightness,
-        "flareCenter": {
-            "_obj": "paint",
-            "horizontal": {"_unit": "pixelsUnit", "_value": flare_center_x},
-            "vertical": {"_unit": "pixelsUnit", "_value": flare_center_y}
-        },
-        "lensType": {"_enum": "lensType", "_value": lens_type},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# NOISE FILTERS (missing)
-# =============================================================================
-
-@mcp.tool()
-def apply_reduce_noise(layer_id: int, strength: int = 6, preserve_details: int = 60, reduce_color_noise: int = 60, sharpen_details: int = 25) -> dict:
-    """
-    Applies Reduce Noise filter.
-
-    Args:
-        layer_id: ID of the layer
-        strength: Noise reduction strength (0-10). Default 6.
-        preserve_details: Preserve details percent (0-100). Default 60.
-        reduce_color_noise: Color noise reduction (0-100). Default 60.
-        sharpen_details: Sharpen details (0-100). Default 25.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "denoise",
-        "strength": strength,
-        "preserveDetails": preserve_details,
-        "reduceColorNoise": reduce_color_noise,
-        "sharpenDetails": sharpen_details,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# OTHER FILTERS (Maximum, Minimum, Offset, Custom)
-# =============================================================================
-
-@mcp.tool()
-def apply_maximum(layer_id: int, radius: int = 1) -> dict:
-    """
-    Applies Maximum filter. Expands bright areas / shrinks dark areas.
-
-    Args:
-        layer_id: ID of the layer
-        radius: Radius in pixels (1-100). Default 1.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "maximum",
-        "radius": {"_unit": "pixelsUnit", "_value": float(radius)},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_minimum(layer_id: int, radius: int = 1) -> dict:
-    """
-    Applies Minimum filter. Shrinks bright areas / expands dark areas.
-
-    Args:
-        layer_id: ID of the layer
-        radius: Radius in pixels (1-100). Default 1.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "minimum",
-        "radius": {"_unit": "pixelsUnit", "_value": float(radius)},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_offset_filter(layer_id: int, horizontal: int = 0, vertical: int = 0, undefined_area: str = "wrapAround") -> dict:
-    """
-    Applies Offset filter. Shifts the layer content.
-
-    Args:
-        layer_id: ID of the layer
-        horizontal: Horizontal offset in pixels. Default 0.
-        vertical: Vertical offset in pixels. Default 0.
-        undefined_area: 'wrapAround', 'repeatEdgePixels', or 'setToTransparent'. Default 'wrapAround'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "offset",
-        "horizontal": {"_unit": "pixelsUnit", "_value": horizontal},
-        "vertical": {"_unit": "pixelsUnit", "_value": vertical},
-        "undefinedArea": {"_enum": "undefinedArea", "_value": undefined_area},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# ===================== NEW TOOLS BATCH 2: ADJUSTMENTS ========================
-# =============================================================================
-
-
-@mcp.tool()
-def apply_desaturate(layer_id: int) -> dict:
-    """
-    Applies Desaturate (Image > Adjustments > Desaturate). Removes all color.
-
-    Args:
-        layer_id: ID of the layer
-    """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "desaturate", "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_equalize(layer_id: int) -> dict:
-    """
-    Applies Equalize adjustment. Redistributes brightness values evenly.
-
-    Args:
-        layer_id: ID of the layer
-    """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "equalize", "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_invert_image(layer_id: int) -> dict:
-    """
-    Applies direct Invert to layer pixels (Image > Adjustments > Invert). Not an adjustment layer.
-
-    Args:
-        layer_id: ID of the layer
-    """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "invert", "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_posterize_direct(layer_id: int, levels: int = 4) -> dict:
-    """
-    Applies Posterize directly to layer pixels (not adjustment layer).
-
-    Args:
-        layer_id: ID of the layer
-        levels: Tonal levels (2-255). Default 4.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "posterize",
-        "levels": levels,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_threshold_direct(layer_id: int, level: int = 128) -> dict:
-    """
-    Applies Threshold directly to layer pixels (not adjustment layer).
-
-    Args:
-        layer_id: ID of the layer
-        level: Threshold level (1-255). Default 128.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "threshold",
-        "level": level,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_match_color(layer_id: int, luminance: int = 100, color_intensity: int = 100, fade: int = 0, neutralize: bool = False) -> dict:
+def apply_shear(layer_id: int, points: list = None, undefined_area: str = "wrapAround") -> dict:
     """
-    Applies Match Color adjustment.
+    Applies Shear distortion filter along a curve defined by control points.
 
     Args:
         layer_id: ID of the layer
-        luminance: Luminance (1-200). Default 100.
-        color_intensity: Color intensity (1-200). Default 100.
-        fade: Fade amount (0-100). Default 0.
-        neutralize: Neutralize color cast. Default False.
+        points: List of {x, y} dicts defining the shear curve (0-255 range). Default straight line.
+        undefined_area: 'wrapAround' or 'repeatEdgePixels'. Default 'wrapAround'.
     """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "matchColor",
-        "luminance": luminance,
-        "colorIntensity": color_intensity,
-        "fade": fade,
-        "neutralize": neutralize,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
+    if points is None:
+        points = [{"x": 0, "y": 0}, {"x": 255, "y": 255}]
 
+    _select_layer_bp(layer_id)
 
-@mcp.tool()
-def apply_replace_color(layer_id: int, fuzziness: int = 40, hue: int = 0, saturation: int = 0, lightness: int = 0, sample_color_red: int = 255, sample_color_green: int = 0, sample_color_blue: int = 0) -> dict:
-    """
-    Applies Replace Color adjustment. Replaces a sampled color with new HSL values.
+    curve_points = [{"_obj": "paint", "horizontal": p["x"], "vertical": p["y"]} for p in points]
 
-    Args:
-        layer_id: ID of the layer
-        fuzziness: Color selection tolerance (0-200). Default 40.
-        hue: New hue shift (-180 to 180). Default 0.
-        saturation: New saturation (-100 to 100). Default 0.
-        lightness: New lightness (-100 to 100). Default 0.
-        sample_color_red: Sample color red (0-255). Default 255.
-        sample_color_green: Sample color green (0-255). Default 0.
-        sample_color_blue: Sample color blue (0-255). Default 0.
-    """
-    _select_layer_bp(layer_id)
     commands = [{
-        "_obj": "replaceColor",
-        "fuzziness": fuzziness,
-        "hue": hue,
-        "saturation": saturation,
-        "lightness": lightness,
-        "color": {
-            "_obj": "RGBColor",
-            "red": sample_color_red,
-            "grain": sample_color_green,
-            "blue": sample_color_blue
-        },
+        "_obj": "shear",
+        "shearPoints": curve_points,
+        "undefinedArea": {"_enum": "undefinedArea", "_value": undefined_area},
         "_isCommand": True
     }]
     command = createCommand("executeBatchPlayCommand", {"commands": commands})
     return sendCommand(command)
 
 
-@mcp.tool()
-def add_color_lookup_adjustment_layer(layer_id: int, lut_name: str = "Crisp_Warm.look") -> dict:
-    """
-    Adds a Color Lookup (LUT) adjustment layer.
+# =============================================================================
+# ======================= NEW TOOLS BATCH 1: FILTERS ==========================
+# =============================================================================
 
-    Args:
-        layer_id: ID of the layer to apply to
-        lut_name: Name of the LUT file (e.g., 'Crisp_Warm.look', 'EdgyAmber.3DL', 'FallColors.look', 'Filmstock_50.3DL', 'LateSunset.3DL', 'Moonlight.3DL', 'NightFromDay.CUBE', 'Teal_Orange_Plus_Contrast.look'). Default 'Crisp_Warm.look'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "make",
-        "_target": [{"_ref": "adjustmentLayer"}],
-        "using": {
-            "_obj": "adjustmentLayer",
-            "type": {
-                "_obj": "colorLookup",
-                "lookupType": {"_enum": "colorLookupType", "_value": "3DLUTFile"},
-                "name": lut_name
-            }
-        },
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
+
+# =============================================================================
+# =============================================================================
 
 
 # =============================================================================
@@ -5622,79 +4595,6 @@ def unlink_layers(layer_ids: list) -> dict:
     return sendCommand(command)
 
 
-@mcp.tool()
-def apply_layer_mask(layer_id: int) -> dict:
-    """
-    Applies (permanently merges) the layer mask into the layer pixels.
-
-    Args:
-        layer_id: ID of the layer
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "delete",
-        "_target": [{"_ref": "channel", "_enum": "channel", "_value": "mask"}],
-        "apply": True,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def enable_layer_mask(layer_id: int, enabled: bool = True) -> dict:
-    """
-    Enables or disables a layer mask without deleting it.
-
-    Args:
-        layer_id: ID of the layer
-        enabled: True to enable, False to disable. Default True.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "set",
-        "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}],
-        "to": {"_obj": "layer", "userMaskEnabled": enabled},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def copy_layer_effects(layer_id: int) -> dict:
-    """
-    Copies layer effects/styles from the specified layer to clipboard.
-
-    Args:
-        layer_id: ID of the source layer
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "copyEffects",
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def paste_layer_effects(layer_id: int) -> dict:
-    """
-    Pastes previously copied layer effects/styles onto the specified layer.
-
-    Args:
-        layer_id: ID of the target layer
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "pasteEffects",
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
 @mcp.tool()
 def add_pattern_fill_layer(pattern_name: str = "Bubbles", scale: int = 100) -> dict:
     """
@@ -5764,240 +4664,9 @@ def add_gradient_fill_layer(angle: int = 90, gradient_type: str = "linear", scal
                 "gradient": {
                     "_obj": "gradient",
                     "colors": cs_descriptors,
-                    "gradientForm": {"_enum": "gradientForm", "_value": "customStops"}
-                }
-            }
-        },
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def lock_layer(layer_id: int, lock_all: bool = True) -> dict:
-    """
-    Locks or unlocks a layer.
-
-    Args:
-        layer_id: ID of the layer
-        lock_all: True to lock all, False to unlock. Default True.
-    """
-    _select_layer_bp(layer_id)
-    lock_value = "protectAll" if lock_all else "protectNone"
-    commands = [{
-        "_obj": "set",
-        "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}],
-        "to": {
-            "_obj": "layer",
-            "layerLocking": {
-                "_obj": "layerLocking",
-                "protectAll": lock_all
-            }
-        },
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def set_layer_color_tag(layer_id: int, color: str = "red") -> dict:
-    """
-    Sets the color tag label for a layer in the Layers panel.
-
-    Args:
-        layer_id: ID of the layer
-        color: 'none', 'red', 'orange', 'yellowColor', 'green', 'blue', 'violet', 'gray'. Default 'red'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "set",
-        "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}],
-        "to": {"_obj": "layer", "color": {"_enum": "color", "_value": color}},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# ==================== NEW TOOLS BATCH 4: SELECTIONS ==========================
-# =============================================================================
-
-
-@mcp.tool()
-def add_to_selection_rectangle(layer_id: int, top: int = 0, left: int = 0, bottom: int = 100, right: int = 100, feather: int = 0) -> dict:
-    """
-    Adds a rectangular area to the existing selection.
-
-    Args:
-        layer_id: ID of the layer
-        top: Top bound. Default 0.
-        left: Left bound. Default 0.
-        bottom: Bottom bound. Default 100.
-        right: Right bound. Default 100.
-        feather: Feather radius in pixels. Default 0.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "set",
-        "_target": [{"_ref": "channel", "_property": "selection"}],
-        "to": {
-            "_obj": "rectangle",
-            "top": {"_unit": "pixelsUnit", "_value": top},
-            "left": {"_unit": "pixelsUnit", "_value": left},
-            "bottom": {"_unit": "pixelsUnit", "_value": bottom},
-            "right": {"_unit": "pixelsUnit", "_value": right}
-        },
-        "selectionModifier": {"_enum": "selectionModifierType", "_value": "addToSelection"},
-        "feather": {"_unit": "pixelsUnit", "_value": float(feather)},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def subtract_from_selection_rectangle(layer_id: int, top: int = 0, left: int = 0, bottom: int = 100, right: int = 100, feather: int = 0) -> dict:
-    """
-    Subtracts a rectangular area from the existing selection.
-
-    Args:
-        layer_id: ID of the layer
-        top: Top bound. Default 0.
-        left: Left bound. Default 0.
-        bottom: Bottom bound. Default 100.
-        right: Right bound. Default 100.
-        feather: Feather radius in pixels. Default 0.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "set",
-        "_target": [{"_ref": "channel", "_property": "selection"}],
-        "to": {
-            "_obj": "rectangle",
-            "top": {"_unit": "pixelsUnit", "_value": top},
-            "left": {"_unit": "pixelsUnit", "_value": left},
-            "bottom": {"_unit": "pixelsUnit", "_value": bottom},
-            "right": {"_unit": "pixelsUnit", "_value": right}
-        },
-        "selectionModifier": {"_enum": "selectionModifierType", "_value": "removeFromSelection"},
-        "feather": {"_unit": "pixelsUnit", "_value": float(feather)},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def intersect_selection_rectangle(layer_id: int, top: int = 0, left: int = 0, bottom: int = 100, right: int = 100, feather: int = 0) -> dict:
-    """
-    Intersects a rectangular area with the existing selection.
-
-    Args:
-        layer_id: ID of the layer
-        top: Top bound. Default 0.
-        left: Left bound. Default 0.
-        bottom: Bottom bound. Default 100.
-        right: Right bound. Default 100.
-        feather: Feather radius in pixels. Default 0.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "set",
-        "_target": [{"_ref": "channel", "_property": "selection"}],
-        "to": {
-            "_obj": "rectangle",
-            "top": {"_unit": "pixelsUnit", "_value": top},
-            "left": {"_unit": "pixelsUnit", "_value": left},
-            "bottom": {"_unit": "pixelsUnit", "_value": bottom},
-            "right": {"_unit": "pixelsUnit", "_value": right}
-        },
-        "selectionModifier": {"_enum": "selectionModifierType", "_value": "intersectWith"},
-        "feather": {"_unit": "pixelsUnit", "_value": float(feather)},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def select_layer_transparency(layer_id: int) -> dict:
-    """
-    Loads a layer's transparency as a selection (Ctrl+click layer thumbnail).
-
-    Args:
-        layer_id: ID of the layer
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "set",
-        "_target": [{"_ref": "channel", "_property": "selection"}],
-        "to": {"_ref": "channel", "_enum": "channel", "_value": "transparencyEnum"},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def select_by_magic_wand(layer_id: int, x: int = 0, y: int = 0, tolerance: int = 32, contiguous: bool = True, anti_alias: bool = True, sample_all_layers: bool = False) -> dict:
-    """
-    Selects pixels using Magic Wand tool at a specific point.
-
-    Args:
-        layer_id: ID of the layer
-        x: X coordinate of click point. Default 0.
-        y: Y coordinate of click point. Default 0.
-        tolerance: Color tolerance (0-255). Default 32.
-        contiguous: Only select contiguous pixels. Default True.
-        anti_alias: Anti-alias edges. Default True.
-        sample_all_layers: Sample from all layers. Default False.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "set",
-        "_target": [{"_ref": "channel", "_property": "selection"}],
-        "to": {
-            "_obj": "point",
-            "horizontal": {"_unit": "pixelsUnit", "_value": x},
-            "vertical": {"_unit": "pixelsUnit", "_value": y}
-        },
-        "tolerance": tolerance,
-        "antiAlias": anti_alias,
-        "contiguous": contiguous,
-        "merged": sample_all_layers,
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-# =============================================================================
-# =================== NEW TOOLS BATCH 5: TRANSFORMS ==========================
-# =============================================================================
-
-
-@mcp.tool()
-def apply_skew(layer_id: int, horizontal_skew: int = 0, vertical_skew: int = 0) -> dict:
-    """
-    Applies Skew transform to a layer.
-
-    Args:
-        layer_id: ID of the layer
-        horizontal_skew: Horizontal skew in degrees (-89 to 89). Default 0.
-        vertical_skew: Vertical skew in degrees (-89 to 89). Default 0.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "transform",
-        "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}],
-        "freeTransformCenterState": {"_enum": "quadCenterState", "_value": "QCSAverage"},
-        "skew": {
-            "_obj": "paint",
-            "horizontal": {"_unit": "angleUnit", "_value": float(horizontal_skew)},
-            "vertical": {"_unit": "angleUnit", "_value": float(vertical_skew)}
+                    "gradientForm": {"_enum": "gradientForm", "_value": "customStops"}
+                }
+            }
         },
         "_isCommand": True
     }]
@@ -6006,78 +4675,16 @@ def apply_skew(layer_id: int, horizontal_skew: int = 0, vertical_skew: int = 0)
 
 
 # =============================================================================
-# ================= NEW TOOLS BATCH 6: DRAWING/PAINTING ======================
 # =============================================================================
 
 
-@mcp.tool()
-def apply_dodge_tool(layer_id: int, x: int = 50, y: int = 50, brush_size: int = 100, exposure: int = 50, range_value: str = "midtones") -> dict:
-    """
-    Applies Dodge tool at a point (lightens area).
-
-    Args:
-        layer_id: ID of the layer
-        x: X coordinate. Default 50.
-        y: Y coordinate. Default 50.
-        brush_size: Brush diameter in pixels. Default 100.
-        exposure: Exposure percentage (1-100). Default 50.
-        range_value: 'shadows', 'midtones', or 'highlights'. Default 'midtones'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "dodge",
-        "position": {
-            "_obj": "paint",
-            "horizontal": {"_unit": "pixelsUnit", "_value": x},
-            "vertical": {"_unit": "pixelsUnit", "_value": y}
-        },
-        "to": {
-            "_obj": "paint",
-            "horizontal": {"_unit": "pixelsUnit", "_value": x},
-            "vertical": {"_unit": "pixelsUnit", "_value": y}
-        },
-        "diameter": {"_unit": "pixelsUnit", "_value": float(brush_size)},
-        "exposure": {"_unit": "percentUnit", "_value": float(exposure)},
-        "range": {"_enum": "range", "_value": range_value},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
+# =============================================================================
+# =============================================================================
 
-@mcp.tool()
-def apply_burn_tool(layer_id: int, x: int = 50, y: int = 50, brush_size: int = 100, exposure: int = 50, range_value: str = "midtones") -> dict:
-    """
-    Applies Burn tool at a point (darkens area).
 
-    Args:
-        layer_id: ID of the layer
-        x: X coordinate. Default 50.
-        y: Y coordinate. Default 50.
-        brush_size: Brush diameter in pixels. Default 100.
-        exposure: Exposure percentage (1-100). Default 50.
-        range_value: 'shadows', 'midtones', or 'highlights'. Default 'midtones'.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "burn",
-        "position": {
-            "_obj": "paint",
-            "horizontal": {"_unit": "pixelsUnit", "_value": x},
-            "vertical": {"_unit": "pixelsUnit", "_value": y}
-        },
-        "to": {
-            "_obj": "paint",
-            "horizontal": {"_unit": "pixelsUnit", "_value": x},
-            "vertical": {"_unit": "pixelsUnit", "_value": y}
-        },
-        "diameter": {"_unit": "pixelsUnit", "_value": float(brush_size)},
-        "exposure": {"_unit": "percentUnit", "_value": float(exposure)},
-        "range": {"_enum": "range", "_value": range_value},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
+# =============================================================================
+# ================= NEW TOOLS BATCH 6: DRAWING/PAINTING ======================
+# =============================================================================
 
 
 @mcp.tool()
@@ -6240,31 +4847,6 @@ def stroke_path(layer_id: int, brush_size: int = 5, color_red: int = 0, color_gr
     return sendCommand(command)
 
 
-@mcp.tool()
-def fill_path(layer_id: int, color_red: int = 255, color_green: int = 0, color_blue: int = 0, opacity: int = 100) -> dict:
-    """
-    Fills the current work path with a color.
-
-    Args:
-        layer_id: ID of the layer
-        color_red: Fill color red (0-255). Default 255.
-        color_green: Fill color green (0-255). Default 0.
-        color_blue: Fill color blue (0-255). Default 0.
-        opacity: Fill opacity (0-100). Default 100.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "fill",
-        "_target": [{"_ref": "path", "_enum": "ordinal", "_value": "targetEnum"}],
-        "using": {"_enum": "fillContents", "_value": "color"},
-        "color": {"_obj": "RGBColor", "red": color_red, "grain": color_green, "blue": color_blue},
-        "opacity": {"_unit": "percentUnit", "_value": float(opacity)},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
 @mcp.tool()
 def path_to_selection(feather: float = 0.0, anti_alias: bool = True) -> dict:
     """
@@ -6422,26 +5004,6 @@ def create_snapshot(snapshot_name: str = "Snapshot") -> dict:
     return sendCommand(command)
 
 
-@mcp.tool()
-def set_layer_opacity(layer_id: int, opacity: int = 100) -> dict:
-    """
-    Sets layer opacity directly via batchPlay. Useful for quick opacity changes.
-
-    Args:
-        layer_id: ID of the layer
-        opacity: Opacity (0-100). Default 100.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{
-        "_obj": "set",
-        "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}],
-        "to": {"_obj": "layer", "opacity": {"_unit": "percentUnit", "_value": float(opacity)}},
-        "_isCommand": True
-    }]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
 def _normalize_blend_mode_for_batchplay(value: str) -> str:
     """Normalizes any blend mode format (UPPERCASE, camelCase, underscore, space) to correct batchPlay camelCase."""
     _MAP = {
@@ -6542,129 +5104,10 @@ def apply_image_size(width: int = 0, height: int = 0, resolution: int = 0, resam
     return sendCommand(command)
 
 
-# ============================================================
-# BATCH 10: BLUR GALLERY FILTERS
-# ============================================================
-
-@mcp.tool()
-def apply_iris_blur(layer_id: int, blur_amount: float = 25.0, center_x: float = 500.0, center_y: float = 500.0) -> dict:
-    """
-    Applies Iris Blur (Blur Gallery) for depth-of-field with elliptical focus area.
-
-    Args:
-        layer_id: ID of the layer.
-        blur_amount: Blur intensity 0-500px. Default 25.
-        center_x: Focus center X coordinate. Default 500.
-        center_y: Focus center Y coordinate. Default 500.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "blurbTransform", "blurbWidgetType": 1, "blurbIrisBlurAmount": float(blur_amount), "blurbWidgetLocationX": float(center_x), "blurbWidgetLocationY": float(center_y), "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_tilt_shift_blur(layer_id: int, blur_amount: float = 30.0, focus_top: int = 300, focus_bottom: int = 500, feather_top: int = 100, feather_bottom: int = 100, angle: int = 0) -> dict:
-    """
-    Applies Tilt-Shift Blur (Blur Gallery) for miniature/diorama effect.
-
-    Args:
-        layer_id: ID of the layer.
-        blur_amount: Blur intensity 0-500px. Default 30.
-        focus_top: Top of in-focus band in pixels. Default 300.
-        focus_bottom: Bottom of in-focus band in pixels. Default 500.
-        feather_top: Feather distance above focus. Default 100.
-        feather_bottom: Feather distance below focus. Default 100.
-        angle: Rotation angle of the focus band. Default 0.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "blurbTransform", "blurbWidgetType": 2, "blurbTiltShiftBlurAmount": float(blur_amount), "blurbTiltShiftFocusTop": focus_top, "blurbTiltShiftFocusBottom": focus_bottom, "blurbTiltShiftFeatherTop": feather_top, "blurbTiltShiftFeatherBottom": feather_bottom, "blurbTiltShiftSymmetric": True, "blurbTiltShiftAngle": angle, "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_spin_blur(layer_id: int, spin_angle: float = 15.0, center_x: float = 500.0, center_y: float = 500.0) -> dict:
-    """
-    Applies Spin Blur (Blur Gallery) for rotational motion blur.
-
-    Args:
-        layer_id: ID of the layer.
-        spin_angle: Spin angle 0-360 degrees. Default 15.
-        center_x: Spin center X. Default 500.
-        center_y: Spin center Y. Default 500.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "blurbTransform", "blurbWidgetType": 3, "blurbSpinBlurAngle": float(spin_angle), "blurbWidgetLocationX": float(center_x), "blurbWidgetLocationY": float(center_y), "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_path_blur(layer_id: int, blur_speed: float = 50.0) -> dict:
-    """
-    Applies Path Blur (Blur Gallery) for directional motion along a path.
-
-    Args:
-        layer_id: ID of the layer.
-        blur_speed: Speed of motion blur 0-500. Default 50.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "blurbTransform", "blurbWidgetType": 4, "blurbPathBlurSpeed": float(blur_speed), "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
 # ============================================================
 # BATCH 11: DRAWING / RETOUCHING TOOLS
 # ============================================================
 
-@mcp.tool()
-def apply_clone_stamp(layer_id: int, source_x: int = 0, source_y: int = 0, dest_x: int = 50, dest_y: int = 50, brush_size: int = 50, opacity: int = 100, hardness: int = 100) -> dict:
-    """
-    Applies Clone Stamp tool - clones pixels from source to destination point.
-
-    Args:
-        layer_id: ID of the layer to clone on.
-        source_x: Source X coordinate. Default 0.
-        source_y: Source Y coordinate. Default 0.
-        dest_x: Destination X coordinate. Default 50.
-        dest_y: Destination Y coordinate. Default 50.
-        brush_size: Brush diameter 1-5000. Default 50.
-        opacity: Opacity 1-100. Default 100.
-        hardness: Hardness 0-100. Default 100.
-    """
-    _select_layer_bp(layer_id)
-    commands = [
-        {"_obj": "set", "_target": [{"_ref": "cloneStampTool"}], "to": {"_obj": "cloneStampTool", "opacity": {"_unit": "percentUnit", "_value": opacity}, "flow": {"_unit": "percentUnit", "_value": 100}, "brush": {"_obj": "brush", "diameter": {"_unit": "pixelsUnit", "_value": float(brush_size)}, "hardness": {"_unit": "percentUnit", "_value": hardness}}}, "_isCommand": True},
-        {"_obj": "setd", "_target": [{"_ref": "paintBrushTool"}], "source": {"_enum": "sourceType", "_value": "samplePoint"}, "offset": {"_obj": "point", "horizontal": {"_unit": "pixelsUnit", "_value": float(source_x)}, "vertical": {"_unit": "pixelsUnit", "_value": float(source_y)}}, "_isCommand": True},
-        {"_obj": "paint", "_target": [{"_ref": "paintBrushTool"}], "from": {"_obj": "point", "horizontal": {"_unit": "pixelsUnit", "_value": float(dest_x)}, "vertical": {"_unit": "pixelsUnit", "_value": float(dest_y)}}, "to": {"_obj": "point", "horizontal": {"_unit": "pixelsUnit", "_value": float(dest_x)}, "vertical": {"_unit": "pixelsUnit", "_value": float(dest_y)}}, "_isCommand": True}
-    ]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def apply_healing_brush(layer_id: int, source_x: int = 0, source_y: int = 0, dest_x: int = 50, dest_y: int = 50, brush_size: int = 50) -> dict:
-    """
-    Applies Healing Brush - blends source texture with destination color/tone.
-
-    Args:
-        layer_id: ID of the layer.
-        source_x: Source X coordinate. Default 0.
-        source_y: Source Y coordinate. Default 0.
-        dest_x: Destination X coordinate. Default 50.
-        dest_y: Destination Y coordinate. Default 50.
-        brush_size: Brush diameter 1-5000. Default 50.
-    """
-    _select_layer_bp(layer_id)
-    commands = [
-        {"_obj": "select", "_target": [{"_ref": "healingBrushTool"}], "_isCommand": True},
-        {"_obj": "set", "_target": [{"_ref": "healingBrushTool"}], "to": {"_obj": "healingBrushTool", "brush": {"_obj": "brush", "diameter": {"_unit": "pixelsUnit", "_value": float(brush_size)}, "hardness": {"_unit": "percentUnit", "_value": 100}}}, "_isCommand": True}
-    ]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
 
 @mcp.tool()
 def apply_spot_healing_brush(layer_id: int, points: list = None, brush_size: int = 30) -> dict:
@@ -6761,39 +5204,6 @@ def apply_mixer_brush(layer_id: int, points: list = None, brush_size: int = 50,
 # BATCH 12: ADVANCED SELECTION TOOLS
 # ============================================================
 
-@mcp.tool()
-def select_object(layer_id: int) -> dict:
-    """
-    Uses Object Selection tool to automatically detect and select the main object on the layer.
-
-    Args:
-        layer_id: ID of the layer containing the object to select.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "autoCutout", "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}], "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
-@mcp.tool()
-def select_by_quick_selection(layer_id: int, x: int = 50, y: int = 50, brush_size: int = 20) -> dict:
-    """
-    Uses Quick Selection tool to select area around a point.
-
-    Args:
-        layer_id: ID of the layer.
-        x: X coordinate to start selection. Default 50.
-        y: Y coordinate to start selection. Default 50.
-        brush_size: Selection brush size 1-500. Default 20.
-    """
-    _select_layer_bp(layer_id)
-    commands = [
-        {"_obj": "select", "_target": [{"_ref": "quickSelectTool"}], "_isCommand": True},
-        {"_obj": "set", "_target": [{"_ref": "quickSelectTool"}], "to": {"_obj": "quickSelectTool", "brush": {"_obj": "brush", "diameter": {"_unit": "pixelsUnit", "_value": float(brush_size)}}}, "_isCommand": True}
-    ]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
 
 @mcp.tool()
 def add_to_selection_ellipse(layer_id: int, bounds: dict = None, feather: int = 0) -> dict:
@@ -6873,20 +5283,6 @@ def subtract_from_selection_polygon(layer_id: int, points: list = None, feather:
 # BATCH 13: SMART OBJECT & LAYER TYPE OPERATIONS
 # ============================================================
 
-@mcp.tool()
-def replace_smart_object_contents(layer_id: int, file_path: str = "") -> dict:
-    """
-    Replaces the contents of a Smart Object layer with a new file.
-
-    Args:
-        layer_id: ID of the Smart Object layer.
-        file_path: Absolute path to the replacement file.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "placedLayerReplaceContents", "null": {"_path": file_path, "_kind": "local"}, "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
 
 @mcp.tool()
 def rasterize_all_layers() -> dict:
@@ -6898,20 +5294,6 @@ def rasterize_all_layers() -> dict:
     return sendCommand(command)
 
 
-@mcp.tool()
-def convert_layer_to_frame(layer_id: int) -> dict:
-    """
-    Converts a layer to a frame layer (for animation timeline).
-
-    Args:
-        layer_id: ID of the layer.
-    """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "convertToFrameAnimation", "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
 # ============================================================
 # BATCH 14: DOCUMENT & PROFILE OPERATIONS
 # ============================================================
@@ -7100,25 +5482,6 @@ def record_action_stop() -> dict:
     return sendCommand(command)
 
 
-# ============================================================
-# BATCH 17: STYLIZE FILTERS (missing ones)
-# ============================================================
-
-@mcp.tool()
-def apply_diffuse(layer_id: int, mode: str = "normal") -> dict:
-    """
-    Applies Diffuse stylize filter for softening effect.
-
-    Args:
-        layer_id: ID of the layer.
-        mode: Diffuse mode - "normal", "darkenOnly", "lightenOnly", "anisotropic". Default "normal".
-    """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "diffuse", "mode": {"_enum": "diffuseMode", "_value": mode}, "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
-
-
 # ============================================================
 # BATCH 18: ADDITIONAL UTILITY OPERATIONS
 # ============================================================
@@ -7158,87 +5521,125 @@ def zoom_to_100() -> dict:
 
 
 @mcp.tool()
-def toggle_layer_effects_visibility(layer_id: int, visible: bool = True) -> dict:
+def ungroup_layers(group_layer_id: int) -> dict:
     """
-    Shows or hides all layer effects/styles on a layer.
+    Ungroups a layer group, moving all children out.
 
     Args:
-        layer_id: ID of the layer.
-        visible: True to show effects, False to hide. Default True.
+        group_layer_id: ID of the group layer to ungroup.
     """
-    _select_layer_bp(layer_id)
-    if visible:
-        commands = [{"_obj": "show", "_target": [{"_ref": "layerEffects"}], "_isCommand": True}]
-    else:
-        commands = [{"_obj": "hide", "_target": [{"_ref": "layerEffects"}], "_isCommand": True}]
+    _select_layer_bp(group_layer_id)
+    commands = [{"_obj": "ungroupLayersEvent", "_isCommand": True}]
     command = createCommand("executeBatchPlayCommand", {"commands": commands})
     return sendCommand(command)
 
 
 @mcp.tool()
-def create_layer_from_effects(layer_id: int) -> dict:
+def apply_auto_blend_layers(blend_method: str = "panorama") -> dict:
     """
-    Converts layer effects to separate layers (Layer > Layer Style > Create Layers).
+    Auto-blends selected layers (Edit > Auto-Blend Layers).
 
     Args:
-        layer_id: ID of the layer with effects.
+        blend_method: "panorama" or "stackImages". Default "panorama".
     """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "newLayersFromVisible", "_isCommand": True}]
+    commands = [{"_obj": "mergeAlignedLayers", "autoBlendType": {"_enum": "autoBlendType", "_value": blend_method}, "seamlessTones": True, "contentAware": True, "_isCommand": True}]
     command = createCommand("executeBatchPlayCommand", {"commands": commands})
     return sendCommand(command)
 
 
 @mcp.tool()
-def ungroup_layers(group_layer_id: int) -> dict:
+def apply_auto_align_layers() -> dict:
     """
-    Ungroups a layer group, moving all children out.
-
-    Args:
-        group_layer_id: ID of the group layer to ungroup.
+    Auto-aligns selected layers (Edit > Auto-Align Layers) using Auto projection.
     """
-    _select_layer_bp(group_layer_id)
-    commands = [{"_obj": "ungroupLayersEvent", "_isCommand": True}]
+    commands = [{"_obj": "align", "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}], "alignmentType": {"_enum": "alignmentType", "_value": "auto"}, "_isCommand": True}]
     command = createCommand("executeBatchPlayCommand", {"commands": commands})
     return sendCommand(command)
 
 
-@mcp.tool()
-def select_linked_layers(layer_id: int) -> dict:
+add_listener(macros.recorder.on_command)
+macros.instrument(mcp._tool_manager,
+    exclude={"start_macro_recording", "stop_macro_recording", "list_macros", "run_macro"})
+
+# outside the macro recorder, so rejected calls are not recorded
+arg_validation.instrument(mcp._tool_manager, batchplay_tools.SPECS,
+    enums={"blend_mode": blend_modes, "interpolation_method": interpolation_methods})
+
+def list_tool_categories():
+    """
+    Lists the categories of Photoshop tools that are not listed yet. Call
+    enable_tool_category to use the tools of a category.
     """
-    Selects all layers linked to the specified layer.
+    return tool_discovery.list_categories()
+
+async def enable_tool_category(category: str, ctx: Context):
+    """
+    Makes the tools of a category available, e.g. "filters" or "layer_styles".
+    See list_tool_categories.
 
     Args:
-        layer_id: ID of a linked layer.
+        category (str): Category name
+
+    Returns:
+        list[dict]: Name and summary of each tool in the category
     """
-    _select_layer_bp(layer_id)
-    commands = [{"_obj": "selectLinked", "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
+    try:
+        tools = tool_discovery.enable_category(category)
+    except ValueError as e:
+        return {'status': 'error', 'error': str(e)}
 
+    try:
+        await ctx.session.send_tool_list_changed()
+    except Exception as e:
+        logger.log(f"Could not notify the client of the new tools: {e}")
 
-@mcp.tool()
-def apply_auto_blend_layers(blend_method: str = "panorama") -> dict:
+    return tools
+
+def describe_tool(name: str):
     """
-    Auto-blends selected layers (Edit > Auto-Blend Layers).
+    Returns the full description and input schema of a tool, including tools in
+    categories that are not enabled yet.
 
     Args:
-        blend_method: "panorama" or "stackImages". Default "panorama".
+        name (str): Tool name
     """
-    commands = [{"_obj": "mergeAlignedLayers", "autoBlendType": {"_enum": "autoBlendType", "_value": blend_method}, "seamlessTones": True, "contentAware": True, "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
+    try:
+        return tool_discovery.describe(name)
+    except ValueError as e:
+        return {'status': 'error', 'error': str(e)}
 
+# added before saving, so their schemas are cached too
+if TOOL_DISCOVERY:
+    mcp.add_tool(list_tool_categories)
+    mcp.add_tool(enable_tool_category)
+    mcp.add_tool(describe_tool)
 
-@mcp.tool()
-def apply_auto_align_layers() -> dict:
-    """
-    Auto-aligns selected layers (Edit > Auto-Align Layers) using Auto projection.
-    """
-    commands = [{"_obj": "align", "_target": [{"_ref": "layer", "_enum": "ordinal", "_value": "targetEnum"}], "alignmentType": {"_enum": "alignmentType", "_value": "auto"}, "_isCommand": True}]
-    command = createCommand("executeBatchPlayCommand", {"commands": commands})
-    return sendCommand(command)
+if isinstance(mcp._tool_manager, tool_schemas.CachingToolManager):
+    mcp._tool_manager.save()
+    logger.log(f"Tool schemas: {mcp._tool_manager.hits} cached, {mcp._tool_manager.misses} generated")
+
+if TOOL_DISCOVERY:
+    tool_discovery.activate(mcp._tool_manager, tool_discovery.CORE_TOOLS
+        | {"list_tool_categories", "enable_tool_category", "describe_tool"})
+    tool_discovery.advertise_list_changed(mcp._mcp_server)
 
+startup.phase("tool registration")
 
 if __name__ == "__main__":
-    mcp.run()
+    if startup.PROFILE:
+        fonts.wait_for_scan()
+        startup.phase("waiting for font scan")
+        startup.add("font scan (background)", fonts.scan_seconds or 0)
+
+        # reported, but not part of the total: it times the proxy and Photoshop,
+        # and a proxy without a plugin would only answer after the timeout
+        start = time.perf_counter()
+        try:
+            sendCommand(createCommand("getDocuments", {}), timeout=2)
+        except Exception as e:
+            logger.log(f"Startup profile: could not reach Photoshop: {e}")
+        startup.add("first connection", time.perf_counter() - start)
+
+        startup.report()
+    else:
+        mcp.run()
@@ -20,7 +20,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import socketio
 import time
 import threading
 import json
@@ -32,6 +31,21 @@ proxy_url = None
 proxy_timeout = None
 application = None
 
+# phase timings of the last call on each thread, see last_timing()
+_timing = threading.local()
+
+def last_timing():
+    """
+    Returns the phase timings in seconds of the last send_message_blocking call
+    on the current thread (used by the benchmarks), or None if there was none.
+
+    Returns:
+        dict: connect (creating the client and connecting to the proxy), send
+            (serializing and sending the command), wait (until the response
+            arrived, including the proxy and the plugin) and total
+    """
+    return getattr(_timing, "last", None)
+
 def send_message_blocking(command, timeout=None):
     """
     Blocking function that connects to a Socket.IO server, sends a message,
@@ -54,7 +68,12 @@ def send_message_blocking(command, timeout=None):
     
     # Use provided timeout or default
     wait_timeout = timeout if timeout is not None else proxy_timeout
+
+    times = {"start": time.perf_counter()}
     
+    # imported here as it is slow to import, and only needed once a command is sent
+    import socketio
+
     # Create a standard (non-async) SocketIO client with WebSocket transport only
     sio = socketio.Client(logger=False)
     
@@ -62,22 +81,33 @@ def send_message_blocking(command, timeout=None):
     response_queue = Queue()
     
     connection_failed = [False]         
+    disconnected = threading.Event()
 
     @sio.event
     def connect():
         logger.log(f"Connected to server with session ID: {sio.sid}")
+        times["connected"] = time.perf_counter()
+
+        # the call timed out while connecting, don't send the command late
+        if disconnected.is_set():
+            return
         
         # Send the command
-        logger.log(f"Sending message to {application}: {command}")
+        if logger.enabled():
+            logger.log(f"Sending message to {application}: {command}")
         sio.emit('command_packet', {
             'type': "command",
             'application': application,
             'command': command
         })
+        times["sent"] = time.perf_counter()
     
     @sio.event
     def packet_response(data):
-        logger.log(f"Received response: {data}")
+        times["received"] = time.perf_counter()
+        # formatting a large response (layer trees, images) takes milliseconds
+        if logger.enabled():
+            logger.log(f"Received response: {data}")
         response_queue.put(data)
         # Disconnect after receiving the response
         sio.disconnect()
@@ -88,6 +118,7 @@ def send_message_blocking(command, timeout=None):
         # If we disconnect without response, put None in the queue
         if response_queue.empty():
             response_queue.put(None)
+        disconnected.set()
     
     @sio.event
     def connect_error(error):
@@ -99,8 +130,14 @@ def send_message_blocking(command, timeout=None):
     def connect_and_wait():
         try:
             sio.connect(proxy_url, transports=['websocket'])
-            # Keep the client running until disconnect is called
-            sio.wait()
+            # Keep the client running until disconnect is called. Not sio.wait(),
+            # which sleeps for a second after the disconnect (for reconnects), and
+            # so added a second to every call.
+            disconnected.wait()
+            # if the call timed out while connecting, nothing else disconnects
+            # this client, and its connection and threads would be left behind
+            if sio.connected:
+                sio.disconnect()
         except Exception as e:
             logger.log(f"Error: {e}")
             connection_failed[0] = True
@@ -124,10 +161,11 @@ def send_message_blocking(command, timeout=None):
 
         if response:
             logger.log("response received...")
-            try:
-                logger.log(json.dumps(response))
-            except:
-                logger.log(f"Response (not JSON-serializable): {response}")
+            if logger.enabled():
+                try:
+                    logger.log(json.dumps(response))
+                except:
+                    logger.log(f"Response (not JSON-serializable): {response}")
 
             if response["status"] == "FAILURE":
                 raise AppError(f"Error returned from {application}: {response['message']}")
@@ -145,9 +183,23 @@ def send_message_blocking(command, timeout=None):
         # Make sure client is disconnected
         if sio.connected:
             sio.disconnect()
+        disconnected.set()
         # Wait for the thread to finish (should be quick after disconnect)
         client_thread.join(timeout=1)
 
+        _timing.last = _phases(times)
+
+def _phases(times):
+    end = time.perf_counter()
+    connected = times.get("connected", end)
+    sent = times.get("sent", connected)
+    return {
+        "connect": connected - times["start"],
+        "send": sent - connected,
+        "wait": times.get("received", end) - sent,
+        "total": end - times["start"],
+    }
+
 class AppError(Exception):
     pass
 
@@ -0,0 +1,68 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# Times the phases of server startup. Imported first by the server, so the
+# "imports" phase covers everything it imports. Run the server with
+# --profile-startup to print the breakdown and exit instead of serving.
+
+import json
+import sys
+import time
+
+PROFILE = "--profile-startup" in sys.argv
+
+_began = time.perf_counter()
+_last = _began
+_phases = []
+
+
+def phase(name):
+    """Ends the current phase, naming it name, and starts the next one."""
+    global _last
+
+    now = time.perf_counter()
+    _phases.append((name, now - _last))
+    _last = now
+
+
+def add(name, seconds):
+    """Records a phase that ran in the background, alongside the others."""
+    _phases.append((name, seconds))
+
+
+def report():
+    """
+    Prints the phases as a table to stderr and as one line of JSON to stdout.
+
+    Returns:
+        dict: phase name -> milliseconds, and "total"
+    """
+    result = {name: round(seconds * 1000, 1) for name, seconds in _phases}
+    result["total"] = round((_last - _began) * 1000, 1)
+
+    for name, seconds in _phases:
+        print(f"{name:>28}: {seconds * 1000:8.1f} ms", file=sys.stderr)
+    print(f"{'total':>28}: {result['total']:8.1f} ms", file=sys.stderr)
+
+    print(json.dumps(result))
+    return result
@@ -0,0 +1,102 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Fixtures shared by the tests. Code that talks to Photoshop is tested against
+# the fake plugin in benchmarks/fake_photoshop.py, called in process in place
+# of the proxy.
+
+import os
+import sys
+
+import pytest
+
+MCP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [MCP_DIR, os.path.join(MCP_DIR, "benchmarks")]
+
+import core
+import document_state
+import fake_photoshop
+import harness
+import image_dedupe
+import pixel_cache
+import socket_client
+
+
+@pytest.fixture(autouse=True)
+def user_dirs(tmp_path, monkeypatch):
+    """Keeps macros and caches written by a test out of the user's directories."""
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("APPDATA", str(tmp_path / "data"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+
+
+def _forget_state():
+    document_state.on_response(None, None)
+    pixel_cache.cache.invalidate()
+    image_dedupe.forget()
+
+
+@pytest.fixture
+def photoshop(monkeypatch):
+    """A fake Photoshop (4 layers, 64x48) that every command is sent to."""
+    plugin = fake_photoshop.FakePhotoshop(layers=4, width=64, height=48)
+
+    def send(command, timeout=None):
+        response = plugin.handle({"senderId": "test", "command": command})
+        if response["status"] == "FAILURE":
+            raise socket_client.AppError(f"Error returned from photoshop: {response['message']}")
+        return response
+
+    monkeypatch.setattr(socket_client, "send_message_blocking", send)
+    monkeypatch.setattr(core, "application", "photoshop")
+    monkeypatch.setattr(core, "socket_client", socket_client)
+    # registered by the server, which a test may not have loaded
+    if document_state.on_response not in core._listeners:
+        monkeypatch.setattr(core, "_listeners", core._listeners + [document_state.on_response])
+    _forget_state()
+    yield plugin
+    _forget_state()
+
+
+@pytest.fixture(scope="session")
+def server(tmp_path_factory):
+    """The ps-mcp.py module, loaded once without serving."""
+    patch = pytest.MonkeyPatch()
+    cache = tmp_path_factory.mktemp("server-cache")
+    patch.setenv("XDG_CACHE_HOME", str(cache))
+    patch.setenv("LOCALAPPDATA", str(cache))
+    patch.setattr(sys, "argv", ["ps-mcp.py"])
+    try:
+        yield harness.load_server(harness.DEFAULT_PROXY_URL)
+    finally:
+        patch.undo()
+
+
+@pytest.fixture
+def tool(server):
+    """Returns the function of a registered tool, as called by the MCP client."""
+    def get(name):
+        fn = server._get_tool_function(name)
+        assert fn is not None, f"no tool {name}"
+        return fn
+    return get
@@ -0,0 +1,116 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+import arg_validation
+import core
+
+
+def blur(layer_id: int, radius: float = 2.5):
+    return core.sendCommand(core.createCommand("applyGaussianBlur", {"layerId": layer_id, "radius": radius}))
+
+
+def blend(layer_id: int, blend_mode: str = "NORMAL"):
+    return core.sendCommand(core.createCommand("setLayerProperties", {"layerId": layer_id, "blendMode": blend_mode}))
+
+
+BLUR_SPEC = {"name": "blur", "params": [{"name": "radius", "bounds": (0.1, 1000), "choices": None}]}
+
+
+@pytest.fixture
+def stats(monkeypatch):
+    stats = arg_validation.ValidationStats()
+    monkeypatch.setattr(arg_validation, "stats", stats)
+    return stats
+
+
+def _wrap(fn, spec=None, enums=None):
+    return arg_validation.wrap(fn.__name__, fn, arg_validation.compile_checks(fn, spec, enums))
+
+
+def _layer_ids(photoshop):
+    return [layer["id"] for layer, _ in photoshop.active_document.iter_layers()]
+
+
+def test_out_of_bounds_is_rejected_without_sending(photoshop, stats):
+    checked = _wrap(blur, BLUR_SPEC)
+    layer_id = _layer_ids(photoshop)[0]
+
+    with pytest.raises(ValueError, match="radius: must be between 0.1 and 1000, got 5000"):
+        checked(layer_id, 5000)
+
+    assert photoshop.commands == 0
+    assert stats.stats()["rejectedByReason"] == {"bounds": 1}
+    assert stats.stats()["avoidedRoundTrips"] == 1
+
+    assert checked(layer_id, 3)["status"] == "SUCCESS"
+    assert stats.stats()["checkedCalls"] == 2
+
+
+def test_enum_ignores_case(photoshop, stats):
+    checked = _wrap(blend, enums={"blend_mode": ["NORMAL", "MULTIPLY"]})
+    layer_id = _layer_ids(photoshop)[0]
+
+    assert checked(layer_id, "multiply")["status"] == "SUCCESS"
+    with pytest.raises(ValueError, match="blend_mode: must be one of NORMAL, MULTIPLY"):
+        checked(layer_id, "glow")
+
+
+def test_missing_layer_is_rejected_after_a_probe(photoshop, stats):
+    checked = _wrap(blur, BLUR_SPEC)
+    core.sendCommand(core.createCommand("getLayers", {}))
+
+    with pytest.raises(ValueError, match="no layer with ID 999"):
+        checked(999)
+
+    result = stats.stats()
+    assert result["rejectedByReason"] == {"layer": 1}
+    assert result["probeRoundTrips"] == 1
+    assert result["avoidedRoundTrips"] == 0
+
+    # known layers need no probe
+    checked(_layer_ids(photoshop)[0])
+    assert stats.stats()["probeRoundTrips"] == 1
+
+
+def test_layer_made_since_the_tree_was_seen_is_allowed(photoshop, stats):
+    checked = _wrap(blur, BLUR_SPEC)
+    core.sendCommand(core.createCommand("getLayers", {}))
+
+    # made in Photoshop, so not seen by the server
+    photoshop.handle({"senderId": "other", "command": core.createCommand("createPixelLayer", {})})
+    new_id = max(_layer_ids(photoshop))
+
+    assert checked(new_id)["status"] == "SUCCESS"
+    assert stats.stats()["rejectedCalls"] == 0
+
+
+def test_layers_are_not_checked_while_collecting(photoshop, stats):
+    checked = _wrap(blur, BLUR_SPEC)
+    core.sendCommand(core.createCommand("getLayers", {}))
+
+    with core.collect_commands() as commands:
+        checked(999)
+
+    assert len(commands) == 1
+    assert stats.stats()["rejectedCalls"] == 0
@@ -0,0 +1,89 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import os
+
+import pytest
+
+import batch_runner
+
+RENDITIONS = [{"suffix": "", "format": "png"}]
+
+
+def test_checkpoint_is_kept_for_the_same_key(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+
+    checkpoint = batch_runner.Checkpoint(path, "key")
+    checkpoint.mark("/in/a.jpg")
+    checkpoint.mark("/in/b.jpg")
+
+    assert batch_runner.Checkpoint(path, "key").done == {"/in/a.jpg", "/in/b.jpg"}
+    assert batch_runner.Checkpoint(path, "other recipe").done == set()
+
+
+def test_unreadable_checkpoint_is_ignored(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    path.write_text("{not json")
+
+    assert batch_runner.Checkpoint(str(path), "key").done == set()
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    directory = tmp_path / "in"
+    directory.mkdir()
+    for name in ("a", "b", "c"):
+        (directory / f"{name}.jpg").write_bytes(b"jpeg")
+    return str(directory / "*.jpg")
+
+
+def test_resume_skips_files_that_were_written(photoshop, inputs, tmp_path):
+    output_dir = str(tmp_path / "out")
+    failing = ["b.jpg"]
+
+    def open_file(options):
+        if os.path.basename(options["filePath"]) in failing:
+            raise ValueError("openFile : Could not open file")
+
+    photoshop._actions["openFile"] = open_file
+
+    result = batch_runner.run(inputs, [], output_dir, RENDITIONS)
+    assert (result["processed"], result["skipped"]) == (2, 0)
+    assert [os.path.basename(f["file"]) for f in result["failed"]] == ["b.jpg"]
+    assert sorted(os.listdir(output_dir)) == sorted(["a.png", "c.png", batch_runner.CHECKPOINT_FILE])
+
+    with open(result["checkpoint"]) as f:
+        assert [os.path.basename(p) for p in json.load(f)["done"]] == ["a.jpg", "c.jpg"]
+
+    # only the failed file is run again
+    failing.clear()
+    result = batch_runner.run(inputs, [], output_dir, RENDITIONS)
+    assert (result["processed"], result["skipped"], result["failed"]) == (1, 2, [])
+    assert os.path.exists(os.path.join(output_dir, "b.png"))
+
+    result = batch_runner.run(inputs, [], output_dir, RENDITIONS, resume=False)
+    assert (result["processed"], result["skipped"]) == (3, 0)
+
+    # other outputs are a different batch
+    result = batch_runner.run(inputs, [], output_dir, [{"suffix": "-small", "format": "jpg", "scale": 0.5}])
+    assert (result["processed"], result["skipped"]) == (3, 0)
@@ -0,0 +1,77 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+import core
+import effect_recipes
+
+
+def _tool(name):
+    # a tool that sends one command with its arguments as options
+    return lambda **args: core.sendCommand(core.createCommand(name, args))
+
+
+def test_compile_substitutes_parameters_and_layer():
+    commands = effect_recipes.compile_effect(effect_recipes.TEXT_EFFECTS, "neon", 5,
+        {"color": {"red": 0, "green": 255, "blue": 10}, "glow_size": 30}, _tool)
+
+    assert [c["action"] for c in commands] == [
+        "add_inner_glow_layer_style", "add_outer_glow_layer_style", "add_drop_shadow_layer_style"]
+    assert all(c["options"]["layer_id"] == 5 for c in commands)
+    assert commands[1]["options"]["size"] == 30
+    assert (commands[0]["options"]["color_red"], commands[0]["options"]["color_green"]) == (0, 255)
+    assert commands[2]["options"]["color"] == {"red": 0, "green": 255, "blue": 10}
+
+
+def test_compile_uses_defaults():
+    commands = effect_recipes.compile_effect(effect_recipes.PHOTO_EFFECTS, "vignette", 1, None, _tool)
+
+    assert commands[0]["options"]["vignette"] == -80
+    assert commands[0]["options"]["vignette_midpoint"] == 40
+
+
+def test_repeat():
+    effects = {"soft": {"description": "", "params": {}, "steps": [
+        {"tool": "blur", "args": {"layer_id": "$layer_id"}, "repeat": 3}]}}
+
+    assert len(effect_recipes.compile_effect(effects, "soft", 1, None, _tool)) == 3
+
+
+@pytest.mark.parametrize("name, params, message", [
+    ("glitter", None, "Unknown effect"),
+    ("neon", {"size": 3}, "Unknown parameters"),
+    ("neon", {"color": "red"}, "must be an object"),
+    ("neon", {"color": {"red": 255}}, "must have the keys"),
+    ("neon", {"color": {"red": 255, "green": 0, "blue": "x"}}, "color.blue"),
+    ("neon", {"glow_size": True}, "must be a number"),
+])
+def test_compile_rejects_bad_effects_and_parameters(name, params, message):
+    with pytest.raises(ValueError, match=message):
+        effect_recipes.compile_effect(effect_recipes.TEXT_EFFECTS, name, 1, params, _tool)
+
+
+def test_unknown_tool():
+    effects = {"odd": {"description": "", "params": {}, "steps": [{"tool": "nope", "args": {}}]}}
+
+    with pytest.raises(ValueError, match="unknown tool 'nope'"):
+        effect_recipes.compile_effect(effects, "odd", 1, None, lambda name: None)
@@ -0,0 +1,85 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from font_index import FontIndex
+
+
+def _font(postscript, family, style):
+    return {"postscript": postscript, "family": family, "style": style}
+
+
+FONTS = [
+    _font("Arial-BoldMT", "Arial", "Bold"),
+    _font("ArialMT", "Arial", "Regular"),
+    _font("Arial-ItalicMT", "Arial", "Italic"),
+    _font("ArialNarrow", "Arial Narrow", "Regular"),
+    _font("Helvetica", "Helvetica", "Regular"),
+    _font("Helvetica-Bold", "Helvetica", "Bold"),
+    _font("MyriadPro-Regular", "Myriad Pro", "Regular"),
+    # the same font found twice
+    _font("ArialMT", "Arial", "Regular"),
+]
+
+
+def _names(results):
+    return [font["postscript"] for font in results]
+
+
+def test_exact_match_first():
+    index = FontIndex(FONTS)
+
+    assert len(index) == 7
+    assert _names(index.search("ArialMT"))[0] == "ArialMT"
+    assert set(_names(index.search("arial"))) == {
+        "ArialMT", "Arial-BoldMT", "Arial-ItalicMT", "ArialNarrow"}
+
+
+def test_matches_inside_names():
+    index = FontIndex(FONTS)
+
+    assert _names(index.search("bold")) == ["Arial-BoldMT", "Helvetica-Bold"]
+    assert _names(index.search("riad")) == ["MyriadPro-Regular"]
+    # ignores case and punctuation
+    assert _names(index.search("myriad pro")) == ["MyriadPro-Regular"]
+    assert index.search("xyz") == []
+
+
+def test_short_queries_match_prefixes():
+    index = FontIndex(FONTS)
+
+    assert set(_names(index.search("he"))) == {"Helvetica", "Helvetica-Bold"}
+    assert index.search("ld") == []
+
+
+def test_family_style_and_limit():
+    index = FontIndex(FONTS)
+
+    assert _names(index.search(family="arial", style="italic")) == ["Arial-ItalicMT"]
+    assert _names(index.search("helvetica", style="Bold")) == ["Helvetica-Bold"]
+    assert len(index.search(limit=2)) == 2
+
+
+def test_contains_ignores_case():
+    index = FontIndex(FONTS)
+
+    assert "arialmt" in index
+    assert "Courier" not in index
@@ -0,0 +1,134 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+import core
+import macros
+
+
+def _layer_id(photoshop, name):
+    for layer, _ in photoshop.active_document.iter_layers():
+        if layer["name"] == name:
+            return layer["id"]
+    return None
+
+
+def _layer_names(photoshop):
+    return [layer["name"] for layer, _ in photoshop.active_document.iter_layers()]
+
+
+def _tool(name):
+    # a tool that sends one command with its arguments as options
+    return lambda **args: core.sendCommand(core.createCommand(name, args))
+
+
+def _save(name, steps, params=None):
+    steps = [{"tool": tool, "args": args, "commands": []} for tool, args in steps]
+    return macros.save(name, steps, params)
+
+
+def test_compile_binds_parameters_and_layer_names():
+    _save("tint", [("set_opacity", {"layer_id": {"$layer": "Logo"}, "opacity": 50})],
+        {"opacity": "set_opacity.opacity"})
+    layers = [{"name": "Logo", "id": 7}, {"name": "Background", "id": 1}]
+
+    commands = macros.compile_macro("tint", {"opacity": 80}, layers, None, _tool)
+
+    assert commands[0]["action"] == "set_opacity"
+    assert commands[0]["options"] == {"layer_id": 7, "opacity": 80}
+
+
+def test_compile_uses_layer_map_and_rejects_missing_layers():
+    _save("tint", [("set_opacity", {"layer_id": {"$layer": "Logo"}, "opacity": 50})])
+
+    with pytest.raises(ValueError, match="Layer 'Logo'"):
+        macros.compile_macro("tint", None, [{"name": "Background", "id": 1}], None, _tool)
+
+    commands = macros.compile_macro("tint", None, [], {"Logo": 3}, _tool)
+    assert commands[0]["options"]["layer_id"] == 3
+
+
+def test_compile_rejects_unknown_parameters():
+    _save("tint", [("set_opacity", {"layer_id": 1, "opacity": 50})], {"opacity": "1.opacity"})
+
+    with pytest.raises(ValueError, match="Unknown parameters"):
+        macros.compile_macro("tint", {"radius": 2}, [], None, _tool)
+
+
+def test_compile_leaves_created_layers_to_the_plugin():
+    _save("copy", [
+        ("duplicate", {"layer_id": {"$layer": "Logo"}}),
+        ("blur", {"layer_id": {"$created": 0}}),
+    ])
+
+    # only Logo has to exist before the macro runs
+    commands = macros.compile_macro("copy", None, [{"name": "Logo", "id": 7}], None, _tool)
+
+    assert macros.layer_names(macros.load("copy")) == {"Logo"}
+    assert commands[1]["options"] == {"layer_id": {"$created": 0}}
+
+
+def test_compiled_commands_are_cached_until_the_file_changes():
+    _save("tint", [("set_opacity", {"layer_id": 1, "opacity": 50})])
+    first = macros.compile_macro("tint", None, [], None, _tool)
+    assert macros.compile_macro("tint", None, [], None, _tool) is first
+
+    _save("tint", [("set_opacity", {"layer_id": 1, "opacity": 60})])
+    # the modification time may not change within the file system's resolution
+    macros._parsed.clear()
+    assert macros.compile_macro("tint", None, [], None, _tool)[0]["options"]["opacity"] == 60
+
+
+def test_record_and_replay(photoshop, tool):
+    logo = _layer_id(photoshop, "Layer 1")
+
+    assert tool("start_macro_recording")("copy")["status"] == "success"
+    tool("get_layers")()
+    tool("duplicate_layer")(logo, "Layer 1 copy")
+    tool("apply_gaussian_blur")(_layer_id(photoshop, "Layer 1 copy"), 3)
+
+    # a bad parameter keeps the recording
+    result = tool("stop_macro_recording")({"radius": "apply_gaussian_blur.size"})
+    assert result["status"] == "error"
+    assert macros.recorder.recording
+
+    result = tool("stop_macro_recording")({"radius": "apply_gaussian_blur.radius"})
+    assert result["status"] == "success"
+    assert [step["tool"] for step in result["steps"]] == ["duplicate_layer", "apply_gaussian_blur"]
+    assert result["steps"][0]["args"]["layer_to_duplicate_id"] == {"$layer": "Layer 1"}
+    assert result["steps"][1]["args"]["layer_id"] == {"$created": 0}
+
+    # replayed where a layer with the copy's name already exists
+    before = len(_layer_names(photoshop))
+    commands = []
+    core.add_listener(lambda command, response: commands.append(command))
+    try:
+        response = tool("run_macro")("copy", {"radius": 5})
+    finally:
+        core._listeners.pop()
+
+    assert response["status"] == "SUCCESS"
+    assert len(_layer_names(photoshop)) == before + 1
+    assert _layer_names(photoshop).count("Layer 1 copy") == 2
+    blur = commands[-1]["options"]["commands"][1]
+    assert blur["options"] == {"layerId": {"$created": 0}, "radius": 5}
@@ -0,0 +1,120 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import io
+
+from PIL import Image
+
+import image_dedupe
+import pixel_cache
+
+
+def _png(pixel=(200, 200, 200)):
+    image = Image.new("RGB", (64, 64), (200, 200, 200))
+    image.putpixel((5, 5), pixel)
+    out = io.BytesIO()
+    image.save(out, "PNG")
+    return out.getvalue()
+
+
+def test_keys_follow_the_history_state():
+    assert pixel_cache.make_key(None, 3, 100, "jpeg") is None
+
+    key = pixel_cache.make_key((1, 10), 3, 100, "jpeg")
+    assert key == pixel_cache.make_key((1, 10), 3, 100, "jpeg")
+    assert key != pixel_cache.make_key((1, 11), 3, 100, "jpeg")
+    assert key != pixel_cache.make_key((2, 10), 3, 100, "jpeg")
+    assert key != pixel_cache.make_key((1, 10), 4, 100, "jpeg")
+    assert key != pixel_cache.make_key((1, 10), 3, 200, "jpeg")
+    assert key != pixel_cache.make_key((1, 10), 3, 100, "raw")
+
+
+def test_cache_evicts_least_recently_used():
+    cache = pixel_cache.PixelCache(max_bytes=100)
+    a, b, c = (pixel_cache.make_key((1, 1), i, 0, "raw") for i in range(3))
+
+    cache.put(a, "a", 40)
+    cache.put(b, "b", 40)
+    assert cache.get(a) == "a"
+    cache.put(c, "c", 40)
+
+    assert cache.get(b) is None
+    assert (cache.get(a), cache.get(c)) == ("a", "c")
+    assert cache.size_bytes == 80
+
+    # too large to cache at all
+    cache.put(b, "b", 101)
+    assert cache.get(b) is None
+
+
+def test_cache_invalidates_one_document():
+    cache = pixel_cache.PixelCache()
+    first = pixel_cache.make_key((1, 1), 5, 0, "raw")
+    second = pixel_cache.make_key((2, 1), 5, 0, "raw")
+    cache.put(first, "first", 10)
+    cache.put(second, "second", 10)
+
+    cache.invalidate(1)
+
+    assert cache.get(first) is None
+    assert cache.get(second) == "second"
+
+
+def test_read_only_commands():
+    get = {"action": "getLayers", "options": {}}
+    change = {"action": "deleteLayer", "options": {"layerId": 2}}
+    batch = lambda *commands: {"action": "runCommands", "options": {"commands": list(commands)}}
+    play = lambda obj: {"action": "executeBatchPlayCommand", "options": {"commands": [{"_obj": obj}]}}
+
+    assert pixel_cache.is_read_only(get)
+    assert not pixel_cache.is_read_only(change)
+    assert pixel_cache.is_read_only(batch(get, get))
+    assert not pixel_cache.is_read_only(batch(get, change))
+    assert not pixel_cache.is_read_only(batch())
+    assert pixel_cache.is_read_only(play("get"))
+    assert not pixel_cache.is_read_only(play("set"))
+
+
+def test_dedupe_by_history_state():
+    image_dedupe.forget()
+    assert not image_dedupe.is_unchanged("doc", (1, 5))
+
+    image_dedupe.record("doc", (1, 5), _png())
+
+    assert image_dedupe.is_unchanged("doc", (1, 5))
+    assert not image_dedupe.is_unchanged("doc", (1, 6))
+    assert not image_dedupe.is_unchanged("doc", None)
+    assert not image_dedupe.is_unchanged("layer", (1, 5))
+
+
+def test_dedupe_by_bytes_only():
+    image_dedupe.forget()
+    assert image_dedupe.record("doc", (1, 1), _png()) == (False, False)
+
+    # the same bytes at a later state are unchanged
+    assert image_dedupe.record("doc", (1, 2), _png()) == (True, False)
+
+    # a one pixel edit looks the same, but is not left out
+    assert image_dedupe.record("doc", (1, 3), _png((201, 200, 200))) == (False, True)
+
+    image_dedupe.forget("doc")
+    assert image_dedupe.record("doc", (1, 4), _png((201, 200, 200))) == (False, False)
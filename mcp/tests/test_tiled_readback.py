@@ -0,0 +1,100 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import tiled_readback
+
+
+def _pixels(height, width, components, seed=0):
+    return np.random.default_rng(seed).integers(0, 256, (height, width, components), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("components", [1, 2, 3, 4])
+def test_png_writer_round_trips(tmp_path, components):
+    pixels = _pixels(37, 23, components)
+    path = str(tmp_path / "out.png")
+
+    writer = tiled_readback.PngStreamWriter(path, 23, 37, components)
+    for top in range(0, 37, 10):
+        writer.write_rows(pixels[top:top + 10])
+    writer.close()
+
+    with Image.open(path) as image:
+        decoded = np.asarray(image)
+
+    assert np.array_equal(decoded.reshape(pixels.shape), pixels)
+
+
+def test_png_writer_checks_row_count(tmp_path):
+    writer = tiled_readback.PngStreamWriter(str(tmp_path / "out.png"), 4, 4, 3)
+    writer.write_rows(_pixels(3, 4, 3))
+
+    with pytest.raises(ValueError, match="expected 4 rows, got 3"):
+        writer.close()
+
+
+def test_read_tiled_places_tiles():
+    image = _pixels(50, 70, 4)
+    region = {"left": 10, "top": 5, "right": 70, "bottom": 50}
+    reads = []
+
+    def read(tile):
+        reads.append(tile)
+        data = image[tile["top"]:tile["bottom"], tile["left"]:tile["right"]]
+        return {"data": data.tobytes(), "width": data.shape[1], "height": data.shape[0],
+            "components": 4}
+
+    out = tiled_readback.read_tiled(read, region, tile_size=16)
+
+    assert len(reads) == 4 * 3
+    assert np.array_equal(out, image[5:50, 10:70])
+
+
+def test_read_tiled_uses_returned_bounds():
+    # a layer only covers part of the tile it is read with
+    pixels = _pixels(4, 4, 4)
+
+    def read(tile):
+        return {"data": pixels.tobytes(), "width": 4, "height": 4, "components": 4,
+            "bounds": {"left": 6, "top": 2, "right": 10, "bottom": 6}}
+
+    out = tiled_readback.read_tiled(read, {"left": 0, "top": 0, "right": 16, "bottom": 16}, 16)
+
+    assert np.array_equal(out[2:6, 6:10], pixels)
+    assert out[:2].sum() == 0 and out[6:].sum() == 0
+
+
+def test_save_png_reads_in_tiles(photoshop, tmp_path):
+    path = str(tmp_path / "doc.png")
+
+    result = tiled_readback.save_png(path, tile_size=16)
+
+    assert (result["width"], result["height"]) == (64, 48)
+    with Image.open(path) as image:
+        decoded = np.asarray(image)
+    assert decoded.shape == (48, 64, 3)
+
+    tile = {"left": 16, "top": 32, "right": 32, "bottom": 48}
+    assert np.array_equal(decoded[32:48, 16:32], tiled_readback.read_region(tile))
@@ -0,0 +1,286 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Reads the document composite from Photoshop in fixed size tiles, so that
+# very large documents can be saved or analyzed without holding the whole
+# image in memory (in the plugin, the proxy or here).
+
+import os
+import struct
+import zlib
+
+from core import createCommand, sendCommand
+import logger
+
+DEFAULT_TILE_SIZE = 1024
+
+# most pixel bytes read in one request, below the 50 MB message limit of the
+# proxy (maxHttpBufferSize in proxy.js) with room for the rest of the response
+MAX_REQUEST_BYTES = 40 * 1024 * 1024
+
+_PNG_COLOR_TYPES = {1: 0, 2: 4, 3: 2, 4: 6}
+
+
+def get_document_size():
+    """Returns (width, height) in pixels of the active document."""
+    response = sendCommand(createCommand("getDocumentInfo", {}))
+    info = response["response"]
+    return (int(round(info["width"])), int(round(info["height"])))
+
+
+def read_region(bounds=None):
+    """
+    Reads raw 8 bit pixels of the document composite from Photoshop.
+
+    Args:
+        bounds (dict): Region to read (left, top, right, bottom). Whole document if None.
+
+    Returns:
+        numpy.ndarray: (height, width, components) uint8 array
+    """
+    import numpy as np
+
+    options = {"bounds": bounds} if bounds else {}
+    response = sendCommand(createCommand("getDocumentPixels", options))
+    result = response["response"]
+
+    return np.frombuffer(result["data"], dtype=np.uint8).reshape(
+        (result["height"], result["width"], result["components"]))
+
+
+def iter_strips(width, height, tile_size=DEFAULT_TILE_SIZE):
+    """
+    Reads the document one strip (tile_size rows, full width) at a time.
+    Each strip is read tile by tile, left to right.
+
+    Yields:
+        tuple: (top, strip) where strip is a (rows, width, components) uint8 array
+    """
+    import numpy as np
+
+    for top in range(0, height, tile_size):
+        bottom = min(top + tile_size, height)
+        strip = None
+
+        for left in range(0, width, tile_size):
+            right = min(left + tile_size, width)
+            tile = read_region({"left": left, "top": top, "right": right, "bottom": bottom})
+
+            if strip is None:
+                strip = np.empty((bottom - top, width, tile.shape[2]), dtype=np.uint8)
+
+            strip[:, left:right] = tile
+
+        logger.log(f"Read rows {top}-{bottom} of {height}")
+        yield (top, strip)
+
+
+def read_document(max_bytes=MAX_REQUEST_BYTES, tile_size=DEFAULT_TILE_SIZE, size=None):
+    """
+    Reads the whole document composite into memory, in one request if it fits
+    in max_bytes and tile by tile otherwise.
+
+    Args:
+        max_bytes (int): Most pixel bytes to read in one request
+        tile_size (int): Tile size in pixels, for documents larger than max_bytes
+        size (tuple): (width, height) of the document, if already known
+
+    Returns:
+        numpy.ndarray: (height, width, components) uint8 array
+    """
+    import numpy as np
+
+    width, height = size or get_document_size()
+
+    # 4 components (RGBA) is the most a read can return
+    if width * height * 4 <= max_bytes:
+        return read_region()
+
+    out = None
+    for top, strip in iter_strips(width, height, tile_size):
+        if out is None:
+            out = np.empty((height, width, strip.shape[2]), dtype=np.uint8)
+        out[top:top + strip.shape[0]] = strip
+
+    return out
+
+
+def read_tiled(read, bounds, tile_size=DEFAULT_TILE_SIZE):
+    """
+    Reads a region of the document tile by tile into one array, for images
+    (layers, artboards, layer comps) too large to read in one request.
+
+    Args:
+        read (callable): Called with the bounds of each tile. Returns the plugin
+            result for it: data, width, height, components and, if the pixels do
+            not start at the tile's top left, their bounds.
+        bounds (dict): Region to read (left, top, right, bottom) in document pixels
+        tile_size (int): Tile size in pixels
+
+    Returns:
+        numpy.ndarray: (height, width, components) uint8 array. Parts that no
+            tile returned pixels for are zero (transparent).
+    """
+    import numpy as np
+
+    left, top = int(bounds["left"]), int(bounds["top"])
+    right, bottom = int(bounds["right"]), int(bounds["bottom"])
+    out = None
+
+    for y in range(top, bottom, tile_size):
+        for x in range(left, right, tile_size):
+            tile = {"left": x, "top": y, "right": min(x + tile_size, right), "bottom": min(y + tile_size, bottom)}
+            result = read(tile)
+            pixels = np.frombuffer(result["data"], dtype=np.uint8).reshape(
+                (result["height"], result["width"], result["components"]))
+
+            if out is None:
+                out = np.zeros((bottom - top, right - left, pixels.shape[2]), dtype=np.uint8)
+
+            # layer pixels can cover less than the tile
+            at = result.get("bounds") or tile
+            x0, y0 = int(at["left"]) - left, int(at["top"]) - top
+            h = min(pixels.shape[0], out.shape[0] - y0)
+            w = min(pixels.shape[1], out.shape[1] - x0)
+            if h > 0 and w > 0:
+                out[y0:y0 + h, x0:x0 + w] = pixels[:h, :w]
+
+    logger.log(f"Read {right - left}x{bottom - top} region in tiles")
+    return out
+
+
+def read_to_memmap(path, tile_size=DEFAULT_TILE_SIZE):
+    """
+    Reads the whole document into a numpy memmap backed by a file on disk,
+    tile by tile, for analysis of documents too large to fit in memory.
+
+    Args:
+        path (str): File to back the memmap
+        tile_size (int): Tile size in pixels
+
+    Returns:
+        numpy.memmap: (height, width, components) uint8 array
+    """
+    import numpy as np
+
+    width, height = get_document_size()
+    out = None
+
+    for top, strip in iter_strips(width, height, tile_size):
+        if out is None:
+            out = np.memmap(path, dtype=np.uint8, mode="w+", shape=(height, width, strip.shape[2]))
+
+        out[top:top + strip.shape[0]] = strip
+        out.flush()
+
+    return out
+
+
+class PngStreamWriter:
+    """
+    Writes a PNG file a few rows at a time, so the whole image never needs to be
+    in memory. Rows are written with the PNG "Sub" filter.
+    """
+
+    def __init__(self, path, width, height, components, compress_level=6):
+        self.path = path
+        self.width = width
+        self.height = height
+        self.components = components
+        self.rows_written = 0
+
+        self._file = open(path, "wb")
+        self._compressor = zlib.compressobj(compress_level)
+
+        self._file.write(b"\x89PNG\r\n\x1a\n")
+        self._chunk(b"IHDR", struct.pack(
+            ">IIBBBBB", width, height, 8, _PNG_COLOR_TYPES[components], 0, 0, 0))
+
+    def _chunk(self, tag, data):
+        self._file.write(struct.pack(">I", len(data)))
+        self._file.write(tag)
+        self._file.write(data)
+        self._file.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(tag))))
+
+    def write_rows(self, rows):
+        """Writes (n, width, components) uint8 rows."""
+        import numpy as np
+
+        n = rows.shape[0]
+        c = self.components
+        flat = np.ascontiguousarray(rows).reshape((n, self.width * c))
+
+        filtered = np.empty((n, self.width * c + 1), dtype=np.uint8)
+        filtered[:, 0] = 1  # Sub filter
+        filtered[:, 1:1 + c] = flat[:, :c]
+        np.subtract(flat[:, c:], flat[:, :-c], out=filtered[:, 1 + c:])
+
+        data = self._compressor.compress(filtered.tobytes())
+        if data:
+            self._chunk(b"IDAT", data)
+
+        self.rows_written += n
+
+    def close(self):
+        if self.rows_written != self.height:
+            self._file.close()
+            raise ValueError(f"PNG expected {self.height} rows, got {self.rows_written}")
+
+        self._chunk(b"IDAT", self._compressor.flush())
+        self._chunk(b"IEND", b"")
+        self._file.close()
+
+
+def save_png(file_path, tile_size=DEFAULT_TILE_SIZE):
+    """
+    Saves the document composite as a PNG, reading and encoding it one strip of
+    tiles at a time. The file is written to a temporary path and moved into place
+    once complete.
+
+    Returns:
+        dict: file_path, width, height and size_bytes of the saved file
+    """
+    width, height = get_document_size()
+    tmp_path = f"{file_path}.tmp"
+    writer = None
+
+    try:
+        for _, strip in iter_strips(width, height, tile_size):
+            if writer is None:
+                writer = PngStreamWriter(tmp_path, width, height, strip.shape[2])
+            writer.write_rows(strip)
+
+        writer.close()
+        os.replace(tmp_path, file_path)
+    except Exception:
+        if writer is not None and not writer._file.closed:
+            writer._file.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return {
+        "file_path": file_path,
+        "width": width,
+        "height": height,
+        "size_bytes": os.path.getsize(file_path),
+    }
@@ -0,0 +1,217 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# Optional "discovery" mode, where the server only lists a small core set of
+# tools at startup. The others are grouped into categories that the client
+# enables when it needs them, so sessions do not start by downloading and
+# tokenizing the schemas of every tool.
+
+import re
+
+import logger
+
+# Tools listed from the start in discovery mode
+CORE_TOOLS = {
+    "get_documents", "get_document_info", "set_active_document", "create_document",
+    "open_photoshop_file", "save_document", "save_document_as", "close_document",
+    "get_document_image", "get_layers", "get_layer_bounds", "get_layer_image",
+    "select_layer", "set_layer_properties", "set_layer_visibility", "rename_layers",
+    "duplicate_layer", "delete_layer", "move_layer", "translate_layer",
+    "create_pixel_layer", "create_single_line_text_layer", "create_multi_line_text_layer",
+    "edit_text_layer", "search_fonts", "undo", "redo", "execute_batchplay",
+    "list_effects", "apply_text_effect", "apply_photo_effect", "list_macros", "run_macro",
+}
+
+# (name, description, pattern matched against the tool name). A tool is in the
+# first category that matches.
+CATEGORIES = [
+    ("export", "Save and export images, renditions, artboards and layer comps, batch "
+        "processing and data merge",
+        r"^export_|^save_document|^get_.*images?$|^get_pixel_cache_stats$|^batch_process$|^data_merge$"),
+    ("documents", "Documents, canvas, image size, color modes, history, guides and the "
+        "document pool",
+        r"document|canvas|^resize_|^crop_|^trim_|^reveal_all$|icc_profile|color_mode|^apply_image_size$"
+        r"|^set_ruler_units$|^fit_on_screen$|^zoom_to_100$|guide|^purge_all$|^create_snapshot$"
+        r"|^step_|^undo$|^redo$|^open_photoshop_file$|^flatten_image$"),
+    ("automation", "Actions, macros and effect recipes",
+        r"macro|action|^list_effects$|_effect$"),
+    ("layer_styles", "Layer styles (drop shadow, glow, bevel, stroke, overlays) and blend-if",
+        r"layer_style|layer_effects|^create_layer_from_effects$|^set_layer_blend_if$"),
+    ("adjustments", "Adjustment and fill layers, and auto / direct image adjustments",
+        r"adjustment_layer|fill_layer$|^auto_|^shadows_highlights$"
+        r"|^apply_(desaturate|equalize|invert_image|posterize_direct|threshold_direct"
+        r"|match_color|replace_color)$"),
+    ("masks", "Layer masks", r"layer_mask|mask_with"),
+    ("channels", "Channels, channel calculations and channel restrictions",
+        r"channel|^calculations$|^apply_image_composite$"),
+    ("selection", "Making and modifying selections",
+        r"select|^grow_|^similar_|^feather_|^smooth_|^border_|^expand_|^contract_"),
+    ("shapes", "Shapes and paths", r"^draw_|_path$"),
+    ("painting", "Brushes, fills, retouching tools and colors",
+        r"stroke$|^gradient_draw$|^paint_bucket_fill$|^content_aware_fill$"
+        r"|(healing|history|mixer)_brush$|_tool$|_stamp$|ground_color$|^swap_colors$|^define_"),
+    ("transforms", "Scaling, rotating, warping and aligning layers",
+        r"transform|^scale_layer$|^rotate_layer$|^flip_layer$|^apply_skew$|^content_aware_scale$"
+        r"|^align_content$|^liquify_"),
+    ("generative", "Generative AI and subject / background tools",
+        r"^generat|^harmonize_layer$|^remove_background$"),
+    ("layers", "Creating, grouping, merging, linking and converting layers",
+        r"layer|^group|^ungroup|^merge|^stamp_visible$|^place_image$|clipboard|^rasterize"
+        r"|smart_object"),
+    ("filters", "Blur, sharpen, noise, distort, stylize, artistic, sketch, texture and other "
+        "filters", r"^apply_|^fade_last_filter$|^lens_correction$"),
+]
+
+OTHER_CATEGORY = ("other", "Other tools")
+
+_tool_manager = None
+
+# name -> tool for tools that are registered but not listed
+_hidden = {}
+
+# category name -> (description, tool names)
+_categories = {}
+
+# names of the tools listed from the start
+_core = set()
+
+_enabled = set()
+
+
+def category_of(tool_name):
+    for name, _, pattern in CATEGORIES:
+        if re.search(pattern, tool_name):
+            return name
+
+    return OTHER_CATEGORY[0]
+
+
+def is_active():
+    return _tool_manager is not None
+
+
+def activate(tool_manager, core_tools=CORE_TOOLS):
+    """
+    Turns on discovery mode: unlists every registered tool that is not in
+    core_tools. They stay known here until their category is enabled.
+    """
+    global _tool_manager
+
+    _tool_manager = tool_manager
+    descriptions = {name: description for name, description, _ in CATEGORIES}
+    descriptions[OTHER_CATEGORY[0]] = OTHER_CATEGORY[1]
+
+    for tool in tool_manager.list_tools():
+        if tool.name in core_tools:
+            _core.add(tool.name)
+            continue
+
+        category = category_of(tool.name)
+        _categories.setdefault(category, (descriptions[category], []))[1].append(tool.name)
+        _hidden[tool.name] = tool
+        del tool_manager._tools[tool.name]
+
+    logger.log(f"Tool discovery: listing {len(tool_manager.list_tools())} tools, "
+        f"{len(_hidden)} in {len(_categories)} categories")
+
+
+def advertise_list_changed(server):
+    """
+    Makes a low level MCP server tell clients that its tool list can change.
+    FastMCP always says it can not, and clients that go by the server's
+    capabilities would then never fetch the tools of enabled categories.
+    """
+    from mcp.server.lowlevel import NotificationOptions
+
+    create = server.create_initialization_options
+
+    def create_initialization_options(notification_options=None, experimental_capabilities=None):
+        options = notification_options or NotificationOptions()
+        options.tools_changed = True
+        return create(options, experimental_capabilities)
+
+    server.create_initialization_options = create_initialization_options
+
+
+def list_categories():
+    """Returns the name, description, number of tools and state of each category."""
+    return [
+        {
+            "name": name,
+            "description": description,
+            "tools": len(tools),
+            "enabled": name in _enabled,
+        }
+        for name, (description, tools) in _categories.items()
+    ]
+
+
+def enable_category(category):
+    """
+    Lists the tools of a category.
+
+    Returns:
+        list[dict]: Name and first line of the description of each tool
+
+    Raises:
+        ValueError: If there is no such category
+    """
+    if category not in _categories:
+        raise ValueError(f"Unknown tool category '{category}'. Available: {', '.join(_categories)}")
+
+    tools = [get_tool(name) for name in _categories[category][1]]
+    for tool in tools:
+        _tool_manager._tools[tool.name] = tool
+        _hidden.pop(tool.name, None)
+
+    _enabled.add(category)
+    logger.log(f"Tool discovery: enabled {category} ({len(tools)} tools)")
+
+    return [{"name": tool.name, "summary": summary(tool)} for tool in tools]
+
+
+def summary(tool):
+    return (tool.description or "").strip().split("\n")[0].strip()
+
+
+def get_tool(name):
+    """Returns a registered tool by name, whether it is listed or not, or None."""
+    if _tool_manager is not None and name in _tool_manager._tools:
+        return _tool_manager._tools[name]
+
+    return _hidden.get(name)
+
+
+def describe(name):
+    """Returns the description and input schema of a tool, listed or not."""
+    tool = get_tool(name)
+    if tool is None:
+        raise ValueError(f"Unknown tool '{name}'")
+
+    return {
+        "name": tool.name,
+        "category": "core" if name in _core else category_of(name),
+        "listed": name not in _hidden,
+        "description": tool.description,
+        "inputSchema": tool.parameters,
+    }
@@ -0,0 +1,216 @@
+# MIT License
+#
+# Copyright (c) 2025 Mike Chambers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# Caches the JSON schemas FastMCP generates for tool arguments, which is most
+# of the time it takes to register hundreds of tools. On a cache hit a tool is
+# registered with its cached schema, and the pydantic model used to validate
+# its arguments is only built the first time the tool is called.
+#
+# This relies on FastMCP internals, checked against the mcp versions allowed in
+# pyproject.toml. With other versions the stock ToolManager is used.
+
+import hashlib
+import inspect
+import json
+import multiprocessing
+import os
+from functools import cached_property
+from typing import Any
+
+from pydantic import Field
+
+from mcp.server.fastmcp.tools import Tool, ToolManager
+
+try:
+    from mcp.server.fastmcp.utilities.context_injection import find_context_parameter
+    from mcp.server.fastmcp.utilities.func_metadata import func_metadata
+except ImportError:
+    find_context_parameter = None
+    func_metadata = None
+
+import fonts
+import logger
+
+# bump when the format of cache entries changes
+CACHE_VERSION = 1
+
+# Tool fields set when registering from the cache
+_TOOL_FIELDS = {"fn", "name", "title", "description", "parameters", "fn_metadata",
+    "is_async", "context_kwarg", "annotations", "icons", "meta"}
+
+# ToolManager.add_tool() arguments that are passed through
+_ADD_TOOL_ARGS = {"fn", "name", "title", "description", "annotations", "icons", "meta",
+    "structured_output"}
+
+
+def cache_path(server_name):
+    """Returns the path of the schema cache of a server, next to the font cache."""
+    return os.path.join(os.path.dirname(fonts.cache_path()), f"tool_schemas-{server_name}.json")
+
+
+def is_supported():
+    """Returns True if the installed mcp has the FastMCP internals the cache relies on."""
+    if find_context_parameter is None or func_metadata is None:
+        return False
+
+    try:
+        return (_TOOL_FIELDS <= set(Tool.model_fields)
+            and _ADD_TOOL_ARGS <= set(inspect.signature(ToolManager.add_tool).parameters))
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+
+def _library_versions():
+    from importlib.metadata import version
+    return {"mcp": version("mcp"), "pydantic": version("pydantic")}
+
+
+def _fingerprint(fn, name, description, structured_output):
+    # anything that changes the generated schema changes the fingerprint
+    text = "\0".join([name, str(inspect.signature(fn)), description or fn.__doc__ or "",
+        str(structured_output)])
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class LazyTool(Tool):
+    """A tool registered from a cached schema. Its fn_metadata is built on first call."""
+
+    structured_output: bool | None = None
+    cached_output_schema: dict[str, Any] | None = Field(default=None, exclude=True)
+
+    @cached_property
+    def output_schema(self):
+        if self.fn_metadata is not None:
+            return self.fn_metadata.output_schema
+        return self.cached_output_schema
+
+    async def run(self, arguments, context=None, convert_result=False):
+        if self.fn_metadata is None:
+            self.fn_metadata = func_metadata(
+                self.fn,
+                skip_names=[self.context_kwarg] if self.context_kwarg is not None else [],
+                structured_output=self.structured_output,
+            )
+
+        return await super().run(arguments, context, convert_result)
+
+
+class CachingToolManager(ToolManager):
+    """ToolManager that registers tools from the schema cache when they have not changed."""
+
+    def __init__(self, path, warn_on_duplicate_tools=True):
+        super().__init__(warn_on_duplicate_tools)
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = self._load()
+        self._changed = False
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if data.get("version") != CACHE_VERSION or data.get("libraries") != _library_versions():
+            return {}
+
+        return data.get("tools", {})
+
+    def add_tool(self, fn, name=None, title=None, description=None, annotations=None,
+            icons=None, meta=None, structured_output=None):
+        tool_name = name or fn.__name__
+        key = _fingerprint(fn, tool_name, description, structured_output)
+        entry = self._entries.get(tool_name)
+
+        if entry is not None and entry["key"] == key and tool_name not in self._tools:
+            try:
+                tool = LazyTool.model_construct(
+                    fn=fn,
+                    name=tool_name,
+                    title=title,
+                    description=description or fn.__doc__ or "",
+                    parameters=entry["parameters"],
+                    fn_metadata=None,
+                    is_async=inspect.iscoroutinefunction(fn),
+                    context_kwarg=find_context_parameter(fn),
+                    annotations=annotations,
+                    icons=icons,
+                    meta=meta,
+                    structured_output=structured_output,
+                    cached_output_schema=entry["outputSchema"],
+                )
+            except (AttributeError, TypeError) as e:
+                logger.log(f"Could not register {tool_name} from the schema cache: {e}")
+            else:
+                self._tools[tool_name] = tool
+                self.hits += 1
+                return tool
+
+        tool = super().add_tool(fn, name=name, title=title, description=description,
+            annotations=annotations, icons=icons, meta=meta,
+            structured_output=structured_output)
+        self._entries[tool_name] = {
+            "key": key,
+            "parameters": tool.parameters,
+            "outputSchema": tool.output_schema,
+        }
+        self._changed = True
+        self.misses += 1
+        return tool
+
+    def save(self):
+        """Writes the cache if a schema was generated, dropping tools that no longer exist."""
+        # pool worker processes re-import the server module, leave the cache to the server
+        if not self._changed or multiprocessing.parent_process() is not None:
+            return
+
+        entries = {name: entry for name, entry in self._entries.items() if name in self._tools}
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_VERSION, "libraries": _library_versions(),
+                    "tools": entries}, f)
+            os.replace(tmp_path, self.path)
+            self._changed = False
+        except Exception as e:
+            logger.log(f"Could not write tool schema cache {self.path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def install(mcp, server_name):
+    """
+    Replaces the tool manager of a FastMCP server (before any tools are added)
+    with a CachingToolManager. Keeps the stock ToolManager if the installed mcp
+    is not supported (see is_supported()).
+    """
+    if not is_supported():
+        logger.log("Tool schema cache not supported by this mcp version, not caching")
+        return mcp._tool_manager
+
+    mcp._tool_manager = CachingToolManager(cache_path(server_name),
+        mcp.settings.warn_on_duplicate_tools)
+    return mcp._tool_manager
@@ -43,7 +43,7 @@ const { rasterizeLayer } = require("./layers").commandHandlers;
 const openFile = async (command) => {
   let options = command.options;
 
-  await execute(async () => {
+  let out = await execute(async () => {
     let entry = null;
     try {
       entry = await fs.getEntryWithUrl("file:" + options.filePath);
@@ -53,8 +53,11 @@ const openFile = async (command) => {
       );
     }
 
-    await app.open(entry);
+    const doc = await app.open(entry);
+    return { documentId: doc.id };
   });
+
+  return out;
 };
 
 const placeImage = async (command) => {
@@ -155,6 +158,187 @@ const getDocumentImage = async (command) => {
   return out;
 };
 
+// Reads raw 8 bit chunky composite pixels, optionally limited to bounds.
+// Must be called from inside execute.
+const _readCompositePixels = async (bounds) => {
+  const pixelsOpt = {
+    applyAlpha: false,
+    componentSize: 8,
+    colorSpace: "RGB",
+  };
+
+  if (bounds) {
+    pixelsOpt.sourceBounds = {
+      left: bounds.left,
+      top: bounds.top,
+      right: bounds.right,
+      bottom: bounds.bottom,
+    };
+  }
+
+  const imgObj = await imaging.getPixels(pixelsOpt);
+  const imageData = imgObj.imageData;
+
+  // raw chunky pixels are sent as binary, not base64
+  const data = await imageData.getData({ chunky: true });
+
+  const result = {
+    data: data,
+    width: imageData.width,
+    height: imageData.height,
+    components: imageData.components,
+    bounds: imgObj.sourceBounds,
+  };
+
+  imageData.dispose();
+  return result;
+};
+
+const getDocumentPixels = async (command) => {
+  const options = command.options;
+
+  // bounds reads only part of the document (used to read large documents in tiles)
+  let out = await execute(async () => {
+    const result = await _readCompositePixels(options.bounds);
+    result.format = "raw";
+    return result;
+  });
+
+  return out;
+};
+
+const _listArtboards = async () => {
+  const doc = app.activeDocument;
+  const layers = doc.layers;
+
+  // one batchPlay call for all top level layers
+  const descriptors = await action.batchPlay(
+    layers.map((layer) => ({
+      _obj: "get",
+      _target: [{ _ref: "layer", _id: layer.id }],
+    })),
+    {},
+  );
+
+  const out = [];
+  for (let i = 0; i < layers.length; i++) {
+    const d = descriptors[i];
+    if (!d || !d.artboardEnabled || !d.artboard) {
+      continue;
+    }
+
+    const rect = d.artboard.artboardRect;
+    out.push({
+      id: layers[i].id,
+      name: layers[i].name,
+      bounds: {
+        left: rect.left,
+        top: rect.top,
+        right: rect.right,
+        bottom: rect.bottom,
+      },
+    });
+  }
+
+  return out;
+};
+
+const getArtboards = async (command) => {
+  return await _listArtboards();
+};
+
+const getArtboardImages = async (command) => {
+  const options = command.options;
+  const ids = options.artboardIds;
+
+  // bounds reads only part of each artboard (used to read large artboards in tiles)
+  const tile = options.bounds;
+
+  let out = await execute(async () => {
+    const artboards = await _listArtboards();
+    const byId = new Map(artboards.map((a) => [a.id, a]));
+    const wanted = ids ? ids : artboards.map((a) => a.id);
+
+    const results = [];
+    for (const id of wanted) {
+      const artboard = byId.get(id);
+      if (!artboard) {
+        results.push({ artboardId: id, error: `Artboard ${id} not found` });
+        continue;
+      }
+
+      try {
+        const pixels = await _readCompositePixels(tile || artboard.bounds);
+        results.push({
+          artboardId: id,
+          name: artboard.name,
+          ...pixels,
+        });
+      } catch (e) {
+        results.push({ artboardId: id, name: artboard.name, error: `${e}` });
+      }
+    }
+
+    return results;
+  }, "Reading artboards");
+
+  return out;
+};
+
+const getLayerComps = async (command) => {
+  return app.activeDocument.layerComps.map((comp) => ({
+    id: comp.id,
+    name: comp.name,
+  }));
+};
+
+const getLayerCompImages = async (command) => {
+  const options = command.options;
+  const ids = options.compIds;
+
+  // bounds reads only part of the document (used to read large comps in tiles)
+  const tile = options.bounds || null;
+
+  let out = await execute(async (executionContext) => {
+    const doc = app.activeDocument;
+    const comps = doc.layerComps;
+    const wanted = ids ? ids : comps.map((c) => c.id);
+
+    // applying comps changes the document, so everything done here is
+    // rolled back when history is resumed without committing
+    const hostControl = executionContext.hostControl;
+    const suspensionID = await hostControl.suspendHistory({
+      documentID: doc.id,
+      name: "Export layer comps",
+    });
+
+    const results = [];
+    try {
+      for (const id of wanted) {
+        const comp = comps.find((c) => c.id === id);
+        if (!comp) {
+          results.push({ compId: id, error: `Layer comp ${id} not found` });
+          continue;
+        }
+
+        try {
+          await comp.apply();
+          const pixels = await _readCompositePixels(tile);
+          results.push({ compId: id, name: comp.name, ...pixels });
+        } catch (e) {
+          results.push({ compId: id, name: comp.name, error: `${e}` });
+        }
+      }
+    } finally {
+      await hostControl.resumeHistory(suspensionID, false);
+    }
+
+    return results;
+  }, "Reading layer comps");
+
+  return out;
+};
+
 const getDocumentInfo = async (command) => {
   let doc = app.activeDocument;
   let path = doc.path;
@@ -173,6 +357,15 @@ const getDocumentInfo = async (command) => {
   return out;
 };
 
+// Cheap probe for the active document's history state. Its response does not
+// include the layer tree (see main.js).
+const getHistoryState = async (command) => {
+  const doc = app.activeDocument;
+  const info = generateDocumentInfo(doc, doc);
+
+  return { documentId: info.id, historyStateId: info.historyStateId };
+};
+
 const cropDocument = async (command) => {
   let options = command.options;
 
@@ -507,10 +700,13 @@ const duplicateDocument = async (command) => {
   let options = command.options;
   let name = options.name;
 
-  await execute(async () => {
+  let out = await execute(async () => {
     const doc = app.activeDocument;
-    await doc.duplicate(name);
+    const duplicate = await doc.duplicate(name);
+    return { documentId: duplicate.id };
   });
+
+  return out;
 };
 
 const createDocument = async (command) => {
@@ -518,8 +714,8 @@ const createDocument = async (command) => {
   let colorMode = getNewDocumentMode(command.options.colorMode);
   let fillColor = parseColor(options.fillColor);
 
-  await execute(async () => {
-    await app.createDocument({
+  let out = await execute(async () => {
+    const doc = await app.createDocument({
       typename: "DocumentCreateOptions",
       width: options.width,
       height: options.height,
@@ -533,7 +729,11 @@ const createDocument = async (command) => {
     let background = findLayerByName("Background");
     background.allLocked = false;
     background.name = "Background";
+
+    return { documentId: doc.id };
   });
+
+  return out;
 };
 
 const executeBatchPlayCommand = async (commands) => {
@@ -809,9 +1009,15 @@ const commandHandlers = {
   getDocuments,
   duplicateDocument,
   getDocumentImage,
+  getDocumentPixels,
+  getArtboards,
+  getArtboardImages,
+  getLayerComps,
+  getLayerCompImages,
   openFile,
   placeImage,
   getDocumentInfo,
+  getHistoryState,
   cropDocument,
   removeBackground,
   alignContent,
@@ -23,6 +23,7 @@
 
 const { app } = require("photoshop");
 const fs = require("uxp").storage.localFileSystem;
+const { execute } = require("./utils");
 
 const adjustmentLayers = require("./adjustment_layers");
 const core = require("./core");
@@ -59,6 +60,112 @@ const parseAndRouteCommand = async (command) => {
     return f(command);
 };
 
+// Runs several commands from a single request, in order, so a multi step
+// operation costs one round trip. Stops at the first command that fails.
+//
+// If options.historyName is set, the commands are grouped into a single
+// history state with that name, and everything is rolled back if one fails.
+const runCommands = async (command) => {
+    const historyName = command.options.historyName;
+
+    if (!historyName) {
+        return _runCommands(command.options.commands);
+    }
+
+    return await execute(async (executionContext) => {
+        const hostControl = executionContext.hostControl;
+        const suspensionID = await hostControl.suspendHistory({
+            documentID: app.activeDocument.id,
+            name: historyName,
+        });
+
+        let results;
+        try {
+            results = await _runCommands(command.options.commands);
+        } catch (e) {
+            await hostControl.resumeHistory(suspensionID, false);
+            throw e;
+        }
+
+        await hostControl.resumeHistory(suspensionID, true);
+        return results;
+    }, historyName);
+};
+
+// Macros refer to a layer created by an earlier command as {"$created": n},
+// the n-th new layer (in id order) since the first command.
+const _usesCreatedLayers = (commands) => {
+    return JSON.stringify(commands).includes('"$created"');
+};
+
+const _layerIds = (layers, out) => {
+    for (const layer of layers) {
+        out.add(layer.id);
+        if (layer.layers) {
+            _layerIds(layer.layers, out);
+        }
+    }
+    return out;
+};
+
+const _resolveCreated = (value, created) => {
+    if (Array.isArray(value)) {
+        return value.map((v) => _resolveCreated(v, created));
+    }
+
+    if (value === null || typeof value !== "object") {
+        return value;
+    }
+
+    if ("$created" in value) {
+        const id = created[value["$created"]];
+        if (id === undefined) {
+            throw new Error(`Layer ${value["$created"]} created by the macro does not exist`);
+        }
+        return id;
+    }
+
+    const out = {};
+    for (const [k, v] of Object.entries(value)) {
+        out[k] = _resolveCreated(v, created);
+    }
+    return out;
+};
+
+const _runCommands = async (commands) => {
+    const results = [];
+    const trackCreated = _usesCreatedLayers(commands);
+    const created = [];
+
+    for (let i = 0; i < commands.length; i++) {
+        let c = commands[i];
+        try {
+            checkRequiresActiveDocument(c);
+
+            let before = null;
+            if (trackCreated) {
+                c = _resolveCreated(c, created);
+                if (app.activeDocument) {
+                    before = _layerIds(app.activeDocument.layers, new Set());
+                }
+            }
+
+            results.push(await parseAndRouteCommand(c));
+
+            if (before && app.activeDocument) {
+                const after = _layerIds(app.activeDocument.layers, new Set());
+                created.push(...[...after].filter((id) => !before.has(id)).sort((a, b) => a - b));
+            }
+        } catch (e) {
+            throw new Error(
+                `runCommands: step ${i + 1} of ${commands.length} (${c.action}) failed : ${e.message || e}`
+            );
+        }
+    }
+
+    return results;
+};
+
 const checkRequiresActiveDocument = (command) => {
     if (!requiresActiveDocument(command)) {
         return;
@@ -87,6 +194,7 @@ const commandHandlers = {
     ...painting.commandHandlers,
     ...advanced.commandHandlers,
     ...channels.commandHandlers,
+    runCommands,
 };
 
 module.exports = {
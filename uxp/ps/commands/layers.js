@@ -25,7 +25,6 @@ const { app, constants, action, imaging } = require("photoshop");
 const fs = require("uxp").storage.localFileSystem;
 
 const {
-  setVisibleAllLayers,
   findLayer,
   execute,
   parseColor,
@@ -35,105 +34,10 @@ const {
   getJustificationMode,
   selectLayer,
   hasActiveSelection,
-  _saveDocumentAs,
   convertFontSize,
   convertFromPhotoshopFontSize,
 } = require("./utils");
 
-// Function to capture visibility state
-const _captureVisibilityState = (layers) => {
-  const state = new Map();
-
-  const capture = (layerSet) => {
-    for (const layer of layerSet) {
-      state.set(layer.id, layer.visible);
-      if (layer.layers && layer.layers.length > 0) {
-        capture(layer.layers);
-      }
-    }
-  };
-
-  capture(layers);
-  return state;
-};
-
-// Function to restore visibility state
-const _restoreVisibilityState = async (state) => {
-  const restore = (layerSet) => {
-    for (const layer of layerSet) {
-      if (state.has(layer.id)) {
-        layer.visible = state.get(layer.id);
-      }
-
-      if (layer.layers && layer.layers.length > 0) {
-        restore(layer.layers);
-      }
-    }
-  };
-
-  await execute(async () => {
-    restore(app.activeDocument.layers);
-  });
-};
-
-const exportLayersAsPng = async (command) => {
-  let options = command.options;
-  let layersInfo = options.layersInfo;
-
-  const results = [];
-
-  let originalState;
-  await execute(async () => {
-    originalState = _captureVisibilityState(app.activeDocument.layers);
-    setVisibleAllLayers(false);
-  });
-
-  for (const info of layersInfo) {
-    let result = {};
-
-    let layer = findLayer(info.layerId);
-
-    try {
-      if (!layer) {
-        throw new Error(
-          `exportLayersAsPng: Could not find layer with ID: [${info.layerId}]`, // Fixed error message
-        );
-      }
-      await execute(async () => {
-        layer.visible = true;
-      });
-
-      let tmp = await _saveDocumentAs(info.filePath, "PNG");
-
-      result = {
-        ...tmp,
-        layerId: info.layerId,
-        success: true,
-      };
-    } catch (e) {
-      result = {
-        ...info,
-        success: false,
-        message: e.message,
-      };
-    } finally {
-      if (layer) {
-        await execute(async () => {
-          layer.visible = false;
-        });
-      }
-    }
-
-    results.push(result);
-  }
-
-  await execute(async () => {
-    await _restoreVisibilityState(originalState);
-  });
-
-  return results;
-};
-
 const scaleLayer = async (command) => {
   let options = command.options;
 
@@ -974,6 +878,88 @@ const getLayerImage = async (command) => {
   return out;
 };
 
+const getLayerImages = async (command) => {
+  const options = command.options;
+  const layerIds = options.layerIds;
+  const thumbSize = options.thumbSize;
+
+  // bounds reads only part of each layer (used to read large layers in tiles)
+  const sourceBounds = options.bounds;
+
+  let out = await execute(async () => {
+    const results = [];
+
+    for (const layerId of layerIds) {
+      const layer = findLayer(layerId);
+
+      if (!layer) {
+        results.push({
+          layerId: layerId,
+          error: `Could not find layerId : ${layerId}`,
+        });
+        continue;
+      }
+
+      try {
+        const bounds = layer.bounds;
+        const width = bounds.right - bounds.left;
+        const height = bounds.bottom - bounds.top;
+
+        const pixelsOpt = {
+          applyAlpha: false,
+          layerID: layerId,
+          componentSize: 8,
+        };
+
+        if (sourceBounds) {
+          pixelsOpt.sourceBounds = {
+            left: sourceBounds.left,
+            top: sourceBounds.top,
+            right: sourceBounds.right,
+            bottom: sourceBounds.bottom,
+          };
+        }
+
+        // only scale down, keeping the aspect ratio of the layer. Full size
+        // pixels are returned if no thumbSize is specified.
+        if (thumbSize && width >= height && width > thumbSize) {
+          pixelsOpt.targetSize = { width: thumbSize };
+        } else if (thumbSize && height > width && height > thumbSize) {
+          pixelsOpt.targetSize = { height: thumbSize };
+        }
+
+        const imgObj = await imaging.getPixels(pixelsOpt);
+        const imageData = imgObj.imageData;
+
+        // raw chunky pixels are sent as binary, not base64
+        const data = await imageData.getData({ chunky: true });
+
+        results.push({
+          layerId: layerId,
+          name: layer.name,
+          width: imageData.width,
+          height: imageData.height,
+          components: imageData.components,
+          bounds: imgObj.sourceBounds,
+          data: data,
+        });
+
+        imageData.dispose();
+      } catch (e) {
+        results.push({
+          layerId: layerId,
+          name: layer.name,
+          error: `${e}`,
+        });
+      }
+    }
+
+    return results;
+  });
+
+  return out;
+};
+
 const setLayerPositionAbsolute = async (command) => {
   let options = command.options;
   let layerId = options.layerId;
@@ -1017,9 +1003,9 @@ const setLayerPositionAbsolute = async (command) => {
 const commandHandlers = {
   renameLayers,
   getLayerImage,
+  getLayerImages,
   harmonizeLayer,
   editTextLayer,
-  exportLayersAsPng,
   removeLayerMask,
   addLayerMask,
   getLayers,
@@ -335,6 +335,8 @@ const fileExists = async (filePath) => {
 };
 
 const generateDocumentInfo = (document, activeDocument) => {
+  let historyState = document.activeHistoryState;
+
   return {
     name: document.name,
     id: document.id,
@@ -342,6 +344,7 @@ const generateDocumentInfo = (document, activeDocument) => {
     path: document.path,
     saved: document.saved,
     title: document.title,
+    historyStateId: historyState ? historyState.id : null,
   };
 };
 
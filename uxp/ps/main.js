@@ -38,6 +38,10 @@ const app = require("photoshop").app;
 const APPLICATION = "photoshop";
 const PROXY_URL = "http://localhost:3001";
 
+// actions whose responses leave out the layer tree, as they are sent just to
+// check the history state
+const NO_LAYERS_ACTIONS = new Set(["getHistoryState"]);
+
 let socket = null;
 
 const onCommandPacket = async (packet) => {
@@ -60,7 +64,9 @@ const onCommandPacket = async (packet) => {
         let doc = generateDocumentInfo(activeDocument, activeDocument)
         out.document = doc;
 
-        out.layers = await getLayers();
+        if (!NO_LAYERS_ACTIONS.has(command.action)) {
+            out.layers = await getLayers();
+        }
 
         out.hasActiveSelection = hasActiveSelection();
     } catch (e) {